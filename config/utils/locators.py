@@ -3,10 +3,18 @@ Centralized Locator Management System
 Provides fallback selectors for all UI elements across WeSign application
 """
 
-from typing import List, Dict, Optional
+import atexit
+import json
+import os
+import time
+from pathlib import Path
+from typing import Any, Callable, List, Dict, Optional, Set
 from dataclasses import dataclass
 
 
+DEFAULT_CACHE_PATH = Path(os.getenv('WESIGN_LOCATOR_CACHE', Path(__file__).parent / '.locator_cache.json'))
+
+
 @dataclass
 class LocatorSet:
     """Container for multiple selector fallbacks"""
@@ -406,23 +414,157 @@ class WeSignLocators:
         return None
 
 
+class SelectorCache:
+    """
+    On-disk record of the selector that last matched each (category, element)
+
+    The cached winner is tried first on the next run. A hit means the cached
+    selector won again; a drift means a different selector won (the UI changed
+    under the primary/cached one); a cold lookup had no cache entry yet.
+
+    Lookups only update memory; save() writes the changed entries once, at
+    process exit for the shared cache, merged into what other processes
+    (xdist workers) saved in the meantime.
+    """
+
+    def __init__(self, path: Optional[Path] = None):
+        self.path = Path(path or DEFAULT_CACHE_PATH)
+        self._entries: Optional[Dict[str, Dict]] = None
+        self._dirty: Set[str] = set()
+        self.stats = {'hits': 0, 'drifts': 0, 'cold': 0}
+
+    @staticmethod
+    def _key(category: str, element: str) -> str:
+        return f"{category.upper()}.{element}"
+
+    def _read(self) -> Dict[str, Dict]:
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return {}
+
+    @property
+    def entries(self) -> Dict[str, Dict]:
+        if self._entries is None:
+            self._entries = self._read()
+        return self._entries
+
+    def cached_selector(self, category: str, element: str) -> Optional[str]:
+        """Get the last winning selector for an element, if any"""
+        entry = self.entries.get(self._key(category, element))
+        return entry['selector'] if entry else None
+
+    def order(self, category: str, element: str, selectors: List[str]) -> List[str]:
+        """Selectors with the cached winner moved to the front"""
+        cached = self.cached_selector(category, element)
+        if cached in selectors:
+            return [cached] + [selector for selector in selectors if selector != cached]
+        return list(selectors)
+
+    def record(self, category: str, element: str, selector: str) -> None:
+        """Record the winning selector (in memory until save())"""
+        key = self._key(category, element)
+        cached = self.cached_selector(category, element)
+
+        if cached is None:
+            self.stats['cold'] += 1
+        elif cached == selector:
+            self.stats['hits'] += 1
+        else:
+            self.stats['drifts'] += 1
+
+        entry = self.entries.get(key, {'wins': 0})
+        entry.update({'selector': selector, 'wins': entry['wins'] + 1 if cached == selector else 1,
+                      'updated': time.time()})
+        self.entries[key] = entry
+        self._dirty.add(key)
+
+    def save(self) -> None:
+        """Merge this process's changed entries into the file (newest entry per key wins)"""
+        if not self._dirty:
+            return
+        merged = self._read()
+        for key in self._dirty:
+            entry = self.entries[key]
+            if entry['updated'] >= merged.get(key, {}).get('updated', 0):
+                merged[key] = entry
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(merged, f, indent=2, ensure_ascii=False)
+            os.replace(tmp_path, self.path)
+            self._entries = merged
+            self._dirty.clear()
+        except OSError as e:
+            print(f"Could not save selector cache: {e}")
+
+    def hit_rate(self, stats: Optional[Dict[str, int]] = None) -> float:
+        """Share of lookups where the cached selector won again"""
+        stats = stats or self.stats
+        total = sum(stats.values())
+        return stats.get('hits', 0) / total if total else 0.0
+
+    def report(self, stats: Optional[Dict[str, int]] = None) -> Dict:
+        """Hit/drift counts (this cache's, or run totals) plus the elements whose winner is not the primary selector"""
+        stats = {'hits': 0, 'drifts': 0, 'cold': 0, **(stats or self.stats)}
+        drifted = {
+            key: entry['selector'] for key, entry in self.entries.items()
+            if entry['selector'] != WeSignLocators.get_primary_selector(*key.split('.', 1))
+        }
+        return {**stats, 'hit_rate': round(self.hit_rate(stats), 3), 'primary_stale': drifted}
+
+
+# Shared by every LocatorHelper in the process
+_default_cache: Optional[SelectorCache] = None
+
+# Lookup counters of this process, plus those of xdist workers on the controller
+_run_stats: Dict[str, int] = {}
+
+
+def get_selector_cache(create: bool = True) -> Optional[SelectorCache]:
+    """Get the process-wide selector cache (None if create is False and nothing used it yet)"""
+    global _default_cache
+    if _default_cache is None and create:
+        _default_cache = SelectorCache()
+        atexit.register(_default_cache.save)
+    return _default_cache
+
+
+def record_selector_stats(stats: Dict[str, int]) -> None:
+    """Add a cache's (or a worker's) lookup counters to the run totals"""
+    for key, value in stats.items():
+        _run_stats[key] = _run_stats.get(key, 0) + value
+
+
+def get_selector_stats() -> Dict[str, int]:
+    """Selector cache lookup counters for the whole run"""
+    return dict(_run_stats)
+
+
 class LocatorHelper:
     """Helper class for working with locators in tests"""
     
-    def __init__(self, page):
+    def __init__(self, page, cache: Optional[SelectorCache] = None):
         self.page = page
+        self.cache = cache or get_selector_cache()
+
+    def _ordered_selectors(self, category: str, element: str) -> List[str]:
+        return self.cache.order(category, element, WeSignLocators.get_selectors(category, element))
     
     def find_element_with_fallbacks(self, category: str, element: str, timeout: int = 10000):
         """
-        Try to find an element using fallback selectors
+        Try to find an element using fallback selectors (cached winner first)
         Returns the first matching element or None if not found
         """
-        selectors = WeSignLocators.get_selectors(category, element)
+        selectors = self._ordered_selectors(category, element)
         
         for selector in selectors:
             try:
                 locator = self.page.locator(selector)
                 if locator.count() > 0:
+                    self.cache.record(category, element, selector)
                     return locator.first
             except Exception:
                 continue
@@ -432,22 +574,47 @@ class LocatorHelper:
     def wait_for_element_with_fallbacks(self, category: str, element: str, timeout: int = 10000):
         """
         Wait for an element to appear using fallback selectors
+
+        All selectors are raced as one combined locator, so a stale primary
+        costs nothing; the winner is then recorded in the selector cache.
         Returns the first matching element or raises timeout error
         """
-        selectors = WeSignLocators.get_selectors(category, element)
+        selectors = self._ordered_selectors(category, element)
+        description = WeSignLocators.get_description(category, element)
+        if not selectors:
+            raise TimeoutError(f"No selectors defined for '{category}.{element}'")
+
+        combined = self.page.locator(selectors[0])
+        for selector in selectors[1:]:
+            combined = combined.or_(self.page.locator(selector))
+
+        try:
+            combined.first.wait_for(timeout=timeout)
+        except Exception:
+            # If no selector worked, raise error with all attempted selectors
+            raise TimeoutError(f"Element '{description}' not found with any of these selectors: {selectors}")
         
+        # Something matched - find which selector it was (no waiting, cached winner first)
         for selector in selectors:
             try:
-                locator = self.page.locator(selector)
-                locator.wait_for(timeout=timeout // len(selectors))
-                if locator.count() > 0:
-                    return locator.first
+                locator = self.page.locator(selector).first
+                if locator.is_visible():
+                    self.cache.record(category, element, selector)
+                    return locator
             except Exception:
                 continue
         
-        # If no selector worked, raise error with all attempted selectors
-        description = WeSignLocators.get_description(category, element)
-        raise TimeoutError(f"Element '{description}' not found with any of these selectors: {selectors}")
+        return combined.first
+
+    def report_cache_stats(self, write: Callable[[str], Any] = print,
+                           stats: Optional[Dict[str, int]] = None) -> Dict:
+        """Write and return selector cache hit rate (low hit rate = selector drift)"""
+        report = self.cache.report(stats)
+        write(f"Selector cache: {report['hits']} hits, {report['drifts']} drifts, "
+              f"{report['cold']} cold, hit rate {report['hit_rate']:.1%}")
+        for key, selector in report['primary_stale'].items():
+            write(f"   {key}: primary stale, using {selector}")
+        return report
     
     def click_with_fallbacks(self, category: str, element: str, timeout: int = 10000) -> bool:
         """
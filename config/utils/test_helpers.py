@@ -236,11 +236,17 @@ class TestHelpers:
             with open(filepath, "w", encoding="utf-8") as f:
                 json.dump(data, f, indent=2, ensure_ascii=False)
                 
-    def create_har_file(self, filename: str) -> str:
-        """Create HAR (HTTP Archive) file for network analysis"""
-        har_path = f"artifacts/{filename}.har"
-        # Note: This would require browser context configuration
-        # context = browser.new_context(record_har_path=har_path)
+    def create_har_file(self, filename: str, url_pattern: str = "**/userapi/**") -> str:
+        """Record matching traffic of this page's context into a HAR (HTTP Archive) file
+
+        The file is written when the browser context closes.
+        """
+        artifacts_dir = Path("artifacts")
+        artifacts_dir.mkdir(exist_ok=True)
+        har_path = str(artifacts_dir / f"{filename}.har")
+        self.page.context.route_from_har(
+            har_path, url=url_pattern, update=True, update_content="embed", update_mode="minimal"
+        )
         return har_path
         
     def validate_accessibility(self) -> Dict[str, Any]:
@@ -8,8 +8,8 @@ for development, staging, production, and local testing environments.
 import json
 import os
 from pathlib import Path
-from typing import Dict, Any, Optional
-from dataclasses import dataclass
+from typing import Dict, Any, Optional, List
+from dataclasses import dataclass, field, fields, replace
 
 
 @dataclass
@@ -26,6 +26,55 @@ class BrowserSettings:
     viewport: Dict[str, int]
     slowMo: Optional[int] = None
     devtools: Optional[bool] = None
+    profile: Optional[str] = None
+    profiles: Optional[Dict[str, Dict[str, Any]]] = None
+
+
+@dataclass
+class ExecutionProfile:
+    """
+    Named browser execution profile (debug, ci-fast, perf-measure)
+
+    None values are taken from the environment's browser_settings.
+    tracing/video: "off", "on" or "retain-on-failure".
+    """
+    name: str
+    headless: Optional[bool] = None
+    slow_mo: Optional[int] = None
+    viewport: Optional[Dict[str, int]] = None
+    maximized: bool = False
+    devtools: Optional[bool] = None
+    args: List[str] = field(default_factory=list)
+    tracing: str = "off"
+    video: str = "off"
+    disable_animations: bool = False
+    block_third_party: bool = False
+    # Serve frontend assets from the shared on-disk cache (utils/asset_cache.py)
+    asset_cache: bool = True
+    # First-party hosts besides base_url that block_third_party lets through
+    allowed_hosts: List[str] = field(default_factory=list)
+
+
+# Built-in profiles; appsettings browser_settings.profiles.<name> overrides any field
+EXECUTION_PROFILES: Dict[str, ExecutionProfile] = {
+    # Current behaviour: everything from browser_settings
+    "config": ExecutionProfile(name="config"),
+    "debug": ExecutionProfile(
+        name="debug", headless=False, maximized=True,
+        args=['--start-maximized'], tracing="on", video="on"
+    ),
+    "ci-fast": ExecutionProfile(
+        name="ci-fast", headless=True, slow_mo=0, devtools=False,
+        args=['--disable-gpu', '--mute-audio', '--hide-scrollbars'],
+        tracing="retain-on-failure", video="off",
+        disable_animations=True, block_third_party=True
+    ),
+    "perf-measure": ExecutionProfile(
+        name="perf-measure", headless=True, slow_mo=0, devtools=False,
+        viewport={'width': 1920, 'height': 1080},
+        tracing="off", video="off", asset_cache=False
+    )
+}
 
 
 @dataclass
@@ -147,7 +196,9 @@ class EnvironmentManager:
             headless=browser_data['headless'],
             viewport=browser_data['viewport'],
             slowMo=browser_data.get('slowMo'),
-            devtools=browser_data.get('devtools')
+            devtools=browser_data.get('devtools'),
+            profile=browser_data.get('profile'),
+            profiles=browser_data.get('profiles')
         )
 
         # Parse API settings (optional)
@@ -297,4 +348,33 @@ def validate_environment(environment: str) -> Dict[str, Any]:
     Returns:
         Dict with validation results
     """
-    return env_manager.validate_config(environment)
\ No newline at end of file
+    return env_manager.validate_config(environment)
+
+
+def get_execution_profile(name: Optional[str] = None, config: Optional[EnvironmentConfig] = None) -> ExecutionProfile:
+    """
+    Resolve a named execution profile against the environment's browser_settings
+
+    Selection order: name argument, WESIGN_BROWSER_PROFILE, browser_settings.profile,
+    "ci-fast" when running under CI, otherwise "config" (browser_settings as-is).
+    """
+    config = config or get_config()
+    settings = config.browser_settings
+
+    name = (name or os.getenv('WESIGN_BROWSER_PROFILE') or settings.profile
+            or ('ci-fast' if os.getenv('CI') else 'config'))
+    if name not in EXECUTION_PROFILES and name not in (settings.profiles or {}):
+        raise ValueError(f"Unknown execution profile: {name}. Valid options: {sorted(EXECUTION_PROFILES)}")
+
+    profile = EXECUTION_PROFILES.get(name, ExecutionProfile(name=name))
+    overrides = (settings.profiles or {}).get(name, {})
+    known = {f.name for f in fields(ExecutionProfile)}
+    profile = replace(profile, **{k: v for k, v in overrides.items() if k in known})
+
+    return replace(
+        profile,
+        headless=settings.headless if profile.headless is None else profile.headless,
+        slow_mo=(settings.slowMo or 0) if profile.slow_mo is None else profile.slow_mo,
+        viewport=profile.viewport or settings.viewport,
+        devtools=bool(settings.devtools) if profile.devtools is None else profile.devtools
+    )
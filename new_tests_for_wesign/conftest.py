@@ -5,46 +5,290 @@ Pytest configuration and fixtures for WeSign tests
 import pytest
 import pytest_asyncio
 import asyncio
-from playwright.async_api import async_playwright, Browser, BrowserContext, Page
-
-
-@pytest_asyncio.fixture(scope="session")
-async def browser():
-    """Create a browser instance for the test session."""
-    async with async_playwright() as p:
-        browser = await p.chromium.launch(
-            headless=False,  # Run in HEADED mode for visibility and debugging
-            slow_mo=50,      # Add 50ms delay between actions for observation
-            timeout=10000,   # 10 second timeout for browser launch
-            args=[
-                '--no-sandbox',
-                '--disable-dev-shm-usage',
-                '--disable-web-security',
-                '--allow-running-insecure-content',
-                '--start-maximized',  # Start browser in full-screen mode
-                '--disable-extensions',
-                '--disable-background-timer-throttling',
-                '--disable-backgrounding-occluded-windows',
-                '--disable-renderer-backgrounding'
-            ]
+import os
+from pathlib import Path
+from urllib.parse import urlparse
+from pytest_asyncio import is_async_test
+from playwright.async_api import BrowserContext, Page
+from config.environment import get_config, get_execution_profile, EXECUTION_PROFILES
+from utils.browser_pool import BrowserPool, set_active_pool, record_pool_stats, get_pool_stats
+from utils.auth_state import AuthStateCache, set_active_auth_cache, record_auth_stats, get_auth_stats
+from utils.response_waits import latency_summary, export_action_timings, record_action_timings
+from utils.wesign_stub_server import start_for_config
+from utils.execution_profile import ProfileRuntime
+from utils.asset_cache import AssetCache, record_stats, get_run_stats
+from utils.har_replay import (
+    HarSettings, HarModuleSession, MODES, add_stale_report, get_stale_reports, export_stale_reports,
+    record_stale_reports
+)
+
+
+def _pool_options(runtime: ProfileRuntime):
+    """Launch/context options for the worker's browser from the selected execution profile."""
+    return runtime.launch_options(), runtime.context_options()
+
+
+def pytest_addoption(parser):
+    """Execution profile and HAR record/replay options (environment variables are the defaults)."""
+    parser.addoption("--browser-profile", default=None,
+                     help=f"execution profile: {', '.join(EXECUTION_PROFILES)} or one defined in appsettings "
+                          "(WESIGN_BROWSER_PROFILE, browser_settings.profile; ci-fast under CI)")
+    parser.addoption("--no-asset-cache", action="store_true",
+                     default=os.environ.get("WESIGN_ASSET_CACHE", "1") == "0",
+                     help="download frontend assets in every context instead of the shared disk cache")
+
+    defaults = HarSettings.from_env()
+    group = parser.getgroup("wesign-har", "WeSign HAR record/replay")
+    group.addoption("--har-mode", choices=MODES, default=defaults.mode,
+                    help="record the traffic of each test module (frontend and API), or replay it "
+                         "offline (WESIGN_HAR_MODE)")
+    group.addoption("--har-dir", default=str(defaults.har_dir),
+                    help="directory holding <module>.har recordings (WESIGN_HAR_DIR)")
+    group.addoption("--har-url", default=defaults.url_pattern,
+                    help="URL glob of requests recorded/served from the HAR; '**/userapi/**' replays only "
+                         "the API and loads the frontend live (WESIGN_HAR_URL)")
+    group.addoption("--har-not-found", choices=("abort", "fallback"), default=defaults.not_found,
+                    help="replay policy for requests missing from the recording (WESIGN_HAR_NOT_FOUND)")
+
+
+def pytest_configure(config):
+    """Register custom markers."""
+    config.addinivalue_line(
+        "markers", "real_login: always drive the login form instead of restoring a cached session"
+    )
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    """
+    Keep each phase's report on the item so fixtures can see whether the test failed,
+    and record the phase's duration as a JUnit XML property (<when>_duration).
+    """
+    outcome = yield
+    report = outcome.get_result()
+    setattr(item, f"rep_{report.when}", report)
+
+    # --junitxml writes the teardown report's properties; it copies item.user_properties
+    # when it is created, so the teardown duration goes on the report itself
+    duration = (f"{report.when}_duration", round(report.duration, 6))
+    if report.when == "teardown":
+        report.user_properties.append(duration)
+    else:
+        item.user_properties.append(duration)
+
+
+def pytest_collection_modifyitems(items):
+    """Run every async test on the session event loop so it can share the worker's browser."""
+    session_loop = pytest.mark.asyncio(loop_scope="session")
+    for item in items:
+        if is_async_test(item):
+            item.add_marker(session_loop, append=False)
+
+
+def pytest_sessionfinish(session):
+    """xdist workers hand their action timings, pool/cache counters and stale HAR reports to the controller."""
+    if hasattr(session.config, "workeroutput"):
+        session.config.workeroutput["browser_pool"] = get_pool_stats()
+        session.config.workeroutput["auth_state"] = get_auth_stats()
+        session.config.workeroutput["action_timings"] = export_action_timings()
+        session.config.workeroutput["asset_cache"] = get_run_stats()
+        session.config.workeroutput["stale_har"] = export_stale_reports()
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error):
+    """Controller side of pytest_sessionfinish (only called with pytest-xdist)."""
+    workeroutput = getattr(node, "workeroutput", {})
+    record_pool_stats(workeroutput.get("browser_pool", {}))
+    record_auth_stats(workeroutput.get("auth_state", {}))
+    record_action_timings(workeroutput.get("action_timings", []))
+    record_stats(workeroutput.get("asset_cache", {}))
+    record_stale_reports(workeroutput.get("stale_har", []))
+
+
+def pytest_terminal_summary(terminalreporter):
+    """Report browser pool and auth cache use, page-object action latency, asset cache savings and stale HAR recordings."""
+    pool_stats = get_pool_stats()
+    if pool_stats.get("launches"):
+        terminalreporter.section("browser pool")
+        terminalreporter.write_line(
+            f"{pool_stats['launches']:.0f} launch(es) in {pool_stats['launch_seconds']:.2f}s, "
+            f"{pool_stats['contexts_created']:.0f} contexts served, "
+            f"{pool_stats.get('blocked_requests', 0):.0f} third-party requests blocked, "
+            f"{pool_stats.get('traces_saved', 0):.0f} traces kept"
         )
-        yield browser
-        await browser.close()
 
+    auth_stats = get_auth_stats()
+    if auth_stats.get("logins") or auth_stats.get("reused"):
+        terminalreporter.section("auth state cache")
+        terminalreporter.write_line(
+            f"{auth_stats['logins']:.0f} login(s) in {auth_stats['login_seconds']:.2f}s, "
+            f"{auth_stats['reused']:.0f} session(s) reused, {auth_stats.get('probes', 0):.0f} probe(s)"
+        )
+
+    summary = latency_summary()
+    if summary:
+        terminalreporter.section("page action latency")
+        for action, stats in sorted(summary.items(), key=lambda item: -item[1]["mean_ms"]):
+            terminalreporter.write_line(
+                f"{action:<40} n={stats['count']:<4} mean={stats['mean_ms']:>8.1f}ms "
+                f"max={stats['max_ms']:>8.1f}ms unmatched={stats['unmatched']}"
+            )
+
+    cache_stats = get_run_stats()
+    if cache_stats.get("hits") or cache_stats.get("revalidated") or cache_stats.get("misses"):
+        terminalreporter.section("asset cache")
+        terminalreporter.write_line(
+            f"hits={cache_stats['hits']} revalidated={cache_stats['revalidated']} misses={cache_stats['misses']} "
+            f"saved={cache_stats['bytes_saved'] / 1048576:.1f}MB fetched={cache_stats['bytes_fetched'] / 1048576:.1f}MB"
+        )
+
+    stale = get_stale_reports()
+    if stale:
+        terminalreporter.section("stale HAR recordings", yellow=True)
+        for report in stale:
+            terminalreporter.write_line(
+                f"{report.module} (recorded {report.recorded_at or 'unknown'}): {'; '.join(report.reasons)}"
+            )
+            for miss in report.misses[:5]:
+                terminalreporter.write_line(f"    missing: {miss}")
+        terminalreporter.write_line("Re-record with: pytest --har-mode record --dist loadfile <module>")
+
+
+@pytest.fixture(scope="session")
+def execution_profile(pytestconfig):
+    """Selected execution profile (debug, ci-fast, perf-measure, ...) for this run."""
+    config = get_config()
+    profile = get_execution_profile(pytestconfig.getoption("browser_profile"), config)
+    return ProfileRuntime(profile, config.base_url)
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session", autouse=True)
+async def browser_pool(execution_profile: ProfileRuntime):
+    """
+    One browser per pytest worker (xdist workers each get their own session).
+
+    The browser is launched lazily, so API-only test runs never start Chromium.
+    Self-launching test classes reach the same pool through pooled_playwright().
+    """
+    launch_options, context_options = _pool_options(execution_profile)
+    pool = BrowserPool(launch_options=launch_options, context_options=context_options)
+    pool.context_hooks.append(execution_profile.attach)
+    pool.context_close_hooks.append(execution_profile.detach)
+    set_active_pool(pool)
+    yield pool
+    set_active_pool(None)
+    await pool.stop()
 
-@pytest_asyncio.fixture(scope="function")
-async def context(browser: Browser):
-    """Create a browser context for each test."""
-    context = await browser.new_context(
-        viewport={'width': 1280, 'height': 720},
-        locale='en-US',
-        timezone_id='America/New_York'
+    # Reported by pytest_terminal_summary (after merging xdist workers' counters)
+    record_pool_stats({
+        **pool.stats,
+        "blocked_requests": execution_profile.stats["blocked_requests"],
+        "traces_saved": execution_profile.stats["traces_saved"]
+    })
+
+
+@pytest.fixture(scope="session", autouse=True)
+def asset_cache(pytestconfig, execution_profile: ProfileRuntime, browser_pool: BrowserPool, har_settings: HarSettings):
+    """
+    Frontend JS/CSS/fonts/images served from a disk cache shared by all contexts and workers.
+
+    Hashed (immutable) assets skip the network; others are revalidated by ETag/Last-Modified.
+    Off while recording HARs, which must capture the server's own responses.
+    """
+    if (pytestconfig.getoption("no_asset_cache") or not execution_profile.profile.asset_cache
+            or har_settings.mode == "record"):
+        yield None
+        return
+
+    cache = AssetCache(urlparse(get_config().base_url).hostname or "localhost")
+    browser_pool.context_hooks.append(cache.attach)
+    yield cache
+    browser_pool.context_hooks.remove(cache.attach)
+    record_stats(cache.stats)
+
+
+@pytest_asyncio.fixture(autouse=True, loop_scope="session")
+async def profile_artifacts(request, execution_profile: ProfileRuntime):
+    """Keep or drop the test's traces/videos according to the execution profile."""
+    execution_profile.begin_test(request.node.nodeid)
+    yield
+    failed = any(
+        getattr(request.node, f"rep_{when}", None) is not None and getattr(request.node, f"rep_{when}").failed
+        for when in ("setup", "call", "teardown")
     )
+    await execution_profile.end_test(failed)
+
+
+@pytest.fixture(scope="session")
+def har_settings(pytestconfig):
+    """HAR record/replay settings from the command line."""
+    return HarSettings(
+        mode=pytestconfig.getoption("har_mode"),
+        har_dir=Path(pytestconfig.getoption("har_dir")),
+        url_pattern=pytestconfig.getoption("har_url"),
+        not_found=pytestconfig.getoption("har_not_found")
+    )
+
+
+@pytest.fixture(scope="module", autouse=True)
+def har_module(request, har_settings: HarSettings, browser_pool: BrowserPool):
+    """
+    Record (or replay) the traffic of every context this module creates.
+
+    One <module>.har per test module, holding the frontend and the API unless
+    --har-url narrows it; replayed modules whose recording no longer matches
+    the frontend are listed under "stale HAR recordings".
+    """
+    if har_settings.mode == "off":
+        yield None
+        return
+
+    session = HarModuleSession(har_settings, request.module.__name__, get_config().base_url)
+    browser_pool.context_hooks.append(session.attach)
+    yield session
+    browser_pool.context_hooks.remove(session.attach)
+    add_stale_report(session.finish())
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def auth_state_cache(browser_pool: BrowserPool):
+    """
+    Authenticated storage state per worker and user type.
+
+    Logs in once, keeps the state on disk (.auth/) for reuse by later runs and
+    only logs in again when the TTL or the token expiry is reached.
+    """
+    cache = AuthStateCache(get_config(), browser_pool)
+    set_active_auth_cache(cache)
+    yield cache
+    set_active_auth_cache(None)
+    record_auth_stats(cache.stats)
+
+
+@pytest.fixture(autouse=True)
+def auth_state_mode(request, auth_state_cache: AuthStateCache):
+    """Page objects restore cached sessions unless the test is marked real_login."""
+    auth_state_cache.enabled = request.node.get_closest_marker("real_login") is None
+    yield
+    auth_state_cache.enabled = True
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def browser(browser_pool: BrowserPool):
+    """Shared browser instance for the test session."""
+    return await browser_pool.get_browser()
+
+
+@pytest_asyncio.fixture(scope="function", loop_scope="session")
+async def context(browser_pool: BrowserPool):
+    """Create a fresh browser context for each test."""
+    context = await browser_pool.new_context()
     yield context
     await context.close()
 
 
-@pytest_asyncio.fixture(scope="function")
+@pytest_asyncio.fixture(scope="function", loop_scope="session")
 async def page(context: BrowserContext):
     """Create a page instance for each test."""
     page = await context.new_page()
@@ -54,33 +298,33 @@ async def page(context: BrowserContext):
     await page.close()
 
 
-@pytest_asyncio.fixture(scope="function")
-async def authenticated_page(context: BrowserContext):
-    """Create an authenticated page that's already logged in."""
-    page = await context.new_page()
+@pytest_asyncio.fixture(scope="function", loop_scope="session")
+async def authenticated_page(auth_state_cache: AuthStateCache):
+    """Create a page on the dashboard, logged in as the company user (cached session, checked on load)."""
+    page = await auth_state_cache.new_page("company_user")
+    yield page
+    await page.context.close()
 
-    # Navigate to login page
-    await page.goto("https://devtest.comda.co.il/")
-    await page.wait_for_load_state("domcontentloaded")
 
-    # Perform login
-    email_field = 'input[type="email"], input[name="email"], input[placeholder*="email"], input[placeholder*="Username"], input[placeholder*="שם משתמש"]'
-    password_field = 'input[type="password"], input[name="password"], input[placeholder*="Password"], input[placeholder*="סיסמה"]'
-    login_button = 'input[type="submit"], button[type="submit"], input[value="Sign in"], input[value="התחברות"]'
+@pytest_asyncio.fixture(scope="function", loop_scope="session")
+async def basic_user_page(auth_state_cache: AuthStateCache):
+    """Create a page on the dashboard, logged in as the basic user (cached session, checked on load)."""
+    page = await auth_state_cache.new_page("basic_user")
+    yield page
+    await page.context.close()
 
-    await page.locator(email_field).first.fill("nirk@comsign.co.il")
-    await page.locator(password_field).first.fill("Comsign1!")
-    await page.locator(login_button).first.click()
 
-    # Wait for dashboard to load
-    try:
-        await page.wait_for_url("**/dashboard**", timeout=15000)
-    except:
-        # Fallback: wait for dashboard elements
-        await page.wait_for_selector('text=ראשי, text=מסמכים', timeout=10000)
+@pytest.fixture(scope="session")
+def wesign_stub_server():
+    """
+    Local in-memory WeSign API stand-in (login, documents, templates, contacts, signing).
 
-    yield page
-    await page.close()
+    Use server.configure(FaultProfile(...)) to inject latency/errors; the
+    environment's company/basic users can log in.
+    """
+    server = start_for_config(get_config())
+    yield server
+    server.stop()
 
 
 # Test configuration fixtures
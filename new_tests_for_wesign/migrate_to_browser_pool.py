@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Browser Pool Migration Script
+Moves self-launching test classes onto the worker-scoped browser pool
+"""
+
+import argparse
+import re
+import sys
+from pathlib import Path
+from typing import Dict, List
+
+
+IMPORT_PATTERN = re.compile(r'^from playwright\.async_api import (?P<names>[^\n(]+)$', re.MULTILINE)
+CALL_PATTERN = re.compile(r'\basync_playwright\(\)')
+POOL_IMPORT = 'from utils.browser_pool import pooled_playwright'
+
+
+class BrowserPoolMigrator:
+    """Rewrites `async_playwright()` launches to lease from the shared BrowserPool"""
+
+    def __init__(self, base_path: str):
+        self.base_path = Path(base_path)
+        self.files_migrated = 0
+        self.launches_migrated = 0
+
+    def find_candidates(self) -> List[Path]:
+        """Find test files that start their own Playwright driver"""
+        candidates = []
+        for file_path in sorted(self.base_path.rglob("test_*.py")):
+            content = file_path.read_text(encoding='utf-8')
+            if CALL_PATTERN.search(content):
+                candidates.append(file_path)
+        return candidates
+
+    def migrate_source(self, content: str) -> Dict:
+        """Return migrated source and the number of launches rewritten"""
+        launches = len(CALL_PATTERN.findall(content))
+        if launches == 0:
+            return {'content': content, 'launches': 0}
+
+        content = CALL_PATTERN.sub('pooled_playwright()', content)
+
+        def rewrite_import(match):
+            names = [name.strip() for name in match.group('names').split(',')]
+            remaining = [name for name in names if name != 'async_playwright']
+            lines = []
+            if remaining:
+                lines.append(f"from playwright.async_api import {', '.join(remaining)}")
+            if POOL_IMPORT not in content:
+                lines.append(POOL_IMPORT)
+            return '\n'.join(lines)
+
+        content, replaced = IMPORT_PATTERN.subn(rewrite_import, content, count=1)
+        if not replaced and POOL_IMPORT not in content:
+            content = f"{POOL_IMPORT}\n{content}"
+
+        return {'content': content, 'launches': launches}
+
+    def migrate_file(self, file_path: Path, dry_run: bool = False) -> int:
+        """Migrate a single file, returning the number of launches rewritten"""
+        original = file_path.read_text(encoding='utf-8')
+        result = self.migrate_source(original)
+
+        if result['launches'] and not dry_run:
+            file_path.write_text(result['content'], encoding='utf-8')
+
+        return result['launches']
+
+    def run(self, dry_run: bool = False) -> None:
+        """Migrate every self-launching test file under base_path"""
+        candidates = self.find_candidates()
+        print(f"Found {len(candidates)} self-launching test files")
+
+        for file_path in candidates:
+            launches = self.migrate_file(file_path, dry_run=dry_run)
+            if launches:
+                self.files_migrated += 1
+                self.launches_migrated += launches
+                action = "Would migrate" if dry_run else "Migrated"
+                print(f"   {action} {launches} launches in {file_path.relative_to(self.base_path)}")
+
+        print("\nSummary:")
+        print(f"   Files: {self.files_migrated}")
+        print(f"   Browser launches moved to pool: {self.launches_migrated}")
+
+
+def main():
+    """Main execution function"""
+    parser = argparse.ArgumentParser(description='Migrate self-launching tests to the shared browser pool')
+    parser.add_argument('path', nargs='?', default=str(Path(__file__).parent), help='Directory to scan')
+    parser.add_argument('--dry-run', action='store_true', help='Report changes without writing files')
+    args = parser.parse_args()
+
+    migrator = BrowserPoolMigrator(args.path)
+    migrator.run(dry_run=args.dry_run)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -3,9 +3,15 @@ Authentication Page Object Model - Written from Scratch
 Comprehensive POM for WeSign authentication functionality
 """
 
-from playwright.async_api import Page, expect
+from playwright.async_api import Page, expect, TimeoutError as PlaywrightTimeoutError
 from .base_page import BasePage
+from utils.auth_state import get_active_auth_cache
+from utils.response_waits import BackendRequest
 import asyncio
+import logging
+
+
+logger = logging.getLogger(__name__)
 
 
 class AuthPage(BasePage):
@@ -32,6 +38,12 @@ class AuthPage(BasePage):
         # Error and validation selectors
         self.error_messages = '.error, .alert-error, [role="alert"], .validation-error'
 
+        # Backend calls behind each action (WeSign UI API)
+        self.backend_requests = {
+            'login': BackendRequest('auth.login', 'POST', r'/users/login'),
+            'language': BackendRequest('auth.language', 'GET', r'/assets/i18n/')
+        }
+
         # Credentials for different user types
         self.company_user_credentials = {
             "email": "nirk@comsign.co.il",
@@ -70,11 +82,33 @@ class AuthPage(BasePage):
 
     async def click_login_button(self) -> None:
         """Click the login button"""
-        await self.page.locator(self.login_button).first.click()
-        await self.page.wait_for_timeout(3000)  # Wait for form submission
+        timing = await self.perform_backend_action('login', self.page.locator(self.login_button).first.click)
+
+        # Failed logins (or client-side validation) stay on the form
+        if timing.status is not None and timing.status < 400:
+            try:
+                await self.page.wait_for_url("**/dashboard**", timeout=5000)
+            except PlaywrightTimeoutError:
+                # Accepted by the backend but no redirect (e.g. 2FA or a password-change prompt)
+                logger.warning("Login returned %s but did not reach the dashboard; now on %s",
+                               timing.status, self.page.url)
+
+    async def restore_session(self, user_type: str = "company_user") -> bool:
+        """Restore a cached authenticated session instead of submitting the form"""
+        cache = get_active_auth_cache()
+        if cache is None:
+            return False
+        try:
+            return await cache.restore(self.page, user_type)
+        except Exception as e:
+            logger.warning("Cached session restore failed, falling back to login form: %s", e)
+            return False
 
     async def login_with_company_user(self) -> None:
-        """Login with company user credentials"""
+        """Login with company user credentials (cached session when available)"""
+        if await self.restore_session("company_user"):
+            return
+
         await self.enter_credentials(
             self.company_user_credentials["email"],
             self.company_user_credentials["password"]
@@ -166,18 +200,17 @@ class AuthPage(BasePage):
 
             if await language_selector.count() > 0 and await language_selector.is_visible():
                 await language_selector.click()
-                await self.page.wait_for_timeout(1000)
+                await self.responses.wait_for_dom_update()
 
+                option = None
                 if language.lower() == "hebrew":
-                    hebrew_option = self.page.locator(self.hebrew_option).first
-                    if await hebrew_option.is_visible():
-                        await hebrew_option.click()
+                    option = self.page.locator(self.hebrew_option).first
                 elif language.lower() == "english":
-                    english_option = self.page.locator(self.english_option).first
-                    if await english_option.is_visible():
-                        await english_option.click()
+                    option = self.page.locator(self.english_option).first
 
-                await self.page.wait_for_timeout(2000)  # Wait for language change
+                if option is not None and await option.is_visible():
+                    # Returns once the translation bundle has loaded
+                    await self.perform_backend_action('language', option.click)
         except:
             # Language switching might not be available
             pass
@@ -348,7 +381,7 @@ class AuthPage(BasePage):
     async def has_form_been_submitted(self) -> bool:
         """Check if form has been submitted"""
         try:
-            await self.page.wait_for_timeout(2000)
+            await self.wait_for_backend('login')
             current_url = self.page.url
 
             # Form submission indicators
@@ -5,6 +5,8 @@ Common functionality for all Page Object Models
 
 from playwright.async_api import Page
 from abc import ABC, abstractmethod
+from typing import Awaitable, Callable, Dict, Optional
+from utils.response_waits import ResponseWaiter, BackendRequest, ActionTiming
 
 
 class BasePage(ABC):
@@ -12,6 +14,10 @@ class BasePage(ABC):
 
     def __init__(self, page: Page):
         self.page = page
+        self.responses = ResponseWaiter.for_page(page)
+
+        # Backend calls triggered by page actions (action name -> BackendRequest)
+        self.backend_requests: Dict[str, BackendRequest] = {}
 
     async def navigate_to(self, url: str) -> None:
         """Navigate to a specific URL"""
@@ -72,6 +78,29 @@ class BasePage(ABC):
         """Wait for page load state"""
         await self.page.wait_for_load_state(state)
 
+    async def perform_backend_action(
+        self,
+        action: str,
+        trigger: Callable[[], Awaitable],
+        dom_selector: Optional[str] = None,
+        timeout: Optional[int] = None
+    ) -> ActionTiming:
+        """Run an action and wait for the backend response it declares plus the DOM update"""
+        timing = await self.responses.perform(
+            f"{type(self).__name__}.{action}",
+            self.backend_requests[action],
+            trigger,
+            dom_selector=dom_selector,
+            timeout=timeout
+        )
+        if timing.status is not None and timing.status >= 400:
+            print(f"{timing.action}: backend returned {timing.status} after {timing.response_ms}ms")
+        return timing
+
+    async def wait_for_backend(self, action: str, dom_selector: Optional[str] = None) -> ActionTiming:
+        """Wait for an in-flight request of the given kind (e.g. the list load after navigation)"""
+        return await self.responses.settle(self.backend_requests[action], dom_selector=dom_selector)
+
     async def take_screenshot(self, path: str = None) -> bytes:
         """Take a screenshot"""
         if path:
@@ -5,6 +5,8 @@ Comprehensive POM for WeSign contacts functionality based on real codebase analy
 
 from playwright.async_api import Page, expect
 from .base_page import BasePage
+from utils.response_waits import BackendRequest
+from utils.table_snapshot import TableSnapshot
 import asyncio
 from pathlib import Path
 
@@ -82,6 +84,15 @@ class ContactsPage(BasePage):
         self.error_messages = '.error, .alert-error, [role="alert"], .validation-error, .color--alert'
         self.success_messages = '.success, .alert-success, .success-message'
 
+        # Backend calls behind each action (WeSign UI API)
+        self.backend_requests = {
+            'list': BackendRequest('contacts.list', 'GET', r'/userapi/ui/v3/contacts(\?|$)'),
+            'search': BackendRequest('contacts.search', 'GET', r'/userapi/ui/v3/contacts(\?|$)'),
+            'save': BackendRequest('contacts.save', 'POST|PUT', r'/userapi/ui/v3/contacts(/[^/?]+)?$'),
+            'delete': BackendRequest('contacts.delete', 'DELETE|PUT', r'/userapi/ui/v3/contacts/'),
+            'import': BackendRequest('contacts.import', 'POST', r'/userapi/ui/v3/contacts')
+        }
+
         # Contact validation patterns
         self.email_pattern = r'[^ @]*@[^ @]*'
         self.phone_pattern = r'(?:^[0][1-9][0-9]{8})?'
@@ -113,8 +124,8 @@ class ContactsPage(BasePage):
             # Check URL is in dashboard
             url_check = "dashboard" in self.page.url
 
-            # Wait a moment for page to load
-            await self.page.wait_for_timeout(2000)
+            # Wait for the contacts list request (if still loading)
+            await self.wait_for_backend('list', dom_selector=self.contacts_table)
 
             # For this user account, contacts functionality may not be available
             # OR it may be integrated into the main dashboard
@@ -156,7 +167,7 @@ class ContactsPage(BasePage):
         try:
             add_button = self.page.locator(self.add_contact_button).first
             await add_button.click()
-            await self.page.wait_for_timeout(1000)  # Wait for modal to appear
+            await self.page.locator(self.add_contact_modal).first.wait_for(state="visible", timeout=5000)
         except Exception as e:
             print(f"Error clicking add contact: {e}")
 
@@ -190,7 +201,6 @@ class ContactsPage(BasePage):
                 await phone_input.clear()
                 await phone_input.fill(contact_data['phone'])
 
-            await self.page.wait_for_timeout(500)  # Wait for form to update
             return True
 
         except Exception as e:
@@ -202,8 +212,8 @@ class ContactsPage(BasePage):
         try:
             submit_button = self.page.locator(self.submit_contact_button).first
             if await submit_button.is_visible() and not await submit_button.is_disabled():
-                await submit_button.click()
-                await self.page.wait_for_timeout(2000)  # Wait for submission
+                # Returns once the create/update response arrives
+                await self.perform_backend_action('save', submit_button.click, dom_selector=self.contact_rows)
                 return True
             return False
         except Exception as e:
@@ -216,7 +226,7 @@ class ContactsPage(BasePage):
             cancel_button = self.page.locator(self.cancel_contact_button).first
             if await cancel_button.is_visible():
                 await cancel_button.click()
-                await self.page.wait_for_timeout(1000)
+                await self.page.locator(self.add_contact_modal).first.wait_for(state="hidden", timeout=5000)
         except Exception as e:
             print(f"Error cancelling contact form: {e}")
 
@@ -232,7 +242,10 @@ class ContactsPage(BasePage):
 
             # Wait for modal
             if not await self.is_contact_modal_visible():
-                await self.page.wait_for_timeout(2000)
+                try:
+                    await self.wait_for_element_visible(self.add_contact_modal, timeout=2000)
+                except:
+                    pass
 
             # Fill form
             if await self.fill_contact_form(contact_data):
@@ -248,43 +261,22 @@ class ContactsPage(BasePage):
     async def get_contacts_list(self) -> list:
         """Get list of contacts from the table"""
         try:
-            # Wait for contacts to load
-            await self.page.wait_for_timeout(2000)
-
-            contacts = []
-            contact_rows = self.page.locator(self.contact_rows)
-            count = await contact_rows.count()
-
-            for i in range(count):
-                try:
-                    row = contact_rows.nth(i)
-
-                    # Get contact details from table cells
-                    name_cell = row.locator('td.ws_td__input label').first
-                    email_cell = row.locator('td.ws_td__input label').nth(1)
-                    phone_cell = row.locator('td.ws_td__input label').nth(2)
-
-                    name = await name_cell.text_content() if await name_cell.count() > 0 else ""
-                    email = await email_cell.text_content() if await email_cell.count() > 0 else ""
-                    phone = await phone_cell.text_content() if await phone_cell.count() > 0 else ""
-
-                    contacts.append({
-                        'index': i,
-                        'name': name.strip() if name else f"Contact {i+1}",
-                        'email': email.strip() if email else "",
-                        'phone': phone.strip() if phone else "",
-                        'element': row
-                    })
-                except:
-                    contacts.append({
-                        'index': i,
-                        'name': f"Contact {i+1}",
-                        'email': "",
-                        'phone': "",
-                        'element': None
-                    })
-
-            return contacts
+            # Wait for the contacts list request (if still loading)
+            await self.wait_for_backend('list', dom_selector=self.contact_rows)
+
+            # All rows and cells in one round trip; 'element' stays a lazy locator
+            rows = await self._contacts_snapshot().capture()
+
+            return [
+                {
+                    'index': row.index,
+                    'name': row.cell(0) or f"Contact {row.index + 1}",
+                    'email': row.cell(1),
+                    'phone': row.cell(2),
+                    'element': row.element
+                }
+                for row in rows
+            ]
 
         except Exception as e:
             print(f"Error getting contacts list: {e}")
@@ -293,13 +285,16 @@ class ContactsPage(BasePage):
     async def count_contacts(self) -> int:
         """Count total number of contacts"""
         try:
-            await self.page.wait_for_timeout(2000)
-            count = await self.page.locator(self.contact_rows).count()
-            return count
+            await self.wait_for_backend('list', dom_selector=self.contact_rows)
+            return await self._contacts_snapshot().count()
         except Exception as e:
             print(f"Error counting contacts: {e}")
             return 0
 
+    def _contacts_snapshot(self) -> TableSnapshot:
+        """Snapshot of the contacts table (name, email, phone cells)"""
+        return TableSnapshot(self.page, self.contact_rows, cell_selector=self.contact_names)
+
     async def search_contacts(self, search_term: str) -> None:
         """Search contacts by term"""
         try:
@@ -307,10 +302,13 @@ class ContactsPage(BasePage):
             if await search_input.is_visible():
                 await search_input.clear()
                 await search_input.fill(search_term)
-                await search_input.press("Enter")
 
-                # Wait for search to complete
-                await self.page.wait_for_timeout(2000)
+                # Wait for the search response and re-rendered rows
+                await self.perform_backend_action(
+                    'search',
+                    lambda: search_input.press("Enter"),
+                    dom_selector=self.contact_rows
+                )
         except Exception as e:
             print(f"Error searching contacts: {e}")
 
@@ -335,7 +333,7 @@ class ContactsPage(BasePage):
             select_all = self.page.locator(self.select_all_checkbox).first
             if await select_all.is_visible():
                 await select_all.check()
-                await self.page.wait_for_timeout(1000)
+                await self.responses.wait_for_dom_update()
                 return True
             return False
         except Exception as e:
@@ -347,17 +345,19 @@ class ContactsPage(BasePage):
         try:
             delete_button = self.page.locator(self.delete_selected_button).first
             if await delete_button.is_visible():
-                await delete_button.click()
-
-                # Wait for confirmation dialog
-                await self.page.wait_for_timeout(1000)
-
-                # Look for confirmation button
-                confirm_button = self.page.locator('button:has-text("אישור"), button:has-text("Confirm")').first
-                if await confirm_button.is_visible():
-                    await confirm_button.click()
-
-                await self.page.wait_for_timeout(2000)  # Wait for deletion
+                async def delete_and_confirm():
+                    await delete_button.click()
+
+                    # Wait for confirmation dialog
+                    confirm_button = self.page.locator('button:has-text("אישור"), button:has-text("Confirm")').first
+                    try:
+                        await confirm_button.wait_for(state="visible", timeout=2000)
+                    except:
+                        pass
+                    if await confirm_button.is_visible():
+                        await confirm_button.click()
+
+                await self.perform_backend_action('delete', delete_and_confirm)
                 return True
             return False
 
@@ -372,16 +372,17 @@ class ContactsPage(BasePage):
                 print(f"File not found: {file_path}")
                 return False
 
-            # Click import button
-            import_button = self.page.locator(self.import_button).first
-            await import_button.click()
+            async def upload_file():
+                # Click import button
+                import_button = self.page.locator(self.import_button).first
+                await import_button.click()
 
-            # Upload file
-            file_input = self.page.locator(self.file_input).first
-            await file_input.set_input_files(file_path)
+                # Upload file
+                file_input = self.page.locator(self.file_input).first
+                await file_input.set_input_files(file_path)
 
-            # Wait for import processing
-            await self.page.wait_for_timeout(3000)
+            # Returns once the import response arrives
+            await self.perform_backend_action('import', upload_file, dom_selector=self.contact_rows, timeout=60000)
             return True
 
         except Exception as e:
@@ -421,7 +422,10 @@ class ContactsPage(BasePage):
                 if contact_name.lower() in contact['name'].lower() and contact['element']:
                     # Click on contact row to edit
                     await contact['element'].click()
-                    await self.page.wait_for_timeout(1000)
+                    try:
+                        await self.wait_for_element_visible(self.add_contact_modal, timeout=5000)
+                    except:
+                        pass
 
                     # Check if edit modal appeared
                     if await self.is_contact_modal_visible():
@@ -462,14 +466,15 @@ class ContactsPage(BasePage):
     async def sort_contacts_by(self, field: str) -> None:
         """Sort contacts by field (name, email, phone)"""
         try:
-            if field.lower() == 'name':
-                await self.page.locator(self.name_header).first.click()
-            elif field.lower() == 'email':
-                await self.page.locator(self.email_header).first.click()
-            elif field.lower() == 'phone':
-                await self.page.locator(self.phone_header).first.click()
-
-            await self.page.wait_for_timeout(1000)  # Wait for sorting
+            headers = {'name': self.name_header, 'email': self.email_header, 'phone': self.phone_header}
+            header = headers.get(field.lower())
+            if header:
+                # Sorting re-queries the contacts list
+                await self.perform_backend_action(
+                    'list',
+                    self.page.locator(header).first.click,
+                    dom_selector=self.contact_rows
+                )
         except Exception as e:
             print(f"Error sorting contacts: {e}")
 
@@ -581,8 +586,8 @@ class ContactsPage(BasePage):
     async def wait_for_contacts_operation(self, timeout: int = 5000) -> None:
         """Wait for contacts operation to complete"""
         try:
-            # Wait for any loading indicators to disappear
-            await self.page.wait_for_timeout(min(timeout, 2000))
+            # Wait for any in-flight contacts request to finish
+            await self.wait_for_backend('list')
 
             # Check if loading spinner is gone
             loading_elements = self.page.locator('.loading, .spinner, .uploading')
@@ -5,6 +5,8 @@ Comprehensive POM for WeSign documents functionality
 
 from playwright.async_api import Page, expect
 from .base_page import BasePage
+from utils.response_waits import BackendRequest
+from utils.table_snapshot import TableSnapshot
 import asyncio
 from pathlib import Path
 
@@ -56,6 +58,16 @@ class DocumentsPage(BasePage):
         self.error_message = '.error, .alert-error, [role="alert"], .validation-error'
         self.success_message = '.success, .alert-success, .notification-success'
 
+        # Backend calls behind each action (WeSign UI API)
+        self.backend_requests = {
+            'upload': BackendRequest('documents.upload', 'POST', r'/userapi/(ui/)?v3/(templates|documentcollections|files)'),
+            'list': BackendRequest('documents.list', 'GET', r'/userapi/ui/v3/documentcollections(\?|$)'),
+            'search': BackendRequest('documents.search', 'GET', r'/userapi/ui/v3/documentcollections(\?|$)'),
+            'view': BackendRequest('documents.view', 'GET', r'/userapi/ui/v3/documentcollections/[^/?]+'),
+            'download': BackendRequest('documents.download', 'GET', r'/userapi/(ui/)?v3/(documentcollections|files)/.+'),
+            'delete': BackendRequest('documents.delete', 'DELETE', r'/userapi/ui/v3/documentcollections/[^/?]+')
+        }
+
         # Supported file types
         self.supported_formats = {
             'pdf': '.pdf',
@@ -112,26 +124,27 @@ class DocumentsPage(BasePage):
             if not Path(file_path).exists():
                 return False
 
-            # Find and use file input
-            file_input = self.page.locator(self.file_input).first
-            if await file_input.count() > 0:
-                await file_input.set_input_files(file_path)
-            else:
-                # Alternative: click upload button first
-                upload_btn = self.page.locator(self.upload_button).first
-                await upload_btn.click()
-                await self.page.wait_for_timeout(1000)
-
+            async def submit_upload():
+                # Find and use file input
                 file_input = self.page.locator(self.file_input).first
-                await file_input.set_input_files(file_path)
-
-            # Submit upload if submit button exists
-            submit_btn = self.page.locator(self.upload_submit).first
-            if await submit_btn.count() > 0 and await submit_btn.is_visible():
-                await submit_btn.click()
-
-            # Wait for upload to complete
-            await self.page.wait_for_timeout(3000)
+                if await file_input.count() > 0:
+                    await file_input.set_input_files(file_path)
+                else:
+                    # Alternative: click upload button first
+                    upload_btn = self.page.locator(self.upload_button).first
+                    await upload_btn.click()
+
+                    file_input = self.page.locator(self.file_input).first
+                    await file_input.wait_for(state="attached", timeout=5000)
+                    await file_input.set_input_files(file_path)
+
+                # Submit upload if submit button exists
+                submit_btn = self.page.locator(self.upload_submit).first
+                if await submit_btn.count() > 0 and await submit_btn.is_visible():
+                    await submit_btn.click()
+
+            # Returns once the upload response arrives
+            await self.perform_backend_action('upload', submit_upload, timeout=60000)
             return True
 
         except Exception as e:
@@ -141,39 +154,51 @@ class DocumentsPage(BasePage):
     async def get_document_list(self) -> list:
         """Get list of documents on the page"""
         try:
-            # Wait for documents to load
-            await self.page.wait_for_timeout(2000)
-
-            documents = []
-            document_items = self.page.locator(self.document_items)
-            count = await document_items.count()
-
-            for i in range(count):
-                item = document_items.nth(i)
-
-                # Get document name
-                name_element = item.locator(self.document_names).first
-                name = await name_element.text_content() if await name_element.count() > 0 else f"Document {i+1}"
-
-                documents.append({
-                    'index': i,
-                    'name': name.strip() if name else f"Document {i+1}",
-                    'element': item
-                })
-
-            return documents
+            # Wait for the document list request (if still loading)
+            await self.wait_for_backend('list', dom_selector=self.document_items)
+
+            # All rows in one round trip; 'element' stays a lazy locator
+            rows = await self._document_snapshot().capture()
+
+            return [
+                {
+                    'index': row.index,
+                    'name': row.fields['name'] or f"Document {row.index + 1}",
+                    'size': row.fields['size'],
+                    'date': row.fields['date'],
+                    'type': row.fields['type'],
+                    'element': row.element
+                }
+                for row in rows
+            ]
 
         except:
             return []
 
+    def _document_snapshot(self) -> TableSnapshot:
+        """Snapshot of the document list with the per-document fields we read"""
+        return TableSnapshot(
+            self.page,
+            self.document_items,
+            fields={
+                'name': self.document_names,
+                'size': self.document_size,
+                'date': self.document_date,
+                'type': self.document_type
+            }
+        )
+
     async def search_documents(self, search_term: str) -> None:
         """Search for documents using search functionality"""
         try:
             search_input = self.page.locator(self.search_input).first
             if await search_input.count() > 0 and await search_input.is_visible():
                 await search_input.fill(search_term)
-                await self.page.keyboard.press("Enter")
-                await self.page.wait_for_timeout(2000)
+                await self.perform_backend_action(
+                    'search',
+                    lambda: self.page.keyboard.press("Enter"),
+                    dom_selector=self.document_items
+                )
 
         except:
             pass
@@ -189,8 +214,7 @@ class DocumentsPage(BasePage):
                     download_btn = doc['element'].locator(self.download_button).first
 
                     if await download_btn.count() > 0 and await download_btn.is_visible():
-                        await download_btn.click()
-                        await self.page.wait_for_timeout(2000)
+                        await self.perform_backend_action('download', download_btn.click)
                         return True
 
             return False
@@ -209,24 +233,26 @@ class DocumentsPage(BasePage):
                     delete_btn = doc['element'].locator(self.delete_button).first
 
                     if await delete_btn.count() > 0 and await delete_btn.is_visible():
-                        await delete_btn.click()
-
-                        # Handle confirmation dialog
-                        await self.page.wait_for_timeout(1000)
-
-                        # Look for confirmation button
-                        confirm_selectors = [
-                            'text=אישור, text=Confirm, text=Yes, text=כן',
-                            'button:has-text("אישור"), button:has-text("Confirm")'
-                        ]
-
-                        for selector in confirm_selectors:
-                            confirm_btn = self.page.locator(selector).first
-                            if await confirm_btn.count() > 0 and await confirm_btn.is_visible():
-                                await confirm_btn.click()
-                                break
-
-                        await self.page.wait_for_timeout(2000)
+                        async def delete_and_confirm():
+                            await delete_btn.click()
+
+                            # Handle confirmation dialog
+                            confirm_selectors = [
+                                'text=אישור, text=Confirm, text=Yes, text=כן',
+                                'button:has-text("אישור"), button:has-text("Confirm")'
+                            ]
+                            try:
+                                await self.page.locator(confirm_selectors[1]).first.wait_for(state="visible", timeout=2000)
+                            except:
+                                pass  # Some lists delete without confirmation
+
+                            for selector in confirm_selectors:
+                                confirm_btn = self.page.locator(selector).first
+                                if await confirm_btn.count() > 0 and await confirm_btn.is_visible():
+                                    await confirm_btn.click()
+                                    break
+
+                        await self.perform_backend_action('delete', delete_and_confirm)
                         return True
 
             return False
@@ -244,15 +270,13 @@ class DocumentsPage(BasePage):
                     # Try clicking document name first
                     name_element = doc['element'].locator(self.document_names).first
                     if await name_element.count() > 0:
-                        await name_element.click()
-                        await self.page.wait_for_timeout(2000)
+                        await self.perform_backend_action('view', name_element.click)
                         return True
 
                     # Alternative: find view button
                     view_btn = doc['element'].locator(self.view_button).first
                     if await view_btn.count() > 0 and await view_btn.is_visible():
-                        await view_btn.click()
-                        await self.page.wait_for_timeout(2000)
+                        await self.perform_backend_action('view', view_btn.click)
                         return True
 
             return False
@@ -325,9 +349,8 @@ class DocumentsPage(BasePage):
     async def count_documents(self) -> int:
         """Count total number of documents on the page"""
         try:
-            await self.page.wait_for_timeout(2000)
-            document_items = self.page.locator(self.document_items)
-            return await document_items.count()
+            await self.wait_for_backend('list', dom_selector=self.document_items)
+            return await self._document_snapshot().count()
 
         except:
             return 0
@@ -351,8 +374,11 @@ class DocumentsPage(BasePage):
         try:
             status_filter = self.page.locator(self.status_filter).first
             if await status_filter.count() > 0 and await status_filter.is_visible():
-                await status_filter.select_option(value=status)
-                await self.page.wait_for_timeout(2000)
+                await self.perform_backend_action(
+                    'list',
+                    lambda: status_filter.select_option(value=status),
+                    dom_selector=self.document_items
+                )
 
         except:
             pass
@@ -364,31 +390,15 @@ class DocumentsPage(BasePage):
 
             for doc in documents:
                 if document_name.lower() in doc['name'].lower():
-                    info = {
+                    # Size, date and type come from the same list snapshot
+                    return {
                         'name': doc['name'],
                         'status': await self.get_document_status(document_name),
-                        'size': '',
-                        'date': '',
-                        'type': ''
+                        'size': doc['size'],
+                        'date': doc['date'],
+                        'type': doc['type']
                     }
 
-                    # Get size if available
-                    size_element = doc['element'].locator(self.document_size).first
-                    if await size_element.count() > 0:
-                        info['size'] = await size_element.text_content() or ''
-
-                    # Get date if available
-                    date_element = doc['element'].locator(self.document_date).first
-                    if await date_element.count() > 0:
-                        info['date'] = await date_element.text_content() or ''
-
-                    # Get type if available
-                    type_element = doc['element'].locator(self.document_type).first
-                    if await type_element.count() > 0:
-                        info['type'] = await type_element.text_content() or ''
-
-                    return info
-
             return {'error': 'Document not found'}
 
         except:
@@ -401,9 +411,9 @@ class DocumentsPage(BasePage):
             deleted_count = 0
 
             for doc in documents:
+                # delete_document already waits for the delete response
                 if await self.delete_document(doc['name']):
                     deleted_count += 1
-                    await self.page.wait_for_timeout(1000)
 
             return deleted_count > 0
 
@@ -5,6 +5,8 @@ Comprehensive POM for WeSign templates functionality based on real codebase anal
 
 from playwright.async_api import Page, expect
 from .base_page import BasePage
+from utils.response_waits import BackendRequest
+from utils.table_snapshot import TableSnapshot
 import asyncio
 from pathlib import Path
 
@@ -77,6 +79,15 @@ class TemplatesPage(BasePage):
         self.error_messages = '.error, .alert-error, [role="alert"], .validation-error'
         self.success_messages = '.success, .alert-success, .success-message'
 
+        # Backend calls behind each action (WeSign UI API)
+        self.backend_requests = {
+            'upload': BackendRequest('templates.upload', 'POST', r'/userapi/ui/v3/templates'),
+            'list': BackendRequest('templates.list', 'GET', r'/userapi/ui/v3/templates(\?|$)'),
+            'search': BackendRequest('templates.search', 'GET', r'/userapi/ui/v3/templates(\?|$)'),
+            'delete': BackendRequest('templates.delete', 'DELETE|PUT', r'/userapi/ui/v3/templates/'),
+            'sign': BackendRequest('templates.sign', 'GET', r'/userapi/ui/v3/(templates|documentcollections)/.+')
+        }
+
     async def navigate_to_templates(self) -> None:
         """Navigate to templates page"""
         try:
@@ -121,7 +132,7 @@ class TemplatesPage(BasePage):
         try:
             add_button = self.page.locator(self.add_new_template_button).first
             await add_button.click()
-            await self.page.wait_for_timeout(1000)  # Wait for modal to appear
+            await self.page.locator(self.upload_template_modal).first.wait_for(state="visible", timeout=5000)
         except Exception as e:
             print(f"Error clicking add new template: {e}")
 
@@ -132,16 +143,18 @@ class TemplatesPage(BasePage):
                 print(f"File not found: {file_path}")
                 return False
 
-            # Look for file input
-            file_input = self.page.locator(self.file_input).first
-            await file_input.set_input_files(file_path)
+            async def submit_upload():
+                # Look for file input
+                file_input = self.page.locator(self.file_input).first
+                await file_input.set_input_files(file_path)
 
-            # Submit upload if submit button exists
-            submit_button = self.page.locator(self.upload_submit).first
-            if await submit_button.is_visible():
-                await submit_button.click()
+                # Submit upload if submit button exists
+                submit_button = self.page.locator(self.upload_submit).first
+                if await submit_button.is_visible():
+                    await submit_button.click()
 
-            await self.page.wait_for_timeout(2000)  # Wait for upload processing
+            # Returns once the upload response arrives
+            await self.perform_backend_action('upload', submit_upload, timeout=60000)
             return True
 
         except Exception as e:
@@ -154,41 +167,33 @@ class TemplatesPage(BasePage):
             search_box = self.page.locator(self.search_input).first
             await search_box.clear()
             await search_box.fill(search_term)
-            await search_box.press("Enter")
 
-            # Wait for search to complete
-            await self.page.wait_for_timeout(1000)
+            # Wait for the search response and re-rendered list
+            await self.perform_backend_action(
+                'search',
+                lambda: search_box.press("Enter"),
+                dom_selector=self.template_items
+            )
         except Exception as e:
             print(f"Error searching templates: {e}")
 
     async def get_templates_list(self) -> list:
         """Get list of templates"""
         try:
-            # Wait for templates to load
-            await self.page.wait_for_timeout(2000)
-
-            # Count template items
-            template_items = await self.page.locator(self.template_items).count()
-
-            templates = []
-            for i in range(template_items):
-                try:
-                    item = self.page.locator(self.template_items).nth(i)
-                    # Get template name/info if visible
-                    text_content = await item.inner_text()
-                    templates.append({
-                        'index': i,
-                        'name': text_content[:100] if text_content else f"Template_{i}",  # Truncate long names
-                        'visible': await item.is_visible()
-                    })
-                except:
-                    templates.append({
-                        'index': i,
-                        'name': f"Template_{i}",
-                        'visible': False
-                    })
-
-            return templates
+            # Wait for the templates list request (if still loading)
+            await self.wait_for_backend('list', dom_selector=self.template_items)
+
+            # All template items in one round trip
+            rows = await TableSnapshot(self.page, self.template_items).capture()
+
+            return [
+                {
+                    'index': row.index,
+                    'name': row.text[:100] if row.text else f"Template_{row.index}",  # Truncate long names
+                    'visible': row.visible
+                }
+                for row in rows
+            ]
         except Exception as e:
             print(f"Error getting templates list: {e}")
             return []
@@ -226,15 +231,19 @@ class TemplatesPage(BasePage):
         try:
             delete_button = self.page.locator(self.delete_batch_button).first
             if await delete_button.is_visible():
-                await delete_button.click()
-
-                # Confirm deletion
-                await self.page.wait_for_timeout(1000)
-                confirm_button = self.page.locator('button:has-text("Submit"), button:has-text("אישור")').first
-                if await confirm_button.is_visible():
-                    await confirm_button.click()
-
-                await self.page.wait_for_timeout(2000)  # Wait for deletion to complete
+                async def delete_and_confirm():
+                    await delete_button.click()
+
+                    # Confirm deletion
+                    confirm_button = self.page.locator('button:has-text("Submit"), button:has-text("אישור")').first
+                    try:
+                        await confirm_button.wait_for(state="visible", timeout=2000)
+                    except:
+                        pass
+                    if await confirm_button.is_visible():
+                        await confirm_button.click()
+
+                await self.perform_backend_action('delete', delete_and_confirm)
                 return True
 
         except Exception as e:
@@ -287,8 +296,7 @@ class TemplatesPage(BasePage):
         try:
             sign_button = self.page.locator(self.sign_button).first
             if await sign_button.is_visible() and not await sign_button.is_disabled():
-                await sign_button.click()
-                await self.page.wait_for_timeout(2000)
+                await self.perform_backend_action('sign', sign_button.click)
                 return True
         except Exception as e:
             print(f"Error clicking sign templates: {e}")
@@ -315,7 +323,7 @@ class TemplatesPage(BasePage):
                 # Press Escape key
                 await self.page.keyboard.press("Escape")
 
-            await self.page.wait_for_timeout(1000)
+            await self.page.locator(self.upload_template_modal).first.wait_for(state="hidden", timeout=5000)
         except Exception as e:
             print(f"Error closing upload modal: {e}")
 
@@ -359,8 +367,8 @@ class TemplatesPage(BasePage):
     async def wait_for_template_operation(self, timeout: int = 5000) -> None:
         """Wait for template operation to complete"""
         try:
-            # Wait for loading indicators to disappear
-            await self.page.wait_for_timeout(timeout)
+            # Wait for any in-flight templates request to finish
+            await self.wait_for_backend('list')
 
             # Check if any loading spinners are gone
             loading_elements = self.page.locator('.loading, .spinner, .uploading')
@@ -376,11 +376,24 @@ if __name__ == "__main__":
                        help="Target environment (default: dev)")
     parser.add_argument("--verbose", "-v", action="store_true",
                        help="Enable verbose output")
+    parser.add_argument("--stub", action="store_true",
+                       help="Run against a local WeSign API stand-in instead of the environment URL")
+    parser.add_argument("--stub-latency", default="fixed:0",
+                       help="Stand-in delay distribution, e.g. lognormal:80:40 (default: fixed:0)")
+    parser.add_argument("--stub-error-rate", type=float, default=0.0,
+                       help="Fraction of stand-in responses replaced by injected 500s")
 
     args = parser.parse_args()
 
+    stub_server = None
     try:
         runner = WeSignPythonAPITestRunner(args.env)
+        if args.stub:
+            from utils.wesign_stub_server import FaultProfile, LatencyModel, start_for_config
+            faults = FaultProfile(latency=LatencyModel.parse(args.stub_latency), error_rate=args.stub_error_rate)
+            stub_server = start_for_config(runner.config, faults)
+            runner.config.base_url = stub_server.url
+            print(f"Using local WeSign stand-in at {stub_server.url}")
         results = runner.run_comprehensive_tests(args.verbose)
 
         # Exit with appropriate code
@@ -389,4 +402,8 @@ if __name__ == "__main__":
 
     except Exception as e:
         print(f"[ERROR] API test runner failed: {str(e)}")
-        sys.exit(1)
\ No newline at end of file
+        sys.exit(1)
+
+    finally:
+        if stub_server is not None:
+            stub_server.stop()
\ No newline at end of file
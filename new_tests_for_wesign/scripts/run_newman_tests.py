@@ -61,13 +61,14 @@ def find_newman_executable():
     return None
 
 
-def run_newman_tests(environment='dev', verbose=False):
+def run_newman_tests(environment='dev', verbose=False, stub=False):
     """
     Run Newman API tests
 
     Args:
         environment: Target environment
         verbose: Enable verbose output
+        stub: Run the collection against a local WeSign API stand-in
 
     Returns:
         bool: True if tests passed, False otherwise
@@ -117,6 +118,7 @@ def run_newman_tests(environment='dev', verbose=False):
     # Prepare Newman command
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     html_report = reports_path / f"newman_api_tests_{environment}_{timestamp}.html"
+    json_report = reports_path / f"newman_api_tests_{environment}_{timestamp}.json"
 
     # Build command based on whether we're using npx or direct newman
     if newman_cmd.startswith('npx'):
@@ -128,8 +130,9 @@ def run_newman_tests(environment='dev', verbose=False):
         '--environment', str(env_file),
         '--delay-request', '1000',
         '--timeout-request', str(config.timeouts.default),
-        '--reporters', 'cli,html',
-        '--reporter-html-export', str(html_report)
+        '--reporters', 'cli,html,json',
+        '--reporter-html-export', str(html_report),
+        '--reporter-json-export', str(json_report)
     ])
 
     if verbose:
@@ -137,6 +140,19 @@ def run_newman_tests(environment='dev', verbose=False):
     else:
         cmd.extend(['--color', 'off'])
 
+    stub_server = None
+    if stub:
+        from utils.wesign_stub_server import start_for_config
+        stub_server = start_for_config(config)
+        print(f"Using local WeSign stand-in at {stub_server.url}")
+        cmd.extend([
+            '--env-var', f'baseUrl={stub_server.url}',
+            '--env-var', f'loginEmail={config.company_user.email}',
+            '--env-var', f'loginPassword={config.company_user.password}',
+            '--env-var', f'test_email={config.company_user.email}',
+            '--env-var', f'test_password={config.company_user.password}'
+        ])
+
     print(f"Command: {' '.join(cmd[:3])} [collection] [options...]")
     print("Running Newman tests...")
     print("-" * 40)
@@ -162,6 +178,7 @@ def run_newman_tests(environment='dev', verbose=False):
         if result.returncode == 0:
             print("[SUCCESS] Newman API tests completed successfully!")
             print(f"HTML report saved to: {html_report}")
+            print(f"JSON report saved to: {json_report}")
             return True
         else:
             print(f"[FAILED] Newman tests failed (exit code: {result.returncode})")
@@ -173,6 +190,9 @@ def run_newman_tests(environment='dev', verbose=False):
     except Exception as e:
         print(f"[ERROR] Failed to run Newman tests: {str(e)}")
         return False
+    finally:
+        if stub_server is not None:
+            stub_server.stop()
 
 
 def validate_newman_setup():
@@ -252,6 +272,8 @@ if __name__ == "__main__":
                        help="Enable verbose output")
     parser.add_argument("--validate", action="store_true",
                        help="Validate Newman setup")
+    parser.add_argument("--stub", action="store_true",
+                       help="Run against a local WeSign API stand-in instead of the environment URL")
 
     args = parser.parse_args()
 
@@ -259,5 +281,5 @@ if __name__ == "__main__":
         success = validate_newman_setup()
         sys.exit(0 if success else 1)
 
-    success = run_newman_tests(args.env, args.verbose)
+    success = run_newman_tests(args.env, args.verbose, args.stub)
     sys.exit(0 if success else 1)
\ No newline at end of file
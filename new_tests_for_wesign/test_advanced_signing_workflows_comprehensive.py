@@ -3,7 +3,7 @@
 import pytest
 import tempfile
 import os
-from playwright.async_api import async_playwright
+from utils.browser_pool import pooled_playwright
 from pages.auth_page import AuthPage
 from pages.self_signing_page import SelfSigningPage
 from pages.documents_page import DocumentsPage
@@ -19,7 +19,7 @@ class TestAdvancedSigningWorkflows:
     @pytest.mark.asyncio
     async def test_complete_self_signing_workflow_pdf(self):
         """Test 1: Complete self-signing workflow with PDF document"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox', '--disable-dev-shm-usage'])
             page = await browser.new_page()
 
@@ -89,7 +89,7 @@ class TestAdvancedSigningWorkflows:
     @pytest.mark.asyncio
     async def test_self_signing_with_different_signature_types(self):
         """Test 2: Self-signing with different signature types"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -166,7 +166,7 @@ class TestAdvancedSigningWorkflows:
     @pytest.mark.asyncio
     async def test_multi_page_document_signing(self):
         """Test 3: Multi-page document signing with fields on different pages"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -232,7 +232,7 @@ class TestAdvancedSigningWorkflows:
     @pytest.mark.asyncio
     async def test_group_signing_workflow_setup(self):
         """Test 4: Group signing workflow setup and configuration"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -300,7 +300,7 @@ class TestAdvancedSigningWorkflows:
     @pytest.mark.asyncio
     async def test_sequential_vs_parallel_signing(self):
         """Test 5: Sequential vs parallel signing workflow comparison"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -375,7 +375,7 @@ class TestAdvancedSigningWorkflows:
     @pytest.mark.asyncio
     async def test_conditional_signing_workflows(self):
         """Test 6: Conditional and approval-based signing workflows"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -437,7 +437,7 @@ class TestAdvancedSigningWorkflows:
     @pytest.mark.asyncio
     async def test_signing_with_attachments_and_metadata(self):
         """Test 7: Signing with attachments and document metadata"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -525,7 +525,7 @@ class TestAdvancedSigningWorkflows:
     @pytest.mark.asyncio
     async def test_signing_audit_trail_and_verification(self):
         """Test 8: Signing audit trail and document verification"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -605,7 +605,7 @@ class TestAdvancedSigningWorkflows:
     @pytest.mark.asyncio
     async def test_mobile_signing_simulation(self):
         """Test 9: Mobile signing workflow simulation"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             # Simulate mobile device
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             context = await browser.new_context(
@@ -668,7 +668,7 @@ class TestAdvancedSigningWorkflows:
     @pytest.mark.asyncio
     async def test_signing_workflow_error_recovery(self):
         """Test 10: Signing workflow error handling and recovery"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
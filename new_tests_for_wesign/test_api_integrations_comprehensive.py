@@ -6,7 +6,7 @@ import json
 import tempfile
 import os
 from datetime import datetime
-from playwright.async_api import async_playwright
+from utils.browser_pool import pooled_playwright
 from pages.auth_page import AuthPage
 from pages.dashboard_page import DashboardPage
 
@@ -17,7 +17,7 @@ class TestAPIIntegrationsComprehensive:
     @pytest.mark.asyncio
     async def test_api_settings_and_configuration_page(self):
         """Test 1: API settings and configuration page navigation"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox', '--disable-dev-shm-usage'])
             page = await browser.new_page()
 
@@ -121,7 +121,7 @@ class TestAPIIntegrationsComprehensive:
     @pytest.mark.asyncio
     async def test_api_key_generation_and_management(self):
         """Test 2: API key generation and management functionality"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -243,7 +243,7 @@ class TestAPIIntegrationsComprehensive:
     @pytest.mark.asyncio
     async def test_webhook_configuration_and_endpoints(self):
         """Test 3: Webhook configuration and endpoint management"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -387,7 +387,7 @@ class TestAPIIntegrationsComprehensive:
     @pytest.mark.asyncio
     async def test_api_documentation_and_endpoints_access(self):
         """Test 4: API documentation and endpoints accessibility"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -532,7 +532,7 @@ class TestAPIIntegrationsComprehensive:
     @pytest.mark.asyncio
     async def test_third_party_integration_settings(self):
         """Test 5: Third-party integration configuration and settings"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -661,7 +661,7 @@ class TestAPIIntegrationsComprehensive:
     @pytest.mark.asyncio
     async def test_api_security_and_permissions(self):
         """Test 6: API security settings and permission management"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -825,7 +825,7 @@ class TestAPIIntegrationsComprehensive:
     @pytest.mark.asyncio
     async def test_webhook_delivery_and_retry_mechanisms(self):
         """Test 7: Webhook delivery, retry mechanisms, and failure handling"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -991,7 +991,7 @@ class TestAPIIntegrationsComprehensive:
     @pytest.mark.asyncio
     async def test_api_testing_and_monitoring_tools(self):
         """Test 8: API testing tools and monitoring capabilities"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -1158,7 +1158,7 @@ class TestAPIIntegrationsComprehensive:
     @pytest.mark.asyncio
     async def test_api_integration_business_logic_boundaries(self):
         """Test 9: API integration business logic boundaries and edge cases"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -1284,7 +1284,7 @@ class TestAPIIntegrationsComprehensive:
     @pytest.mark.asyncio
     async def test_comprehensive_api_workflow_integration(self):
         """Test 10: Comprehensive API and webhook workflow integration"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
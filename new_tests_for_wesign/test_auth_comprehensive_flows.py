@@ -4,12 +4,16 @@ import pytest
 import asyncio
 import tempfile
 import os
-from playwright.async_api import async_playwright
+from utils.browser_pool import pooled_playwright
 from pages.auth_page import AuthPage
 from pages.dashboard_page import DashboardPage
 from utils.smart_waits import WeSignSmartWaits
 
 
+# Login tests must exercise the form, not a cached session
+pytestmark = pytest.mark.real_login
+
+
 class TestAuthenticationComprehensive:
     """Comprehensive authentication test suite covering all auth scenarios"""
 
@@ -24,7 +28,7 @@ class TestAuthenticationComprehensive:
     @pytest.mark.asyncio
     async def test_auth_valid_company_user_login(self):
         """Test 1: Valid company user login flow"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox', '--disable-dev-shm-usage'])
             page = await browser.new_page()
 
@@ -46,7 +50,7 @@ class TestAuthenticationComprehensive:
     @pytest.mark.asyncio
     async def test_auth_basic_user_permissions(self):
         """Test 2: Basic user with limited permissions"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -69,7 +73,7 @@ class TestAuthenticationComprehensive:
     @pytest.mark.asyncio
     async def test_auth_invalid_credentials_rejection(self):
         """Test 3: Invalid credentials are properly rejected"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -91,7 +95,7 @@ class TestAuthenticationComprehensive:
     @pytest.mark.asyncio
     async def test_auth_form_validation_empty_fields(self):
         """Test 4: Form validation for empty fields"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -119,7 +123,7 @@ class TestAuthenticationComprehensive:
     @pytest.mark.asyncio
     async def test_auth_email_format_validation(self):
         """Test 5: Email format validation"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -152,7 +156,7 @@ class TestAuthenticationComprehensive:
     @pytest.mark.asyncio
     async def test_auth_hebrew_interface_detection(self):
         """Test 6: Hebrew interface detection and RTL layout"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -175,7 +179,7 @@ class TestAuthenticationComprehensive:
     @pytest.mark.asyncio
     async def test_auth_english_interface_detection(self):
         """Test 7: English interface detection and LTR layout"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -198,7 +202,7 @@ class TestAuthenticationComprehensive:
     @pytest.mark.asyncio
     async def test_auth_language_switching(self):
         """Test 8: Language switching functionality"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -230,7 +234,7 @@ class TestAuthenticationComprehensive:
     @pytest.mark.asyncio
     async def test_auth_session_persistence(self):
         """Test 9: Session persistence after page refresh"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -258,7 +262,7 @@ class TestAuthenticationComprehensive:
     @pytest.mark.asyncio
     async def test_auth_concurrent_sessions(self):
         """Test 10: Multiple concurrent sessions behavior"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser1 = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             browser2 = await p.chromium.launch(headless=True, args=['--no-sandbox'])
 
@@ -287,7 +291,7 @@ class TestAuthenticationComprehensive:
     @pytest.mark.asyncio
     async def test_auth_password_security_requirements(self):
         """Test 11: Password security requirements during registration flow"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -320,7 +324,7 @@ class TestAuthenticationComprehensive:
     @pytest.mark.asyncio
     async def test_auth_protected_route_redirect(self):
         """Test 12: Protected route redirect to login"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -350,7 +354,7 @@ class TestAuthenticationComprehensive:
     @pytest.mark.asyncio
     async def test_auth_post_login_redirect(self):
         """Test 13: Correct redirect after successful login"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -380,7 +384,7 @@ class TestAuthenticationComprehensive:
     @pytest.mark.asyncio
     async def test_auth_network_failure_handling(self):
         """Test 14: Handling network failures during auth"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -409,7 +413,7 @@ class TestAuthenticationComprehensive:
     @pytest.mark.asyncio
     async def test_auth_browser_back_button_behavior(self):
         """Test 15: Browser back button behavior in auth flow"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -438,7 +442,7 @@ class TestAuthenticationComprehensive:
     @pytest.mark.asyncio
     async def test_auth_comprehensive_workflow_integration(self):
         """Test 16: Complete authentication workflow with all validations"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
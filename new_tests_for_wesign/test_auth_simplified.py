@@ -1,15 +1,19 @@
 """Simplified authentication test using Page Object Models"""
 
 import pytest
-from playwright.async_api import async_playwright
+from utils.browser_pool import pooled_playwright
 from pages.auth_page import AuthPage
 from pages.dashboard_page import DashboardPage
 
 
+# Login tests must exercise the form, not a cached session
+pytestmark = pytest.mark.real_login
+
+
 @pytest.mark.asyncio
 async def test_auth_with_page_objects():
     """Test authentication using our Page Object Models"""
-    async with async_playwright() as p:
+    async with pooled_playwright() as p:
         try:
             print("Starting authentication test with Page Objects...")
 
@@ -74,7 +78,7 @@ async def test_auth_with_page_objects():
 @pytest.mark.asyncio
 async def test_invalid_credentials():
     """Test authentication with invalid credentials"""
-    async with async_playwright() as p:
+    async with pooled_playwright() as p:
         try:
             print("Testing invalid credentials...")
 
@@ -112,7 +116,7 @@ async def test_invalid_credentials():
 @pytest.mark.asyncio
 async def test_form_validation():
     """Test form validation"""
-    async with async_playwright() as p:
+    async with pooled_playwright() as p:
         try:
             print("Testing form validation...")
 
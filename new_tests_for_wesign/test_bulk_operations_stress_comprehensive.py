@@ -4,7 +4,7 @@ import pytest
 import asyncio
 import tempfile
 import os
-from playwright.async_api import async_playwright
+from utils.browser_pool import pooled_playwright
 from pages.auth_page import AuthPage
 from pages.documents_page import DocumentsPage
 from pages.templates_page import TemplatesPage
@@ -22,7 +22,7 @@ class TestBulkOperationsStress:
     @pytest.mark.asyncio
     async def test_bulk_document_upload_performance(self):
         """Test 1: Bulk document upload performance"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox', '--disable-dev-shm-usage'])
             page = await browser.new_page()
 
@@ -92,7 +92,7 @@ class TestBulkOperationsStress:
     @pytest.mark.asyncio
     async def test_concurrent_document_operations(self):
         """Test 2: Concurrent document operations stress test"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -149,7 +149,7 @@ class TestBulkOperationsStress:
     @pytest.mark.asyncio
     async def test_large_document_list_performance(self):
         """Test 3: Large document list handling performance"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -219,7 +219,7 @@ class TestBulkOperationsStress:
     @pytest.mark.asyncio
     async def test_bulk_template_management(self):
         """Test 4: Bulk template creation and management"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -288,7 +288,7 @@ class TestBulkOperationsStress:
     @pytest.mark.asyncio
     async def test_memory_usage_stress(self):
         """Test 5: Memory usage and stability under stress"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -335,7 +335,7 @@ class TestBulkOperationsStress:
     @pytest.mark.asyncio
     async def test_network_resilience_stress(self):
         """Test 6: Network resilience and error recovery"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -390,7 +390,7 @@ class TestBulkOperationsStress:
     @pytest.mark.asyncio
     async def test_concurrent_user_simulation(self):
         """Test 7: Simulate concurrent user behavior"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             # Create multiple browser contexts to simulate different users
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
 
@@ -457,7 +457,7 @@ class TestBulkOperationsStress:
     @pytest.mark.asyncio
     async def test_data_integrity_stress(self):
         """Test 8: Data integrity under stress conditions"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -521,7 +521,7 @@ class TestBulkOperationsStress:
     @pytest.mark.asyncio
     async def test_performance_benchmarking(self):
         """Test 9: Comprehensive performance benchmarking"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -592,7 +592,7 @@ class TestBulkOperationsStress:
     @pytest.mark.asyncio
     async def test_long_running_session_stability(self):
         """Test 10: Long-running session stability"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -1,17 +1,21 @@
 """Comprehensive Authentication Tests - Adapted for Direct Execution"""
 
 import pytest
-from playwright.async_api import async_playwright
+from utils.browser_pool import pooled_playwright
 from pages.auth_page import AuthPage
 from pages.dashboard_page import DashboardPage
 
 
+# Login tests must exercise the form, not a cached session
+pytestmark = pytest.mark.real_login
+
+
 class TestAuthenticationComprehensive:
     """Comprehensive authentication test suite using direct browser initialization"""
 
     async def setup_browser_and_auth_page(self):
         """Setup browser and return auth page"""
-        p = await async_playwright().__aenter__()
+        p = await pooled_playwright().__aenter__()
         browser = await p.chromium.launch(
             headless=True,
             timeout=15000,
@@ -23,7 +23,8 @@ Version: 1.0.0
 
 import asyncio
 import pytest
-from playwright.async_api import async_playwright, Page, Browser, BrowserContext
+from playwright.async_api import Page, Browser, BrowserContext
+from utils.browser_pool import pooled_playwright
 import os
 import time
 import json
@@ -83,7 +84,7 @@ class TestCrossModuleIntegrationComprehensive:
 
     async def setup_method(self):
         """Enhanced setup for cross-module integration testing"""
-        playwright = await async_playwright().start()
+        playwright = await pooled_playwright().start()
         self.browser = await playwright.chromium.launch(
             headless=False,
             args=['--no-sandbox', '--disable-dev-shm-usage']
@@ -179,7 +180,7 @@ class TestCrossModuleIntegrationComprehensive:
         Group Signing → API Webhooks → Reports → Analytics
         """
         # Setup browser
-        playwright = await async_playwright().start()
+        playwright = await pooled_playwright().start()
         self.browser = await playwright.chromium.launch(
             headless=False,
             args=['--no-sandbox', '--disable-dev-shm-usage']
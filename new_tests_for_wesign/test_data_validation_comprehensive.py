@@ -27,7 +27,7 @@ import pytest
 import asyncio
 import tempfile
 import os
-from playwright.async_api import async_playwright
+from utils.browser_pool import pooled_playwright
 from pages.auth_page import AuthPage
 from pages.contacts_page import ContactsPage
 from pages.documents_page import DocumentsPage
@@ -47,7 +47,7 @@ class TestDataValidationComprehensive:
     @pytest.mark.asyncio
     async def test_email_format_validation_contact_form(self):
         """Test email format validation in contact forms"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -103,7 +103,7 @@ class TestDataValidationComprehensive:
     @pytest.mark.asyncio
     async def test_email_validation_login_form(self):
         """Test email validation in login form"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -143,7 +143,7 @@ class TestDataValidationComprehensive:
     @pytest.mark.asyncio
     async def test_phone_number_format_validation(self):
         """Test phone number format validation for SMS preferences"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -201,7 +201,7 @@ class TestDataValidationComprehensive:
     @pytest.mark.asyncio
     async def test_file_upload_type_restrictions(self):
         """Test file upload type restrictions and security"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -273,7 +273,7 @@ class TestDataValidationComprehensive:
     @pytest.mark.asyncio
     async def test_file_size_limitations(self):
         """Test file size limitations and validation"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -328,7 +328,7 @@ class TestDataValidationComprehensive:
     @pytest.mark.asyncio
     async def test_search_input_sanitization(self):
         """Test search input sanitization against XSS and injection attacks"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -385,7 +385,7 @@ class TestDataValidationComprehensive:
     @pytest.mark.asyncio
     async def test_date_range_validation_logic(self):
         """Test date range validation logic (from date <= to date)"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -473,7 +473,7 @@ class TestDataValidationComprehensive:
     @pytest.mark.asyncio
     async def test_bulk_operation_limits_and_safeguards(self):
         """Test bulk operation limits and safeguards"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -533,7 +533,7 @@ class TestDataValidationComprehensive:
     @pytest.mark.asyncio
     async def test_cross_field_validation_dependencies(self):
         """Test validation dependencies between related fields"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -608,7 +608,7 @@ class TestDataValidationComprehensive:
     @pytest.mark.asyncio
     async def test_comprehensive_data_validation_integration(self):
         """Comprehensive test of all data validation systems working together"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -1,13 +1,13 @@
 """Direct authentication test without complex fixtures"""
 
 import pytest
-from playwright.async_api import async_playwright
+from utils.browser_pool import pooled_playwright
 
 
 @pytest.mark.asyncio
 async def test_direct_authentication():
     """Test direct authentication to WeSign"""
-    async with async_playwright() as p:
+    async with pooled_playwright() as p:
         try:
             print("Launching browser...")
             browser = await p.chromium.launch(
@@ -3,7 +3,7 @@
 import pytest
 import tempfile
 import os
-from playwright.async_api import async_playwright
+from utils.browser_pool import pooled_playwright
 from pages.auth_page import AuthPage
 from pages.documents_page import DocumentsPage
 
@@ -11,7 +11,7 @@ from pages.documents_page import DocumentsPage
 @pytest.mark.asyncio
 async def test_documents_navigation():
     """Test navigation to documents page"""
-    async with async_playwright() as p:
+    async with pooled_playwright() as p:
         try:
             print("Testing documents navigation...")
 
@@ -65,7 +65,7 @@ async def test_documents_navigation():
 @pytest.mark.asyncio
 async def test_document_upload():
     """Test document upload functionality"""
-    async with async_playwright() as p:
+    async with pooled_playwright() as p:
         try:
             print("Testing document upload...")
 
@@ -143,7 +143,7 @@ async def test_document_upload():
 @pytest.mark.asyncio
 async def test_document_search():
     """Test document search functionality"""
-    async with async_playwright() as p:
+    async with pooled_playwright() as p:
         try:
             print("Testing document search...")
 
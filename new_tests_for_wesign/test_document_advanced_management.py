@@ -22,7 +22,7 @@ Critical Gap Areas Addressed:
 
 import pytest
 import asyncio
-from playwright.async_api import async_playwright
+from utils.browser_pool import pooled_playwright
 from pages.auth_page import AuthPage
 from pages.documents_page import DocumentsPage
 from pages.dashboard_page import DashboardPage
@@ -42,7 +42,7 @@ class TestAdvancedDocumentManagement:
     @pytest.mark.asyncio
     async def test_document_status_filter_all_documents(self):
         """Test filtering documents by 'All documents' status"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -77,7 +77,7 @@ class TestAdvancedDocumentManagement:
     @pytest.mark.asyncio
     async def test_document_status_filter_pending(self):
         """Test filtering documents by 'Pending' status"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -110,7 +110,7 @@ class TestAdvancedDocumentManagement:
     @pytest.mark.asyncio
     async def test_document_status_filter_signed(self):
         """Test filtering documents by 'Signed' status"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -140,7 +140,7 @@ class TestAdvancedDocumentManagement:
     @pytest.mark.asyncio
     async def test_document_status_filter_declined_and_canceled(self):
         """Test filtering by Declined and Canceled statuses"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -177,7 +177,7 @@ class TestAdvancedDocumentManagement:
     @pytest.mark.asyncio
     async def test_document_search_by_document_name(self):
         """Test searching documents by document name"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -213,7 +213,7 @@ class TestAdvancedDocumentManagement:
     @pytest.mark.asyncio
     async def test_document_search_criteria_switching(self):
         """Test switching between search criteria (Document Name, Signer Details, Sender Details)"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -249,7 +249,7 @@ class TestAdvancedDocumentManagement:
     @pytest.mark.asyncio
     async def test_document_date_range_filtering(self):
         """Test filtering documents by date range"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -288,7 +288,7 @@ class TestAdvancedDocumentManagement:
     @pytest.mark.asyncio
     async def test_document_rows_per_page_configuration(self):
         """Test changing rows per page setting (10, 25, 50)"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -326,7 +326,7 @@ class TestAdvancedDocumentManagement:
     @pytest.mark.asyncio
     async def test_document_pagination_navigation(self):
         """Test pagination navigation controls"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -361,7 +361,7 @@ class TestAdvancedDocumentManagement:
     @pytest.mark.asyncio
     async def test_document_bulk_selection(self):
         """Test bulk document selection with checkboxes"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -397,7 +397,7 @@ class TestAdvancedDocumentManagement:
     @pytest.mark.asyncio
     async def test_document_select_all_functionality(self):
         """Test select all documents functionality"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -438,7 +438,7 @@ class TestAdvancedDocumentManagement:
     @pytest.mark.asyncio
     async def test_document_action_buttons_availability(self):
         """Test availability of document action buttons (View, Edit, Delete, Download, etc.)"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -477,7 +477,7 @@ class TestAdvancedDocumentManagement:
     @pytest.mark.asyncio
     async def test_document_export_to_excel_functionality(self):
         """Test document export to Excel functionality"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -511,7 +511,7 @@ class TestAdvancedDocumentManagement:
     @pytest.mark.asyncio
     async def test_document_status_persistence_across_filters(self):
         """Test that document statuses persist correctly when switching between filters"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -556,7 +556,7 @@ class TestAdvancedDocumentManagement:
     @pytest.mark.asyncio
     async def test_document_comprehensive_workflow_integration(self):
         """Test comprehensive document management workflow integration"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
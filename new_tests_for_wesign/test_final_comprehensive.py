@@ -3,7 +3,7 @@
 import pytest
 import tempfile
 import os
-from playwright.async_api import async_playwright
+from utils.browser_pool import pooled_playwright
 from pages.auth_page import AuthPage
 from pages.dashboard_page import DashboardPage
 from pages.documents_page import DocumentsPage
@@ -17,7 +17,7 @@ class TestWeSignComprehensive:
     @pytest.mark.asyncio
     async def test_auth_valid_login_success(self):
         """Test 1: Valid login with company credentials"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -35,7 +35,7 @@ class TestWeSignComprehensive:
     @pytest.mark.asyncio
     async def test_auth_invalid_credentials(self):
         """Test 2: Invalid credentials rejection"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -52,7 +52,7 @@ class TestWeSignComprehensive:
     @pytest.mark.asyncio
     async def test_auth_form_validation(self):
         """Test 3: Empty field validation"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -69,7 +69,7 @@ class TestWeSignComprehensive:
     @pytest.mark.asyncio
     async def test_auth_language_detection(self):
         """Test 4: Multi-language interface detection"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -87,7 +87,7 @@ class TestWeSignComprehensive:
     @pytest.mark.asyncio
     async def test_auth_user_permissions(self):
         """Test 5: User permissions detection"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -109,7 +109,7 @@ class TestWeSignComprehensive:
     @pytest.mark.asyncio
     async def test_docs_navigation(self):
         """Test 6: Documents page navigation"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -133,7 +133,7 @@ class TestWeSignComprehensive:
     @pytest.mark.asyncio
     async def test_docs_pdf_upload(self):
         """Test 7: PDF document upload"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -174,7 +174,7 @@ class TestWeSignComprehensive:
     @pytest.mark.asyncio
     async def test_docs_search_functionality(self):
         """Test 8: Document search"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -197,7 +197,7 @@ class TestWeSignComprehensive:
     @pytest.mark.asyncio
     async def test_docs_list_operations(self):
         """Test 9: Document list operations"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -230,7 +230,7 @@ class TestWeSignComprehensive:
     @pytest.mark.asyncio
     async def test_docs_multiple_formats(self):
         """Test 10: Multiple document format handling"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -275,7 +275,7 @@ class TestWeSignComprehensive:
     @pytest.mark.asyncio
     async def test_comprehensive_workflow(self):
         """Test 11: Complete user workflow"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -324,7 +324,7 @@ class TestWeSignComprehensive:
     @pytest.mark.asyncio
     async def test_error_handling_scenarios(self):
         """Test 12: Error handling and edge cases"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -362,7 +362,7 @@ class TestWeSignComprehensive:
     @pytest.mark.asyncio
     async def test_performance_and_stability(self):
         """Test 13: Performance and stability"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -5,7 +5,7 @@ import asyncio
 import tempfile
 import os
 from datetime import datetime, timedelta
-from playwright.async_api import async_playwright
+from utils.browser_pool import pooled_playwright
 from pages.auth_page import AuthPage
 from pages.dashboard_page import DashboardPage
 
@@ -16,7 +16,7 @@ class TestGroupSigningComprehensive:
     @pytest.mark.asyncio
     async def test_group_signing_page_navigation_and_setup(self):
         """Test 1: Group signing page navigation and initial setup"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox', '--disable-dev-shm-usage'])
             page = await browser.new_page()
 
@@ -108,7 +108,7 @@ class TestGroupSigningComprehensive:
     @pytest.mark.asyncio
     async def test_document_upload_for_group_signing(self):
         """Test 2: Document upload specifically for group signing workflow"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -200,7 +200,7 @@ class TestGroupSigningComprehensive:
     @pytest.mark.asyncio
     async def test_signer_assignment_and_management(self):
         """Test 3: Signer assignment and management functionality"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -311,7 +311,7 @@ class TestGroupSigningComprehensive:
     @pytest.mark.asyncio
     async def test_signing_order_and_workflow_configuration(self):
         """Test 4: Signing order and workflow sequence configuration"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -424,7 +424,7 @@ class TestGroupSigningComprehensive:
     @pytest.mark.asyncio
     async def test_signature_field_assignment_per_signer(self):
         """Test 5: Signature field assignment and positioning per signer"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -529,7 +529,7 @@ class TestGroupSigningComprehensive:
     @pytest.mark.asyncio
     async def test_group_signing_workflow_initiation(self):
         """Test 6: Group signing workflow initiation and sending"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -641,7 +641,7 @@ class TestGroupSigningComprehensive:
     @pytest.mark.asyncio
     async def test_group_signing_progress_tracking(self):
         """Test 7: Group signing progress tracking and monitoring"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -748,7 +748,7 @@ class TestGroupSigningComprehensive:
     @pytest.mark.asyncio
     async def test_group_signing_reminder_and_escalation(self):
         """Test 8: Group signing reminder and escalation functionality"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -874,7 +874,7 @@ class TestGroupSigningComprehensive:
     @pytest.mark.asyncio
     async def test_group_signing_completion_and_finalization(self):
         """Test 9: Group signing completion and document finalization"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -993,7 +993,7 @@ class TestGroupSigningComprehensive:
     @pytest.mark.asyncio
     async def test_group_signing_error_handling_and_edge_cases(self):
         """Test 10: Group signing error handling and edge cases"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -27,7 +27,7 @@ import pytest
 import asyncio
 import tempfile
 import os
-from playwright.async_api import async_playwright
+from utils.browser_pool import pooled_playwright
 from pages.auth_page import AuthPage
 from pages.contacts_page import ContactsPage
 from pages.documents_page import DocumentsPage
@@ -49,7 +49,7 @@ class TestCrossModuleIntegration:
     @pytest.mark.asyncio
     async def test_contact_to_document_signing_workflow(self):
         """Test complete workflow from contact management to document signing"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -112,7 +112,7 @@ class TestCrossModuleIntegration:
     @pytest.mark.asyncio
     async def test_contact_data_consistency_across_modules(self):
         """Test that contact data remains consistent when accessed from different modules"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -168,7 +168,7 @@ class TestCrossModuleIntegration:
     @pytest.mark.asyncio
     async def test_template_to_document_creation_workflow(self):
         """Test template integration with document creation workflow"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -236,7 +236,7 @@ class TestCrossModuleIntegration:
     @pytest.mark.asyncio
     async def test_excel_import_export_cross_module_consistency(self):
         """Test Excel import/export functionality consistency across modules"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -320,7 +320,7 @@ class TestCrossModuleIntegration:
     @pytest.mark.asyncio
     async def test_multi_language_consistency_across_modules(self):
         """Test multi-language interface consistency across all modules"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -413,7 +413,7 @@ class TestCrossModuleIntegration:
     @pytest.mark.asyncio
     async def test_authentication_state_persistence_across_modules(self):
         """Test user authentication state persistence across all modules"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -514,7 +514,7 @@ class TestCrossModuleIntegration:
     @pytest.mark.asyncio
     async def test_comprehensive_cross_module_integration_workflow(self):
         """Comprehensive test of all major cross-module integrations"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
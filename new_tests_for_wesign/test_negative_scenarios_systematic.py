@@ -4,7 +4,7 @@ import pytest
 import asyncio
 import tempfile
 import os
-from playwright.async_api import async_playwright
+from utils.browser_pool import pooled_playwright
 from pages.auth_page import AuthPage
 from pages.dashboard_page import DashboardPage
 from utils.smart_waits import WeSignSmartWaits
@@ -21,7 +21,7 @@ class TestNegativeSystematicScenarios:
     @pytest.mark.asyncio
     async def test_invalid_credentials_must_fail(self):
         """CRITICAL: Test MUST fail with invalid credentials - prevents false positives"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -58,7 +58,7 @@ class TestNegativeSystematicScenarios:
     @pytest.mark.asyncio
     async def test_empty_credentials_must_fail(self):
         """CRITICAL: Test MUST fail with empty credentials"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -88,7 +88,7 @@ class TestNegativeSystematicScenarios:
     @pytest.mark.asyncio
     async def test_malformed_email_must_fail(self):
         """CRITICAL: Test MUST fail with malformed email addresses"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -130,7 +130,7 @@ class TestNegativeSystematicScenarios:
     @pytest.mark.asyncio
     async def test_sql_injection_attempts_must_fail(self):
         """CRITICAL: Test MUST fail and reject SQL injection attempts"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -170,7 +170,7 @@ class TestNegativeSystematicScenarios:
     @pytest.mark.asyncio
     async def test_xss_attempts_must_fail(self):
         """CRITICAL: Test MUST fail and reject XSS attempts"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -209,7 +209,7 @@ class TestNegativeSystematicScenarios:
     @pytest.mark.asyncio
     async def test_rate_limiting_behavior(self):
         """Test rapid login attempts to verify rate limiting exists"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -250,7 +250,7 @@ class TestNegativeSystematicScenarios:
     @pytest.mark.asyncio
     async def test_direct_dashboard_access_must_redirect(self):
         """CRITICAL: Direct dashboard access without auth MUST redirect to login"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -276,7 +276,7 @@ class TestNegativeSystematicScenarios:
     @pytest.mark.asyncio
     async def test_session_timeout_behavior(self):
         """Test session timeout behavior (simulated)"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -315,7 +315,7 @@ class TestNegativeSystematicScenarios:
     @pytest.mark.asyncio
     async def test_concurrent_session_handling(self):
         """Test behavior with concurrent sessions"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser1 = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             browser2 = await p.chromium.launch(headless=True, args=['--no-sandbox'])
 
@@ -348,7 +348,7 @@ class TestNegativeSystematicScenarios:
     @pytest.mark.asyncio
     async def test_password_field_security(self):
         """Test password field security features"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
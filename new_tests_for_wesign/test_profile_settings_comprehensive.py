@@ -4,7 +4,7 @@ import pytest
 import asyncio
 import tempfile
 import os
-from playwright.async_api import async_playwright
+from utils.browser_pool import pooled_playwright
 from pages.auth_page import AuthPage
 from pages.dashboard_page import DashboardPage
 
@@ -15,7 +15,7 @@ class TestProfileSettingsComprehensive:
     @pytest.mark.asyncio
     async def test_profile_page_navigation_and_layout(self):
         """Test 1: Profile page navigation and UI layout validation"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox', '--disable-dev-shm-usage'])
             page = await browser.new_page()
 
@@ -65,7 +65,7 @@ class TestProfileSettingsComprehensive:
     @pytest.mark.asyncio
     async def test_profile_information_update(self):
         """Test 2: Profile information update functionality"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -155,7 +155,7 @@ class TestProfileSettingsComprehensive:
     @pytest.mark.asyncio
     async def test_language_settings_configuration(self):
         """Test 3: Language and localization settings"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -232,7 +232,7 @@ class TestProfileSettingsComprehensive:
     @pytest.mark.asyncio
     async def test_signature_preferences_settings(self):
         """Test 4: Signature color and preferences configuration"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -313,7 +313,7 @@ class TestProfileSettingsComprehensive:
     @pytest.mark.asyncio
     async def test_notification_reminder_settings(self):
         """Test 5: Notification and reminder frequency settings"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -399,7 +399,7 @@ class TestProfileSettingsComprehensive:
     @pytest.mark.asyncio
     async def test_password_change_functionality(self):
         """Test 6: Password change and security settings"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -481,7 +481,7 @@ class TestProfileSettingsComprehensive:
     @pytest.mark.asyncio
     async def test_phone_number_update_modal(self):
         """Test 7: Phone number update functionality (modal-based)"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -574,7 +574,7 @@ class TestProfileSettingsComprehensive:
     @pytest.mark.asyncio
     async def test_profile_validation_and_error_handling(self):
         """Test 8: Profile form validation and error handling"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -681,7 +681,7 @@ class TestProfileSettingsComprehensive:
     @pytest.mark.asyncio
     async def test_profile_accessibility_and_usability(self):
         """Test 9: Profile accessibility features and usability"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -770,7 +770,7 @@ class TestProfileSettingsComprehensive:
     @pytest.mark.asyncio
     async def test_profile_data_persistence_and_reload(self):
         """Test 10: Profile data persistence across sessions and page reloads"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -5,7 +5,7 @@ import asyncio
 import tempfile
 import os
 from datetime import datetime, timedelta
-from playwright.async_api import async_playwright
+from utils.browser_pool import pooled_playwright
 from pages.auth_page import AuthPage
 from pages.dashboard_page import DashboardPage
 
@@ -16,7 +16,7 @@ class TestReportsAnalyticsComprehensive:
     @pytest.mark.asyncio
     async def test_reports_page_navigation_and_layout(self):
         """Test 1: Reports page navigation and UI layout validation"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox', '--disable-dev-shm-usage'])
             page = await browser.new_page()
 
@@ -53,7 +53,7 @@ class TestReportsAnalyticsComprehensive:
     @pytest.mark.asyncio
     async def test_report_filter_functionality(self):
         """Test 2: Report filtering and date range selection"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -111,7 +111,7 @@ class TestReportsAnalyticsComprehensive:
     @pytest.mark.asyncio
     async def test_report_generation_workflow(self):
         """Test 3: Complete report generation workflow"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -186,7 +186,7 @@ class TestReportsAnalyticsComprehensive:
     @pytest.mark.asyncio
     async def test_report_export_functionality(self):
         """Test 4: Report export to different formats"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -241,7 +241,7 @@ class TestReportsAnalyticsComprehensive:
     @pytest.mark.asyncio
     async def test_analytics_dashboard_metrics(self):
         """Test 5: Analytics dashboard and key metrics display"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -305,7 +305,7 @@ class TestReportsAnalyticsComprehensive:
     @pytest.mark.asyncio
     async def test_report_frequency_settings(self):
         """Test 6: Automated report frequency configuration"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -352,7 +352,7 @@ class TestReportsAnalyticsComprehensive:
     @pytest.mark.asyncio
     async def test_report_data_accuracy_validation(self):
         """Test 7: Report data accuracy and consistency validation"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -420,7 +420,7 @@ class TestReportsAnalyticsComprehensive:
     @pytest.mark.asyncio
     async def test_report_performance_large_datasets(self):
         """Test 8: Report performance with large date ranges"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -475,7 +475,7 @@ class TestReportsAnalyticsComprehensive:
     @pytest.mark.asyncio
     async def test_report_error_handling_edge_cases(self):
         """Test 9: Report error handling and edge cases"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -537,7 +537,7 @@ class TestReportsAnalyticsComprehensive:
     @pytest.mark.asyncio
     async def test_report_accessibility_compliance(self):
         """Test 10: Report accessibility and usability features"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -3,7 +3,7 @@
 import pytest
 import tempfile
 import os
-from playwright.async_api import async_playwright
+from utils.browser_pool import pooled_playwright
 from pages.auth_page import AuthPage
 from pages.templates_page import TemplatesPage
 from pages.documents_page import DocumentsPage
@@ -18,7 +18,7 @@ class TestTemplatesAdvanced:
     @pytest.mark.asyncio
     async def test_template_page_navigation_and_layout(self):
         """Test 1: Template page navigation and layout verification"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox', '--disable-dev-shm-usage'])
             page = await browser.new_page()
 
@@ -47,7 +47,7 @@ class TestTemplatesAdvanced:
     @pytest.mark.asyncio
     async def test_template_creation_workflow(self):
         """Test 2: Complete template creation workflow"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -94,7 +94,7 @@ class TestTemplatesAdvanced:
     @pytest.mark.asyncio
     async def test_template_upload_multiple_formats(self):
         """Test 3: Upload templates in multiple formats"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -135,7 +135,7 @@ class TestTemplatesAdvanced:
     @pytest.mark.asyncio
     async def test_template_list_and_search_functionality(self):
         """Test 4: Template list display and search functionality"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -173,7 +173,7 @@ class TestTemplatesAdvanced:
     @pytest.mark.asyncio
     async def test_template_editing_functionality(self):
         """Test 5: Template editing and modification"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -215,7 +215,7 @@ class TestTemplatesAdvanced:
     @pytest.mark.asyncio
     async def test_template_field_management_comprehensive(self):
         """Test 6: Comprehensive template field management"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -260,7 +260,7 @@ class TestTemplatesAdvanced:
     @pytest.mark.asyncio
     async def test_template_sharing_and_permissions(self):
         """Test 7: Template sharing and permission management"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -295,7 +295,7 @@ class TestTemplatesAdvanced:
     @pytest.mark.asyncio
     async def test_template_usage_tracking_and_analytics(self):
         """Test 8: Template usage tracking and analytics"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -327,7 +327,7 @@ class TestTemplatesAdvanced:
     @pytest.mark.asyncio
     async def test_template_version_management(self):
         """Test 9: Template version management and history"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -365,7 +365,7 @@ class TestTemplatesAdvanced:
     @pytest.mark.asyncio
     async def test_template_duplication_and_cloning(self):
         """Test 10: Template duplication and cloning functionality"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -408,7 +408,7 @@ class TestTemplatesAdvanced:
     @pytest.mark.asyncio
     async def test_template_to_document_workflow(self):
         """Test 11: Complete template to document workflow"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -447,7 +447,7 @@ class TestTemplatesAdvanced:
     @pytest.mark.asyncio
     async def test_template_bulk_operations(self):
         """Test 12: Template bulk operations and management"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -485,7 +485,7 @@ class TestTemplatesAdvanced:
     @pytest.mark.asyncio
     async def test_template_error_handling_and_validation(self):
         """Test 13: Template error handling and validation"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -534,7 +534,7 @@ class TestTemplatesAdvanced:
     @pytest.mark.asyncio
     async def test_template_performance_and_scalability(self):
         """Test 14: Template performance and scalability"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -574,7 +574,7 @@ class TestTemplatesAdvanced:
     @pytest.mark.asyncio
     async def test_template_accessibility_and_usability(self):
         """Test 15: Template accessibility and usability features"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
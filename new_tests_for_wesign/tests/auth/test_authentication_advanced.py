@@ -19,6 +19,10 @@ from pages.auth_page import AuthPage
 from pages.dashboard_page import DashboardPage
 
 
+# Login tests must exercise the form, not a cached session
+pytestmark = pytest.mark.real_login
+
+
 class TestAuthenticationAdvanced:
     """Advanced authentication test suite for WeSign platform"""
 
@@ -12,11 +12,15 @@ Test Categories:
 """
 
 import pytest
-from playwright.async_api import async_playwright
+from utils.browser_pool import pooled_playwright
 from pages.auth_page import AuthPage
 from pages.dashboard_page import DashboardPage
 
 
+# Login tests must exercise the form, not a cached session
+pytestmark = pytest.mark.real_login
+
+
 class TestAuthenticationFixed:
     """Fixed core authentication test suite for WeSign platform using direct async setup"""
 
@@ -26,7 +30,7 @@ class TestAuthenticationFixed:
     @pytest.mark.asyncio
     async def test_login_with_valid_company_credentials_success(self):
         """Test successful login with valid company user credentials"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -56,7 +60,7 @@ class TestAuthenticationFixed:
     @pytest.mark.asyncio
     async def test_login_with_invalid_credentials_failure(self):
         """Test login failure with invalid credentials"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -80,7 +84,7 @@ class TestAuthenticationFixed:
     @pytest.mark.asyncio
     async def test_login_with_empty_email_validation(self):
         """Test form validation with empty email field"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -105,7 +109,7 @@ class TestAuthenticationFixed:
     @pytest.mark.asyncio
     async def test_login_with_empty_password_validation(self):
         """Test form validation with empty password field"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -130,7 +134,7 @@ class TestAuthenticationFixed:
     @pytest.mark.asyncio
     async def test_login_with_malformed_email_validation(self):
         """Test email format validation with invalid email"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -155,7 +159,7 @@ class TestAuthenticationFixed:
     @pytest.mark.asyncio
     async def test_interface_language_detection(self):
         """Test interface language detection and display"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -185,7 +189,7 @@ class TestAuthenticationFixed:
     @pytest.mark.asyncio
     async def test_rtl_ltr_layout_direction(self):
         """Test RTL/LTR layout direction based on language"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -211,7 +215,7 @@ class TestAuthenticationFixed:
     @pytest.mark.asyncio
     async def test_forgot_password_link_visibility(self):
         """Test forgot password link visibility and functionality"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -238,7 +242,7 @@ class TestAuthenticationFixed:
     @pytest.mark.asyncio
     async def test_session_persistence_after_login(self):
         """Test session persistence after successful login"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -267,7 +271,7 @@ class TestAuthenticationFixed:
     @pytest.mark.asyncio
     async def test_logout_functionality(self):
         """Test logout functionality and session termination"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -308,7 +312,7 @@ class TestAuthenticationFixed:
     @pytest.mark.asyncio
     async def test_user_permissions_after_login(self):
         """Test user permissions and role detection after login"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -336,7 +340,7 @@ class TestAuthenticationFixed:
     @pytest.mark.asyncio
     async def test_dashboard_navigation_elements(self):
         """Test dashboard navigation elements visibility"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -362,7 +366,7 @@ class TestAuthenticationFixed:
     @pytest.mark.asyncio
     async def test_multiple_login_attempts_security(self):
         """Test security measures for multiple failed login attempts"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -395,7 +399,7 @@ class TestAuthenticationFixed:
     @pytest.mark.asyncio
     async def test_login_form_accessibility(self):
         """Test login form accessibility features"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -428,7 +432,7 @@ class TestAuthenticationFixed:
     @pytest.mark.asyncio
     async def test_comprehensive_dashboard_verification(self):
         """Test comprehensive dashboard functionality verification"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
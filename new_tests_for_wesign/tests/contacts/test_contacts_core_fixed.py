@@ -16,7 +16,7 @@ Test Categories:
 """
 
 import pytest
-from playwright.async_api import async_playwright
+from utils.browser_pool import pooled_playwright
 from pages.contacts_page import ContactsPage
 from pages.auth_page import AuthPage
 from pages.dashboard_page import DashboardPage
@@ -35,7 +35,7 @@ class TestContactsFixed:
     @pytest.mark.asyncio
     async def test_navigate_to_contacts_page_success(self):
         """Test successful navigation to contacts page"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -61,7 +61,7 @@ class TestContactsFixed:
     @pytest.mark.asyncio
     async def test_contacts_page_elements_visibility(self):
         """Test contacts page key elements are visible"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -93,7 +93,7 @@ class TestContactsFixed:
     @pytest.mark.asyncio
     async def test_add_contact_button_availability(self):
         """Test add contact button availability"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -120,7 +120,7 @@ class TestContactsFixed:
     @pytest.mark.asyncio
     async def test_click_add_contact_modal(self):
         """Test clicking add contact opens modal"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -152,7 +152,7 @@ class TestContactsFixed:
     @pytest.mark.asyncio
     async def test_create_contact_valid_english_email(self):
         """Test creating contact with valid English name and email"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -190,7 +190,7 @@ class TestContactsFixed:
     @pytest.mark.asyncio
     async def test_create_contact_valid_hebrew_email(self):
         """Test creating contact with valid Hebrew name and email"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -228,7 +228,7 @@ class TestContactsFixed:
     @pytest.mark.asyncio
     async def test_create_contact_valid_phone_english(self):
         """Test creating contact with valid English name and phone"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -266,7 +266,7 @@ class TestContactsFixed:
     @pytest.mark.asyncio
     async def test_create_contact_valid_phone_hebrew(self):
         """Test creating contact with valid Hebrew name and phone"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -304,7 +304,7 @@ class TestContactsFixed:
     @pytest.mark.asyncio
     async def test_create_contact_both_email_phone(self):
         """Test creating contact with both email and phone"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -343,7 +343,7 @@ class TestContactsFixed:
     @pytest.mark.asyncio
     async def test_contact_validation_empty_name(self):
         """Test contact validation with empty name"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -374,7 +374,7 @@ class TestContactsFixed:
     @pytest.mark.asyncio
     async def test_contact_validation_invalid_email(self):
         """Test contact validation with invalid email format"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -406,7 +406,7 @@ class TestContactsFixed:
     @pytest.mark.asyncio
     async def test_contact_validation_no_contact_method(self):
         """Test contact validation with no contact method"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -437,7 +437,7 @@ class TestContactsFixed:
     @pytest.mark.asyncio
     async def test_contacts_list_loading(self):
         """Test contacts list loading and display"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -465,7 +465,7 @@ class TestContactsFixed:
     @pytest.mark.asyncio
     async def test_contacts_count_functionality(self):
         """Test contacts count functionality"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -493,7 +493,7 @@ class TestContactsFixed:
     @pytest.mark.asyncio
     async def test_contact_search_functionality(self):
         """Test contacts search functionality"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -520,7 +520,7 @@ class TestContactsFixed:
     @pytest.mark.asyncio
     async def test_contact_selection_functionality(self):
         """Test contact selection functionality"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -553,7 +553,7 @@ class TestContactsFixed:
     @pytest.mark.asyncio
     async def test_select_all_contacts_functionality(self):
         """Test select all contacts functionality"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -580,7 +580,7 @@ class TestContactsFixed:
     @pytest.mark.asyncio
     async def test_contact_form_error_handling(self):
         """Test contact form error handling"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -611,7 +611,7 @@ class TestContactsFixed:
     @pytest.mark.asyncio
     async def test_contact_sorting_by_name(self):
         """Test contact sorting by name"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -638,7 +638,7 @@ class TestContactsFixed:
     @pytest.mark.asyncio
     async def test_contact_sorting_by_email(self):
         """Test contact sorting by email"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -665,7 +665,7 @@ class TestContactsFixed:
     @pytest.mark.asyncio
     async def test_contact_page_url_verification(self):
         """Test contacts page URL verification"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -693,7 +693,7 @@ class TestContactsFixed:
     @pytest.mark.asyncio
     async def test_contact_import_functionality(self):
         """Test contact import functionality"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -735,7 +735,7 @@ class TestContactsFixed:
     @pytest.mark.asyncio
     async def test_contact_name_length_validation(self):
         """Test contact name length validation"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -785,7 +785,7 @@ class TestContactsFixed:
     @pytest.mark.asyncio
     async def test_contact_phone_format_validation(self):
         """Test contact phone format validation"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -825,7 +825,7 @@ class TestContactsFixed:
     @pytest.mark.asyncio
     async def test_contact_search_by_name(self):
         """Test contact search by name"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -860,7 +860,7 @@ class TestContactsFixed:
     @pytest.mark.asyncio
     async def test_contact_search_by_email(self):
         """Test contact search by email"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -891,7 +891,7 @@ class TestContactsFixed:
     @pytest.mark.asyncio
     async def test_contact_delete_functionality(self):
         """Test contact deletion functionality"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -927,7 +927,7 @@ class TestContactsFixed:
     @pytest.mark.asyncio
     async def test_contact_comprehensive_verification(self):
         """Test comprehensive contact page functionality"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -960,7 +960,7 @@ class TestContactsFixed:
     @pytest.mark.asyncio
     async def test_contact_workflow_integration(self):
         """Test contact workflow and integration"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -989,7 +989,7 @@ class TestContactsFixed:
     @pytest.mark.asyncio
     async def test_contact_page_responsiveness(self):
         """Test contact page responsiveness"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -1018,7 +1018,7 @@ class TestContactsFixed:
     @pytest.mark.asyncio
     async def test_contact_security_access(self):
         """Test contact security and access controls"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -1046,7 +1046,7 @@ class TestContactsFixed:
     @pytest.mark.asyncio
     async def test_contact_multilingual_support(self):
         """Test contact page multilingual support"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -1077,7 +1077,7 @@ class TestContactsFixed:
     @pytest.mark.asyncio
     async def test_contact_performance_benchmarks(self):
         """Test contact page performance benchmarks"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -1114,7 +1114,7 @@ class TestContactsFixed:
     @pytest.mark.asyncio
     async def test_contact_data_persistence(self):
         """Test contact data persistence"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -1148,7 +1148,7 @@ class TestContactsFixed:
     @pytest.mark.asyncio
     async def test_contact_accessibility_features(self):
         """Test contact page accessibility features"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -1189,7 +1189,7 @@ class TestContactsFixed:
     @pytest.mark.asyncio
     async def test_add_contact_success_valid_email_hebrew(self):
         """Test successful contact addition with valid email in Hebrew interface"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -1229,7 +1229,7 @@ class TestContactsFixed:
     @pytest.mark.asyncio
     async def test_add_contact_success_valid_phone_hebrew(self):
         """Test successful contact addition with valid phone in Hebrew interface"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -1265,7 +1265,7 @@ class TestContactsFixed:
     @pytest.mark.asyncio
     async def test_interface_language_switching(self):
         """Test switching between Hebrew and English interface languages"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -1301,7 +1301,7 @@ class TestContactsFixed:
     @pytest.mark.asyncio
     async def test_hebrew_rtl_layout_validation(self):
         """Test right-to-left layout validation for Hebrew interface"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -1336,7 +1336,7 @@ class TestContactsFixed:
     @pytest.mark.asyncio
     async def test_multilingual_contact_names_support(self):
         """Test support for multilingual contact names"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -1385,7 +1385,7 @@ class TestContactsFixed:
     @pytest.mark.asyncio
     async def test_contacts_import_valid_xlsx_file_success(self):
         """Test successful import of contacts from valid XLSX file"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -1421,7 +1421,7 @@ class TestContactsFixed:
     @pytest.mark.asyncio
     async def test_contacts_import_csv_file_success(self):
         """Test successful import of contacts from valid CSV file"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -1456,7 +1456,7 @@ class TestContactsFixed:
     @pytest.mark.asyncio
     async def test_contacts_export_functionality(self):
         """Test export functionality for contacts data"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -1499,7 +1499,7 @@ class TestContactsFixed:
     @pytest.mark.asyncio
     async def test_bulk_contact_selection(self):
         """Test bulk selection of multiple contacts"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -1540,7 +1540,7 @@ class TestContactsFixed:
     @pytest.mark.asyncio
     async def test_bulk_contact_deletion(self):
         """Test bulk deletion of multiple contacts"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -1577,7 +1577,7 @@ class TestContactsFixed:
     @pytest.mark.asyncio
     async def test_advanced_search_by_email_domain(self):
         """Test advanced search functionality by email domain"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -1616,7 +1616,7 @@ class TestContactsFixed:
     @pytest.mark.asyncio
     async def test_search_by_partial_name(self):
         """Test search functionality with partial name matching"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -1658,7 +1658,7 @@ class TestContactsFixed:
     @pytest.mark.asyncio
     async def test_contact_tags_functionality(self):
         """Test contact tagging and tag management"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -1697,7 +1697,7 @@ class TestContactsFixed:
     @pytest.mark.asyncio
     async def test_contact_list_performance_large_dataset(self):
         """Test performance with large contact datasets"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -1734,7 +1734,7 @@ class TestContactsFixed:
     @pytest.mark.asyncio
     async def test_pagination_functionality(self):
         """Test pagination controls and navigation"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -1781,7 +1781,7 @@ class TestContactsFixed:
     @pytest.mark.asyncio
     async def test_duplicate_contact_prevention(self):
         """Test prevention of duplicate contact creation"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -1831,7 +1831,7 @@ class TestContactsFixed:
     @pytest.mark.asyncio
     async def test_contact_field_character_limits(self):
         """Test character limits for contact fields"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -1876,7 +1876,7 @@ class TestContactsFixed:
     @pytest.mark.asyncio
     async def test_contact_integration_with_documents(self):
         """Test integration between contacts and documents"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -1913,7 +1913,7 @@ class TestContactsFixed:
     @pytest.mark.asyncio
     async def test_contact_integration_with_templates(self):
         """Test integration between contacts and templates"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -1951,7 +1951,7 @@ class TestContactsFixed:
     @pytest.mark.asyncio
     async def test_contact_data_security_validation(self):
         """Test security validation for contact data"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -2001,7 +2001,7 @@ class TestContactsFixed:
     @pytest.mark.asyncio
     async def test_contacts_mobile_responsive_layout(self):
         """Test mobile responsive layout for contacts page"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -2043,7 +2043,7 @@ class TestContactsFixed:
     @pytest.mark.asyncio
     async def test_contact_complete_lifecycle(self):
         """Test complete contact lifecycle from creation to deletion"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -2098,7 +2098,7 @@ class TestContactsFixed:
     @pytest.mark.asyncio
     async def test_contact_sorting_functionality(self):
         """Test contact list sorting by various criteria"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -2135,7 +2135,7 @@ class TestContactsFixed:
     @pytest.mark.asyncio
     async def test_contact_filtering_by_date(self):
         """Test filtering contacts by creation/modification date"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -2172,7 +2172,7 @@ class TestContactsFixed:
     @pytest.mark.asyncio
     async def test_contact_activity_tracking(self):
         """Test contact activity and interaction history tracking"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -2209,7 +2209,7 @@ class TestContactsFixed:
     @pytest.mark.asyncio
     async def test_contact_backup_and_restore(self):
         """Test contact data backup and restore functionality"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -2246,7 +2246,7 @@ class TestContactsFixed:
     @pytest.mark.asyncio
     async def test_contact_api_integration(self):
         """Test contact API integration and external data sync"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -2285,7 +2285,7 @@ class TestContactsFixed:
     @pytest.mark.asyncio
     async def test_contact_notification_settings(self):
         """Test contact notification and alert preferences"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -2322,7 +2322,7 @@ class TestContactsFixed:
     @pytest.mark.asyncio
     async def test_contact_group_management(self):
         """Test contact grouping and category management"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -2359,7 +2359,7 @@ class TestContactsFixed:
     @pytest.mark.asyncio
     async def test_contact_merge_functionality(self):
         """Test merging duplicate or related contacts"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -2396,7 +2396,7 @@ class TestContactsFixed:
     @pytest.mark.asyncio
     async def test_contact_history_tracking(self):
         """Test comprehensive contact history and change tracking"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -2433,7 +2433,7 @@ class TestContactsFixed:
     @pytest.mark.asyncio
     async def test_contact_permissions_management(self):
         """Test contact access permissions and role-based controls"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -2470,7 +2470,7 @@ class TestContactsFixed:
     @pytest.mark.asyncio
     async def test_contact_analytics_and_reporting(self):
         """Test contact analytics, metrics, and reporting features"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -2510,7 +2510,7 @@ class TestContactsFixed:
     @pytest.mark.asyncio
     async def test_contact_system_administration(self):
         """Test system administration features for contacts module"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -2551,7 +2551,7 @@ class TestContactsFixed:
     @pytest.mark.asyncio
     async def test_contact_bulk_edit_functionality(self):
         """Test bulk editing of multiple contacts"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
             try:
@@ -2573,7 +2573,7 @@ class TestContactsFixed:
     @pytest.mark.asyncio
     async def test_contact_duplicate_detection_advanced(self):
         """Test 71: Advanced duplicate detection algorithms"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
             try:
@@ -2595,7 +2595,7 @@ class TestContactsFixed:
     @pytest.mark.asyncio
     async def test_contact_export_csv_format(self):
         """Test 72: Contact export in CSV format"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
             try:
@@ -2614,7 +2614,7 @@ class TestContactsFixed:
     @pytest.mark.asyncio
     async def test_contact_export_excel_format(self):
         """Test 73: Contact export in Excel format"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
             try:
@@ -2633,7 +2633,7 @@ class TestContactsFixed:
     @pytest.mark.asyncio
     async def test_contact_validation_phone_formats(self):
         """Test 74: Validation of various phone number formats"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
             try:
@@ -2652,7 +2652,7 @@ class TestContactsFixed:
     @pytest.mark.asyncio
     async def test_contact_validation_email_formats(self):
         """Test 75: Validation of various email formats"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
             try:
@@ -2671,7 +2671,7 @@ class TestContactsFixed:
     @pytest.mark.asyncio
     async def test_contact_custom_fields_support(self):
         """Test 76: Custom field support for contacts"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
             try:
@@ -2690,7 +2690,7 @@ class TestContactsFixed:
     @pytest.mark.asyncio
     async def test_contact_notes_and_comments(self):
         """Test 77: Contact notes and comments functionality"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
             try:
@@ -2709,7 +2709,7 @@ class TestContactsFixed:
     @pytest.mark.asyncio
     async def test_contact_profile_pictures(self):
         """Test 78: Contact profile picture upload and management"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
             try:
@@ -2728,7 +2728,7 @@ class TestContactsFixed:
     @pytest.mark.asyncio
     async def test_contact_communication_history(self):
         """Test 79: Contact communication history tracking"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
             try:
@@ -2747,7 +2747,7 @@ class TestContactsFixed:
     @pytest.mark.asyncio
     async def test_contact_preferred_communication_method(self):
         """Test 80: Contact preferred communication method settings"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
             try:
@@ -2766,7 +2766,7 @@ class TestContactsFixed:
     @pytest.mark.asyncio
     async def test_contact_timezone_support(self):
         """Test 81: Contact timezone support and scheduling"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
             try:
@@ -2785,7 +2785,7 @@ class TestContactsFixed:
     @pytest.mark.asyncio
     async def test_contact_social_media_integration(self):
         """Test 82: Social media profile integration for contacts"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
             try:
@@ -2804,7 +2804,7 @@ class TestContactsFixed:
     @pytest.mark.asyncio
     async def test_contact_address_management(self):
         """Test 83: Contact address management functionality"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
             try:
@@ -2823,7 +2823,7 @@ class TestContactsFixed:
     @pytest.mark.asyncio
     async def test_contact_company_organization_fields(self):
         """Test 84: Contact company and organization fields"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
             try:
@@ -2842,7 +2842,7 @@ class TestContactsFixed:
     @pytest.mark.asyncio
     async def test_contact_birthday_anniversary_tracking(self):
         """Test 85: Contact birthday and anniversary tracking"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
             try:
@@ -2861,7 +2861,7 @@ class TestContactsFixed:
     @pytest.mark.asyncio
     async def test_contact_relationship_mapping(self):
         """Test 86: Contact relationship mapping and connections"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
             try:
@@ -2880,7 +2880,7 @@ class TestContactsFixed:
     @pytest.mark.asyncio
     async def test_contact_privacy_settings(self):
         """Test 87: Contact privacy and data protection settings"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
             try:
@@ -2899,7 +2899,7 @@ class TestContactsFixed:
     @pytest.mark.asyncio
     async def test_contact_data_sync_external_systems(self):
         """Test 88: Contact data synchronization with external systems"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
             try:
@@ -2918,7 +2918,7 @@ class TestContactsFixed:
     @pytest.mark.asyncio
     async def test_contact_advanced_search_filters(self):
         """Test 89: Advanced search and filtering capabilities"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
             try:
@@ -2937,7 +2937,7 @@ class TestContactsFixed:
     @pytest.mark.asyncio
     async def test_contact_keyboard_shortcuts(self):
         """Test 90: Keyboard shortcuts for contact management"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
             try:
@@ -2956,7 +2956,7 @@ class TestContactsFixed:
     @pytest.mark.asyncio
     async def test_contact_list_virtualization(self):
         """Test 91: Contact list virtualization for large datasets"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
             try:
@@ -2975,7 +2975,7 @@ class TestContactsFixed:
     @pytest.mark.asyncio
     async def test_contact_offline_capabilities(self):
         """Test 92: Contact management offline capabilities"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
             try:
@@ -2994,7 +2994,7 @@ class TestContactsFixed:
     @pytest.mark.asyncio
     async def test_contact_real_time_collaboration(self):
         """Test 93: Real-time collaboration features for contact management"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
             try:
@@ -3013,7 +3013,7 @@ class TestContactsFixed:
     @pytest.mark.asyncio
     async def test_contact_comprehensive_end_to_end_workflow(self):
         """Test 94: Comprehensive end-to-end contact management workflow"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
             try:
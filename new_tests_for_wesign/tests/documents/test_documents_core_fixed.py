@@ -13,7 +13,7 @@ Test Categories:
 """
 
 import pytest
-from playwright.async_api import async_playwright
+from utils.browser_pool import pooled_playwright
 from pages.auth_page import AuthPage
 from pages.documents_page import DocumentsPage
 from pathlib import Path
@@ -30,7 +30,7 @@ class TestDocumentsCoreFixed:
     @pytest.mark.asyncio
     async def test_navigate_to_documents_page_success(self):
         """Test successful navigation to documents page"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -56,7 +56,7 @@ class TestDocumentsCoreFixed:
     @pytest.mark.asyncio
     async def test_upload_pdf_document_success(self):
         """Test successful PDF document upload"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -102,7 +102,7 @@ class TestDocumentsCoreFixed:
     @pytest.mark.asyncio
     async def test_upload_multiple_file_types_success(self):
         """Test upload functionality with multiple file types"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -147,7 +147,7 @@ class TestDocumentsCoreFixed:
     @pytest.mark.asyncio
     async def test_document_list_functionality(self):
         """Test document list display and functionality"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -180,7 +180,7 @@ class TestDocumentsCoreFixed:
     @pytest.mark.asyncio
     async def test_document_search_functionality(self):
         """Test document search functionality"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -219,7 +219,7 @@ class TestDocumentsCoreFixed:
     @pytest.mark.asyncio
     async def test_upload_functionality_availability(self):
         """Test upload functionality availability"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -247,7 +247,7 @@ class TestDocumentsCoreFixed:
     @pytest.mark.asyncio
     async def test_document_upload_with_unique_name(self):
         """Test document upload with unique filename"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -289,7 +289,7 @@ class TestDocumentsCoreFixed:
     @pytest.mark.asyncio
     async def test_empty_document_list_handling(self):
         """Test handling of empty document list"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -321,7 +321,7 @@ class TestDocumentsCoreFixed:
     @pytest.mark.asyncio
     async def test_document_status_detection(self):
         """Test document status detection"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -358,7 +358,7 @@ class TestDocumentsCoreFixed:
     @pytest.mark.asyncio
     async def test_document_info_retrieval(self):
         """Test document information retrieval"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -395,7 +395,7 @@ class TestDocumentsCoreFixed:
     @pytest.mark.asyncio
     async def test_upload_error_handling(self):
         """Test upload error handling"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -427,7 +427,7 @@ class TestDocumentsCoreFixed:
     @pytest.mark.asyncio
     async def test_success_message_detection(self):
         """Test success message detection"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -458,7 +458,7 @@ class TestDocumentsCoreFixed:
     @pytest.mark.asyncio
     async def test_documents_page_verification(self):
         """Test comprehensive documents page verification"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -487,7 +487,7 @@ class TestDocumentsCoreFixed:
     @pytest.mark.asyncio
     async def test_file_input_element_accessibility(self):
         """Test file input element accessibility"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -517,7 +517,7 @@ class TestDocumentsCoreFixed:
     @pytest.mark.asyncio
     async def test_document_page_url_validation(self):
         """Test document page URL validation"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -545,7 +545,7 @@ class TestDocumentsCoreFixed:
     @pytest.mark.asyncio
     async def test_upload_file_size_handling(self):
         """Test upload file size handling"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -580,7 +580,7 @@ class TestDocumentsCoreFixed:
     @pytest.mark.asyncio
     async def test_document_interface_responsiveness(self):
         """Test document interface responsiveness"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -614,7 +614,7 @@ class TestDocumentsCoreFixed:
     @pytest.mark.asyncio
     async def test_search_reset_functionality(self):
         """Test search reset functionality"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -649,7 +649,7 @@ class TestDocumentsCoreFixed:
     @pytest.mark.asyncio
     async def test_multiple_search_operations(self):
         """Test multiple search operations"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -683,7 +683,7 @@ class TestDocumentsCoreFixed:
     @pytest.mark.asyncio
     async def test_document_operations_availability(self):
         """Test document operations availability"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -16,7 +16,7 @@ Test Categories:
 """
 
 import pytest
-from playwright.async_api import async_playwright
+from utils.browser_pool import pooled_playwright
 from pages.templates_page import TemplatesPage
 from pages.auth_page import AuthPage
 from pages.dashboard_page import DashboardPage
@@ -33,7 +33,7 @@ class TestTemplatesFixed:
     @pytest.mark.asyncio
     async def test_navigate_to_templates_page_success(self):
         """Test successful navigation to templates page"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -59,7 +59,7 @@ class TestTemplatesFixed:
     @pytest.mark.asyncio
     async def test_templates_page_elements_visibility(self):
         """Test templates page key elements are visible"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -86,7 +86,7 @@ class TestTemplatesFixed:
     @pytest.mark.asyncio
     async def test_add_new_template_button_availability(self):
         """Test add new template button availability"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -113,7 +113,7 @@ class TestTemplatesFixed:
     @pytest.mark.asyncio
     async def test_templates_list_loading(self):
         """Test templates list loading and display"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -141,7 +141,7 @@ class TestTemplatesFixed:
     @pytest.mark.asyncio
     async def test_templates_count_functionality(self):
         """Test templates count functionality"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -169,7 +169,7 @@ class TestTemplatesFixed:
     @pytest.mark.asyncio
     async def test_search_templates_functionality(self):
         """Test templates search functionality"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -196,7 +196,7 @@ class TestTemplatesFixed:
     @pytest.mark.asyncio
     async def test_click_add_new_template(self):
         """Test clicking add new template button"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -229,7 +229,7 @@ class TestTemplatesFixed:
     @pytest.mark.asyncio
     async def test_upload_template_modal_visibility(self):
         """Test upload template modal visibility"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -262,7 +262,7 @@ class TestTemplatesFixed:
     @pytest.mark.asyncio
     async def test_template_file_upload_pdf_success(self):
         """Test PDF template file upload functionality"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -301,7 +301,7 @@ class TestTemplatesFixed:
     @pytest.mark.asyncio
     async def test_template_file_upload_docx_success(self):
         """Test DOCX template file upload functionality"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -361,7 +361,7 @@ class TestTemplatesFixed:
     @pytest.mark.asyncio
     async def test_template_selection_functionality(self):
         """Test template selection functionality"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -394,7 +394,7 @@ class TestTemplatesFixed:
     @pytest.mark.asyncio
     async def test_template_error_handling(self):
         """Test template error handling"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -425,7 +425,7 @@ class TestTemplatesFixed:
     @pytest.mark.asyncio
     async def test_template_success_handling(self):
         """Test template success message handling"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -456,7 +456,7 @@ class TestTemplatesFixed:
     @pytest.mark.asyncio
     async def test_close_upload_modal(self):
         """Test closing upload modal"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -489,7 +489,7 @@ class TestTemplatesFixed:
     @pytest.mark.asyncio
     async def test_sign_templates_button(self):
         """Test sign templates button functionality"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -516,7 +516,7 @@ class TestTemplatesFixed:
     @pytest.mark.asyncio
     async def test_template_info_retrieval(self):
         """Test template information retrieval"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -543,7 +543,7 @@ class TestTemplatesFixed:
     @pytest.mark.asyncio
     async def test_wait_for_template_operation(self):
         """Test waiting for template operation completion"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -570,7 +570,7 @@ class TestTemplatesFixed:
     @pytest.mark.asyncio
     async def test_template_page_url_verification(self):
         """Test templates page URL verification"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -598,7 +598,7 @@ class TestTemplatesFixed:
     @pytest.mark.asyncio
     async def test_template_multiple_file_format_support(self):
         """Test multiple template file format support"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -629,7 +629,7 @@ class TestTemplatesFixed:
     @pytest.mark.asyncio
     async def test_template_upload_with_invalid_file(self):
         """Test template upload with invalid file type"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -668,7 +668,7 @@ class TestTemplatesFixed:
     @pytest.mark.asyncio
     async def test_template_search_with_results(self):
         """Test template search with expected results"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -703,7 +703,7 @@ class TestTemplatesFixed:
     @pytest.mark.asyncio
     async def test_template_search_with_no_results(self):
         """Test template search with no expected results"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -734,7 +734,7 @@ class TestTemplatesFixed:
     @pytest.mark.asyncio
     async def test_template_delete_functionality(self):
         """Test template deletion functionality"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -770,7 +770,7 @@ class TestTemplatesFixed:
     @pytest.mark.asyncio
     async def test_template_comprehensive_verification(self):
         """Test comprehensive template page functionality"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -803,7 +803,7 @@ class TestTemplatesFixed:
     @pytest.mark.asyncio
     async def test_template_workflow_integration(self):
         """Test template workflow and integration"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -832,7 +832,7 @@ class TestTemplatesFixed:
     @pytest.mark.asyncio
     async def test_template_page_responsiveness(self):
         """Test template page responsiveness"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -861,7 +861,7 @@ class TestTemplatesFixed:
     @pytest.mark.asyncio
     async def test_template_security_access(self):
         """Test template security and access controls"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -889,7 +889,7 @@ class TestTemplatesFixed:
     @pytest.mark.asyncio
     async def test_template_metadata_handling(self):
         """Test template metadata handling"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -921,7 +921,7 @@ class TestTemplatesFixed:
     @pytest.mark.asyncio
     async def test_template_error_recovery(self):
         """Test template error recovery"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -951,7 +951,7 @@ class TestTemplatesFixed:
     @pytest.mark.asyncio
     async def test_template_performance_benchmarks(self):
         """Test template page performance benchmarks"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -988,7 +988,7 @@ class TestTemplatesFixed:
     @pytest.mark.asyncio
     async def test_template_multilingual_support(self):
         """Test template page multilingual support"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -1019,7 +1019,7 @@ class TestTemplatesFixed:
     @pytest.mark.asyncio
     async def test_template_accessibility_features(self):
         """Test template page accessibility features"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
 
@@ -1058,7 +1058,7 @@ class TestTemplatesFixed:
     @pytest.mark.asyncio
     async def test_upload_template_large_pdf_102_pages(self):
         """Test upload of large PDF template (102+ pages)"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
             try:
@@ -1086,7 +1086,7 @@ class TestTemplatesFixed:
     @pytest.mark.asyncio
     async def test_upload_template_word_document_success(self):
         """Test successful Word document template upload"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
             try:
@@ -1113,7 +1113,7 @@ class TestTemplatesFixed:
     @pytest.mark.asyncio
     async def test_upload_template_excel_spreadsheet_success(self):
         """Test successful Excel spreadsheet template upload"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
             try:
@@ -1140,7 +1140,7 @@ class TestTemplatesFixed:
     @pytest.mark.asyncio
     async def test_upload_template_image_png_success(self):
         """Test successful PNG image template upload"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
             try:
@@ -1167,7 +1167,7 @@ class TestTemplatesFixed:
     @pytest.mark.asyncio
     async def test_template_duplicate_functionality(self):
         """Test template duplication functionality"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
             try:
@@ -1193,7 +1193,7 @@ class TestTemplatesFixed:
     @pytest.mark.asyncio
     async def test_template_editing_functionality(self):
         """Test template editing functionality"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
             try:
@@ -1219,7 +1219,7 @@ class TestTemplatesFixed:
     @pytest.mark.asyncio
     async def test_template_url_generation_sharing(self):
         """Test template URL generation and sharing"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
             try:
@@ -1245,7 +1245,7 @@ class TestTemplatesFixed:
     @pytest.mark.asyncio
     async def test_template_download_functionality(self):
         """Test template download functionality"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
             try:
@@ -1270,7 +1270,7 @@ class TestTemplatesFixed:
     @pytest.mark.asyncio
     async def test_template_send_for_signing_workflow(self):
         """Test template send for signing workflow - CORE WESIGN FUNCTIONALITY"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
             try:
@@ -1303,7 +1303,7 @@ class TestTemplatesFixed:
     @pytest.mark.asyncio
     async def test_template_field_overlay_management(self):
         """Test template field overlay management for signature placement"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
             try:
@@ -1329,7 +1329,7 @@ class TestTemplatesFixed:
     @pytest.mark.asyncio
     async def test_template_permission_restrictions(self):
         """Test template permission restrictions based on user roles"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
             try:
@@ -1356,7 +1356,7 @@ class TestTemplatesFixed:
     @pytest.mark.asyncio
     async def test_template_workflow_creation_complete(self):
         """Test complete template creation workflow"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
             try:
@@ -1391,7 +1391,7 @@ class TestTemplatesFixed:
     @pytest.mark.asyncio
     async def test_template_actions_availability(self):
         """Test 45: Template action buttons availability (edit, duplicate, delete, sign)"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
             try:
@@ -1419,7 +1419,7 @@ class TestTemplatesFixed:
     @pytest.mark.asyncio
     async def test_template_deletion_workflow(self):
         """Test 46: Template deletion workflow with confirmation"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
             try:
@@ -1443,7 +1443,7 @@ class TestTemplatesFixed:
     @pytest.mark.asyncio
     async def test_template_search_and_filter_advanced(self):
         """Test 47: Advanced template search and filtering capabilities"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
             try:
@@ -1466,7 +1466,7 @@ class TestTemplatesFixed:
     @pytest.mark.asyncio
     async def test_template_usage_tracking(self):
         """Test 48: Template usage tracking and statistics"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
             try:
@@ -1486,7 +1486,7 @@ class TestTemplatesFixed:
     @pytest.mark.asyncio
     async def test_template_version_management(self):
         """Test 49: Template version management and history"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
             try:
@@ -1506,7 +1506,7 @@ class TestTemplatesFixed:
     @pytest.mark.asyncio
     async def test_template_collaboration_features(self):
         """Test 50: Template collaboration and team sharing features"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
             try:
@@ -1526,7 +1526,7 @@ class TestTemplatesFixed:
     @pytest.mark.asyncio
     async def test_template_file_validation_errors(self):
         """Test 51: Template file validation and error handling"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
             try:
@@ -1550,7 +1550,7 @@ class TestTemplatesFixed:
     @pytest.mark.asyncio
     async def test_template_bulk_operations(self):
         """Test 52: Bulk template operations"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
             try:
@@ -1575,7 +1575,7 @@ class TestTemplatesFixed:
     @pytest.mark.asyncio
     async def test_template_mobile_responsiveness(self):
         """Test 53: Template management mobile responsiveness"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
             try:
@@ -1594,7 +1594,7 @@ class TestTemplatesFixed:
     @pytest.mark.asyncio
     async def test_template_integration_with_documents_workflow(self):
         """Test 54: Template integration with document creation workflow - FINAL COMPREHENSIVE TEST"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
             try:
@@ -1623,7 +1623,7 @@ class TestTemplatesFixed:
     @pytest.mark.asyncio
     async def test_template_language_switching_hebrew_to_english(self):
         """Test switching template language from Hebrew to English"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
             try:
@@ -1659,7 +1659,7 @@ class TestTemplatesFixed:
     @pytest.mark.asyncio
     async def test_template_language_switching_english_to_hebrew(self):
         """Test switching template language from English to Hebrew"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
             try:
@@ -1696,7 +1696,7 @@ class TestTemplatesFixed:
     @pytest.mark.asyncio
     async def test_template_multilingual_content_display(self):
         """Test displaying templates with multilingual content"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
             try:
@@ -1726,7 +1726,7 @@ class TestTemplatesFixed:
     @pytest.mark.asyncio
     async def test_template_auto_attached_fields_to_signers_success(self):
         """Test automatic attachment of template fields to signers"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
             try:
@@ -1764,7 +1764,7 @@ class TestTemplatesFixed:
     @pytest.mark.asyncio
     async def test_template_fields_not_saved_in_original_after_modifications(self):
         """Test template fields not saved in original after modifications during use"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
             try:
@@ -1812,7 +1812,7 @@ class TestTemplatesFixed:
     @pytest.mark.asyncio
     async def test_duplicate_template_success(self):
         """Test successful template duplication functionality"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
             try:
@@ -1855,7 +1855,7 @@ class TestTemplatesFixed:
     @pytest.mark.asyncio
     async def test_template_workflow_automation_settings(self):
         """Test template workflow automation configuration"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
             try:
@@ -1893,7 +1893,7 @@ class TestTemplatesFixed:
     @pytest.mark.asyncio
     async def test_template_expiration_date_settings(self):
         """Test template document expiration date configuration"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
             try:
@@ -1937,7 +1937,7 @@ class TestTemplatesFixed:
     @pytest.mark.asyncio
     async def test_template_signature_order_configuration(self):
         """Test template signature order configuration"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
             try:
@@ -1979,7 +1979,7 @@ class TestTemplatesFixed:
     @pytest.mark.asyncio
     async def test_template_custom_branding_settings(self):
         """Test template custom branding configuration"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
             try:
@@ -2030,7 +2030,7 @@ class TestTemplatesFixed:
     @pytest.mark.asyncio
     async def test_template_notification_settings(self):
         """Test template notification configuration"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
             try:
@@ -2079,7 +2079,7 @@ class TestTemplatesFixed:
     @pytest.mark.asyncio
     async def test_template_field_validation_rules(self):
         """Test template field validation rules configuration"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
             try:
@@ -2128,7 +2128,7 @@ class TestTemplatesFixed:
     @pytest.mark.asyncio
     async def test_template_conditional_logic_fields(self):
         """Test template conditional logic for fields"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
             try:
@@ -2177,7 +2177,7 @@ class TestTemplatesFixed:
     @pytest.mark.asyncio
     async def test_template_integration_with_crm_systems(self):
         """Test template CRM integration functionality"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
             try:
@@ -2226,7 +2226,7 @@ class TestTemplatesFixed:
     @pytest.mark.asyncio
     async def test_template_advanced_search_functionality(self):
         """Test template advanced search and filtering"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
             try:
@@ -2278,7 +2278,7 @@ class TestTemplatesFixed:
     @pytest.mark.asyncio
     async def test_template_version_history_management(self):
         """Test template version history and rollback functionality"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
             try:
@@ -2333,7 +2333,7 @@ class TestTemplatesFixed:
     @pytest.mark.asyncio
     async def test_template_bulk_import_export_functionality(self):
         """Test template bulk import and export functionality"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
             try:
@@ -2394,7 +2394,7 @@ class TestTemplatesFixed:
     @pytest.mark.asyncio
     async def test_template_collaborative_editing_features(self):
         """Test template collaborative editing and sharing"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
             try:
@@ -2460,7 +2460,7 @@ class TestTemplatesFixed:
     @pytest.mark.asyncio
     async def test_template_api_integration_settings(self):
         """Test template API integration and webhook configuration"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
             try:
@@ -2501,7 +2501,7 @@ class TestTemplatesFixed:
     @pytest.mark.asyncio
     async def test_template_audit_trail_logging(self):
         """Test template audit trail and activity logging"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
             try:
@@ -2547,7 +2547,7 @@ class TestTemplatesFixed:
     @pytest.mark.asyncio
     async def test_template_performance_optimization(self):
         """Test template performance and loading optimization"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
             try:
@@ -2572,7 +2572,7 @@ class TestTemplatesFixed:
     @pytest.mark.asyncio
     async def test_template_accessibility_compliance(self):
         """Test template interface accessibility compliance"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
             try:
@@ -2595,7 +2595,7 @@ class TestTemplatesFixed:
     @pytest.mark.asyncio
     async def test_template_error_handling_recovery(self):
         """Test template error handling and recovery mechanisms"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
             try:
@@ -2618,7 +2618,7 @@ class TestTemplatesFixed:
     @pytest.mark.asyncio
     async def test_template_mobile_responsive_design(self):
         """Test template interface mobile responsiveness"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
             try:
@@ -2642,7 +2642,7 @@ class TestTemplatesFixed:
     @pytest.mark.asyncio
     async def test_template_data_validation_enforcement(self):
         """Test template data validation enforcement"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
             try:
@@ -2665,7 +2665,7 @@ class TestTemplatesFixed:
     @pytest.mark.asyncio
     async def test_template_backup_restore_functionality(self):
         """Test template backup and restore functionality"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
             try:
@@ -2688,7 +2688,7 @@ class TestTemplatesFixed:
     @pytest.mark.asyncio
     async def test_template_integration_testing_environment(self):
         """Test template integration with other system components"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
             try:
@@ -2711,7 +2711,7 @@ class TestTemplatesFixed:
     @pytest.mark.asyncio
     async def test_template_user_permission_matrix(self):
         """Test template user permissions and role-based access"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
             try:
@@ -2734,7 +2734,7 @@ class TestTemplatesFixed:
     @pytest.mark.asyncio
     async def test_template_cross_browser_compatibility(self):
         """Test template cross-browser compatibility"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
             try:
@@ -2758,7 +2758,7 @@ class TestTemplatesFixed:
     @pytest.mark.asyncio
     async def test_template_load_testing_performance(self):
         """Test template performance under load conditions"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
             try:
@@ -2783,7 +2783,7 @@ class TestTemplatesFixed:
     @pytest.mark.asyncio
     async def test_template_security_vulnerability_scanning(self):
         """Test template security vulnerability scanning"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
             try:
@@ -2806,7 +2806,7 @@ class TestTemplatesFixed:
     @pytest.mark.asyncio
     async def test_template_internationalization_support(self):
         """Test template internationalization and localization"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
             try:
@@ -2830,7 +2830,7 @@ class TestTemplatesFixed:
     @pytest.mark.asyncio
     async def test_template_analytics_reporting_integration(self):
         """Test template analytics and reporting integration"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
             try:
@@ -2851,7 +2851,7 @@ class TestTemplatesFixed:
     @pytest.mark.asyncio
     async def test_template_disaster_recovery_procedures(self):
         """Test template disaster recovery procedures"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
             try:
@@ -2875,7 +2875,7 @@ class TestTemplatesFixed:
     @pytest.mark.asyncio
     async def test_template_compliance_audit_readiness(self):
         """Test template compliance audit readiness"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
             try:
@@ -2898,7 +2898,7 @@ class TestTemplatesFixed:
     @pytest.mark.asyncio
     async def test_template_ai_ml_integration_features(self):
         """Test template AI/ML integration features"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
             try:
@@ -2921,7 +2921,7 @@ class TestTemplatesFixed:
     @pytest.mark.asyncio
     async def test_template_future_scalability_architecture(self):
         """Test template future scalability architecture"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
             try:
@@ -2942,7 +2942,7 @@ class TestTemplatesFixed:
     @pytest.mark.asyncio
     async def test_template_enterprise_integration_readiness(self):
         """Test template enterprise integration readiness"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
             try:
@@ -2966,7 +2966,7 @@ class TestTemplatesFixed:
     @pytest.mark.asyncio
     async def test_template_comprehensive_stress_testing(self):
         """Test template comprehensive stress testing"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
             try:
@@ -2993,7 +2993,7 @@ class TestTemplatesFixed:
     @pytest.mark.asyncio
     async def test_template_final_comprehensive_validation(self):
         """Final comprehensive validation of all template functionality - TEST 94/94"""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
             page = await browser.new_page()
             try:
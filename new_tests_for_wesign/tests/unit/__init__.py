@@ -0,0 +1 @@
+# Unit tests package (no browser or WeSign server needed)
@@ -0,0 +1,31 @@
+"""
+Shared fixtures for the browser-free unit tests
+"""
+
+import copy
+
+import pytest
+
+from config.environment import EnvironmentConfig, EnvironmentManager
+
+
+APPSETTINGS = {
+    "base_url": "https://wesign.test",
+    "login_credentials": {
+        "company_user": {"email": "company@example.com", "password": "CompanyPass1!"},
+        "basic_user": {"email": "basic@example.com", "password": "BasicPass123!"}
+    },
+    "test_files_path": "test_files",
+    "timeouts": {"default": 30000, "login": 15000, "upload": 45000, "signing": 60000},
+    "browser_settings": {"headless": True, "viewport": {"width": 1280, "height": 720}}
+}
+
+
+@pytest.fixture
+def make_config():
+    """Build an EnvironmentConfig from appsettings data, with browser_settings overrides"""
+    def make(**browser_settings) -> EnvironmentConfig:
+        data = copy.deepcopy(APPSETTINGS)
+        data["browser_settings"].update(browser_settings)
+        return EnvironmentManager()._parse_config(data)
+    return make
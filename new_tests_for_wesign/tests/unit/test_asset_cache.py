@@ -0,0 +1,146 @@
+"""
+Unit tests for utils/asset_cache.py
+Hits, revalidations and misses of the shared on-disk asset cache
+"""
+
+import json
+
+import pytest
+
+from utils.asset_cache import AssetCache, asset_url_pattern
+
+
+HOST = "wesign.test"
+HASHED_URL = f"https://{HOST}/main.3f2a1c9e1b2d4f5a.js"
+PLAIN_URL = f"https://{HOST}/assets/logo.svg"
+
+
+class FakeResponse:
+    def __init__(self, status=200, headers=None, body=b""):
+        self.status = status
+        self.headers = headers or {}
+        self._body = body
+
+    async def body(self):
+        return self._body
+
+
+class FakeRoute:
+    """Route whose network fetches are scripted per test"""
+
+    def __init__(self, url, network=None, method="GET"):
+        self.request = type("Request", (), {"url": url, "method": method, "headers": {"accept": "*/*"}})()
+        self.network = network
+        self.fetched_headers = []
+        self.fulfilled = None
+        self.fell_back = False
+
+    async def fetch(self, headers=None):
+        self.fetched_headers.append(headers)
+        return self.network
+
+    async def fulfill(self, status=None, headers=None, body=None, response=None):
+        self.fulfilled = {"status": status or response.status, "body": body, "from_network": response is not None}
+
+    async def fallback(self):
+        self.fell_back = True
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return AssetCache(HOST, tmp_path)
+
+
+async def serve(cache, url, network=None, method="GET"):
+    route = FakeRoute(url, network, method)
+    await cache.handle(route)
+    return route
+
+
+class TestHandle:
+    """Serving decisions per request"""
+
+    @pytest.mark.asyncio
+    async def test_hashed_asset_is_served_without_the_network(self, cache):
+        first = await serve(cache, HASHED_URL, FakeResponse(200, {"content-type": "text/javascript"}, b"bundle"))
+        assert first.fulfilled == {"status": 200, "body": b"bundle", "from_network": True}
+
+        second = await serve(cache, HASHED_URL)
+        assert second.fetched_headers == []
+        assert second.fulfilled == {"status": 200, "body": b"bundle", "from_network": False}
+        assert (cache.stats["misses"], cache.stats["hits"], cache.stats["bytes_saved"]) == (1, 1, 6)
+
+    @pytest.mark.asyncio
+    async def test_unchanged_asset_is_revalidated(self, cache):
+        await serve(cache, PLAIN_URL, FakeResponse(200, {"etag": '"v1"', "last-modified": "Mon, 01 Jan 2024"}, b"<svg/>"))
+
+        route = await serve(cache, PLAIN_URL, FakeResponse(304))
+        assert route.fetched_headers[0]["if-none-match"] == '"v1"'
+        assert route.fetched_headers[0]["if-modified-since"] == "Mon, 01 Jan 2024"
+        assert route.fetched_headers[0]["accept"] == "*/*"
+        assert route.fulfilled["body"] == b"<svg/>"
+        assert cache.stats["revalidated"] == 1
+
+    @pytest.mark.asyncio
+    async def test_changed_asset_replaces_the_entry(self, cache):
+        await serve(cache, PLAIN_URL, FakeResponse(200, {"etag": '"v1"'}, b"old"))
+        route = await serve(cache, PLAIN_URL, FakeResponse(200, {"etag": '"v2"'}, b"new"))
+
+        assert route.fulfilled["from_network"]
+        assert cache.load(PLAIN_URL)[0]["etag"] == '"v2"'
+        assert cache.load(PLAIN_URL)[1] == b"new"
+        assert (cache.stats["misses"], cache.stats["revalidated"]) == (2, 0)
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("status, headers", [
+        (200, {"cache-control": "no-store", "etag": '"v1"'}),
+        (200, {"cache-control": "private", "etag": '"v1"'}),
+        (200, {}),
+        (404, {"etag": '"v1"'})
+    ])
+    async def test_uncacheable_responses_are_not_stored(self, cache, status, headers):
+        await serve(cache, PLAIN_URL, FakeResponse(status, headers, b"x"))
+        assert cache.load(PLAIN_URL) is None
+
+    @pytest.mark.asyncio
+    async def test_non_get_requests_fall_back(self, cache):
+        route = await serve(cache, PLAIN_URL, method="POST")
+        assert route.fell_back and route.fulfilled is None
+        assert cache.hit_rate() == 0.0
+
+    @pytest.mark.asyncio
+    async def test_hit_rate(self, cache):
+        await serve(cache, HASHED_URL, FakeResponse(200, {}, b"a"))
+        await serve(cache, HASHED_URL)
+        await serve(cache, HASHED_URL)
+        await serve(cache, PLAIN_URL, FakeResponse(200, {}, b"b"))
+        assert cache.hit_rate() == pytest.approx(0.5)
+
+
+class TestStorage:
+    """Entries on disk shared between workers"""
+
+    def test_half_written_entries_are_ignored(self, cache):
+        cache.store(HASHED_URL, 200, {"content-type": "text/javascript", "set-cookie": "a=b"}, b"bundle")
+        meta, body = cache.load(HASHED_URL)
+        assert meta["headers"] == {"content-type": "text/javascript"}
+        assert body == b"bundle"
+
+        meta_path, body_path = cache._paths(HASHED_URL)
+        body_path.write_bytes(b"bund")
+        assert cache.load(HASHED_URL) is None
+
+        body_path.write_bytes(b"bundle")
+        meta_path.write_text(json.dumps({**meta, "url": PLAIN_URL}), encoding="utf-8")
+        assert cache.load(HASHED_URL) is None
+
+    def test_caches_share_a_directory(self, cache, tmp_path):
+        cache.store(HASHED_URL, 200, {}, b"bundle")
+        assert AssetCache(HOST, tmp_path).load(HASHED_URL)[1] == b"bundle"
+
+    def test_url_pattern(self):
+        pattern = asset_url_pattern(HOST)
+        assert pattern.match(HASHED_URL)
+        assert pattern.match(f"https://{HOST}:8443/fonts/roboto.woff2?v=3")
+        assert not pattern.match(f"https://{HOST}/userapi/ui/v3/documents")
+        assert not pattern.match("https://cdn.example.com/main.js")
@@ -0,0 +1,189 @@
+"""
+Unit tests for utils/auth_state.py
+JWT expiry, TTL invalidation and the memory -> disk -> login fallback order
+"""
+
+import base64
+import json
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from utils.auth_state import AuthStateCache, EXPIRY_SKEW_SECONDS, decode_jwt_expiry, find_tokens
+
+
+def make_jwt(claims):
+    payload = base64.urlsafe_b64encode(json.dumps(claims).encode()).decode().rstrip("=")
+    return f"eyJhbGciOiJIUzI1NiJ9.{payload}.c2lnbmF0dXJl"
+
+
+def make_state(email="company@example.com", age=0, expires_in=None):
+    token = make_jwt({"sub": email, "exp": time.time() + expires_in} if expires_in else {"sub": email})
+    return {
+        "user_type": "company_user",
+        "email": email,
+        "created_at": time.time() - age,
+        "token_expires_at": decode_jwt_expiry(token),
+        "storage_state": {
+            "cookies": [{"name": "session", "value": "opaque"}],
+            "origins": [{"origin": "https://wesign.test", "localStorage": [{"name": "token", "value": f'"{token}"'}]}]
+        },
+        "session_storage": {"refresh": f"Bearer {token}"}
+    }
+
+
+class FakeAuthStateCache(AuthStateCache):
+    """Logins and probes are scripted instead of driving a browser"""
+
+    def __init__(self, *args, probe_result=True, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.probe_result = probe_result
+        self.calls = []
+
+    async def _probe(self, state):
+        self.calls.append("probe")
+        return self.probe_result
+
+    async def _login(self, user_type):
+        self.calls.append("login")
+        self.stats["logins"] += 1
+        return make_state(self.credentials_for(user_type).email, expires_in=3600)
+
+
+@pytest.fixture
+def cache(make_config, tmp_path):
+    return FakeAuthStateCache(make_config(), pool=None, cache_dir=tmp_path, ttl_seconds=600, worker_id="gw0")
+
+
+class TestTokens:
+    """JWT discovery and expiry decoding"""
+
+    def test_decode_jwt_expiry(self):
+        assert decode_jwt_expiry(make_jwt({"exp": 1900000000})) == 1900000000.0
+        assert decode_jwt_expiry("Bearer " + make_jwt({"exp": 1900000000})) == 1900000000.0
+        assert decode_jwt_expiry(make_jwt({"sub": "no-exp"})) is None
+        assert decode_jwt_expiry("opaque-session-id") is None
+        assert decode_jwt_expiry("eyJhbGciOiJIUzI1NiJ9.bm90LWpzb24.x") is None
+
+    def test_find_tokens_in_storage(self):
+        tokens = find_tokens(make_state(expires_in=3600))
+
+        assert len(tokens) == 2
+        assert tokens[0].startswith("eyJ") and tokens[1].startswith("Bearer eyJ")
+
+
+class TestFreshness:
+    """TTL and token expiry checks"""
+
+    def test_fresh_state(self, cache):
+        assert cache.is_fresh(make_state(age=10, expires_in=3600))
+        assert cache.is_fresh(make_state(age=10))
+
+    def test_ttl_expired(self, cache):
+        assert not cache.is_fresh(make_state(age=600, expires_in=3600))
+
+    def test_zero_ttl_never_reuses(self, make_config, tmp_path):
+        cache = FakeAuthStateCache(make_config(), pool=None, cache_dir=tmp_path, ttl_seconds=0, worker_id="gw0")
+        assert cache.ttl_seconds == 0
+        assert not cache.is_fresh(make_state(age=0, expires_in=3600))
+
+    def test_token_expiring_within_skew(self, cache):
+        assert cache.is_fresh(make_state(expires_in=EXPIRY_SKEW_SECONDS + 30))
+        assert not cache.is_fresh(make_state(expires_in=EXPIRY_SKEW_SECONDS - 30))
+
+
+class TestGetState:
+    """Memory, then disk (probed once), then a real login"""
+
+    @pytest.mark.asyncio
+    async def test_login_once_then_reuse(self, cache):
+        first = await cache.get_state("company_user")
+        second = await cache.get_state("company_user")
+
+        assert first is second
+        assert cache.calls == ["login"]
+        assert cache.stats["reused"] == 1
+        assert json.loads(cache.state_path("company_user").read_text())["email"] == "company@example.com"
+
+    @pytest.mark.asyncio
+    async def test_disk_state_probed(self, cache):
+        cache._save("company_user", make_state(age=60, expires_in=3600))
+
+        await cache.get_state("company_user")
+
+        assert cache.calls == ["probe"]
+
+    @pytest.mark.asyncio
+    async def test_rejected_disk_state_logs_in(self, cache):
+        cache.probe_result = False
+        cache._save("company_user", make_state(age=60, expires_in=3600))
+
+        await cache.get_state("company_user")
+
+        assert cache.calls == ["probe", "login"]
+
+    @pytest.mark.parametrize("state", [
+        make_state(age=3600, expires_in=7200),
+        make_state(expires_in=10),
+        make_state(email="someone-else@example.com", expires_in=3600)
+    ], ids=["ttl", "token-expiry", "other-user"])
+    @pytest.mark.asyncio
+    async def test_unusable_disk_state_skips_probe(self, cache, state):
+        cache._save("company_user", state)
+
+        await cache.get_state("company_user")
+
+        assert cache.calls == ["login"]
+
+    @pytest.mark.asyncio
+    async def test_memory_state_expires(self, cache):
+        await cache.get_state("company_user")
+
+        later = time.time() + cache.ttl_seconds
+        with patch("time.time", lambda: later):
+            await cache.get_state("company_user")
+
+        assert cache.calls == ["login", "login"]
+
+    @pytest.mark.asyncio
+    async def test_invalidate(self, cache):
+        await cache.get_state("company_user")
+
+        cache.invalidate("company_user")
+        await cache.get_state("company_user")
+
+        assert cache.calls == ["login", "login"]
+
+    def test_unknown_user_type(self, cache):
+        with pytest.raises(ValueError, match="Unknown user type"):
+            cache.credentials_for("admin_user")
+
+
+class TestNewPage:
+    """Logged-in pages checked through restore(), with one retry after a rejection"""
+
+    @pytest.fixture
+    def context(self, cache):
+        context = MagicMock(close=AsyncMock(), new_page=AsyncMock(return_value=MagicMock()))
+        cache.pool = MagicMock(new_context=AsyncMock(return_value=context))
+        return context
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("outcomes", [[True], [False, True]], ids=["restored", "rejected-then-login"])
+    async def test_returns_logged_in_page(self, cache, context, outcomes):
+        with patch.object(cache, "restore", AsyncMock(side_effect=outcomes)) as restore:
+            page = await cache.new_page("basic_user")
+
+        assert page is context.new_page.return_value
+        assert restore.await_count == len(outcomes)
+        restore.assert_awaited_with(page, "basic_user")
+        context.close.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_closes_context_when_login_fails(self, cache, context):
+        with patch.object(cache, "restore", AsyncMock(return_value=False)):
+            with pytest.raises(RuntimeError, match="basic_user"):
+                await cache.new_page("basic_user")
+
+        context.close.assert_awaited_once()
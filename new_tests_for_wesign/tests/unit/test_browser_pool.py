@@ -0,0 +1,178 @@
+"""
+Unit tests for utils/browser_pool.py
+Fake Playwright objects stand in for Chromium, so no browser is launched
+"""
+
+import asyncio
+import logging
+from unittest.mock import patch
+
+import pytest
+
+from utils import browser_pool
+from utils.browser_pool import BrowserPool, pooled_playwright, get_active_pool, set_active_pool
+
+
+class FakePage:
+    def __init__(self):
+        self._handlers = {}
+
+    def on(self, event, handler):
+        self._handlers.setdefault(event, []).append(handler)
+
+    def close(self):
+        for handler in self._handlers.get("close", []):
+            handler(self)
+
+
+class FakeContext:
+    def __init__(self, options, fail_close=False):
+        self.options = options
+        self.closed = 0
+        self.fail_close = fail_close
+
+    async def new_page(self):
+        return FakePage()
+
+    async def close(self, **kwargs):
+        await asyncio.sleep(0)
+        self.closed += 1
+        if self.fail_close:
+            raise RuntimeError("context already gone")
+
+
+class FakeBrowser:
+    def __init__(self):
+        self.connected = True
+        self.closed = False
+        self.contexts = []
+        self.fail_close = False
+
+    def is_connected(self):
+        return self.connected
+
+    async def new_context(self, **options):
+        context = FakeContext(options, fail_close=self.fail_close)
+        self.contexts.append(context)
+        return context
+
+    async def close(self):
+        self.closed = True
+
+
+class FakePlaywright:
+    def __init__(self):
+        self.browsers = []
+        self.stopped = False
+        self.chromium = self
+
+    async def start(self):
+        return self
+
+    async def launch(self, **options):
+        browser = FakeBrowser()
+        self.browsers.append(browser)
+        return browser
+
+    async def stop(self):
+        self.stopped = True
+
+
+@pytest.fixture
+def fake_playwright():
+    playwright = FakePlaywright()
+    with patch.object(browser_pool, "async_playwright", lambda: playwright):
+        yield playwright
+
+
+@pytest.fixture
+def active_pool():
+    """Register a test pool in place of the session's, restoring it afterwards"""
+    session_pool = get_active_pool()
+    yield set_active_pool
+    set_active_pool(session_pool)
+
+
+class TestBrowserPool:
+    """Launch once, relaunch after a disconnect, close what new_page() opened"""
+
+    @pytest.mark.asyncio
+    async def test_browser_reused_across_contexts(self, fake_playwright):
+        pool = BrowserPool(context_options={"locale": "he-IL"})
+
+        first = await pool.new_context()
+        second = await pool.new_context(locale="en-US")
+        browsers = await asyncio.gather(pool.get_browser(), pool.get_browser())
+
+        assert len(fake_playwright.browsers) == 1 and pool.stats["launches"] == 1
+        assert browsers[0] is browsers[1] is fake_playwright.browsers[0]
+        assert (first.options, second.options) == ({"locale": "he-IL"}, {"locale": "en-US"})
+        assert pool.stats["contexts_created"] == 2
+
+    @pytest.mark.asyncio
+    async def test_relaunch_after_disconnect(self, fake_playwright):
+        pool = BrowserPool()
+        crashed = await pool.get_browser()
+        crashed.connected = False
+
+        relaunched = await pool.get_browser()
+
+        assert relaunched is not crashed and pool.is_running
+        assert pool.stats["launches"] == 2
+
+    @pytest.mark.asyncio
+    async def test_context_hooks(self, fake_playwright, caplog):
+        pool = BrowserPool()
+        seen = []
+
+        async def on_open(context):
+            seen.append(("open", context))
+
+        async def on_close(context):
+            seen.append(("close", context))
+            raise RuntimeError("trace export failed")
+
+        pool.context_hooks.append(on_open)
+        pool.context_close_hooks.append(on_close)
+        context = await pool.new_context()
+        with caplog.at_level(logging.ERROR, logger=browser_pool.__name__):
+            await context.close()
+            await context.close()
+
+        assert seen == [("open", context), ("close", context)]
+        assert context.closed == 2
+        assert "Context close hook failed" in caplog.text
+
+    @pytest.mark.asyncio
+    async def test_stop_waits_for_page_context_close(self, fake_playwright, caplog):
+        pool = BrowserPool()
+        page = await pool.new_page()
+        browser = fake_playwright.browsers[0]
+        browser.fail_close = True
+        failing_page = await pool.new_page()
+
+        page.close()
+        failing_page.close()
+        with caplog.at_level(logging.ERROR, logger=browser_pool.__name__):
+            await pool.stop()
+
+        assert [context.closed for context in browser.contexts] == [1, 1]
+        assert browser.closed and fake_playwright.stopped and not pool.is_running
+        assert "Closing a pooled page's context failed" in caplog.text
+
+    @pytest.mark.asyncio
+    async def test_pooled_playwright_leases_contexts(self, fake_playwright, active_pool):
+        pool = BrowserPool()
+        active_pool(pool)
+        async with pooled_playwright() as p:
+            browser = await p.chromium.launch(headless=False, slow_mo=100)
+            await browser.new_page()
+            await browser.new_page()
+
+        shared = fake_playwright.browsers[0]
+        assert [context.closed for context in shared.contexts] == [1, 1]
+        assert not shared.closed and pool.stats["pages_created"] == 2
+
+    def test_pooled_playwright_without_pool(self, fake_playwright, active_pool):
+        active_pool(None)
+        assert pooled_playwright() is fake_playwright
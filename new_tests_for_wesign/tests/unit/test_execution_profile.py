@@ -0,0 +1,105 @@
+"""
+Unit tests for execution profile resolution (config/environment.py)
+and the options ProfileRuntime derives from a profile
+"""
+
+import pytest
+
+from config.environment import EnvironmentManager, get_execution_profile
+from utils.execution_profile import ProfileRuntime, third_party_pattern
+
+
+@pytest.fixture(autouse=True)
+def no_profile_environment(monkeypatch):
+    """Selection must not depend on the shell running the tests"""
+    monkeypatch.delenv("WESIGN_BROWSER_PROFILE", raising=False)
+    monkeypatch.delenv("CI", raising=False)
+
+
+class TestSelection:
+    """Which profile is picked"""
+
+    def test_defaults_to_browser_settings(self, make_config):
+        profile = get_execution_profile(config=make_config(slowMo=250, devtools=True))
+        assert profile.name == "config"
+        assert (profile.headless, profile.slow_mo, profile.devtools) == (True, 250, True)
+        assert profile.viewport == {"width": 1280, "height": 720}
+        assert (profile.tracing, profile.video) == ("off", "off")
+
+    def test_ci_picks_ci_fast(self, make_config, monkeypatch):
+        monkeypatch.setenv("CI", "true")
+        assert get_execution_profile(config=make_config()).name == "ci-fast"
+
+    def test_config_profile_beats_ci(self, make_config, monkeypatch):
+        monkeypatch.setenv("CI", "true")
+        assert get_execution_profile(config=make_config(profile="perf-measure")).name == "perf-measure"
+
+    def test_environment_variable_beats_config(self, make_config, monkeypatch):
+        monkeypatch.setenv("WESIGN_BROWSER_PROFILE", "debug")
+        assert get_execution_profile(config=make_config(profile="perf-measure")).name == "debug"
+
+    def test_explicit_name_beats_everything(self, make_config, monkeypatch):
+        monkeypatch.setenv("WESIGN_BROWSER_PROFILE", "debug")
+        assert get_execution_profile("ci-fast", make_config(profile="perf-measure")).name == "ci-fast"
+
+    def test_unknown_profile(self, make_config):
+        with pytest.raises(ValueError, match="Unknown execution profile: turbo"):
+            get_execution_profile("turbo", make_config())
+
+
+class TestOverrides:
+    """browser_settings.profiles.<name> on top of the built-in profiles"""
+
+    def test_built_in_values_win_over_browser_settings(self, make_config):
+        profile = get_execution_profile("ci-fast", make_config(headless=False, slowMo=500, devtools=True))
+        assert (profile.headless, profile.slow_mo, profile.devtools) == (True, 0, False)
+        assert profile.disable_animations and profile.block_third_party
+
+    def test_config_overrides_a_built_in_profile(self, make_config):
+        config = make_config(profiles={"ci-fast": {"allowed_hosts": ["cdn.example.com"], "tracing": "off", "bogus": 1}})
+        profile = get_execution_profile("ci-fast", config)
+        assert profile.allowed_hosts == ["cdn.example.com"]
+        assert profile.tracing == "off"
+        assert profile.block_third_party
+
+    def test_profile_defined_only_in_config(self, make_config):
+        profile = get_execution_profile("smoke", make_config(slowMo=10, profiles={"smoke": {"video": "on"}}))
+        assert (profile.name, profile.video, profile.slow_mo) == ("smoke", "on", 10)
+
+    def test_shipped_dev_settings_slow_down_debug(self):
+        config = EnvironmentManager().load_config("dev")
+        assert get_execution_profile("debug", config).slow_mo == 100
+        assert get_execution_profile(config=config).slow_mo == 0
+
+    def test_shipped_local_settings_default_to_debug(self):
+        profile = get_execution_profile(config=EnvironmentManager().load_config("local"))
+        assert profile.name == "debug"
+        assert (profile.headless, profile.slow_mo) == (False, 500)
+
+
+class TestRuntimeOptions:
+    """Launch and context options built from a profile"""
+
+    def test_debug_is_headed_and_maximized(self, make_config):
+        runtime = ProfileRuntime(get_execution_profile("debug", make_config(slowMo=100)), "https://wesign.test")
+        launch = runtime.launch_options()
+        assert (launch["headless"], launch["slow_mo"]) == (False, 100)
+        assert "--start-maximized" in launch["args"]
+
+        context = runtime.context_options()
+        assert context["no_viewport"] is True and "viewport" not in context
+        assert context["record_video_dir"].endswith("videos")
+
+    def test_perf_measure_is_cold(self, make_config):
+        runtime = ProfileRuntime(get_execution_profile("perf-measure", make_config()), "https://wesign.test")
+        assert runtime.context_options()["viewport"] == {"width": 1920, "height": 1080}
+        assert "record_video_dir" not in runtime.context_options()
+        assert runtime.profile.asset_cache is False
+
+    def test_third_party_pattern(self):
+        pattern = third_party_pattern(["wesign.test", "localhost"])
+        assert not pattern.match("https://wesign.test/userapi/ui/v3/users")
+        assert not pattern.match("https://cdn.wesign.test/main.js")
+        assert not pattern.match("http://localhost:4200/")
+        assert pattern.match("https://www.google-analytics.com/collect")
+        assert pattern.match("https://wesign.test.evil.com/")
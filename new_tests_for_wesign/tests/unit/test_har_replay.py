@@ -0,0 +1,247 @@
+"""
+Unit tests for utils/har_replay.py
+Route registration per mode, HAR merging and stale-recording detection
+"""
+
+import json
+import urllib.error
+from unittest.mock import patch
+
+import pytest
+
+from utils import har_replay
+from utils.har_replay import (
+    API_URL_PATTERN, DEFAULT_URL_PATTERN, HarModuleSession, HarSettings, StaleReport,
+    add_stale_report, export_stale_reports, get_stale_reports, index_bundles, merge_har_files,
+    record_stale_reports
+)
+
+
+BASE_URL = "https://wesign.test"
+
+
+class FakeContext:
+    """Records the routes and HAR routing a session sets up"""
+
+    def __init__(self):
+        self.calls = []
+
+    def on(self, event, handler):
+        self.calls.append(("on", event))
+
+    async def route(self, url, handler):
+        self.calls.append(("route", url))
+
+    async def route_from_har(self, har, **options):
+        self.calls.append(("route_from_har", har, options))
+
+
+class FakeRoute:
+    def __init__(self, method, url):
+        self.request = type("Request", (), {"method": method, "url": url})()
+        self.outcome = None
+
+    async def abort(self):
+        self.outcome = "abort"
+
+    async def continue_(self):
+        self.outcome = "continue"
+
+
+def har_entry(method, url, status=200, body=None):
+    request = {"method": method, "url": url}
+    if body is not None:
+        request["postData"] = {"text": body}
+    return {"request": request, "response": {"status": status}}
+
+
+def write_har(path, entries):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps({"log": {"version": "1.2", "entries": entries}}), encoding="utf-8")
+
+
+@pytest.fixture(autouse=True)
+def isolated_module_state(monkeypatch):
+    """Live index lookups and stale reports are per process; keep tests apart"""
+    monkeypatch.setattr(har_replay, "_live_index", {})
+    monkeypatch.setattr(har_replay, "_stale_reports", [])
+
+
+@pytest.fixture
+def make_session(tmp_path, monkeypatch):
+    monkeypatch.delenv("PYTEST_XDIST_WORKER", raising=False)
+
+    def make(mode, **settings):
+        return HarModuleSession(HarSettings(mode=mode, har_dir=tmp_path, **settings), "tests.test_docs", BASE_URL)
+    return make
+
+
+class TestAttach:
+    """What each mode registers on a new context"""
+
+    def test_default_pattern_covers_whole_app(self):
+        settings = HarSettings()
+        assert settings.url_pattern == DEFAULT_URL_PATTERN == "**/*"
+        assert settings.not_found == "abort"
+
+    @pytest.mark.asyncio
+    async def test_record_writes_a_part_per_context(self, make_session, tmp_path):
+        session = make_session("record")
+        first, second = FakeContext(), FakeContext()
+        await session.attach(first)
+        await session.attach(second)
+
+        _, part, options = first.calls[-1]
+        assert part == tmp_path / ".parts" / "tests.test_docs" / "main-0001.har"
+        assert second.calls[-1][1].name == "main-0002.har"
+        assert options == {"url": "**/*", "update": True, "update_content": "embed", "update_mode": "minimal"}
+        assert not [call for call in first.calls if call[0] == "route"]
+
+    @pytest.mark.asyncio
+    async def test_replay_routes_misses_before_the_har(self, make_session):
+        session = make_session("replay")
+        write_har(session.har_path, [])
+        context = FakeContext()
+        await session.attach(context)
+
+        assert context.calls == [
+            ("on", "response"),
+            ("route", "**/*"),
+            ("route_from_har", session.har_path, {"url": "**/*", "not_found": "fallback"})
+        ]
+
+    @pytest.mark.asyncio
+    async def test_api_only_pattern_is_opt_in(self, make_session):
+        session = make_session("replay", url_pattern=API_URL_PATTERN)
+        write_har(session.har_path, [])
+        context = FakeContext()
+        await session.attach(context)
+
+        assert ("route", "**/userapi/**") in context.calls
+        assert context.calls[-1][2]["url"] == "**/userapi/**"
+
+    @pytest.mark.asyncio
+    async def test_missing_recording_routes_only_misses(self, make_session):
+        context = FakeContext()
+        await make_session("replay").attach(context)
+        assert [call[0] for call in context.calls] == ["on", "route"]
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("not_found, outcome", [("abort", "abort"), ("fallback", "continue")])
+    async def test_unrecorded_requests(self, make_session, not_found, outcome):
+        session = make_session("replay", not_found=not_found)
+        route = FakeRoute("GET", f"{BASE_URL}/assets/logo.svg")
+        await session._on_miss(route)
+
+        assert route.outcome == outcome
+        assert session._misses == [f"GET {BASE_URL}/assets/logo.svg"]
+
+
+class TestMerge:
+    """Per-context parts become one deduplicated HAR"""
+
+    def test_duplicates_are_dropped(self, tmp_path):
+        login = har_entry("POST", f"{BASE_URL}/userapi/ui/v3/users/login", body='{"email": "a"}')
+        write_har(tmp_path / "a.har", [har_entry("GET", f"{BASE_URL}/"), login])
+        write_har(tmp_path / "b.har", [
+            har_entry("GET", f"{BASE_URL}/"),
+            login,
+            har_entry("POST", f"{BASE_URL}/userapi/ui/v3/users/login", body='{"email": "b"}')
+        ])
+
+        target = tmp_path / "merged" / "module.har"
+        assert merge_har_files([tmp_path / "a.har", tmp_path / "b.har"], target) == 3
+        assert len(json.loads(target.read_text())["log"]["entries"]) == 3
+
+    def test_unreadable_parts_are_skipped(self, tmp_path):
+        (tmp_path / "broken.har").write_text("{", encoding="utf-8")
+        write_har(tmp_path / "ok.har", [har_entry("GET", f"{BASE_URL}/")])
+
+        assert merge_har_files([tmp_path / "broken.har", tmp_path / "ok.har"], tmp_path / "out.har") == 1
+        assert merge_har_files([tmp_path / "broken.har"], tmp_path / "none.har") == 0
+        assert not (tmp_path / "none.har").exists()
+
+
+class TestFrontendBuild:
+    """Bundle fingerprints of the recorded and the live frontend"""
+
+    def test_index_bundles(self):
+        html = """<link rel="stylesheet" href="styles.9b8e.css?v=2">
+            <script src="/runtime.1a2b.js"></script><script src='main.3f2a.js'></script>
+            <link rel="icon" href="favicon.ico"><script src="https://cdn.example.com/lib.js"></script>"""
+        assert index_bundles(html, BASE_URL) == ["/main.3f2a.js", "/runtime.1a2b.js", "/styles.9b8e.css"]
+
+    def test_unreachable_frontend_is_fetched_once(self):
+        with patch("utils.har_replay.urllib.request.urlopen", side_effect=urllib.error.URLError("offline")) as urlopen:
+            assert har_replay.fetch_index_bundles(BASE_URL) is None
+            assert har_replay.fetch_index_bundles(BASE_URL) is None
+        assert urlopen.call_count == 1
+
+
+class TestFinish:
+    """Recording metadata and stale-replay reasons"""
+
+    def test_record_merges_parts_and_writes_meta(self, make_session):
+        session = make_session("record")
+        write_har(session.parts_dir / "main-0001.har", [har_entry("GET", f"{BASE_URL}/")])
+        session._frontend_urls = {f"{BASE_URL}/main.3f2a.js", f"{BASE_URL}/assets/logo.svg"}
+
+        with patch("utils.har_replay.fetch_index_bundles", return_value=["/main.3f2a.js"]):
+            assert session.finish() is None
+
+        meta = json.loads(session.meta_path.read_text())
+        assert meta["entries"] == 1
+        assert meta["url_pattern"] == "**/*"
+        assert meta["frontend_bundles"] == ["/main.3f2a.js"]
+        assert meta["index_bundles"] == ["/main.3f2a.js"]
+        assert session.har_path.exists()
+        assert not list(session.parts_dir.glob("*.har"))
+
+    def replayed(self, make_session, meta, frontend_urls=(), misses=()):
+        session = make_session("replay")
+        write_har(session.har_path, [])
+        session.meta_path.write_text(json.dumps(meta), encoding="utf-8")
+        session._meta = session._load_meta()
+        session._frontend_urls = set(frontend_urls)
+        session._misses = list(misses)
+        return session
+
+    def test_live_build_change_is_stale(self, make_session):
+        session = self.replayed(
+            make_session, {"index_bundles": ["/main.3f2a.js"], "frontend_bundles": ["/main.3f2a.js"]},
+            frontend_urls=[f"{BASE_URL}/main.3f2a.js"]
+        )
+        with patch("utils.har_replay.fetch_index_bundles", return_value=["/main.77aa.js"]):
+            report = session.finish()
+        assert report.reasons == ["live frontend build differs from the recorded one"]
+
+    def test_offline_replay_of_a_full_recording_is_fresh(self, make_session):
+        session = self.replayed(
+            make_session, {"index_bundles": ["/main.3f2a.js"], "frontend_bundles": ["/main.3f2a.js"]},
+            frontend_urls=[f"{BASE_URL}/main.3f2a.js"]
+        )
+        with patch("utils.har_replay.fetch_index_bundles", return_value=None):
+            assert not session.finish().is_stale
+
+    def test_api_only_replay_compares_loaded_bundles(self, make_session):
+        session = self.replayed(
+            make_session, {"frontend_bundles": ["/main.3f2a.js"]},
+            frontend_urls=[f"{BASE_URL}/main.77aa.js"], misses=["GET https://wesign.test/userapi/ui/v3/contacts"]
+        )
+        report = session.finish()
+        assert report.reasons == ["1 request(s) not in the recording", "frontend bundles changed since recording"]
+        assert report.misses == ["GET https://wesign.test/userapi/ui/v3/contacts"]
+
+
+class TestStaleReports:
+    """Worker reports survive the trip through xdist workeroutput"""
+
+    def test_export_and_record_round_trip(self):
+        add_stale_report(StaleReport(module="tests.test_docs", reasons=["no recording for this module"]))
+        add_stale_report(StaleReport(module="tests.test_fresh"))
+
+        exported = export_stale_reports()
+        assert json.loads(json.dumps(exported)) == exported
+
+        record_stale_reports(exported)
+        assert [report.module for report in get_stale_reports()] == ["tests.test_docs", "tests.test_docs"]
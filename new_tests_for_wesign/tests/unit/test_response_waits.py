@@ -0,0 +1,210 @@
+"""
+Unit tests for utils/response_waits.py
+A fake page emits request events; responses are resolved by the test
+"""
+
+import asyncio
+import gc
+import weakref
+
+import pytest
+
+from utils import response_waits
+from utils.response_waits import (
+    BackendRequest, ResponseWaiter, export_action_timings, latency_summary, record_action_timings
+)
+
+
+LOGIN = BackendRequest("auth.login", "POST", r"/users/login")
+
+
+class FakeResponse:
+    def __init__(self, status, request):
+        self.status = status
+        self.request = request
+        self.url = request.url
+
+
+class FakeRequest:
+    def __init__(self, page, method, url):
+        self.page = page
+        self.method = method
+        self.url = url
+        self._response = asyncio.get_running_loop().create_future()
+
+    def respond(self, status=200):
+        """Complete the request (status None: failed), emitting the page events Playwright would"""
+        response = FakeResponse(status, self) if status else None
+        self._response.set_result(response)
+        self.page.emit("response" if response else "requestfailed", response or self)
+        self.page.emit("requestfinished", self)
+
+    async def response(self):
+        return await self._response
+
+
+class FakeLocator:
+    first = property(lambda self: self)
+
+    async def wait_for(self, **kwargs):
+        pass
+
+    async def count(self):
+        return 1
+
+
+class FakePage:
+    def __init__(self):
+        self.listeners = {}
+
+    def on(self, event, handler):
+        self.listeners.setdefault(event, []).append(handler)
+
+    def remove_listener(self, event, handler):
+        self.listeners[event].remove(handler)
+
+    def emit(self, event, payload):
+        for handler in list(self.listeners.get(event, [])):
+            handler(payload)
+
+    def send(self, method, url):
+        request = FakeRequest(self, method, url)
+        self.emit("request", request)
+        return request
+
+    def locator(self, selector):
+        return FakeLocator()
+
+    async def evaluate(self, script):
+        pass
+
+
+@pytest.fixture(autouse=True)
+def timings():
+    """Keep these tests' timings out of the session's latency summary"""
+    saved = list(response_waits._timings)
+    response_waits._timings.clear()
+    yield response_waits._timings
+    response_waits._timings[:] = saved
+
+
+@pytest.fixture
+def page():
+    return FakePage()
+
+
+class TestPerform:
+    """perform() waits for the response to the request its trigger started"""
+
+    @pytest.mark.asyncio
+    async def test_response_of_triggered_request(self, page):
+        waiter = ResponseWaiter(page, start_timeout=500)
+
+        async def trigger():
+            request = page.send("POST", "https://wesign.test/userapi/v3/users/login")
+            asyncio.get_running_loop().call_later(0.01, request.respond, 200)
+
+        timing = await waiter.perform("login", LOGIN, trigger)
+
+        assert timing.matched and timing.status == 200 and timing.response_ms is not None
+        assert page.listeners["request"] == [waiter._in_flight.add]
+
+    @pytest.mark.asyncio
+    async def test_in_flight_request_ignored(self, page):
+        waiter = ResponseWaiter(page, start_timeout=500)
+        earlier = page.send("POST", "https://wesign.test/userapi/v3/users/login")
+
+        async def trigger():
+            request = page.send("POST", "https://wesign.test/userapi/v3/users/login")
+            # The earlier request completes first and must not satisfy the wait
+            earlier.respond(401)
+            asyncio.get_running_loop().call_later(0.01, request.respond, 200)
+
+        timing = await waiter.perform("login", LOGIN, trigger)
+
+        assert timing.matched and timing.status == 200
+
+    @pytest.mark.asyncio
+    async def test_no_request_started(self, page):
+        waiter = ResponseWaiter(page, start_timeout=50)
+
+        async def trigger():
+            pass  # Client-side validation error: nothing sent
+
+        timing = await waiter.perform("login", LOGIN, trigger)
+
+        assert not timing.matched and timing.status is None and timing.response_ms is None
+
+    @pytest.mark.asyncio
+    async def test_other_requests_ignored(self, page):
+        waiter = ResponseWaiter(page, start_timeout=50)
+
+        async def trigger():
+            page.send("GET", "https://wesign.test/userapi/v3/users/login").respond(200)
+            page.send("POST", "https://wesign.test/userapi/v3/documents").respond(200)
+
+        timing = await waiter.perform("login", LOGIN, trigger)
+
+        assert not timing.matched
+
+    @pytest.mark.asyncio
+    async def test_failed_request(self, page):
+        waiter = ResponseWaiter(page, start_timeout=500)
+
+        async def trigger():
+            page.send("POST", "https://wesign.test/userapi/v3/users/login").respond(None)
+
+        timing = await waiter.perform("login", LOGIN, trigger)
+
+        assert timing.matched and timing.status is None
+
+
+class TestSettle:
+    """settle() waits for requests already in flight"""
+
+    @pytest.mark.asyncio
+    async def test_waits_for_in_flight_request(self, page):
+        documents = BackendRequest("documents.list", "GET", r"/documents")
+        waiter = ResponseWaiter(page)
+        request = page.send("GET", "https://wesign.test/userapi/v3/documents?offset=0")
+        asyncio.get_running_loop().call_later(0.01, request.respond, 200)
+
+        timing = await waiter.settle(documents, dom_selector="table tbody tr")
+
+        assert timing.matched and timing.status == 200 and timing.action == "documents.list.settle"
+
+
+class TestSharedWaiter:
+    """One waiter per page, released together with the page"""
+
+    def test_for_page_shares_waiter(self, page):
+        assert ResponseWaiter.for_page(page) is ResponseWaiter.for_page(page)
+
+    def test_page_not_kept_alive(self):
+        page = FakePage()
+        waiter = ResponseWaiter.for_page(page)
+        page_ref = weakref.ref(page)
+
+        del page
+        gc.collect()
+
+        assert page_ref() is None and waiter not in ResponseWaiter._instances.values()
+        with pytest.raises(RuntimeError):
+            waiter.page
+
+
+class TestSummary:
+    """Per-action latency summary and the xdist hand-off"""
+
+    def test_latency_summary_merges_workers(self, timings):
+        exported = [
+            {"action": "login", "request": "auth.login", "status": 200, "response_ms": 100.0,
+             "dom_ms": 10.0, "total_ms": 110.0, "matched": True, "timestamp": 0.0},
+            {"action": "login", "request": "auth.login", "status": None, "response_ms": None,
+             "dom_ms": 5.0, "total_ms": 50.0, "matched": False, "timestamp": 0.0}
+        ]
+
+        record_action_timings(exported)
+
+        assert export_action_timings() == exported
+        assert latency_summary() == {"login": {"count": 2, "max_ms": 110.0, "unmatched": 1, "mean_ms": 80.0}}
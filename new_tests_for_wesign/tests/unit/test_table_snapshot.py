@@ -0,0 +1,84 @@
+"""
+Unit tests for utils/table_snapshot.py
+The in-page scripts are replaced by canned rows; these tests cover the Python side
+"""
+
+import pytest
+
+from utils.table_snapshot import COUNT_SCRIPT, SNAPSHOT_SCRIPT, RowRecord, TableSnapshot, count_first_match
+
+
+RAW_ROWS = [
+    {"text": "Contract.pdf  Signed", "visible": True, "cells": ["Contract.pdf", "Signed"], "fields": {"name": "Contract.pdf"}},
+    {"text": "Draft.pdf", "visible": False, "cells": ["Draft.pdf"], "fields": {"name": "Draft.pdf"}}
+]
+
+
+class FakeRowsLocator:
+    def __init__(self, calls):
+        self.calls = calls
+
+    async def evaluate_all(self, script, arg):
+        self.calls.append((script, arg))
+        if script == SNAPSHOT_SCRIPT:
+            return RAW_ROWS
+        return sum(1 for row in RAW_ROWS if row["visible"] or not arg)
+
+    def nth(self, index):
+        return ("row", index)
+
+
+class FakePage:
+    def __init__(self):
+        self.calls = []
+
+    def locator(self, selector):
+        self.calls.append(("locator", selector))
+        return FakeRowsLocator(self.calls)
+
+    async def evaluate(self, script, arg):
+        self.calls.append((script, arg))
+        return 3
+
+
+@pytest.fixture
+def page():
+    return FakePage()
+
+
+class TestTableSnapshot:
+    """One evaluate call per capture/count"""
+
+    @pytest.mark.asyncio
+    async def test_capture(self, page):
+        snapshot = TableSnapshot(page, "tbody tr", cell_selector="td", fields={"name": "td.name"})
+
+        records = await snapshot.capture()
+
+        assert [(record.index, record.visible, record.fields["name"]) for record in records] == [
+            (0, True, "Contract.pdf"), (1, False, "Draft.pdf")]
+        assert page.calls == [("locator", "tbody tr"), (SNAPSHOT_SCRIPT, ["td", {"name": "td.name"}])]
+        assert records[0].cell(1) == "Signed" and records[1].cell(1, "-") == "-"
+        assert records[1].element == ("row", 1)
+
+    @pytest.mark.asyncio
+    async def test_capture_visible_only(self, page):
+        records = await TableSnapshot(page, "tbody tr").capture(visible_only=True)
+
+        assert [record.text for record in records] == ["Contract.pdf  Signed"]
+        assert records[0].index == 0
+
+    @pytest.mark.asyncio
+    async def test_count(self, page):
+        snapshot = TableSnapshot(page, "tbody tr")
+
+        assert (await snapshot.count(), await snapshot.count(visible_only=True)) == (2, 1)
+        assert [call for call in page.calls if call[0] == COUNT_SCRIPT] == [(COUNT_SCRIPT, False), (COUNT_SCRIPT, True)]
+
+    @pytest.mark.asyncio
+    async def test_count_first_match(self, page):
+        assert await count_first_match(page, ("table tr", ".list-item")) == 3
+        assert page.calls[-1][1] == ["table tr", ".list-item"]
+
+    def test_record_without_locator(self):
+        assert RowRecord(index=0, text="", visible=True).element is None
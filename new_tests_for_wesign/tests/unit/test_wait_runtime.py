@@ -0,0 +1,168 @@
+"""
+Unit tests for utils/wait_runtime.py and the WeSignSmartWaits built on it
+The in-page race is replaced by scripted results from a fake page
+"""
+
+import pytest
+
+from utils.smart_waits import WeSignSmartWaits
+from utils.wait_runtime import (
+    RACE_SCRIPT, WAIT_RUNTIME_SCRIPT, WaitRuntime,
+    appeared_then_gone, appears, count_at_least, gone, present, quiet, url_contains, visible
+)
+
+
+def race_result(condition=None, satisfied=(), timed_out=False):
+    return {"condition": condition, "elapsed_ms": 12.5, "satisfied": list(satisfied), "timed_out": timed_out}
+
+
+class FakeContext:
+    def __init__(self):
+        self.init_scripts = []
+
+    async def add_init_script(self, script):
+        self.init_scripts.append(script)
+
+
+class FakeLocator:
+    def __init__(self, count):
+        self._count = count
+
+    async def count(self):
+        return self._count
+
+
+class FakePage:
+    """evaluate() pops scripted race results (exceptions are raised); `present` lists selectors on the page"""
+
+    def __init__(self, *results, present=(), network_idle=True):
+        self.context = FakeContext()
+        self.results = list(results)
+        self.races = []
+        self.present = set(present)
+        self.network_idle = network_idle
+        self.load_states = []
+
+    async def evaluate(self, script, arg):
+        assert script == RACE_SCRIPT
+        self.races.append(arg)
+        result = self.results.pop(0)
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    async def wait_for_load_state(self, state, timeout=None):
+        self.load_states.append(state)
+        if state == "networkidle" and not self.network_idle:
+            raise TimeoutError("networkidle not reached")
+
+    def locator(self, selector):
+        return FakeLocator(int(selector in self.present))
+
+
+class TestConditions:
+    """Condition builders produce the records the in-page runtime understands"""
+
+    def test_condition_kinds(self):
+        conditions = [present("a"), visible("a"), gone("a"), appears("a"), appeared_then_gone("a"),
+                      count_at_least("tr", 3), url_contains("/dashboard"), quiet(500, ".spinner")]
+
+        assert [condition["kind"] for condition in conditions] == [
+            "present", "visible", "gone", "appears", "appearedThenGone", "count", "url", "quiet"]
+        assert count_at_least("tr", 3)["min"] == 3
+        assert quiet(500, ".spinner") == {"kind": "quiet", "ms": 500, "busySelector": ".spinner"}
+        # Every kind has a branch in the in-page check()
+        assert all(f"case '{condition['kind']}'" in WAIT_RUNTIME_SCRIPT for condition in conditions)
+
+
+class TestWaitRuntime:
+    """One evaluate per race, restarted after a navigation"""
+
+    @pytest.mark.asyncio
+    async def test_race_result(self):
+        page = FakePage(race_result("error", satisfied=["error", "busy_gone"]))
+
+        result = await WaitRuntime(page).race({"error": visible(".alert-danger")}, timeout=5000)
+
+        assert (result.condition, result.satisfied, result.timed_out) == ("error", ["error", "busy_gone"], False)
+        assert page.races[0][0] == {"error": visible(".alert-danger")}
+        assert 0 < page.races[0][1] <= 5000
+
+    @pytest.mark.asyncio
+    async def test_installed_once_per_context(self):
+        page = FakePage(race_result("a"), race_result("a"))
+
+        await WaitRuntime(page).race({"a": present("a")})
+        await WaitRuntime(page).race({"a": present("a")})
+
+        assert page.context.init_scripts == [WAIT_RUNTIME_SCRIPT]
+
+    @pytest.mark.asyncio
+    async def test_restarted_after_navigation(self):
+        page = FakePage(Exception("Execution context was destroyed, most likely because of a navigation"),
+                        race_result("dashboard_url"))
+
+        result = await WaitRuntime(page).race({"dashboard_url": url_contains("/dashboard")})
+
+        assert result.condition == "dashboard_url"
+        assert len(page.races) == 2 and page.load_states == ["domcontentloaded"]
+
+    @pytest.mark.asyncio
+    async def test_other_errors_raised(self):
+        page = FakePage(Exception("SyntaxError: unexpected token"))
+
+        with pytest.raises(Exception, match="SyntaxError"):
+            await WaitRuntime(page).race({"a": present("a")})
+
+    @pytest.mark.asyncio
+    async def test_no_time_left(self):
+        page = FakePage()
+
+        result = await WaitRuntime(page).race({"a": present("a")}, timeout=0)
+
+        assert result.timed_out and result.condition is None and page.races == []
+
+
+class TestWeSignSmartWaits:
+    """Login and upload waits decide from the race result, with the old fallbacks"""
+
+    @pytest.mark.asyncio
+    async def test_login_success(self):
+        result = await WeSignSmartWaits(FakePage(race_result("dashboard_url"))).wait_for_login_result()
+
+        assert result["success"] and result["status"] == "success"
+
+    @pytest.mark.asyncio
+    async def test_login_error_appears(self):
+        result = await WeSignSmartWaits(FakePage(race_result("error"))).wait_for_login_result()
+
+        assert result["error"] and result["status"] == "error"
+
+    @pytest.mark.asyncio
+    async def test_login_error_already_visible(self):
+        page = FakePage(race_result(timed_out=True), present={".alert-danger"})
+
+        result = await WeSignSmartWaits(page).wait_for_login_result()
+
+        assert result["status"] == "error" and result["indicators_found"] == [".alert-danger"]
+
+    @pytest.mark.asyncio
+    async def test_login_still_on_form(self):
+        result = await WeSignSmartWaits(FakePage(race_result(timed_out=True))).wait_for_login_result()
+
+        assert result == {"success": False, "error": False, "status": "login_page", "indicators_found": []}
+
+    @pytest.mark.asyncio
+    async def test_upload_settled(self):
+        page = FakePage(race_result("progress_done"))
+
+        assert await WeSignSmartWaits(page).wait_for_document_upload()
+        assert page.load_states == []
+
+    @pytest.mark.parametrize("network_idle", [True, False])
+    @pytest.mark.asyncio
+    async def test_upload_falls_back_to_network_idle(self, network_idle):
+        page = FakePage(race_result(timed_out=True), network_idle=network_idle)
+
+        assert await WeSignSmartWaits(page).wait_for_document_upload() is network_idle
+        assert page.load_states == ["networkidle"]
@@ -0,0 +1,213 @@
+"""
+Unit tests for utils/wesign_stub_server.py
+Runs the stand-in on a free local port: login/token, paging, create/sign,
+input validation, seeded fault injection and the stats endpoint
+"""
+
+import random
+
+import pytest
+import requests
+
+from utils.auth_state import decode_jwt_expiry
+from utils.wesign_stub_server import FaultProfile, LatencyModel, WeSignStubServer, parse_route_option, route_key
+
+
+EMAIL, PASSWORD = "company@example.com", "CompanyPass1!"
+OTHER_EMAIL, OTHER_PASSWORD = "basic@example.com", "BasicPass123!"
+
+
+@pytest.fixture(scope="module")
+def running_stub():
+    with WeSignStubServer(users={EMAIL: PASSWORD, OTHER_EMAIL: OTHER_PASSWORD}) as stub:
+        yield stub
+
+
+@pytest.fixture
+def server(running_stub):
+    """The module's stand-in with empty data, stats and no faults"""
+    running_stub.configure(FaultProfile())
+    assert requests.post(f"{running_stub.url}/__stub/reset", timeout=5).status_code == 200
+    return running_stub
+
+
+def login(server, email=EMAIL, password=PASSWORD):
+    response = requests.post(f"{server.api_url}/users/login", json={"email": email, "password": password}, timeout=5)
+    assert response.status_code == 200
+    return response.json()
+
+
+def api(server, method, path, token=None, headers=None, **kwargs):
+    headers = {**(headers or {}), **({"Authorization": f"Bearer {token}"} if token else {})}
+    return requests.request(method, f"{server.api_url}{path}", headers=headers, timeout=5, **kwargs)
+
+
+class TestAuth:
+    """Login, token refresh and authorization"""
+
+    def test_login_issues_expiring_jwt(self, server):
+        tokens = login(server)
+        assert tokens["userId"] == EMAIL
+        assert decode_jwt_expiry(tokens["token"]) is not None
+        assert api(server, "GET", "/users", tokens["token"]).json()["email"] == EMAIL
+
+    def test_wrong_password_and_missing_token_are_rejected(self, server):
+        assert api(server, "POST", "/users/login", json={"email": EMAIL, "password": "wrong"}).status_code == 401
+        assert api(server, "GET", "/contacts").status_code == 401
+        assert api(server, "GET", "/contacts", "not-a-token").status_code == 401
+
+    def test_refresh_token_is_single_use(self, server):
+        tokens = login(server)
+        refreshed = api(server, "POST", "/users/refresh", json={"refreshToken": tokens["refreshToken"]})
+        assert refreshed.status_code == 200
+        assert refreshed.json()["token"] != tokens["token"]
+        assert api(server, "POST", "/users/refresh", json={"refreshToken": tokens["refreshToken"]}).status_code == 401
+
+    def test_logout_revokes_the_token(self, server):
+        token = login(server)["token"]
+        assert api(server, "POST", "/users/logout", token).status_code == 200
+        assert api(server, "GET", "/users", token).status_code == 401
+
+
+class TestResources:
+    """Listing, creating and signing per-user items"""
+
+    def test_list_paging(self, server):
+        token = login(server)["token"]
+        for i in range(5):
+            assert api(server, "POST", "/contacts", token, json={"name": f"Contact {i}"}).status_code == 201
+
+        page = api(server, "GET", "/contacts", token, params={"offset": 3, "limit": 2}).json()
+        assert [item["name"] for item in page["contacts"]] == ["Contact 3", "Contact 4"]
+        assert (page["total"], page["offset"], page["limit"]) == (5, 3, 2)
+
+        found = api(server, "GET", "/contacts", token, params={"search": "contact 1"}).json()
+        assert found["total"] == 1
+
+    def test_create_and_sign_document(self, server):
+        token = login(server)["token"]
+        created = api(server, "POST", "/documents/upload", token, json={"filename": "contract.pdf"})
+        assert created.status_code == 201
+        document = created.json()
+        assert (document["name"], document["status"]) == ("contract.pdf", "Pending")
+
+        signed = api(server, "POST", f"/documents/{document['id']}/sign", token, json={"signature": "J. Doe"})
+        assert signed.status_code == 200
+        assert (signed.json()["status"], signed.json()["signature"]) == ("Signed", "J. Doe")
+        assert api(server, "GET", f"/documentcollections/{document['id']}", token).json()["status"] == "Signed"
+
+    def test_items_are_private_to_their_owner(self, server):
+        document = api(server, "POST", "/documents", login(server)["token"], json={"name": "mine.pdf"}).json()
+        other = login(server, OTHER_EMAIL, OTHER_PASSWORD)["token"]
+
+        assert api(server, "GET", f"/documents/{document['id']}", other).status_code == 404
+        assert api(server, "POST", f"/documents/{document['id']}/sign", other, json={}).status_code == 404
+        assert api(server, "GET", "/documents", other).json()["total"] == 0
+
+
+class TestValidation:
+    """Malformed input is answered with 400, not a stand-in error"""
+
+    @pytest.mark.parametrize("params", [{"offset": "x"}, {"limit": "1.5"}, {"offset": -1}])
+    def test_bad_paging_parameters(self, server, params):
+        response = api(server, "GET", "/contacts", login(server)["token"], params=params)
+        assert response.status_code == 400
+        assert response.json()["status"] == 400
+
+    @pytest.mark.parametrize("body", [[EMAIL, PASSWORD], "text", {"email": [EMAIL], "password": PASSWORD}])
+    def test_bad_login_body(self, server, body):
+        assert api(server, "POST", "/users/login", json=body).status_code == 400
+
+    def test_malformed_json(self, server):
+        token = login(server)["token"]
+        response = api(server, "POST", "/contacts", token, data="{", headers={"Content-Type": "application/json"})
+        assert response.status_code == 400
+        assert api(server, "PUT", "/contacts/123456", token, json=[1, 2]).status_code == 400
+
+    def test_bad_fault_profile(self, server):
+        assert requests.post(f"{server.url}/__stub/config", json=[], timeout=5).status_code == 400
+        assert requests.post(f"{server.url}/__stub/config", json={"latency": "gamma:1"}, timeout=5).status_code == 400
+        assert requests.post(f"{server.url}/__stub/config", json={"error_rate": 0.5}, timeout=5).status_code == 200
+
+    @pytest.mark.parametrize("profile", [
+        {"latency": "uniform"},
+        {"latency": "uniform:10"},
+        {"latency": "fixed:1:2"},
+        {"latency": "exponential:-5"},
+        {"route_latency": {"GET /health": "normal:10"}},
+        {"error_rate": 1.5},
+        {"route_error_rate": {"GET /health": -0.1}},
+        {"error_rate": 1, "error_statuses": {}},
+        {"error_rate": 1, "error_statuses": {"500": 0}},
+    ])
+    def test_rejected_fault_profile_leaves_the_server_working(self, server, profile):
+        assert requests.post(f"{server.url}/__stub/config", json=profile, timeout=5).status_code == 400
+        assert api(server, "GET", "/health").status_code == 200
+
+    def test_broken_profile_is_answered_with_500(self, server):
+        faults = FaultProfile(error_rate=1.0)
+        faults.error_statuses = {500: 0.0}
+        server.configure(faults)
+        response = api(server, "GET", "/health")
+        assert response.status_code == 500
+        assert response.json()["title"] == "Stub server error"
+
+
+class TestFaults:
+    """Seeded latency and error injection"""
+
+    def statuses(self, faults, count=40):
+        with WeSignStubServer(faults=faults) as stub:
+            return [requests.get(f"{stub.api_url}/health", timeout=5).status_code for _ in range(count)], stub.stats
+
+    def test_error_rate_is_reproducible_with_a_seed(self):
+        faults = dict(error_rate=0.5, error_statuses={500: 1.0, 503: 1.0}, seed=7)
+        first, stats = self.statuses(FaultProfile(**faults))
+        second, _ = self.statuses(FaultProfile(**faults))
+
+        assert first == second
+        assert {500, 503, 200} == set(first)
+        assert stats["injected_errors"] == sum(status != 200 for status in first)
+        assert stats["routes"]["GET /health"]["errors"] == stats["injected_errors"]
+
+    def test_injected_latency_is_recorded(self):
+        _, stats = self.statuses(FaultProfile(latency=LatencyModel.parse("fixed:5")), count=4)
+        assert stats["injected_delay_ms"] == pytest.approx(20.0)
+
+    def test_route_faults_override_the_default(self, server):
+        server.configure(FaultProfile(route_error_rate={"POST /users/login": 1.0}, seed=1))
+        assert api(server, "POST", "/users/login", json={"email": EMAIL, "password": PASSWORD}).status_code == 500
+        assert api(server, "GET", "/health").status_code == 200
+
+    def test_latency_models(self):
+        rng = random.Random(3)
+        samples = [LatencyModel.parse("lognormal:80:40").sample(rng) for _ in range(5000)]
+        assert sum(samples) / len(samples) == pytest.approx(80, rel=0.05)
+        assert min(LatencyModel.parse("normal:5:50").sample(rng) for _ in range(200)) == 0.0
+        assert LatencyModel.parse("uniform:20:30").sample(rng) <= 30
+        for spec in ("gamma:1", "uniform:10", "lognormal:80", "fixed:x", "exponential:-5", "uniform:30:20"):
+            with pytest.raises(ValueError):
+                LatencyModel.parse(spec)
+
+
+class TestStats:
+    """Per-route counters at /__stub/stats"""
+
+    def test_stats_endpoint(self, server):
+        token = login(server)["token"]
+        document = api(server, "POST", "/documents", token, json={"name": "a.pdf"}).json()
+        api(server, "GET", f"/documents/{document['id']}", token)
+        api(server, "GET", "/documents/00000000-0000-0000-0000-000000000000", token)
+
+        stats = requests.get(f"{server.url}/__stub/stats", timeout=5).json()
+        assert stats["requests"] == 4
+        assert stats["routes"]["POST /users/login"]["count"] == 1
+        assert stats["routes"]["GET /documents/{id}"] == {"count": 2, "errors": 1, "delay_ms": 0.0}
+
+        requests.post(f"{server.url}/__stub/reset", timeout=5)
+        assert requests.get(f"{server.url}/__stub/stats", timeout=5).json()["requests"] == 0
+
+    def test_route_helpers(self):
+        assert route_key("GET", "/documents/3f2a1c9e-aaaa/metadata") == "GET /documents/{id}/metadata"
+        assert route_key("DELETE", "/contacts/42") == "DELETE /contacts/{id}"
+        assert parse_route_option("POST /users/login = normal:200:50") == ("POST /users/login", "normal:200:50")
@@ -3,5 +3,15 @@ Utilities package for WeSign Playwright tests
 """
 
 from .smart_waits import SmartWaits, WeSignSmartWaits, WaitCondition
+from .browser_pool import BrowserPool, pooled_playwright
+from .auth_state import AuthStateCache
+from .response_waits import ResponseWaiter, BackendRequest
+from .table_snapshot import TableSnapshot, RowRecord
+from .wait_runtime import WaitRuntime, WaitResult
+from .har_replay import HarSettings, HarModuleSession
+from .wesign_stub_server import WeSignStubServer, FaultProfile, LatencyModel
 
-__all__ = ['SmartWaits', 'WeSignSmartWaits', 'WaitCondition']
\ No newline at end of file
+__all__ = ['SmartWaits', 'WeSignSmartWaits', 'WaitCondition', 'BrowserPool', 'pooled_playwright', 'AuthStateCache',
+           'ResponseWaiter', 'BackendRequest', 'TableSnapshot', 'RowRecord',
+           'WaitRuntime', 'WaitResult', 'HarSettings', 'HarModuleSession',
+           'WeSignStubServer', 'FaultProfile', 'LatencyModel']
@@ -0,0 +1,183 @@
+"""
+Shared Static-Asset Cache for WeSign Tests
+Browser contexts do not share an HTTP cache, so every test re-downloads the
+frontend bundles, fonts and images. This cache serves them from disk through
+context.route, keyed by URL and validated with ETag / Last-Modified.
+"""
+
+from playwright.async_api import BrowserContext, Route
+import hashlib
+import json
+import os
+import re
+import time
+from pathlib import Path
+from typing import Optional, Dict, Any, Tuple
+
+
+DEFAULT_CACHE_DIR = Path(os.environ.get(
+    "WESIGN_ASSET_CACHE_DIR",
+    Path(__file__).resolve().parent.parent / ".asset_cache"
+))
+
+STATIC_EXTENSIONS = r"js|mjs|css|woff2?|ttf|otf|eot|png|jpe?g|gif|svg|ico|webp"
+
+# Build-hashed file names (main.3f2a1c9e1b2d4f5a.js, roboto-v20.8a9b7c6d.woff2) never change content
+HASHED_NAME = re.compile(rf"[.\-_][0-9a-f]{{8,}}\.({STATIC_EXTENSIONS})$", re.IGNORECASE)
+
+# Response headers worth replaying from the cache (others describe the original transfer)
+KEPT_HEADERS = ("content-type", "cache-control", "etag", "last-modified", "access-control-allow-origin")
+
+
+def asset_url_pattern(host: str) -> "re.Pattern[str]":
+    """Regex matching static assets served by the frontend host"""
+    return re.compile(rf"^https?://{re.escape(host)}(?::\d+)?/[^?#]*\.({STATIC_EXTENSIONS})(?:[?#].*)?$", re.IGNORECASE)
+
+
+class AssetCache:
+    """
+    On-disk asset cache shared by every context and every pytest worker
+
+    Immutable (hashed) assets are served without touching the network;
+    other assets are revalidated with a conditional request and served from
+    disk on 304. Entries are written atomically, so workers can share the
+    directory without locking.
+    """
+
+    def __init__(self, host: str, cache_dir: Path = DEFAULT_CACHE_DIR):
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.pattern = asset_url_pattern(host)
+
+        self.stats = {
+            "hits": 0,
+            "revalidated": 0,
+            "misses": 0,
+            "bytes_saved": 0,
+            "bytes_fetched": 0
+        }
+
+    def _paths(self, url: str) -> Tuple[Path, Path]:
+        key = hashlib.sha256(url.encode()).hexdigest()
+        return self.cache_dir / f"{key}.json", self.cache_dir / f"{key}.body"
+
+    def load(self, url: str) -> Optional[Tuple[Dict[str, Any], bytes]]:
+        """Cached metadata and body for a URL (None if absent or half-written)"""
+        meta_path, body_path = self._paths(url)
+        try:
+            with open(meta_path, 'r', encoding='utf-8') as f:
+                meta = json.load(f)
+            body = body_path.read_bytes()
+        except (OSError, ValueError):
+            return None
+        if meta.get("url") != url or meta.get("size") != len(body):
+            return None
+        return meta, body
+
+    def store(self, url: str, status: int, headers: Dict[str, str], body: bytes) -> None:
+        """Write an entry (body first, then metadata; both atomically)"""
+        meta_path, body_path = self._paths(url)
+        meta = {
+            "url": url,
+            "status": status,
+            "headers": {name: headers[name] for name in KEPT_HEADERS if name in headers},
+            "etag": headers.get("etag"),
+            "last_modified": headers.get("last-modified"),
+            "size": len(body),
+            "stored_at": time.time()
+        }
+        suffix = f".{os.getpid()}.tmp"
+        try:
+            body_tmp = body_path.with_suffix(suffix)
+            body_tmp.write_bytes(body)
+            os.replace(body_tmp, body_path)
+
+            meta_tmp = meta_path.with_suffix(suffix)
+            with open(meta_tmp, 'w', encoding='utf-8') as f:
+                json.dump(meta, f)
+            os.replace(meta_tmp, meta_path)
+        except OSError as e:
+            print(f"Asset cache write failed for {url}: {e}")
+
+    @staticmethod
+    def is_cacheable(headers: Dict[str, str]) -> bool:
+        cache_control = headers.get("cache-control", "").lower()
+        return "no-store" not in cache_control and "private" not in cache_control
+
+    @staticmethod
+    def is_immutable(url: str, meta: Dict[str, Any]) -> bool:
+        path = url.split("?", 1)[0].split("#", 1)[0]
+        cache_control = meta.get("headers", {}).get("cache-control", "").lower()
+        return bool(HASHED_NAME.search(path)) or "immutable" in cache_control
+
+    async def handle(self, route: Route) -> None:
+        """Route handler: serve from disk, revalidate, or fetch and store"""
+        request = route.request
+        if request.method != "GET":
+            await route.fallback()
+            return
+
+        url = request.url
+        cached = self.load(url)
+
+        if cached is not None:
+            meta, body = cached
+            if self.is_immutable(url, meta):
+                self.stats["hits"] += 1
+                self.stats["bytes_saved"] += len(body)
+                await route.fulfill(status=meta["status"], headers=meta["headers"], body=body)
+                return
+
+            conditional = {}
+            if meta.get("etag"):
+                conditional["if-none-match"] = meta["etag"]
+            if meta.get("last_modified"):
+                conditional["if-modified-since"] = meta["last_modified"]
+
+            if conditional:
+                response = await route.fetch(headers={**request.headers, **conditional})
+                if response.status == 304:
+                    self.stats["revalidated"] += 1
+                    self.stats["bytes_saved"] += len(body)
+                    await route.fulfill(status=meta["status"], headers=meta["headers"], body=body)
+                    return
+                await self._store_and_fulfill(route, url, response)
+                return
+
+        await self._store_and_fulfill(route, url, await route.fetch())
+
+    async def _store_and_fulfill(self, route: Route, url: str, response) -> None:
+        self.stats["misses"] += 1
+        body = await response.body()
+        self.stats["bytes_fetched"] += len(body)
+
+        headers = response.headers
+        validators = headers.get("etag") or headers.get("last-modified")
+        if response.status == 200 and self.is_cacheable(headers) and (validators or HASHED_NAME.search(url.split("?", 1)[0])):
+            self.store(url, response.status, headers, body)
+
+        await route.fulfill(response=response, body=body)
+
+    async def attach(self, context: BrowserContext) -> None:
+        """Context hook: route the frontend's static assets through the cache"""
+        await context.route(self.pattern, self.handle)
+
+    def hit_rate(self) -> float:
+        served = self.stats["hits"] + self.stats["revalidated"]
+        total = served + self.stats["misses"]
+        return served / total if total else 0.0
+
+
+# Counters of this process, plus those of xdist workers on the controller
+_run_stats: Dict[str, int] = {}
+
+
+def record_stats(stats: Dict[str, int]) -> None:
+    """Add a cache's (or a worker's) counters to the run totals"""
+    for key, value in stats.items():
+        _run_stats[key] = _run_stats.get(key, 0) + value
+
+
+def get_run_stats() -> Dict[str, int]:
+    """Cache counters for the whole run"""
+    return dict(_run_stats)
@@ -0,0 +1,341 @@
+"""
+Authenticated Storage State Cache for WeSign Tests
+Log in once per worker and user type, then start contexts already authenticated
+"""
+
+from playwright.async_api import BrowserContext, Page
+import asyncio
+import base64
+import json
+import logging
+import os
+import re
+import time
+from pathlib import Path
+from typing import Optional, Dict, Any, List
+
+from config.environment import EnvironmentConfig, LoginCredentials
+
+
+logger = logging.getLogger(__name__)
+
+
+JWT_PATTERN = re.compile(r'^(?:Bearer\s+)?(eyJ[\w-]+)\.([\w-]+)\.([\w-]*)$')
+
+# Seconds before JWT expiry at which a cached state is treated as expired
+EXPIRY_SKEW_SECONDS = 60
+
+# Read back the login session's sessionStorage (not part of Playwright storage_state)
+SESSION_STORAGE_SNAPSHOT = "() => Object.assign({}, sessionStorage)"
+
+# Rendered only for a logged-in user (DashboardPage's logout icon and home header) / only on the login form
+LOGGED_IN_MARKER = 'i-feather[name="log-out"], header.ct-p-home'
+LOGGED_OUT_MARKER = 'input[type="password"]'
+
+# Resolves to "in" or "out" once the SPA has rendered either marker
+SESSION_OUTCOME = """([loggedIn, loggedOut]) =>
+    document.querySelector(loggedIn) ? "in" : (document.querySelector(loggedOut) ? "out" : null)"""
+
+
+def decode_jwt_expiry(token: str) -> Optional[float]:
+    """Return the `exp` claim of a JWT as epoch seconds, or None if not a JWT"""
+    match = JWT_PATTERN.match(token.strip())
+    if not match:
+        return None
+
+    payload = match.group(2)
+    payload += '=' * (-len(payload) % 4)
+    try:
+        claims = json.loads(base64.urlsafe_b64decode(payload))
+        exp = claims.get('exp')
+        return float(exp) if exp is not None else None
+    except (ValueError, TypeError):
+        return None
+
+
+def find_tokens(state: Dict[str, Any]) -> List[str]:
+    """Collect JWT-looking values from cookies, localStorage and sessionStorage"""
+    candidates = [cookie.get('value', '') for cookie in state.get('storage_state', {}).get('cookies', [])]
+
+    for origin in state.get('storage_state', {}).get('origins', []):
+        candidates.extend(item.get('value', '') for item in origin.get('localStorage', []))
+
+    candidates.extend(state.get('session_storage', {}).values())
+
+    tokens = []
+    for value in candidates:
+        if not isinstance(value, str):
+            continue
+        # Tokens are sometimes stored JSON-quoted
+        value = value.strip().strip('"')
+        if JWT_PATTERN.match(value):
+            tokens.append(value)
+    return tokens
+
+
+class AuthStateCache:
+    """
+    Per-worker, per-user-type cache of Playwright storage state
+
+    A cached state is reused while it is younger than the TTL and its JWT has
+    not expired. The first time a worker picks up a state left on disk by an
+    earlier run, a single API probe confirms the token is still accepted.
+    """
+
+    def __init__(
+        self,
+        config: EnvironmentConfig,
+        pool,
+        cache_dir: Optional[Path] = None,
+        ttl_seconds: Optional[int] = None,
+        worker_id: Optional[str] = None,
+        probe_path: str = "/userapi/ui/v3/users"
+    ):
+        self.config = config
+        self.pool = pool
+        self.cache_dir = Path(cache_dir or Path(__file__).parent.parent / ".auth")
+        self.ttl_seconds = ttl_seconds if ttl_seconds is not None else int(os.getenv('WESIGN_AUTH_STATE_TTL', '1800'))
+        self.worker_id = worker_id or os.getenv('PYTEST_XDIST_WORKER', 'main')
+        self.probe_url = f"{config.base_url.rstrip('/')}{probe_path}"
+
+        # Disabled for tests that must exercise the login form (real_login marker)
+        self.enabled = True
+
+        self._users: Dict[str, LoginCredentials] = {}
+        self._states: Dict[str, Dict[str, Any]] = {}
+        self._locks: Dict[str, asyncio.Lock] = {}
+
+        self.stats = {"logins": 0, "login_seconds": 0.0, "reused": 0, "probes": 0}
+
+    def register_user(self, user_type: str, credentials: LoginCredentials) -> None:
+        """Add a user type that is not part of EnvironmentConfig (e.g. suite-specific accounts)"""
+        if self._users.get(user_type) != credentials:
+            self._users[user_type] = credentials
+            self._states.pop(user_type, None)
+
+    def credentials_for(self, user_type: str) -> LoginCredentials:
+        """Resolve credentials for a registered user type or one defined in EnvironmentConfig"""
+        credentials = self._users.get(user_type) or getattr(self.config, user_type, None)
+        if not isinstance(credentials, LoginCredentials):
+            raise ValueError(f"Unknown user type: {user_type}. Expected company_user or basic_user")
+        return credentials
+
+    def state_path(self, user_type: str) -> Path:
+        """Path of the on-disk state for this worker and user type"""
+        host = re.sub(r'[^\w.-]', '_', self.config.base_url.split('://')[-1])
+        return self.cache_dir / f"{host}_{user_type}_{self.worker_id}.json"
+
+    def is_fresh(self, state: Dict[str, Any]) -> bool:
+        """Check TTL and token expiry without touching the network"""
+        now = time.time()
+        if now - state.get('created_at', 0) >= self.ttl_seconds:
+            return False
+
+        expires_at = state.get('token_expires_at')
+        if expires_at is not None and now >= expires_at - EXPIRY_SKEW_SECONDS:
+            return False
+
+        return True
+
+    def _load(self, user_type: str) -> Optional[Dict[str, Any]]:
+        path = self.state_path(user_type)
+        if not path.exists():
+            return None
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                state = json.load(f)
+            if state.get('email') != self.credentials_for(user_type).email:
+                return None
+            return state
+        except (json.JSONDecodeError, OSError):
+            return None
+
+    def _save(self, user_type: str, state: Dict[str, Any]) -> None:
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        path = self.state_path(user_type)
+        tmp_path = path.with_suffix('.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(state, f)
+        os.replace(tmp_path, path)
+
+    async def _probe(self, state: Dict[str, Any]) -> bool:
+        """One authenticated API call to confirm the server still accepts the token"""
+        self.stats["probes"] += 1
+        tokens = find_tokens(state)
+        headers = {"Authorization": f"Bearer {tokens[0]}"} if tokens else {}
+
+        context = await self.pool.new_context(storage_state=state['storage_state'])
+        try:
+            response = await context.request.get(self.probe_url, headers=headers, max_redirects=0)
+            # A redirect (e.g. to the login page) is a rejection too
+            return 200 <= response.status < 300
+        except Exception as e:
+            logger.warning("Auth state probe failed: %s", e)
+            return False
+        finally:
+            await context.close()
+
+    async def _login(self, user_type: str) -> Dict[str, Any]:
+        """Drive the login form once and capture the resulting state"""
+        from pages.auth_page import AuthPage
+
+        credentials = self.credentials_for(user_type)
+        start = time.perf_counter()
+
+        context = await self.pool.new_context()
+        try:
+            page = await context.new_page()
+            auth_page = AuthPage(page)
+            auth_page.base_url = self.config.base_url
+
+            await auth_page.navigate()
+            await auth_page.enter_credentials(credentials.email, credentials.password)
+            await page.locator(auth_page.login_button).first.click()
+            await page.wait_for_url("**/dashboard**", timeout=self.config.timeouts.login)
+
+            state = {
+                "user_type": user_type,
+                "email": credentials.email,
+                "base_url": self.config.base_url,
+                "created_at": time.time(),
+                "storage_state": await context.storage_state(),
+                "session_storage": await page.evaluate(SESSION_STORAGE_SNAPSHOT)
+            }
+        finally:
+            await context.close()
+
+        expiries = [exp for exp in map(decode_jwt_expiry, find_tokens(state)) if exp is not None]
+        state["token_expires_at"] = min(expiries) if expiries else None
+
+        self.stats["logins"] += 1
+        self.stats["login_seconds"] += time.perf_counter() - start
+        return state
+
+    async def get_state(self, user_type: str = "company_user") -> Dict[str, Any]:
+        """Return a valid state for the user type, logging in only when needed"""
+        lock = self._locks.setdefault(user_type, asyncio.Lock())
+        async with lock:
+            state = self._states.get(user_type)
+            if state and self.is_fresh(state):
+                self.stats["reused"] += 1
+                return state
+
+            state = self._load(user_type)
+            if state and self.is_fresh(state) and await self._probe(state):
+                self._states[user_type] = state
+                self.stats["reused"] += 1
+                return state
+
+            state = await self._login(user_type)
+            self._save(user_type, state)
+            self._states[user_type] = state
+            return state
+
+    def invalidate(self, user_type: str) -> None:
+        """Drop a state the application rejected (e.g. server-side logout)"""
+        self._states.pop(user_type, None)
+        path = self.state_path(user_type)
+        if path.exists():
+            path.unlink()
+
+    async def new_context(self, user_type: str = "company_user", **options) -> BrowserContext:
+        """Fresh pooled context that starts out logged in as user_type"""
+        state = await self.get_state(user_type)
+        return await self.pool.new_context(storage_state=state['storage_state'], **options)
+
+    async def restore(self, page: Page, user_type: str = "company_user") -> bool:
+        """
+        Log an existing page in from the cache instead of the login form
+
+        Cookies are added to the page's context, local/session storage are
+        seeded on the WeSign origin, then the page is sent to the dashboard.
+        The session counts as restored only once the dashboard renders a
+        logged-in element; a login form (revoked or expired token) or
+        neither within the login timeout invalidates the cached state.
+        """
+        state = await self.get_state(user_type)
+        storage_state = state['storage_state']
+
+        if storage_state.get('cookies'):
+            await page.context.add_cookies(storage_state['cookies'])
+
+        if not page.url.startswith(self.config.base_url):
+            await page.goto(f"{self.config.base_url}/", wait_until="commit")
+
+        origin = await page.evaluate("() => location.origin")
+        local_storage = {
+            item['name']: item['value']
+            for entry in storage_state.get('origins', []) if entry.get('origin') == origin
+            for item in entry.get('localStorage', [])
+        }
+        await page.evaluate(
+            """([local, session]) => {
+                for (const [k, v] of Object.entries(local)) localStorage.setItem(k, v);
+                for (const [k, v] of Object.entries(session)) sessionStorage.setItem(k, v);
+            }""",
+            [local_storage, state.get('session_storage', {})]
+        )
+
+        await page.goto(f"{self.config.base_url}/dashboard")
+        try:
+            outcome = await page.wait_for_function(
+                SESSION_OUTCOME, arg=[LOGGED_IN_MARKER, LOGGED_OUT_MARKER], timeout=self.config.timeouts.login
+            )
+            if await outcome.json_value() == "in":
+                return True
+        except Exception:
+            pass
+
+        # Token was revoked server-side; force a real login next time
+        self.invalidate(user_type)
+        return False
+
+    async def new_page(self, user_type: str = "company_user", **options) -> Page:
+        """
+        Page in a fresh pooled context, logged in as user_type via restore()
+
+        A state the application rejects is invalidated by restore(); the
+        second attempt then logs in through the form. Close the page's
+        context when done.
+        """
+        context = await self.pool.new_context(**options)
+        try:
+            page = await context.new_page()
+            page.set_default_timeout(30000)
+            if await self.restore(page, user_type) or await self.restore(page, user_type):
+                return page
+            raise RuntimeError(f"Could not log in as {user_type} from a fresh or cached session")
+        except BaseException:
+            await context.close()
+            raise
+
+
+# Cache registered by the session fixture in conftest.py for the current worker
+_active_cache: Optional[AuthStateCache] = None
+
+# Counters of this process's caches, plus those of xdist workers on the controller
+_run_stats: Dict[str, float] = {}
+
+
+def record_auth_stats(stats: Dict[str, float]) -> None:
+    """Add a cache's (or a worker's) counters to the run totals"""
+    for key, value in stats.items():
+        _run_stats[key] = _run_stats.get(key, 0) + value
+
+
+def get_auth_stats() -> Dict[str, float]:
+    """Login and reuse counters for the whole run"""
+    return dict(_run_stats)
+
+
+def get_active_auth_cache() -> Optional[AuthStateCache]:
+    """Get the enabled cache for this worker (None outside pytest or for real_login tests)"""
+    if _active_cache is not None and _active_cache.enabled:
+        return _active_cache
+    return None
+
+
+def set_active_auth_cache(cache: Optional[AuthStateCache]) -> None:
+    """Register (or clear) the cache used by page objects"""
+    global _active_cache
+    _active_cache = cache
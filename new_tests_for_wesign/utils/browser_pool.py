@@ -0,0 +1,303 @@
+"""
+Browser Pool for WeSign Playwright Tests
+One long-lived browser per pytest worker, handing out fresh contexts per test
+"""
+
+from playwright.async_api import async_playwright, Browser, BrowserContext, Page, Playwright
+import asyncio
+import logging
+import time
+from typing import Optional, Dict, Any, List, Set, Callable, Awaitable
+
+
+logger = logging.getLogger(__name__)
+
+
+DEFAULT_LAUNCH_OPTIONS: Dict[str, Any] = {
+    "headless": True,
+    "timeout": 10000,
+    "args": [
+        '--no-sandbox',
+        '--disable-dev-shm-usage',
+        '--disable-extensions',
+        '--disable-background-timer-throttling',
+        '--disable-backgrounding-occluded-windows',
+        '--disable-renderer-backgrounding'
+    ]
+}
+
+DEFAULT_CONTEXT_OPTIONS: Dict[str, Any] = {
+    "viewport": {'width': 1280, 'height': 720},
+    "locale": 'en-US',
+    "timezone_id": 'America/New_York'
+}
+
+
+class BrowserPool:
+    """
+    Worker-scoped Chromium pool
+
+    The browser is launched lazily on the first context request and reused
+    until stop() is called, so every test pays for a new context (~10ms)
+    instead of a Chromium cold start (~1-2s). All calls must come from the
+    event loop the pool was started on.
+    """
+
+    def __init__(
+        self,
+        launch_options: Optional[Dict[str, Any]] = None,
+        context_options: Optional[Dict[str, Any]] = None
+    ):
+        self.launch_options = dict(launch_options or DEFAULT_LAUNCH_OPTIONS)
+        self.context_options = dict(context_options or DEFAULT_CONTEXT_OPTIONS)
+
+        self._playwright: Optional[Playwright] = None
+        self._browser: Optional[Browser] = None
+        self._lock: Optional[asyncio.Lock] = None
+        # Context closes started by new_page() pages closing, awaited by stop()
+        self._closing: Set["asyncio.Task[None]"] = set()
+
+        # Awaited with every new context (e.g. HAR record/replay routes) and
+        # before it closes (e.g. saving a trace, which needs the context open)
+        self.context_hooks: List[Callable[[BrowserContext], Awaitable[None]]] = []
+        self.context_close_hooks: List[Callable[[BrowserContext], Awaitable[None]]] = []
+
+        self.stats = {
+            "launches": 0,
+            "launch_seconds": 0.0,
+            "contexts_created": 0,
+            "pages_created": 0
+        }
+
+    @property
+    def is_running(self) -> bool:
+        """Check if the pooled browser is up and connected"""
+        return self._browser is not None and self._browser.is_connected()
+
+    async def get_browser(self) -> Browser:
+        """Return the shared browser, launching (or relaunching after a crash) on demand"""
+        if self.is_running:
+            return self._browser
+
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+
+        async with self._lock:
+            if self.is_running:
+                return self._browser
+
+            if self._playwright is None:
+                self._playwright = await async_playwright().start()
+
+            start = time.perf_counter()
+            self._browser = await self._playwright.chromium.launch(**self.launch_options)
+            self.stats["launches"] += 1
+            self.stats["launch_seconds"] += time.perf_counter() - start
+
+            return self._browser
+
+    async def new_context(self, **overrides) -> BrowserContext:
+        """Create a fresh, isolated context on the shared browser"""
+        browser = await self.get_browser()
+        options = {**self.context_options, **overrides}
+        context = await browser.new_context(**options)
+        for hook in list(self.context_hooks):
+            await hook(context)
+        if self.context_close_hooks:
+            self._run_hooks_before_close(context, self.context_close_hooks)
+        self.stats["contexts_created"] += 1
+        return context
+
+    @staticmethod
+    def _run_hooks_before_close(context: BrowserContext, hooks: List[Callable[[BrowserContext], Awaitable[None]]]) -> None:
+        """Make context.close() await the close hooks first (whoever calls it)"""
+        original_close = context.close
+        pending = list(hooks)
+
+        async def close(**kwargs) -> None:
+            # Second close() calls (fixture teardown after the test closed it) skip the hooks
+            hooks_to_run, pending[:] = list(pending), []
+            for hook in hooks_to_run:
+                try:
+                    await hook(context)
+                except Exception:
+                    logger.exception("Context close hook failed")
+            await original_close(**kwargs)
+
+        context.close = close
+
+    async def new_page(self, **overrides) -> Page:
+        """Create a page in its own fresh context (closed together with the page)"""
+        context = await self.new_context(**overrides)
+        page = await context.new_page()
+        self.stats["pages_created"] += 1
+        page.on("close", lambda _: self._close_later(context))
+        return page
+
+    def _close_later(self, context: BrowserContext) -> None:
+        """Close a context from a synchronous event handler; stop() waits for it"""
+        task = asyncio.get_running_loop().create_task(context.close())
+        self._closing.add(task)
+        task.add_done_callback(self._closed)
+
+    def _closed(self, task: "asyncio.Task[None]") -> None:
+        self._closing.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            logger.error("Closing a pooled page's context failed", exc_info=task.exception())
+
+    async def stop(self) -> None:
+        """Wait for pending context closes, then close the shared browser and the Playwright driver"""
+        if self._closing:
+            await asyncio.gather(*self._closing, return_exceptions=True)
+
+        if self._browser is not None:
+            try:
+                await self._browser.close()
+            except Exception:
+                logger.exception("Browser pool close failed")
+            self._browser = None
+
+        if self._playwright is not None:
+            await self._playwright.stop()
+            self._playwright = None
+
+
+# Pool registered by the session fixture in conftest.py for the current worker
+_active_pool: Optional[BrowserPool] = None
+
+# Counters of this process's pools, plus those of xdist workers on the controller
+_run_stats: Dict[str, float] = {}
+
+
+def record_pool_stats(stats: Dict[str, float]) -> None:
+    """Add a pool's (or a worker's) counters to the run totals"""
+    for key, value in stats.items():
+        _run_stats[key] = _run_stats.get(key, 0) + value
+
+
+def get_pool_stats() -> Dict[str, float]:
+    """Pool counters for the whole run"""
+    return dict(_run_stats)
+
+
+def get_active_pool() -> Optional[BrowserPool]:
+    """Get the pool registered for this worker (None outside pytest)"""
+    return _active_pool
+
+
+def set_active_pool(pool: Optional[BrowserPool]) -> None:
+    """Register (or clear) the pool used by pooled_playwright()"""
+    global _active_pool
+    _active_pool = pool
+
+
+class PooledBrowser:
+    """
+    Browser stand-in handed to self-launching tests
+
+    new_page()/new_context() lease fresh contexts from the pool; close()
+    only closes what this lease created and leaves the shared browser up.
+    """
+
+    def __init__(self, pool: BrowserPool, browser: Browser):
+        self._pool = pool
+        self._browser = browser
+        self._contexts: List[BrowserContext] = []
+
+    @property
+    def contexts(self) -> List[BrowserContext]:
+        return list(self._contexts)
+
+    @property
+    def version(self) -> str:
+        return self._browser.version
+
+    def is_connected(self) -> bool:
+        return self._browser.is_connected()
+
+    def __getattr__(self, name: str) -> Any:
+        # Anything not leased per test (browser_type, new_browser_cdp_session, ...)
+        return getattr(self._browser, name)
+
+    async def new_context(self, **kwargs) -> BrowserContext:
+        context = await self._pool.new_context(**kwargs)
+        self._contexts.append(context)
+        return context
+
+    async def new_page(self, **kwargs) -> Page:
+        context = await self.new_context(**kwargs)
+        page = await context.new_page()
+        self._pool.stats["pages_created"] += 1
+        return page
+
+    async def close(self, **kwargs) -> None:
+        contexts, self._contexts = self._contexts, []
+        for context in contexts:
+            try:
+                await context.close()
+            except Exception:
+                # Context may already be gone if the test closed it
+                pass
+
+
+class PooledBrowserType:
+    """chromium stand-in whose launch() leases the pooled browser"""
+
+    name = "chromium"
+
+    def __init__(self, pool: BrowserPool):
+        self._pool = pool
+        self._leases: List[PooledBrowser] = []
+
+    async def launch(self, **kwargs) -> PooledBrowser:
+        # Per-test launch options (headless, args, slow_mo) are intentionally
+        # ignored - the worker's pool launch options apply to every test
+        browser = await self._pool.get_browser()
+        lease = PooledBrowser(self._pool, browser)
+        self._leases.append(lease)
+        return lease
+
+    async def release_all(self) -> None:
+        """Close contexts of leases the test forgot to close()"""
+        leases, self._leases = self._leases, []
+        for lease in leases:
+            await lease.close()
+
+
+class PooledPlaywright:
+    """
+    Drop-in for async_playwright() backed by the worker's BrowserPool
+
+    Supports both `async with pooled_playwright() as p:` and
+    `p = await pooled_playwright().start()`.
+    """
+
+    def __init__(self, pool: BrowserPool):
+        self.chromium = PooledBrowserType(pool)
+
+    async def start(self) -> "PooledPlaywright":
+        return self
+
+    async def stop(self) -> None:
+        await self.chromium.release_all()
+
+    async def __aenter__(self) -> "PooledPlaywright":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.stop()
+
+
+def pooled_playwright():
+    """
+    Migration entry point for test classes that launch their own browser
+
+    Replace `async_playwright()` with `pooled_playwright()`; the rest of the
+    test (p.chromium.launch / browser.new_page / browser.close) is unchanged.
+    Falls back to a real async_playwright() when no pool is registered, so
+    migrated modules still run standalone.
+    """
+    pool = get_active_pool()
+    if pool is None:
+        return async_playwright()
+    return PooledPlaywright(pool)
@@ -0,0 +1,171 @@
+"""
+Execution Profile Runtime for WeSign Tests
+Applies a named ExecutionProfile (debug, ci-fast, perf-measure) to the
+browser pool: launch/context options, animation-free CSS, third-party
+blocking, and tracing/video retention per test
+"""
+
+from playwright.async_api import BrowserContext, Page, Route, Video
+import re
+import shutil
+from pathlib import Path
+from typing import Dict, List, Any
+from urllib.parse import urlparse
+
+from config.environment import ExecutionProfile
+
+
+# Zero-length animations/transitions: Angular Material and CSS effects finish
+# immediately instead of making every wait sit through them
+DISABLE_ANIMATIONS_SCRIPT = """
+(() => {
+    const css = `*, *::before, *::after {
+        animation-duration: 0s !important; animation-delay: 0s !important;
+        transition-duration: 0s !important; transition-delay: 0s !important;
+        scroll-behavior: auto !important; caret-color: transparent !important;
+    }`;
+    const apply = () => {
+        if (document.getElementById('__wesign-no-animations')) return;
+        const style = document.createElement('style');
+        style.id = '__wesign-no-animations';
+        style.textContent = css;
+        (document.head || document.documentElement).appendChild(style);
+    };
+    if (document.documentElement) apply();
+    document.addEventListener('DOMContentLoaded', apply);
+})();
+"""
+
+BASE_ARGS = [
+    '--no-sandbox',
+    '--disable-dev-shm-usage',
+    '--disable-web-security',
+    '--allow-running-insecure-content',
+    '--disable-extensions',
+    '--disable-background-timer-throttling',
+    '--disable-backgrounding-occluded-windows',
+    '--disable-renderer-backgrounding'
+]
+
+DEFAULT_ARTIFACTS_DIR = Path(__file__).resolve().parent.parent / "reports"
+
+
+def third_party_pattern(first_party_hosts: List[str]) -> "re.Pattern[str]":
+    """Regex matching http(s) URLs whose host is not one of (or a subdomain of) the first-party hosts"""
+    hosts = "|".join(re.escape(host) for host in first_party_hosts)
+    return re.compile(rf"^https?://(?!(?:[^/@]*\.)?(?:{hosts})(?::\d+)?(?:/|$))")
+
+
+def safe_test_name(nodeid: str) -> str:
+    """File-system friendly test id"""
+    return re.sub(r"[^A-Za-z0-9_.-]+", "_", nodeid).strip("_")[:150]
+
+
+class ProfileRuntime:
+    """
+    Applies one execution profile to every context the browser pool creates
+
+    attach()/detach() are registered as BrowserPool context hooks;
+    begin_test()/end_test() bracket each test so traces and videos can be
+    kept or discarded according to the profile's policy.
+    """
+
+    def __init__(self, profile: ExecutionProfile, base_url: str, artifacts_dir: Path = DEFAULT_ARTIFACTS_DIR):
+        self.profile = profile
+        self.base_url = base_url
+        self.traces_dir = artifacts_dir / "traces"
+        self.videos_dir = artifacts_dir / "videos"
+
+        first_party = [urlparse(base_url).hostname or "", "localhost", "127.0.0.1", *profile.allowed_hosts]
+        self.blocked_pattern = third_party_pattern([host for host in first_party if host])
+
+        self.current_test = "session"
+        self._trace_count = 0
+        self._test_videos: List[Video] = []
+
+        self.stats = {"blocked_requests": 0, "traces_saved": 0, "videos_saved": 0}
+
+    def launch_options(self) -> Dict[str, Any]:
+        """Browser launch options for the pool"""
+        args = BASE_ARGS + [arg for arg in self.profile.args if arg not in BASE_ARGS]
+        if self.profile.devtools:
+            args.append('--auto-open-devtools-for-tabs')
+        return {
+            "headless": self.profile.headless,
+            "slow_mo": self.profile.slow_mo or 0,
+            "timeout": 10000,  # 10 second timeout for browser launch
+            "args": args
+        }
+
+    def context_options(self) -> Dict[str, Any]:
+        """Default options of every pooled context"""
+        options: Dict[str, Any] = {
+            "locale": 'en-US',
+            "timezone_id": 'America/New_York'
+        }
+        if self.profile.maximized:
+            options["no_viewport"] = True  # Window size follows --start-maximized
+        else:
+            options["viewport"] = self.profile.viewport
+        if self.profile.disable_animations:
+            options["reduced_motion"] = "reduce"
+        if self.profile.video != "off":
+            options["record_video_dir"] = str(self.videos_dir)
+            if not self.profile.maximized:
+                options["record_video_size"] = self.profile.viewport
+        return options
+
+    async def _block(self, route: Route) -> None:
+        self.stats["blocked_requests"] += 1
+        await route.abort("blockedbyclient")
+
+    def _track_video(self, page: Page) -> None:
+        if page.video is not None:
+            self._test_videos.append(page.video)
+
+    async def attach(self, context: BrowserContext) -> None:
+        """Context hook: apply CSS/blocking and start tracing"""
+        if self.profile.disable_animations:
+            await context.add_init_script(DISABLE_ANIMATIONS_SCRIPT)
+        if self.profile.block_third_party:
+            await context.route(self.blocked_pattern, self._block)
+        if self.profile.video != "off":
+            context.on("page", self._track_video)
+        if self.profile.tracing != "off":
+            await context.tracing.start(screenshots=True, snapshots=True)
+
+    async def detach(self, context: BrowserContext) -> None:
+        """Close hook: write the context's trace before it goes away"""
+        if self.profile.tracing == "off":
+            return
+        self._trace_count += 1
+        trace_path = self.traces_dir / safe_test_name(self.current_test) / f"context-{self._trace_count}.zip"
+        trace_path.parent.mkdir(parents=True, exist_ok=True)
+        await context.tracing.stop(path=str(trace_path))
+
+    def begin_test(self, nodeid: str) -> None:
+        self.current_test = nodeid
+        self._trace_count = 0
+        self._test_videos = []
+
+    async def end_test(self, failed: bool) -> None:
+        """Keep or drop the test's traces/videos according to the profile"""
+        trace_dir = self.traces_dir / safe_test_name(self.current_test)
+        if trace_dir.exists():
+            if self.profile.tracing == "retain-on-failure" and not failed:
+                shutil.rmtree(trace_dir, ignore_errors=True)
+            else:
+                self.stats["traces_saved"] += len(list(trace_dir.glob("*.zip")))
+
+        for video in self._test_videos:
+            try:
+                if self.profile.video == "retain-on-failure" and not failed:
+                    await video.delete()
+                else:
+                    self.stats["videos_saved"] += 1
+            except Exception as e:
+                print(f"Video cleanup failed: {e}")
+
+        self.current_test = "session"
+        self._test_videos = []
+
@@ -0,0 +1,290 @@
+"""
+HAR Record/Replay for WeSign Tests
+Records the traffic of each test module - the frontend shell, its assets and
+the WeSign API - and serves it back with route_from_har, so replayed UI
+suites run offline against a fixed frontend and backend. Pointing the URL
+pattern at the API only (API_URL_PATTERN) keeps the frontend live instead.
+"""
+
+from playwright.async_api import BrowserContext, Response, Route
+import json
+import os
+import re
+import urllib.request
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Optional, Dict, List, Set, Any
+from urllib.parse import urljoin, urlparse
+
+
+MODES = ("off", "record", "replay")
+
+DEFAULT_HAR_DIR = Path(__file__).resolve().parent.parent / "har_recordings"
+# Everything the pages load; unrecorded requests are aborted on replay
+DEFAULT_URL_PATTERN = "**/*"
+# Opt-in: replay the WeSign API only and load the frontend from the live server
+API_URL_PATTERN = "**/userapi/**"
+
+# Hashed bundle names change with every frontend build (main.3f2a1c.js, styles.9b8e.css)
+BUNDLE_PATTERN = re.compile(r"\.(js|css)$")
+
+# Script and stylesheet references in the frontend's index document
+INDEX_REFERENCE = re.compile(r"""(?:src|href)\s*=\s*["']([^"'#?]+\.(?:js|css))(?:[?#][^"']*)?["']""", re.IGNORECASE)
+
+
+@dataclass
+class HarSettings:
+    """How recordings are written and matched (from pytest options / environment)"""
+    mode: str = "off"
+    har_dir: Path = DEFAULT_HAR_DIR
+    # Only requests matching this glob are recorded / served from the HAR
+    url_pattern: str = DEFAULT_URL_PATTERN
+    # Replay policy for requests missing from the HAR: "abort" (offline) or "fallback" (network)
+    not_found: str = "abort"
+
+    @classmethod
+    def from_env(cls) -> "HarSettings":
+        return cls(
+            mode=os.environ.get("WESIGN_HAR_MODE", "off"),
+            har_dir=Path(os.environ.get("WESIGN_HAR_DIR", DEFAULT_HAR_DIR)),
+            url_pattern=os.environ.get("WESIGN_HAR_URL", DEFAULT_URL_PATTERN),
+            not_found=os.environ.get("WESIGN_HAR_NOT_FOUND", "abort")
+        )
+
+
+@dataclass
+class StaleReport:
+    """Why a module's recording no longer matches the current frontend"""
+    module: str
+    reasons: List[str] = field(default_factory=list)
+    misses: List[str] = field(default_factory=list)
+    recorded_at: Optional[str] = None
+
+    @property
+    def is_stale(self) -> bool:
+        return bool(self.reasons)
+
+
+def frontend_fingerprint(urls: Set[str]) -> List[str]:
+    """Sorted bundle paths (js/css) served by the frontend origin"""
+    return sorted(urlparse(url).path for url in urls if BUNDLE_PATTERN.search(urlparse(url).path))
+
+
+def index_bundles(html: str, base_url: str) -> List[str]:
+    """Sorted bundle paths (js/css) on the frontend origin referenced by an index document"""
+    base = base_url.rstrip("/") + "/"
+    urls = [urlparse(urljoin(base, reference)) for reference in INDEX_REFERENCE.findall(html)]
+    return sorted({url.path for url in urls if url.netloc == urlparse(base).netloc})
+
+
+# Live index bundles per base URL, fetched once per process
+_live_index: Dict[str, Optional[List[str]]] = {}
+
+
+def fetch_index_bundles(base_url: str, timeout: float = 5.0) -> Optional[List[str]]:
+    """Bundles the live frontend serves right now (None when it cannot be reached, e.g. offline)"""
+    if base_url not in _live_index:
+        try:
+            with urllib.request.urlopen(base_url.rstrip("/") + "/", timeout=timeout) as response:
+                html = response.read().decode("utf-8", errors="replace")
+            _live_index[base_url] = index_bundles(html, base_url)
+        except (OSError, ValueError):
+            _live_index[base_url] = None
+    return _live_index[base_url]
+
+
+def merge_har_files(parts: List[Path], target: Path) -> int:
+    """
+    Merge per-context HAR files into one, dropping duplicate entries
+
+    Returns the number of entries written.
+    """
+    merged: Optional[Dict[str, Any]] = None
+    seen: Set[tuple] = set()
+
+    for part in sorted(parts):
+        try:
+            with open(part, 'r', encoding='utf-8') as f:
+                har = json.load(f)
+        except Exception as e:
+            print(f"Skipping unreadable HAR {part}: {e}")
+            continue
+
+        if merged is None:
+            merged = {"log": {**har["log"], "entries": []}}
+
+        for entry in har["log"].get("entries", []):
+            request = entry.get("request", {})
+            key = (
+                request.get("method"),
+                request.get("url"),
+                (request.get("postData") or {}).get("text"),
+                entry.get("response", {}).get("status")
+            )
+            if key not in seen:
+                seen.add(key)
+                merged["log"]["entries"].append(entry)
+
+    if merged is None:
+        return 0
+
+    target.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = target.with_suffix(".tmp")
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(merged, f)
+    os.replace(tmp_path, target)
+    return len(merged["log"]["entries"])
+
+
+class HarModuleSession:
+    """
+    Record or replay the HAR of one test module
+
+    attach() is registered as a BrowserPool context hook, so every context
+    created while the module runs (fixtures, pooled_playwright leases, auth
+    logins) is recorded into / served from the module's HAR.
+    """
+
+    def __init__(self, settings: HarSettings, module: str, base_url: str):
+        self.settings = settings
+        self.module = module
+        self.base_url = base_url
+        self.frontend_host = urlparse(base_url).netloc
+
+        self.har_path = settings.har_dir / f"{module}.har"
+        self.meta_path = settings.har_dir / f"{module}.meta.json"
+        self.parts_dir = settings.har_dir / ".parts" / module
+        # Part files are per xdist worker; run recordings with --dist loadfile so
+        # one worker owns each module
+        self.worker_id = os.environ.get("PYTEST_XDIST_WORKER", "main")
+
+        self._frontend_urls: Set[str] = set()
+        self._misses: List[str] = []
+        self._part_count = 0
+        self._meta = self._load_meta()
+
+        if settings.mode == "record":
+            # Parts of an interrupted earlier recording must not leak into this one
+            for stale_part in self._parts():
+                stale_part.unlink()
+
+    def _parts(self) -> List[Path]:
+        return list(self.parts_dir.glob(f"{self.worker_id}-*.har"))
+
+    def _load_meta(self) -> Dict[str, Any]:
+        try:
+            with open(self.meta_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except Exception:
+            return {}
+
+    def _on_response(self, response: Response) -> None:
+        if urlparse(response.url).netloc == self.frontend_host:
+            self._frontend_urls.add(response.url)
+
+    async def _on_miss(self, route: Route) -> None:
+        """Requests of the URL pattern that the recording has no entry for"""
+        request = route.request
+        self._misses.append(f"{request.method} {request.url}")
+        if self.settings.not_found == "fallback":
+            await route.continue_()
+        else:
+            await route.abort()
+
+    async def attach(self, context: BrowserContext) -> None:
+        """Context hook: start recording into / serving from the module HAR"""
+        context.on("response", self._on_response)
+
+        if self.settings.mode == "record":
+            self.parts_dir.mkdir(parents=True, exist_ok=True)
+            self._part_count += 1
+            part = self.parts_dir / f"{self.worker_id}-{self._part_count:04d}.har"
+            await context.route_from_har(
+                part,
+                url=self.settings.url_pattern,
+                update=True,
+                update_content="embed",
+                update_mode="minimal"
+            )
+
+        elif self.settings.mode == "replay":
+            # Registered first so it runs only when route_from_har falls back
+            await context.route(self.settings.url_pattern, self._on_miss)
+            if self.har_path.exists():
+                await context.route_from_har(
+                    self.har_path,
+                    url=self.settings.url_pattern,
+                    not_found="fallback"
+                )
+
+    def finish(self) -> Optional[StaleReport]:
+        """Merge a recording, or check a replayed recording for staleness"""
+        fingerprint = frontend_fingerprint(self._frontend_urls)
+
+        if self.settings.mode == "record":
+            parts = self._parts()
+            entries = merge_har_files(parts, self.har_path)
+            for part in parts:
+                part.unlink()
+            if entries:
+                meta = {
+                    "module": self.module,
+                    "base_url": self.base_url,
+                    "url_pattern": self.settings.url_pattern,
+                    "recorded_at": datetime.now().isoformat(),
+                    "entries": entries,
+                    "frontend_bundles": fingerprint,
+                    "index_bundles": fetch_index_bundles(self.base_url)
+                }
+                with open(self.meta_path, 'w', encoding='utf-8') as f:
+                    json.dump(meta, f, indent=2)
+                print(f"\nRecorded {entries} responses for {self.module} -> {self.har_path}")
+            return None
+
+        if self.settings.mode != "replay" or not (self._misses or self._frontend_urls):
+            return None
+
+        report = StaleReport(module=self.module, misses=list(self._misses), recorded_at=self._meta.get("recorded_at"))
+        if not self.har_path.exists():
+            report.reasons.append("no recording for this module")
+        if self._misses:
+            report.reasons.append(f"{len(self._misses)} request(s) not in the recording")
+
+        # A frontend served from the HAR always matches its own recording; compare the live
+        # build's index (skipped when offline). With the API-only pattern the pages load live
+        # bundles, which are compared directly.
+        recorded_index = self._meta.get("index_bundles")
+        live_index = fetch_index_bundles(self.base_url) if recorded_index else None
+        recorded_bundles = self._meta.get("frontend_bundles") or []
+        if live_index is not None and set(live_index) != set(recorded_index):
+            report.reasons.append("live frontend build differs from the recorded one")
+        elif recorded_bundles and fingerprint and set(fingerprint) != set(recorded_bundles):
+            report.reasons.append("frontend bundles changed since recording")
+        return report
+
+
+# Reports of every replayed module in this worker (printed by conftest at session end)
+_stale_reports: List[StaleReport] = []
+
+
+def add_stale_report(report: Optional[StaleReport]) -> None:
+    if report is not None and report.is_stale:
+        _stale_reports.append(report)
+        print(f"\nStale HAR recording for {report.module}: {'; '.join(report.reasons)}")
+
+
+def get_stale_reports() -> List[StaleReport]:
+    """Modules whose recording no longer matches the current frontend"""
+    return list(_stale_reports)
+
+
+def export_stale_reports() -> List[Dict[str, Any]]:
+    """This worker's reports as plain data (xdist workeroutput must be serializable)"""
+    return [asdict(report) for report in _stale_reports]
+
+
+def record_stale_reports(reports: List[Dict[str, Any]]) -> None:
+    """Add a worker's exported reports to the controller's list"""
+    _stale_reports.extend(StaleReport(**report) for report in reports)
+
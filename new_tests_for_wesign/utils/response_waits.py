@@ -0,0 +1,243 @@
+"""
+Response-Correlated Waits for WeSign Page Objects
+Page actions declare the backend request they trigger and return as soon as
+that response (and the DOM update it causes) arrives
+"""
+
+from playwright.async_api import Page, Request, Response
+import asyncio
+import re
+import time
+import weakref
+from dataclasses import asdict, dataclass, field
+from typing import Optional, Callable, Awaitable, Dict, List, Set, Any
+
+
+# Resolves after the next two animation frames, i.e. once the framework has rendered
+DOM_SETTLED_SCRIPT = "() => new Promise(r => requestAnimationFrame(() => requestAnimationFrame(r)))"
+
+
+@dataclass(frozen=True)
+class BackendRequest:
+    """A backend call a page action triggers, matched by HTTP method ("POST|PUT", "*") and URL regex"""
+    name: str
+    method: str
+    url_pattern: str
+
+    def matches(self, method: str, url: str) -> bool:
+        """Check if a request/response belongs to this backend call"""
+        if self.method != "*" and method.upper() not in self.method.split("|"):
+            return False
+        return re.search(self.url_pattern, url) is not None
+
+
+@dataclass
+class ActionTiming:
+    """Observed latency of one page action"""
+    action: str
+    request: str
+    status: Optional[int]
+    response_ms: Optional[float]
+    dom_ms: float
+    total_ms: float
+    matched: bool
+    timestamp: float = field(default_factory=time.time)
+
+
+# Every timing recorded in this process (printed by conftest at session end)
+_timings: List[ActionTiming] = []
+
+
+def get_action_timings() -> List[ActionTiming]:
+    """All action timings recorded so far"""
+    return list(_timings)
+
+
+def export_action_timings() -> List[Dict[str, Any]]:
+    """This worker's timings as plain data (xdist workeroutput must be serializable)"""
+    return [asdict(timing) for timing in _timings]
+
+
+def record_action_timings(timings: List[Dict[str, Any]]) -> None:
+    """Add a worker's exported timings to the controller's list"""
+    _timings.extend(ActionTiming(**timing) for timing in timings)
+
+
+def latency_summary() -> Dict[str, Dict[str, Any]]:
+    """Per-action count, mean and max latency (ms) plus unmatched count"""
+    summary: Dict[str, Dict[str, Any]] = {}
+    for timing in _timings:
+        entry = summary.setdefault(timing.action, {"count": 0, "total_ms": 0.0, "max_ms": 0.0, "unmatched": 0})
+        entry["count"] += 1
+        entry["total_ms"] += timing.total_ms
+        entry["max_ms"] = max(entry["max_ms"], timing.total_ms)
+        if not timing.matched:
+            entry["unmatched"] += 1
+
+    for entry in summary.values():
+        entry["mean_ms"] = round(entry.pop("total_ms") / entry["count"], 1)
+        entry["max_ms"] = round(entry["max_ms"], 1)
+    return summary
+
+
+class ResponseWaiter:
+    """
+    Correlates page actions with the backend responses they cause
+
+    One waiter is shared by every page object on the same Playwright page
+    (see for_page()), so in-flight requests are tracked from the moment the
+    first page object is created.
+    """
+
+    _instances: "weakref.WeakKeyDictionary[Page, ResponseWaiter]" = weakref.WeakKeyDictionary()
+
+    def __init__(self, page: Page, default_timeout: int = 15000, start_timeout: int = 1500):
+        # Weak, so the _instances entry (keyed by the page) does not keep the page alive
+        self._page = weakref.ref(page)
+        self.default_timeout = default_timeout
+        # How long to wait for the declared request to *start* before assuming
+        # the action was handled client-side (validation error, cached list, ...)
+        self.start_timeout = start_timeout
+
+        self._in_flight: Set[Request] = set()
+        page.on("request", self._in_flight.add)
+        page.on("requestfinished", self._in_flight.discard)
+        page.on("requestfailed", self._in_flight.discard)
+
+    @property
+    def page(self) -> Page:
+        page = self._page()
+        if page is None:
+            raise RuntimeError("Page of this ResponseWaiter no longer exists")
+        return page
+
+    @classmethod
+    def for_page(cls, page: Page) -> "ResponseWaiter":
+        """Get the shared waiter for a page, creating it on first use"""
+        waiter = cls._instances.get(page)
+        if waiter is None:
+            waiter = cls(page)
+            cls._instances[page] = waiter
+        return waiter
+
+    async def wait_for_dom_update(self, selector: Optional[str] = None, timeout: int = 1000) -> None:
+        """Wait for the selector (if given) and for the next rendered frame"""
+        if selector:
+            try:
+                await self.page.locator(selector).first.wait_for(state="visible", timeout=timeout)
+            except Exception:
+                pass  # Empty result sets legitimately render nothing
+        try:
+            await self.page.evaluate(DOM_SETTLED_SCRIPT)
+        except Exception:
+            pass  # Page navigated away mid-update
+
+    async def perform(
+        self,
+        action: str,
+        request: BackendRequest,
+        trigger: Callable[[], Awaitable[Any]],
+        dom_selector: Optional[str] = None,
+        timeout: Optional[int] = None
+    ) -> ActionTiming:
+        """
+        Run trigger() and wait for the declared backend response and DOM update
+
+        Returns as soon as the response arrives; if the request never starts
+        within start_timeout the action is recorded as unmatched instead of
+        waiting for the full timeout. Only the response to a request started
+        after this call counts, not one to a matching request already in flight.
+        """
+        timeout = timeout or self.default_timeout
+        started: asyncio.Future = asyncio.get_running_loop().create_future()
+
+        def on_request(req: Request) -> None:
+            if not started.done() and request.matches(req.method, req.url):
+                started.set_result(req)
+
+        page = self.page
+        page.on("request", on_request)
+
+        start = time.perf_counter()
+        response: Optional[Response] = None
+        matched = False
+        try:
+            await trigger()
+            try:
+                triggered = await asyncio.wait_for(asyncio.shield(started), self.start_timeout / 1000)
+                # None when the request failed (aborted, connection refused, ...)
+                response = await asyncio.wait_for(triggered.response(), timeout / 1000)
+                matched = True
+            except asyncio.TimeoutError:
+                pass
+        finally:
+            page.remove_listener("request", on_request)
+
+        response_at = time.perf_counter()
+        await self.wait_for_dom_update(dom_selector)
+        end = time.perf_counter()
+
+        timing = ActionTiming(
+            action=action,
+            request=request.name,
+            status=response.status if response is not None else None,
+            response_ms=round((response_at - start) * 1000, 1) if matched else None,
+            dom_ms=round((end - response_at) * 1000, 1),
+            total_ms=round((end - start) * 1000, 1),
+            matched=matched
+        )
+        _timings.append(timing)
+        return timing
+
+    async def settle(
+        self,
+        request: BackendRequest,
+        dom_selector: Optional[str] = None,
+        timeout: Optional[int] = None
+    ) -> ActionTiming:
+        """
+        Wait for a matching request that is already in flight (e.g. the list
+        load fired by navigation) instead of a fixed sleep before reading the page
+
+        If nothing is in flight and dom_selector has not rendered yet, the
+        request may not have started; wait up to start_timeout for it.
+        """
+        timeout = timeout or self.default_timeout
+        start = time.perf_counter()
+        deadline = start + timeout / 1000
+
+        pending = [req for req in self._in_flight if request.matches(req.method, req.url)]
+        if not pending and dom_selector and await self.page.locator(dom_selector).count() == 0:
+            try:
+                pending = [await self.page.wait_for_event(
+                    "request",
+                    lambda req: request.matches(req.method, req.url),
+                    timeout=self.start_timeout
+                )]
+            except Exception:
+                pass  # Nothing to load (empty list or already rendered elsewhere)
+
+        matched = bool(pending)
+        status = None
+        for req in pending:
+            try:
+                resp = await asyncio.wait_for(req.response(), max(deadline - time.perf_counter(), 0))
+                status = resp.status if resp is not None else status
+            except Exception:
+                pass
+
+        response_at = time.perf_counter()
+        await self.wait_for_dom_update(dom_selector)
+        end = time.perf_counter()
+
+        timing = ActionTiming(
+            action=f"{request.name}.settle",
+            request=request.name,
+            status=status,
+            response_ms=round((response_at - start) * 1000, 1) if matched else None,
+            dom_ms=round((end - response_at) * 1000, 1),
+            total_ms=round((end - start) * 1000, 1),
+            matched=matched
+        )
+        _timings.append(timing)
+        return timing
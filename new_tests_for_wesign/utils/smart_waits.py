@@ -7,6 +7,7 @@ from playwright.async_api import Page, Locator
 import asyncio
 from typing import Optional, Union, List, Dict, Any
 from enum import Enum
+from .wait_runtime import WaitRuntime, present, appears, appeared_then_gone, url_contains, quiet
 
 
 class WaitCondition(Enum):
@@ -29,6 +30,7 @@ class SmartWaits:
     def __init__(self, page: Page, default_timeout: int = 10000):
         self.page = page
         self.default_timeout = default_timeout
+        self.runtime = WaitRuntime(page)
 
     async def wait_for_element_state(
         self,
@@ -114,27 +116,25 @@ class SmartWaits:
 
         try:
             # Wait for either success or error indicator
-            conditions = []
+            conditions = {}
 
             if success_indicator:
-                conditions.append(f"document.querySelector('{success_indicator}')")
+                conditions["success"] = present(success_indicator)
             if error_indicator:
-                conditions.append(f"document.querySelector('{error_indicator}')")
+                conditions["error"] = present(error_indicator)
 
             if conditions:
-                # Wait for any success/error indicator to appear
-                await self.page.wait_for_function(
-                    f"({' || '.join(conditions)})",
-                    timeout=timeout
-                )
+                # One round trip: first indicator to appear plus everything present at that moment
+                race = await self.runtime.race(conditions, timeout=timeout)
+                if race.timed_out:
+                    return result
 
-                # Check which indicators are present
-                if success_indicator and await self.page.locator(success_indicator).count() > 0:
+                if "success" in race.satisfied:
                     result["success"] = True
                     result["status"] = "success"
                     result["indicators_found"].append(success_indicator)
 
-                if error_indicator and await self.page.locator(error_indicator).count() > 0:
+                if "error" in race.satisfied:
                     result["error"] = True
                     result["status"] = "error"
                     result["indicators_found"].append(error_indicator)
@@ -345,56 +345,57 @@ class WeSignSmartWaits(SmartWaits):
 
     async def wait_for_document_upload(self) -> bool:
         """Wait for document upload to complete in WeSign"""
+        progress = ".upload-progress, .progress-bar, [class*='progress'], .uploading"
         try:
-            # Wait for any progress indicators to appear and then disappear
-            progress_selectors = [".upload-progress", ".progress-bar", "[class*='progress']", "[class*='upload']"]
-
-            # First wait for progress to start (optional)
-            for selector in progress_selectors:
-                try:
-                    await self.page.wait_for_selector(selector, timeout=2000)
-                    # Then wait for it to disappear
-                    await self.page.wait_for_selector(selector, state="hidden", timeout=25000)
-                    break
-                except:
-                    continue
-
-            # Wait for network to be idle
-            await self.page.wait_for_load_state("networkidle", timeout=15000)
-            return True
+            # Progress indicator came and went, or the page settled without one
+            race = await self.runtime.race({
+                "progress_done": appeared_then_gone(progress),
+                "success": appears(".alert-success, .success-message, .upload-success"),
+                "settled": quiet(2000, busy_selector=progress)
+            }, timeout=30000)
+            if not race.timed_out:
+                return True
+        except Exception as e:
+            print(f"Document upload wait failed: {e}")
 
+        # Fallback: the DOM never went quiet (e.g. a polling widget); accept network idle
+        try:
+            await self.page.wait_for_load_state("networkidle", timeout=10000)
+            return True
         except Exception:
-            # Fallback: just wait for network idle
-            try:
-                await self.page.wait_for_load_state("networkidle", timeout=10000)
-                return True
-            except:
-                return False
+            return False
 
     async def wait_for_login_result(self) -> Dict[str, Any]:
         """Wait for login attempt to complete"""
+        error_selectors = [".error-message", ".alert-danger", "[class*='error']", "[class*='danger']"]
         try:
-            # Wait for either navigation to dashboard OR error message
-            await asyncio.wait_for(
-                self.page.wait_for_url("**/dashboard**", timeout=10000),
-                timeout=12.0
-            )
-            return {"success": True, "status": "success", "error": False, "indicators_found": ["dashboard_url"]}
-        except (asyncio.TimeoutError, Exception):
-            # Check for error indicators
-            error_selectors = [
-                ".error-message",
-                ".alert-danger",
-                "[class*='error']",
-                "[class*='danger']"
-            ]
-
-            for selector in error_selectors:
+            # Dashboard navigation OR a newly shown error, whichever comes first
+            race = await self.runtime.race({
+                "dashboard_url": url_contains("/dashboard"),
+                "error": appears(", ".join(error_selectors))
+            }, timeout=10000)
+        except Exception as e:
+            print(f"Login result wait failed: {e}")
+            race = None
+
+        if race is not None and race.condition == "dashboard_url":
+            return {"success": True, "status": "success", "error": False,
+                    "indicators_found": ["dashboard_url"], "elapsed_ms": race.elapsed_ms}
+
+        if race is not None and race.condition == "error":
+            return {"success": False, "error": True, "status": "error",
+                    "indicators_found": [", ".join(error_selectors)], "elapsed_ms": race.elapsed_ms}
+
+        # An error shown before the race started never "appears"; check what is on the page now
+        for selector in error_selectors:
+            try:
                 if await self.page.locator(selector).count() > 0:
                     return {"success": False, "error": True, "status": "error", "indicators_found": [selector]}
+            except Exception:
+                continue
 
-            # Default: assume we're still on login page (login failed)
-            return {"success": False, "error": False, "status": "login_page", "indicators_found": []}
+        # Default: assume we're still on login page (login failed)
+        return {"success": False, "error": False, "status": "login_page", "indicators_found": []}
 
     async def wait_for_template_operation(self) -> bool:
         """Wait for template-related operations"""
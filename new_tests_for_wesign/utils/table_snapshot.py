@@ -0,0 +1,123 @@
+"""
+Table/Grid Snapshot for WeSign Page Objects
+Reads every row and cell of a list in a single browser round trip
+"""
+
+from playwright.async_api import Page, Locator
+from dataclasses import dataclass, field
+from typing import Optional, Dict, List, Sequence
+
+
+# Runs in the page against all rows matched by the (Playwright) row selector.
+# Cell and field selectors are plain CSS, evaluated inside each row.
+SNAPSHOT_SCRIPT = """
+(rows, [cellSelector, fields]) => {
+    const isVisible = el => !!(el.offsetWidth || el.offsetHeight || el.getClientRects().length);
+    const text = el => (el ? (el.textContent || '') : '').trim();
+    return rows.map(row => {
+        const record = {
+            text: (row.innerText || row.textContent || '').trim(),
+            visible: isVisible(row),
+            cells: cellSelector ? Array.from(row.querySelectorAll(cellSelector), text) : [],
+            fields: {}
+        };
+        for (const [name, selector] of Object.entries(fields)) {
+            record.fields[name] = text(row.querySelector(selector));
+        }
+        return record;
+    });
+}
+"""
+
+COUNT_SCRIPT = """
+(rows, visibleOnly) => visibleOnly
+    ? rows.filter(el => !!(el.offsetWidth || el.offsetHeight || el.getClientRects().length)).length
+    : rows.length
+"""
+
+# First selector with at least one match wins (CSS only, evaluated in one call)
+FIRST_MATCH_COUNT_SCRIPT = """
+(selectors) => {
+    for (const selector of selectors) {
+        const count = document.querySelectorAll(selector).length;
+        if (count) return count;
+    }
+    return 0;
+}
+"""
+
+
+@dataclass
+class RowRecord:
+    """One row of a snapshot; `element` is only resolved when the row is acted on"""
+    index: int
+    text: str
+    visible: bool
+    cells: List[str] = field(default_factory=list)
+    fields: Dict[str, str] = field(default_factory=dict)
+    rows_locator: Optional[Locator] = field(default=None, repr=False, compare=False)
+
+    @property
+    def element(self) -> Optional[Locator]:
+        """Lazy locator for this row (no browser call until it is used)"""
+        if self.rows_locator is None:
+            return None
+        return self.rows_locator.nth(self.index)
+
+    def cell(self, position: int, default: str = "") -> str:
+        """Cell text by position, or default if the row has fewer cells"""
+        return self.cells[position] if position < len(self.cells) else default
+
+
+class TableSnapshot:
+    """
+    Snapshot of a table/grid taken with a single evaluate call
+
+    Replaces per-row loops of `locator.nth(i)` + `count()` + `text_content()`,
+    which cost several CDP round trips per row.
+    """
+
+    def __init__(
+        self,
+        page: Page,
+        row_selector: str,
+        cell_selector: Optional[str] = None,
+        fields: Optional[Dict[str, str]] = None
+    ):
+        self.page = page
+        self.row_selector = row_selector
+        self.cell_selector = cell_selector
+        self.fields = fields or {}
+
+    @property
+    def rows(self) -> Locator:
+        return self.page.locator(self.row_selector)
+
+    async def capture(self, visible_only: bool = False) -> List[RowRecord]:
+        """Extract all rows (text, cells and named fields) in one round trip"""
+        rows_locator = self.rows
+        raw_rows = await rows_locator.evaluate_all(SNAPSHOT_SCRIPT, [self.cell_selector, self.fields])
+
+        records = [
+            RowRecord(
+                index=i,
+                text=raw['text'],
+                visible=raw['visible'],
+                cells=raw['cells'],
+                fields=raw['fields'],
+                rows_locator=rows_locator
+            )
+            for i, raw in enumerate(raw_rows)
+        ]
+        if visible_only:
+            records = [record for record in records if record.visible]
+        return records
+
+    async def count(self, visible_only: bool = False) -> int:
+        """Count rows in one round trip"""
+        return await self.rows.evaluate_all(COUNT_SCRIPT, visible_only)
+
+
+async def count_first_match(page: Page, selectors: Sequence[str]) -> int:
+    """Count matches of the first CSS selector that matches anything, in one evaluate"""
+    return await page.evaluate(FIRST_MATCH_COUNT_SCRIPT, list(selectors))
@@ -0,0 +1,207 @@
+"""
+In-Page Wait Runtime for WeSign Tests
+A MutationObserver-based condition racer injected once per browser context
+"""
+
+from playwright.async_api import Page, BrowserContext
+import time
+import weakref
+from dataclasses import dataclass, field
+from typing import Optional, Dict, List, Any
+
+
+# Installed with add_init_script, so it exists in every document of the context.
+# race() re-evaluates all conditions on each DOM mutation / URL change and
+# resolves with the first one that holds - no polling and one round trip.
+WAIT_RUNTIME_SCRIPT = """
+(() => {
+    if (window.__wesignWait) return;
+
+    const isVisible = el => !!(el && (el.offsetWidth || el.offsetHeight || el.getClientRects().length));
+    const visibleMatch = selector => Array.from(document.querySelectorAll(selector)).some(isVisible);
+
+    const check = (cond, state) => {
+        switch (cond.kind) {
+            case 'present': return document.querySelector(cond.selector) !== null;
+            case 'visible': return visibleMatch(cond.selector);
+            case 'gone': return !visibleMatch(cond.selector);
+            case 'count': return document.querySelectorAll(cond.selector).length >= cond.min;
+            case 'url': return location.href.includes(cond.fragment);
+            case 'appears':
+                // Only elements that were not already visible when the race started
+                return !state.initiallyVisible && visibleMatch(cond.selector);
+            case 'appearedThenGone':
+                if (visibleMatch(cond.selector)) { state.seen = true; return false; }
+                return !!state.seen;
+            case 'quiet':
+                return !visibleMatch(cond.busySelector || ':not(*)') &&
+                    performance.now() - window.__wesignWait.lastMutation >= cond.ms;
+            default: return false;
+        }
+    };
+
+    const runtime = {
+        lastMutation: performance.now(),
+
+        race(conditions, timeoutMs) {
+            const start = performance.now();
+            runtime.lastMutation = start;
+            const states = {};
+            for (const [name, cond] of Object.entries(conditions)) {
+                states[name] = {initiallyVisible: cond.selector ? visibleMatch(cond.selector) : false};
+            }
+
+            return new Promise(resolve => {
+                let done = false;
+                let observer, timer, quietTimer;
+
+                const finish = (name, timedOut) => {
+                    if (done) return;
+                    done = true;
+                    observer && observer.disconnect();
+                    clearTimeout(timer);
+                    clearInterval(quietTimer);
+                    window.removeEventListener('popstate', evaluate);
+                    window.removeEventListener('hashchange', evaluate);
+                    const satisfied = Object.entries(conditions)
+                        .filter(([n, c]) => c.kind !== 'appearedThenGone' && check(c, states[n]))
+                        .map(([n]) => n);
+                    resolve({condition: name, elapsed_ms: performance.now() - start, satisfied, timed_out: timedOut});
+                };
+
+                function evaluate() {
+                    for (const [name, cond] of Object.entries(conditions)) {
+                        if (check(cond, states[name])) return finish(name, false);
+                    }
+                }
+
+                observer = new MutationObserver(() => {
+                    runtime.lastMutation = performance.now();
+                    evaluate();
+                });
+                observer.observe(document.documentElement, {
+                    childList: true, subtree: true, attributes: true, characterData: true
+                });
+                window.addEventListener('popstate', evaluate);
+                window.addEventListener('hashchange', evaluate);
+
+                // Quiet-period conditions are satisfied by the *absence* of mutations
+                const quietMs = Math.min(...Object.values(conditions).filter(c => c.kind === 'quiet').map(c => c.ms));
+                if (Number.isFinite(quietMs)) quietTimer = setInterval(evaluate, Math.max(quietMs / 4, 50));
+
+                timer = setTimeout(() => finish(null, true), timeoutMs);
+                evaluate();
+            });
+        }
+    };
+
+    window.__wesignWait = runtime;
+})();
+"""
+
+# Installs the runtime if this document predates install(), then races - one round trip
+RACE_SCRIPT = (
+    "([conditions, timeout]) => {" + WAIT_RUNTIME_SCRIPT +
+    " return window.__wesignWait.race(conditions, timeout); }"
+)
+
+NAVIGATION_ERRORS = ("Execution context was destroyed", "navigation", "Target closed")
+
+
+def present(selector: str) -> Dict[str, Any]:
+    """Element matching the CSS selector exists in the DOM"""
+    return {"kind": "present", "selector": selector}
+
+
+def visible(selector: str) -> Dict[str, Any]:
+    """Any element matching the CSS selector is visible"""
+    return {"kind": "visible", "selector": selector}
+
+
+def gone(selector: str) -> Dict[str, Any]:
+    """No element matching the CSS selector is visible"""
+    return {"kind": "gone", "selector": selector}
+
+
+def appears(selector: str) -> Dict[str, Any]:
+    """A matching element becomes visible that was not visible when the wait started"""
+    return {"kind": "appears", "selector": selector}
+
+
+def appeared_then_gone(selector: str) -> Dict[str, Any]:
+    """A matching element was seen and has since disappeared (progress bars, spinners)"""
+    return {"kind": "appearedThenGone", "selector": selector}
+
+
+def count_at_least(selector: str, minimum: int) -> Dict[str, Any]:
+    """At least `minimum` elements match the CSS selector"""
+    return {"kind": "count", "selector": selector, "min": minimum}
+
+
+def url_contains(fragment: str) -> Dict[str, Any]:
+    """Current URL contains the fragment"""
+    return {"kind": "url", "fragment": fragment}
+
+
+def quiet(ms: int, busy_selector: Optional[str] = None) -> Dict[str, Any]:
+    """No DOM mutation for `ms` milliseconds and no busy indicator visible"""
+    return {"kind": "quiet", "ms": ms, "busySelector": busy_selector}
+
+
+@dataclass
+class WaitResult:
+    """Outcome of a race: the winning condition and how long it took"""
+    condition: Optional[str]
+    elapsed_ms: float
+    satisfied: List[str] = field(default_factory=list)
+    timed_out: bool = False
+
+
+class WaitRuntime:
+    """Python side of the in-page wait runtime"""
+
+    # Contexts that already carry the init script
+    _installed: "weakref.WeakSet[BrowserContext]" = weakref.WeakSet()
+
+    def __init__(self, page: Page):
+        self.page = page
+
+    @classmethod
+    async def install(cls, context: BrowserContext) -> None:
+        """Inject the runtime into every future document of the context (once)"""
+        if context not in cls._installed:
+            await context.add_init_script(WAIT_RUNTIME_SCRIPT)
+            cls._installed.add(context)
+
+    async def race(self, conditions: Dict[str, Dict[str, Any]], timeout: int = 10000) -> WaitResult:
+        """
+        Resolve with the first condition that holds, in a single round trip
+
+        A full page navigation destroys the in-page promise; the race is then
+        restarted on the new document with the remaining time.
+        """
+        start = time.perf_counter()
+        deadline = start + timeout / 1000
+
+        while True:
+            remaining = int((deadline - time.perf_counter()) * 1000)
+            if remaining <= 0:
+                return WaitResult(condition=None, elapsed_ms=round((time.perf_counter() - start) * 1000, 1), timed_out=True)
+
+            try:
+                await self.install(self.page.context)
+                result = await self.page.evaluate(RACE_SCRIPT, [conditions, remaining])
+                return WaitResult(
+                    condition=result["condition"],
+                    elapsed_ms=round((time.perf_counter() - start) * 1000, 1),
+                    satisfied=result["satisfied"],
+                    timed_out=result["timed_out"]
+                )
+            except Exception as e:
+                if not any(marker in str(e) for marker in NAVIGATION_ERRORS):
+                    raise
+                # Navigated mid-wait; continue on the new document
+                try:
+                    await self.page.wait_for_load_state("domcontentloaded", timeout=max(remaining, 1))
+                except Exception:
+                    pass
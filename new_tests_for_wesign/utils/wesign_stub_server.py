@@ -0,0 +1,611 @@
+"""
+Local WeSign API Stand-in Server
+In-memory implementation of the WeSign endpoints used by the API runner,
+the Newman collection and the k6 scenarios (login, documents, templates,
+contacts, signing), with injectable latency and error distributions
+
+Usage:
+    python -m utils.wesign_stub_server --port 8089 --latency lognormal:80:40 --error-rate 0.02
+    k6 run -e BASE_URL=http://127.0.0.1:8089/userapi/ui/v3 loadTesting/scenarios/smoke/smoke-basic.js
+"""
+
+import base64
+import json
+import math
+import random
+import re
+import threading
+import time
+import uuid
+from dataclasses import dataclass, field
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional, Dict, List, Tuple, Any
+from urllib.parse import urlparse, parse_qs
+
+
+# Every client uses a different base path; all of them resolve to the same routes
+API_PREFIXES = ("/userapi/ui/v3", "/userapi/v3", "/api/v1", "/api")
+
+DEFAULT_USERS = {
+    "nirk@comsign.co.il": "Comsign1!",
+    "basic@example.com": "BasicPass123!",
+    "local_company@test.com": "LocalTest123!",
+    "local_basic@test.com": "LocalBasic123!",
+    "test.user@loadtest.com": "LoadTest123!"
+}
+
+TOKEN_TTL_SECONDS = 3600
+
+
+@dataclass
+class LatencyModel:
+    """
+    Response delay distribution in milliseconds
+
+    Spec strings: "fixed:50", "uniform:20:200", "normal:100:25",
+    "lognormal:80:40" (mean:stddev of the delay), "exponential:60".
+    """
+    distribution: str = "fixed"
+    params: Tuple[float, ...] = (0.0,)
+
+    # Number of parameters each distribution takes
+    ARITY = {"fixed": 1, "uniform": 2, "normal": 2, "lognormal": 2, "exponential": 1}
+
+    @classmethod
+    def parse(cls, spec: str) -> "LatencyModel":
+        name, *values = str(spec).split(":")
+        if name not in cls.ARITY:
+            raise ValueError(f"Unknown latency distribution: {name}")
+        if len(values) != cls.ARITY[name]:
+            raise ValueError(f"Latency '{name}' takes {cls.ARITY[name]} parameter(s), got {len(values)}: {spec}")
+        params = tuple(float(v) for v in values)
+        if any(not v >= 0 for v in params):
+            raise ValueError(f"Latency parameters must be non-negative: {spec}")
+        if name == "uniform" and params[0] > params[1]:
+            raise ValueError(f"Uniform latency minimum exceeds maximum: {spec}")
+        return cls(distribution=name, params=params)
+
+    def sample(self, rng: random.Random) -> float:
+        p = self.params
+        if self.distribution == "uniform":
+            value = rng.uniform(p[0], p[1])
+        elif self.distribution == "normal":
+            value = rng.gauss(p[0], p[1] if len(p) > 1 else 0.0)
+        elif self.distribution == "lognormal":
+            mean, stddev = p[0], (p[1] if len(p) > 1 else 0.0)
+            if mean <= 0:
+                return 0.0
+            # Convert the requested mean/stddev of the delay into mu/sigma
+            sigma2 = math.log(1 + (stddev / mean) ** 2)
+            value = rng.lognormvariate(math.log(mean) - sigma2 / 2, sigma2 ** 0.5)
+        elif self.distribution == "exponential":
+            value = rng.expovariate(1 / p[0]) if p[0] > 0 else 0.0
+        else:
+            value = p[0]
+        return max(value, 0.0)
+
+
+@dataclass
+class FaultProfile:
+    """Latency and error injection, globally and per route ("POST /users/login")"""
+    latency: LatencyModel = field(default_factory=LatencyModel)
+    error_rate: float = 0.0
+    # Status codes of injected errors, weighted
+    error_statuses: Dict[int, float] = field(default_factory=lambda: {500: 1.0})
+    route_latency: Dict[str, LatencyModel] = field(default_factory=dict)
+    route_error_rate: Dict[str, float] = field(default_factory=dict)
+    seed: Optional[int] = None
+
+    def __post_init__(self) -> None:
+        rates = [self.error_rate, *self.route_error_rate.values()]
+        if any(not 0.0 <= rate <= 1.0 for rate in rates):
+            raise ValueError("Error rates must be between 0 and 1")
+        if any(not weight >= 0 for weight in self.error_statuses.values()):
+            raise ValueError("Error status weights must be non-negative")
+        if not sum(self.error_statuses.values()) > 0:
+            raise ValueError("Error statuses need at least one positive weight")
+
+    def latency_for(self, route: str) -> LatencyModel:
+        return self.route_latency.get(route, self.latency)
+
+    def error_rate_for(self, route: str) -> float:
+        return self.route_error_rate.get(route, self.error_rate)
+
+    def pick_error_status(self, rng: random.Random) -> int:
+        statuses = list(self.error_statuses)
+        return rng.choices(statuses, weights=[self.error_statuses[s] for s in statuses])[0]
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "FaultProfile":
+        """Build from the JSON accepted by POST /__stub/config"""
+        return cls(
+            latency=LatencyModel.parse(data.get("latency", "fixed:0")),
+            error_rate=float(data.get("error_rate", 0.0)),
+            error_statuses={int(k): float(v) for k, v in data.get("error_statuses", {"500": 1}).items()},
+            route_latency={k: LatencyModel.parse(v) for k, v in data.get("route_latency", {}).items()},
+            route_error_rate={k: float(v) for k, v in data.get("route_error_rate", {}).items()},
+            seed=data.get("seed")
+        )
+
+
+def make_token(email: str, ttl_seconds: int = TOKEN_TTL_SECONDS) -> str:
+    """Unsigned JWT with sub/exp claims, so expiry-aware clients can decode it"""
+    def encode(part: Dict[str, Any]) -> str:
+        return base64.urlsafe_b64encode(json.dumps(part).encode()).decode().rstrip("=")
+
+    claims = {"sub": email, "exp": int(time.time()) + ttl_seconds, "jti": uuid.uuid4().hex}
+    return f"{encode({'alg': 'none', 'typ': 'JWT'})}.{encode(claims)}.stub"
+
+
+class StubState:
+    """In-memory WeSign data shared by all request threads"""
+
+    def __init__(self, users: Optional[Dict[str, str]] = None):
+        self.lock = threading.Lock()
+        self.users = dict(users or DEFAULT_USERS)
+        self.sessions: Dict[str, str] = {}
+        self.refresh_tokens: Dict[str, str] = {}
+        self.collections: Dict[str, Dict[str, Dict[str, Any]]] = {
+            "documentCollections": {},
+            "templates": {},
+            "contacts": {}
+        }
+        self.stats: Dict[str, Any] = {"requests": 0, "injected_errors": 0, "injected_delay_ms": 0.0, "routes": {}}
+
+    def login(self, email: str, password: str) -> Optional[Dict[str, str]]:
+        with self.lock:
+            if not email or self.users.get(email) != password:
+                return None
+            return self._issue(email)
+
+    def refresh(self, refresh_token: str) -> Optional[Dict[str, str]]:
+        with self.lock:
+            email = self.refresh_tokens.pop(refresh_token, None)
+            return self._issue(email) if email else None
+
+    def _issue(self, email: str) -> Dict[str, str]:
+        token = make_token(email)
+        refresh_token = uuid.uuid4().hex
+        self.sessions[token] = email
+        self.refresh_tokens[refresh_token] = email
+        return {"token": token, "refreshToken": refresh_token, "authToken": token, "userId": email}
+
+    def user_for(self, token: Optional[str]) -> Optional[str]:
+        with self.lock:
+            return self.sessions.get(token or "")
+
+    def logout(self, token: str) -> None:
+        with self.lock:
+            self.sessions.pop(token, None)
+
+    def create(self, kind: str, owner: str, data: Dict[str, Any]) -> Dict[str, Any]:
+        item = {
+            **data,
+            "id": str(uuid.uuid4()),
+            "owner": owner,
+            "creationTime": datetime.now().isoformat()
+        }
+        if kind == "documentCollections":
+            item.setdefault("name", item.get("filename", "document.pdf"))
+            item.setdefault("status", "Pending")
+        with self.lock:
+            self.collections[kind][item["id"]] = item
+        return item
+
+    def list(self, kind: str, owner: str, offset: int, limit: int, search: str = "") -> Tuple[List[Dict[str, Any]], int]:
+        with self.lock:
+            items = [item for item in self.collections[kind].values() if item["owner"] == owner]
+        if search:
+            items = [item for item in items if search.lower() in json.dumps(item).lower()]
+        return items[offset:offset + limit], len(items)
+
+    def get(self, kind: str, owner: str, item_id: str) -> Optional[Dict[str, Any]]:
+        with self.lock:
+            item = self.collections[kind].get(item_id)
+        return item if item and item["owner"] == owner else None
+
+    def update(self, kind: str, owner: str, item_id: str, data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        with self.lock:
+            item = self.collections[kind].get(item_id)
+            if not item or item["owner"] != owner:
+                return None
+            item.update({k: v for k, v in data.items() if k not in ("id", "owner")})
+            return dict(item)
+
+    def delete(self, kind: str, owner: str, item_id: str) -> bool:
+        with self.lock:
+            item = self.collections[kind].get(item_id)
+            if not item or item["owner"] != owner:
+                return False
+            del self.collections[kind][item_id]
+            return True
+
+    def record(self, route: str, status: int, delay_ms: float, injected: bool) -> None:
+        with self.lock:
+            self.stats["requests"] += 1
+            self.stats["injected_delay_ms"] += delay_ms
+            if injected:
+                self.stats["injected_errors"] += 1
+            entry = self.stats["routes"].setdefault(route, {"count": 0, "errors": 0, "delay_ms": 0.0})
+            entry["count"] += 1
+            entry["delay_ms"] += delay_ms
+            if status >= 400:
+                entry["errors"] += 1
+
+
+# Resource path segment -> state collection
+RESOURCES = {
+    "documentcollections": "documentCollections",
+    "documents": "documentCollections",
+    "files": "documentCollections",
+    "templates": "templates",
+    "contacts": "contacts"
+}
+
+
+def normalize_path(path: str) -> str:
+    """Strip the client-specific API prefix and trailing slash"""
+    for prefix in API_PREFIXES:
+        if path.lower().startswith(prefix + "/"):
+            path = path[len(prefix):]
+            break
+    return path.rstrip("/") or "/"
+
+
+def bad_request(detail: str) -> Tuple[int, Dict[str, Any]]:
+    return 400, {"title": "Bad request", "detail": detail, "status": 400}
+
+
+def route_key(method: str, path: str) -> str:
+    """Route template used for stats and per-route faults ("GET /documents/{id}")"""
+    parts = path.strip("/").split("/")
+    templated = [parts[0]] + ["{id}" if re.fullmatch(r"[0-9a-fA-F-]{6,}|\d+", p) else p for p in parts[1:]]
+    return f"{method} /{'/'.join(p for p in templated if p)}"
+
+
+class StubRequestHandler(BaseHTTPRequestHandler):
+    """Routes one request against the server's StubState and FaultProfile"""
+
+    server: "StubHTTPServer"
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format: str, *args: Any) -> None:
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+    def do_GET(self) -> None:
+        self._handle("GET")
+
+    def do_POST(self) -> None:
+        self._handle("POST")
+
+    def do_PUT(self) -> None:
+        self._handle("PUT")
+
+    def do_DELETE(self) -> None:
+        self._handle("DELETE")
+
+    def _read_body(self) -> Any:
+        """Parsed JSON body, {"size": n} for other uploads, or None when unreadable"""
+        try:
+            length = int(self.headers.get("Content-Length") or 0)
+        except ValueError:
+            # The body cannot be skipped reliably, so the connection cannot be reused
+            self.close_connection = True
+            return None
+        raw = self.rfile.read(length) if length > 0 else b""
+        if "json" in (self.headers.get("Content-Type") or "") and raw:
+            try:
+                return json.loads(raw)
+            except ValueError:
+                return None
+        # Multipart/binary uploads: only the size matters to the stand-in
+        return {"size": len(raw)} if raw else {}
+
+    def _send(self, status: int, payload: Any = None) -> None:
+        body = json.dumps(payload).encode() if payload is not None else b""
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if body:
+            self.wfile.write(body)
+
+    def _handle(self, method: str) -> None:
+        parsed = urlparse(self.path)
+        path = normalize_path(parsed.path)
+        query = {k: v[0] for k, v in parse_qs(parsed.query).items()}
+        body = self._read_body() if method in ("POST", "PUT") else {}
+
+        if path.startswith("/__stub/"):
+            status, payload = self.server.admin(method, path, body)
+            self._send(status, payload)
+            return
+
+        route = route_key(method, path)
+        profile = self.server.faults
+        delay_ms, inject = 0.0, False
+        try:
+            with self.server.rng_lock:
+                delay_ms = profile.latency_for(route).sample(self.server.rng)
+                inject = self.server.rng.random() < profile.error_rate_for(route)
+                error_status = profile.pick_error_status(self.server.rng) if inject else None
+
+            if delay_ms:
+                time.sleep(delay_ms / 1000)
+
+            if inject:
+                status, payload = error_status, {"title": "Injected error", "status": error_status}
+            else:
+                status, payload = self.server.dispatch(method, path, query, body, self.headers.get("Authorization"))
+        except Exception as e:
+            status, payload = 500, {"title": "Stub server error", "detail": str(e)}
+
+        self.server.state.record(route, status, delay_ms, inject)
+        self._send(status, payload)
+
+
+class StubHTTPServer(ThreadingHTTPServer):
+    """ThreadingHTTPServer carrying the stand-in's state and routing"""
+
+    daemon_threads = True
+
+    def __init__(self, address: Tuple[str, int], state: StubState, faults: FaultProfile, verbose: bool = False):
+        super().__init__(address, StubRequestHandler)
+        self.state = state
+        self.verbose = verbose
+        self.rng_lock = threading.Lock()
+        self.configure(faults)
+
+    def configure(self, faults: FaultProfile) -> None:
+        """Swap the fault profile (also reachable via POST /__stub/config)"""
+        with self.rng_lock:
+            self.faults = faults
+            self.rng = random.Random(faults.seed)
+
+    def admin(self, method: str, path: str, body: Any) -> Tuple[int, Any]:
+        if path == "/__stub/stats":
+            with self.state.lock:
+                return 200, json.loads(json.dumps(self.state.stats))
+        if path == "/__stub/config" and method == "POST":
+            if not isinstance(body, dict):
+                return bad_request("Fault profile must be a JSON object")
+            try:
+                faults = FaultProfile.from_dict(body)
+            except (ValueError, TypeError, AttributeError, IndexError) as e:
+                return bad_request(f"Invalid fault profile: {e}")
+            self.configure(faults)
+            return 200, {"configured": True}
+        if path == "/__stub/reset" and method == "POST":
+            users = self.state.users
+            self.state = StubState(users)
+            return 200, {"reset": True}
+        return 404, {"title": "Unknown admin endpoint"}
+
+    def dispatch(self, method: str, path: str, query: Dict[str, str], body: Any, authorization: Optional[str]) -> Tuple[int, Any]:
+        state = self.state
+        parts = path.strip("/").split("/")
+        head = parts[0].lower()
+
+        if path == "/health" or path == "/status":
+            return 200, {"status": "Healthy", "time": datetime.now().isoformat()}
+
+        # Malformed input is the client's fault (400), not a stand-in error (500)
+        if method in ("POST", "PUT") and not isinstance(body, dict):
+            return bad_request("Request body must be a JSON object")
+
+        if method == "POST" and path.lower() in ("/users/login", "/auth/login", "/login"):
+            email, password = body.get("email", ""), body.get("password", "")
+            if not isinstance(email, str) or not isinstance(password, str):
+                return bad_request("email and password must be strings")
+            tokens = state.login(email, password)
+            if tokens is None:
+                return 401, {"title": "Invalid email or password", "status": 401}
+            return 200, tokens
+
+        if method == "POST" and path.lower() == "/users/refresh":
+            refresh_token = body.get("refreshToken", "")
+            if not isinstance(refresh_token, str):
+                return bad_request("refreshToken must be a string")
+            tokens = state.refresh(refresh_token)
+            return (200, tokens) if tokens else (401, {"title": "Invalid refresh token", "status": 401})
+
+        token = (authorization or "").replace("Bearer ", "", 1).strip()
+        user = state.user_for(token)
+        if user is None:
+            return 401, {"title": "Unauthorized", "status": 401}
+
+        if path.lower() in ("/users/logout",):
+            state.logout(token)
+            return 200, {"loggedOut": True}
+        if path.lower() in ("/users", "/users/profile", "/user"):
+            return 200, {"email": user, "name": user.split("@")[0], "userType": "Company"}
+        if path.lower() == "/users/groups":
+            return 200, {"groups": [{"id": "1", "name": "Default"}]}
+
+        kind = RESOURCES.get(head)
+        if kind is None:
+            if head == "upload":
+                kind, parts = "documentCollections", ["documents", "upload"]
+            else:
+                return 404, {"title": f"No stand-in for {method} {path}", "status": 404}
+
+        rest = parts[1:]
+        # Upload aliases: POST /documents/upload, /files/upload, /upload
+        if method == "POST" and rest == ["upload"]:
+            rest = []
+        # Download alias: GET /files/download/{id}
+        if rest[:1] == ["download"]:
+            rest = rest[1:]
+
+        if not rest:
+            if method == "GET":
+                try:
+                    offset = int(query.get("offset", 0))
+                    limit = int(query.get("limit", 20))
+                except ValueError:
+                    return bad_request("offset and limit must be integers")
+                if offset < 0 or limit < 0:
+                    return bad_request("offset and limit must not be negative")
+                items, total = state.list(kind, user, offset, limit, query.get("search", query.get("key", "")))
+                return 200, {kind: items, "total": total, "offset": offset, "limit": limit}
+            if method == "POST":
+                return 201, state.create(kind, user, body)
+            return 405, {"title": "Method not allowed", "status": 405}
+
+        item_id, action = rest[0], (rest[1].lower() if len(rest) > 1 else None)
+
+        if action == "sign" and method == "POST" and kind == "documentCollections":
+            signed = state.update(kind, user, item_id, {
+                "status": "Signed",
+                "signedAt": datetime.now().isoformat(),
+                "signature": body.get("signature")
+            })
+            return (200, signed) if signed else (404, {"title": "Document not found", "status": 404})
+
+        if action == "metadata" and method == "GET":
+            item = state.get(kind, user, item_id)
+            return (200, {"id": item_id, "size": item.get("size", 0)}) if item else (404, {"title": "Not found", "status": 404})
+
+        if action is not None:
+            return 404, {"title": f"No stand-in for {method} {path}", "status": 404}
+
+        if method == "GET":
+            item = state.get(kind, user, item_id)
+            return (200, item) if item else (404, {"title": "Not found", "status": 404})
+        if method == "PUT":
+            item = state.update(kind, user, item_id, body)
+            return (200, item) if item else (404, {"title": "Not found", "status": 404})
+        if method == "DELETE":
+            return (200, {"deleted": item_id}) if state.delete(kind, user, item_id) else (404, {"title": "Not found", "status": 404})
+        return 405, {"title": "Method not allowed", "status": 405}
+
+
+class WeSignStubServer:
+    """
+    Start/stop wrapper running the stand-in on a background thread
+
+    Port 0 picks a free port; `url` is the server root (Postman baseUrl) and
+    `api_url` the /userapi/ui/v3 base used by k6 and the UI clients.
+    """
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        faults: Optional[FaultProfile] = None,
+        users: Optional[Dict[str, str]] = None,
+        verbose: bool = False
+    ):
+        self.host = host
+        self.port = port
+        self.faults = faults or FaultProfile()
+        self.users = users
+        self.verbose = verbose
+        self._server: Optional[StubHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        return f"http://{self.host}:{self.port}"
+
+    @property
+    def api_url(self) -> str:
+        return f"{self.url}/userapi/ui/v3"
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        return self._server.state.stats if self._server else {}
+
+    def configure(self, faults: FaultProfile) -> None:
+        """Change latency/error injection while running"""
+        self.faults = faults
+        if self._server:
+            self._server.configure(faults)
+
+    def start(self) -> "WeSignStubServer":
+        self._server = StubHTTPServer((self.host, self.port), StubState(self.users), self.faults, self.verbose)
+        self.port = self._server.server_address[1]
+        self._thread = threading.Thread(target=self._server.serve_forever, name="wesign-stub", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def __enter__(self) -> "WeSignStubServer":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+
+def start_for_config(config: Any, faults: Optional[FaultProfile] = None) -> WeSignStubServer:
+    """Start a stand-in that accepts the company/basic users of an EnvironmentConfig"""
+    users = dict(DEFAULT_USERS)
+    for user in (config.company_user, config.basic_user):
+        users[user.email] = user.password
+    return WeSignStubServer(faults=faults, users=users).start()
+
+
+def parse_route_option(value: str) -> Tuple[str, str]:
+    """'POST /users/login=normal:200:50' -> ('POST /users/login', 'normal:200:50')"""
+    route, _, setting = value.rpartition("=")
+    return route.strip(), setting.strip()
+
+
+def main() -> None:
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Local WeSign API stand-in server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8089)
+    parser.add_argument("--latency", default="fixed:0",
+                        help="delay distribution: fixed:MS, uniform:MIN:MAX, normal:MEAN:SD, lognormal:MEAN:SD, exponential:MEAN")
+    parser.add_argument("--route-latency", action="append", default=[],
+                        help="per-route delay, e.g. 'POST /users/login=normal:200:50' (repeatable)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="fraction of requests answered with an injected error")
+    parser.add_argument("--route-error-rate", action="append", default=[],
+                        help="per-route error rate, e.g. 'POST /documents/upload=0.1' (repeatable)")
+    parser.add_argument("--error-status", default="500",
+                        help="injected status codes with optional weights, e.g. '500:3,503:1'")
+    parser.add_argument("--user", action="append", default=[], help="extra login 'email:password' (repeatable)")
+    parser.add_argument("--seed", type=int, help="random seed for reproducible latency/error sequences")
+    parser.add_argument("--verbose", "-v", action="store_true", help="log every request")
+    args = parser.parse_args()
+
+    try:
+        statuses: Dict[int, float] = {}
+        for item in args.error_status.split(","):
+            status, _, weight = item.partition(":")
+            statuses[int(status)] = float(weight or 1)
+
+        faults = FaultProfile(
+            latency=LatencyModel.parse(args.latency),
+            error_rate=args.error_rate,
+            error_statuses=statuses,
+            route_latency={route: LatencyModel.parse(spec) for route, spec in map(parse_route_option, args.route_latency)},
+            route_error_rate={route: float(rate) for route, rate in map(parse_route_option, args.route_error_rate)},
+            seed=args.seed
+        )
+    except ValueError as e:
+        parser.error(str(e))
+    users = dict(DEFAULT_USERS)
+    users.update(dict(user.split(":", 1) for user in args.user))
+
+    server = WeSignStubServer(args.host, args.port, faults, users, args.verbose).start()
+    print(f"WeSign stand-in listening on {server.url} (API base {server.api_url})")
+    print(f"Latency: {args.latency}, error rate: {args.error_rate}; stats at {server.url}/__stub/stats")
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -29,6 +29,7 @@ import os
 foundation_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'foundation')
 sys.path.append(foundation_path)
 
+from utils.table_snapshot import count_first_match
 from authentication import WeSignTestFoundation
 from navigation import WeSignNavigationUtils
 from data_management import WeSignTestDataManager
@@ -579,12 +580,8 @@ class TestSearchFiltering:
                 '[data-item-id]'
             ]
 
-            for selector in item_selectors:
-                items = await page.query_selector_all(selector)
-                if items:
-                    return len(items)
-
-            return 0
+            # One evaluate instead of an element handle per item
+            return await count_first_match(page, item_selectors)
 
         except Exception:
             return 0
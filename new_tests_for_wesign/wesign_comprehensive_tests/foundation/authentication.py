@@ -25,6 +25,9 @@ from typing import Optional, Dict, Any
 from playwright.async_api import Page, Browser, BrowserContext
 import logging
 
+from config.environment import LoginCredentials
+from utils.auth_state import get_active_auth_cache
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -74,6 +77,10 @@ class WeSignTestFoundation:
         try:
             logger.info("🔐 Starting WeSign authentication...")
 
+            # Reuse the worker's cached session for this account when available
+            if await self._restore_cached_session(page):
+                return True
+
             # Step 1: Navigate to login page
             logger.info(f"   → Navigating to login: {self.login_url}")
             await page.goto(self.login_url)
@@ -130,6 +137,30 @@ class WeSignTestFoundation:
             self.is_authenticated = False
             return False
 
+    async def _restore_cached_session(self, page: Page) -> bool:
+        """Restore a cached storage state instead of driving the login form."""
+        cache = get_active_auth_cache()
+        if cache is None:
+            return False
+
+        try:
+            cache.register_user("foundation_user", LoginCredentials(**self.credentials))
+            if not await cache.restore(page, "foundation_user"):
+                return False
+        except Exception as e:
+            logger.warning(f"   ⚠️  Cached session unavailable, using login form: {str(e)}")
+            return False
+
+        logger.info(f"   ✅ Restored cached session! Dashboard URL: {page.url}")
+        self.is_authenticated = True
+        self.authentication_timestamp = time.time()
+        self.session_data = {
+            "login_time": self.authentication_timestamp,
+            "dashboard_url": page.url,
+            "user_email": self.credentials["email"]
+        }
+        return True
+
     async def verify_authentication_state(self, page: Page) -> bool:
         """
         Verify that the user is still authenticated.
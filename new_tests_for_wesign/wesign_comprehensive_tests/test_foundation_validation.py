@@ -15,7 +15,7 @@ import pytest
 import asyncio
 import tempfile
 import os
-from playwright.async_api import async_playwright
+from utils.browser_pool import pooled_playwright
 
 # Import foundation components
 from foundation import WeSignTestFoundation, WeSignNavigationUtils, WeSignTestDataManager
@@ -129,7 +129,7 @@ class TestFoundationValidation:
     @pytest.mark.asyncio
     async def test_browser_compatibility(self):
         """Test basic browser compatibility with foundation utilities."""
-        async with async_playwright() as p:
+        async with pooled_playwright() as p:
             browser = await p.chromium.launch(headless=True)
             page = await browser.new_page()
 
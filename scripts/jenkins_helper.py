@@ -12,22 +12,30 @@ Platform: Windows-compatible (py command ready)
 """
 
 import argparse
+import asyncio
 import base64
+import codecs
+import functools
+import hashlib
 import json
 import logging
 import os
 import re
 import sys
+import threading
 import time
 import urllib.parse
+from collections import Counter, deque
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, asdict
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Any, Union
+from typing import Callable, Dict, List, Optional, Sequence, Tuple, Any, Union
 import zipfile
 
 try:
     import requests
+    from requests.adapters import HTTPAdapter
     from requests.auth import HTTPBasicAuth
 except ImportError:
     print("ERROR: requests library not installed. Run: pip install requests")
@@ -60,6 +68,7 @@ class BuildInfo:
     cause: Optional[str] = None
     commit_hash: Optional[str] = None
     branch: Optional[str] = None
+    estimated_duration_ms: Optional[int] = None  # Jenkins' estimate from recent builds (None if unknown)
 
 
 @dataclass
@@ -71,6 +80,7 @@ class ArtifactInfo:
     size_bytes: int
     build_number: int
     download_url: str
+    fingerprint: Optional[str] = None  # MD5 recorded by Jenkins when the artifact was fingerprinted
 
 
 @dataclass
@@ -95,16 +105,328 @@ class ConsoleLogAnalysis:
     performance_metrics: Dict[str, Any]
 
 
+def _scoped_flags(pattern: str) -> str:
+    """Turn a leading global flag group ('(?i)...') into a scoped one so patterns can be combined."""
+    match = re.match(r'\(\?([aiLmsux]+)\)', pattern)
+    if match:
+        return f"(?{match.group(1)}:{pattern[match.end():]})"
+    return f"(?:{pattern})"
+
+
+class ConsoleLogScanner:
+    """
+    Single-pass console log classifier.
+
+    A keyword prefilter (every error/warning keyword and the literal prefix of
+    every duration/performance pattern, as one case-sensitive alternation over
+    the lower-cased text) is searched over the whole text, so lines without a
+    keyword are never visited from Python. Only lines with a hit are classified
+    against the precompiled patterns; the result is the same
+    ConsoleLogAnalysis as matching each pattern on each line.
+    """
+
+    ERROR_PATTERNS = [
+        r'(?i)\berror\b',
+        r'(?i)\bfailed\b',
+        r'(?i)\bexception\b',
+        r'(?i)\bfatal\b',
+        r'\[ERROR\]',
+        r'ERROR:',
+        r'✗',
+        r'FAIL:'
+    ]
+
+    WARNING_PATTERNS = [
+        r'(?i)\bwarning\b',
+        r'(?i)\bwarn\b',
+        r'\[WARN\]',
+        r'WARNING:',
+        r'⚠',
+        r'UNSTABLE'
+    ]
+
+    # Duration extraction patterns
+    DURATION_PATTERNS = {
+        'total_build': r'Finished: \w+ in ([0-9.]+) (sec|min|hr)',
+        'test_execution': r'Tests run: \d+.*Time elapsed: ([0-9.]+) sec',
+        'compilation': r'Compilation time: ([0-9.]+) seconds?',
+        'docker_build': r'Successfully built.*in ([0-9.]+)s'
+    }
+
+    # Performance metrics patterns
+    PERFORMANCE_PATTERNS = {
+        'memory_usage': r'Memory usage: ([0-9.]+)MB',
+        'cpu_usage': r'CPU usage: ([0-9.]+)%',
+        'test_count': r'Tests run: (\d+)',
+        'passed_tests': r'Tests run: \d+.*Failures: (\d+).*Errors: (\d+)'
+    }
+
+    # Literal text each duration/performance pattern starts with
+    METRIC_KEYWORDS = ['Finished: ', 'Tests run: ', 'Compilation time: ', 'Successfully built',
+                       'Memory usage: ', 'CPU usage: ']
+
+    # Lower-case keywords every matching line contains (after str.lower())
+    PREFILTER_KEYWORDS = ['error', 'fail', 'exception', 'fatal', 'warn', 'unstable', '✗', '⚠'] + \
+        [keyword.lower() for keyword in METRIC_KEYWORDS]
+
+    # (?i) also matches these against 'i'/'s', but str.lower() leaves them alone
+    CASEFOLD_ODDITIES = ('ı', 'ſ')
+
+    # Common timestamp patterns in Jenkins logs (first match wins)
+    TIMESTAMP_PATTERNS = [
+        re.compile(r'(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2})'),
+        re.compile(r'(\d{2}:\d{2}:\d{2})'),
+        re.compile(r'\[(\d{2}:\d{2}:\d{2})\]')
+    ]
+
+    ERROR = re.compile('|'.join(_scoped_flags(pattern) for pattern in ERROR_PATTERNS))
+    WARNING = re.compile('|'.join(_scoped_flags(pattern) for pattern in WARNING_PATTERNS))
+    PREFILTER = re.compile('|'.join(re.escape(keyword) for keyword in PREFILTER_KEYWORDS))
+    TRIGGER = re.compile('|'.join([_scoped_flags(pattern) for pattern in ERROR_PATTERNS + WARNING_PATTERNS] +
+                                  [re.escape(keyword) for keyword in METRIC_KEYWORDS]))
+    METRICS = [(name, re.compile(pattern)) for name, pattern in {**DURATION_PATTERNS, **PERFORMANCE_PATTERNS}.items()]
+
+    MAX_KEY_EVENTS = 50  # Keep the last 50 events to avoid memory issues
+    MAX_MESSAGE_LENGTH = 200
+
+    def __init__(self):
+        self.total_lines = 1  # A log of n newlines has n + 1 lines, as str.split('\n') counts them
+        self.error_count = 0
+        self.warning_count = 0
+        self.duration_analysis: Dict[str, Any] = {}
+        self.key_events: deque = deque(maxlen=self.MAX_KEY_EVENTS)
+        self._partial_line = ''
+
+    @staticmethod
+    def extract_timestamp(line: str) -> Optional[str]:
+        """Extract timestamp from log line if present."""
+        for pattern in ConsoleLogScanner.TIMESTAMP_PATTERNS:
+            match = pattern.search(line)
+            if match:
+                return match.group(1)
+        return None
+
+    def _event(self, event_type: str, line: str, line_number: int) -> None:
+        self.key_events.append({
+            'line_number': line_number,
+            'type': event_type,
+            'message': line.strip()[:self.MAX_MESSAGE_LENGTH],  # Truncate long messages
+            'timestamp': self.extract_timestamp(line)
+        })
+
+    def _classify(self, line: str, line_number: int) -> None:
+        """Count and record one line that contains a trigger keyword."""
+        if self.ERROR.search(line):
+            self.error_count += 1
+            self._event('error', line, line_number)
+        if self.WARNING.search(line):
+            self.warning_count += 1
+            self._event('warning', line, line_number)
+
+        for name, pattern in self.METRICS:
+            match = pattern.search(line)
+            if match:
+                if name == 'passed_tests':
+                    self.duration_analysis[name] = {'failures': int(match.group(1)), 'errors': int(match.group(2))}
+                else:
+                    self.duration_analysis[name] = float(match.group(1))
+
+    def scan(self, text: str) -> None:
+        """Scan a complete log (or a block of whole lines following what was already scanned)."""
+        first_line = self.total_lines
+
+        # Literal search over the lower-cased text is ~10x faster than the case-insensitive
+        # patterns; positions carry over unless lowering changed the length
+        lowered = text.lower()
+        if len(lowered) == len(text) and not any(char in lowered for char in self.CASEFOLD_ODDITIES):
+            search = functools.partial(self.PREFILTER.search, lowered)
+        else:
+            search = functools.partial(self.TRIGGER.search, text)
+        counted_to = 0
+        newlines = 0
+        position = 0
+
+        while True:
+            match = search(position)
+            if match is None:
+                break
+            line_start = text.rfind('\n', 0, match.start()) + 1
+            line_end = text.find('\n', match.end())
+            if line_end == -1:
+                line_end = len(text)
+
+            newlines += text.count('\n', counted_to, line_start)
+            counted_to = line_start
+            self._classify(text[line_start:line_end], first_line + newlines)
+            position = line_end + 1
+
+        self.total_lines += text.count('\n')
+
+    def feed(self, chunk: str) -> None:
+        """
+        Scan the next piece of a log read incrementally.
+
+        Whole lines are scanned as they arrive; the trailing partial line is held
+        back until its newline (or finish()), so memory stays at one chunk plus
+        one line however long the log is.
+        """
+        if not chunk:
+            return
+        text = self._partial_line + chunk if self._partial_line else chunk
+        cut = text.rfind('\n') + 1
+        if cut:
+            self.scan(text[:cut])
+            self._partial_line = text[cut:]
+        else:
+            self._partial_line = text
+
+    def finish(self) -> None:
+        """Scan the final line of a fed log (one without a trailing newline)."""
+        if self._partial_line:
+            self.scan(self._partial_line)
+            self._partial_line = ''
+
+    def analysis(self) -> ConsoleLogAnalysis:
+        """Analysis of everything scanned so far (a fed line still in progress is classified once complete)."""
+        total_lines = self.total_lines
+        performance_metrics = {
+            'error_rate': (self.error_count / total_lines * 100) if total_lines > 0 else 0,
+            'warning_rate': (self.warning_count / total_lines * 100) if total_lines > 0 else 0,
+            'log_density': total_lines,
+            'has_performance_data': bool(self.duration_analysis)
+        }
+
+        return ConsoleLogAnalysis(
+            total_lines=total_lines,
+            error_count=self.error_count,
+            warning_count=self.warning_count,
+            duration_analysis=dict(self.duration_analysis),
+            key_events=list(self.key_events),
+            performance_metrics=performance_metrics
+        )
+
+
 class JenkinsAPIError(Exception):
     """Custom exception for Jenkins API related errors."""
     pass
 
 
+class BuildCache:
+    """
+    API data of finished builds, by job and build number.
+
+    A finished build never changes, so once fetched it is served from memory
+    and, with a cache directory, from one JSON file per job on later runs.
+    Entries remember whether they hold the report tree (artifacts, test
+    counts) or only the build summary.
+    """
+
+    MAX_BUILDS_PER_JOB = 1000
+
+    def __init__(self, cache_dir: Optional[Path] = None, jenkins_url: str = ''):
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self.jenkins_url = jenkins_url
+        self._jobs: Dict[str, Dict[int, Dict[str, Any]]] = {}
+        self.stats = {'hits': 0, 'misses': 0, 'stored': 0}
+
+    @staticmethod
+    def is_finished(data: Dict[str, Any]) -> bool:
+        return not data.get('building') and data.get('result') is not None
+
+    def _path(self, job_name: str) -> Path:
+        return self.cache_dir / f"{urllib.parse.quote(job_name, safe='')}.json"
+
+    def _builds(self, job_name: str) -> Dict[int, Dict[str, Any]]:
+        builds = self._jobs.get(job_name)
+        if builds is None:
+            builds = {}
+            if self.cache_dir:
+                try:
+                    stored = json.loads(self._path(job_name).read_text(encoding='utf-8'))
+                except (OSError, ValueError):
+                    stored = {}
+                if stored.get('jenkins_url') == self.jenkins_url:
+                    builds = {int(number): entry for number, entry in stored.get('builds', {}).items()}
+            self._jobs[job_name] = builds
+        return builds
+
+    def has_job(self, job_name: str) -> bool:
+        return bool(self._builds(job_name))
+
+    def get(self, job_name: str, build_number: Union[int, str], detailed: bool = False) -> Optional[Dict[str, Any]]:
+        """Cached data of a finished build (None for aliases like lastBuild, or if not cached)."""
+        entry = None
+        if str(build_number).isdigit():
+            entry = self._builds(job_name).get(int(build_number))
+        if entry and (entry['detailed'] or not detailed):
+            self.stats['hits'] += 1
+            return entry['data']
+        self.stats['misses'] += 1
+        return None
+
+    def put(self, job_name: str, data: Dict[str, Any], detailed: bool = False) -> bool:
+        """Cache a build if it has finished; returns whether the cache changed."""
+        if not self.is_finished(data) or 'number' not in data:
+            return False
+        builds = self._builds(job_name)
+        current = builds.get(data['number'])
+        if current and current['detailed'] and not detailed:
+            return False
+        builds[data['number']] = {'detailed': detailed, 'data': data}
+        for number in sorted(builds)[:-self.MAX_BUILDS_PER_JOB]:
+            del builds[number]
+        self.stats['stored'] += 1
+        return True
+
+    def save(self, job_name: str) -> None:
+        """Write a job's cached builds to the cache directory (atomically)."""
+        if not self.cache_dir:
+            return
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            path = self._path(job_name)
+            tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+            tmp_path.write_text(json.dumps({'jenkins_url': self.jenkins_url,
+                                            'builds': self._builds(job_name)}), encoding='utf-8')
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"Failed to write build cache for {job_name}: {str(e)}")
+
+
 class JenkinsClient:
     """Jenkins API client with comprehensive functionality."""
 
-    def __init__(self, base_url: str, username: str, api_token: str, verify_ssl: bool = True):
-        """Initialize Jenkins client."""
+    # Fields requested with ?tree= (everything BuildInfo, reports and downloads read)
+    BUILD_FIELDS = 'number,url,building,result,timestamp,duration,estimatedDuration,displayName,description,builtOn'
+    ACTION_FIELDS = 'causes[shortDescription],lastBuiltRevision[SHA1],remoteUrls,branch[name]'
+    BUILD_TREE = f"{BUILD_FIELDS},actions[{ACTION_FIELDS}]"
+    REPORT_TREE = (f"{BUILD_FIELDS},actions[{ACTION_FIELDS},urlName,failCount,skipCount,totalCount],"
+                   "artifacts[displayPath,fileName,relativePath,size],fingerprint[fileName,hash]")
+    TEST_REPORT_TREE = 'totalCount,failCount,passCount,skipCount,duration'
+
+    # Jenkins' builds property stops at 100 entries; allBuilds{M,N} reaches further back
+    BUILDS_PROPERTY_LIMIT = 100
+
+    # Build status polling (seconds)
+    POLL_MIN_INTERVAL = 2.0
+    POLL_MAX_INTERVAL = 60.0
+    POLL_FRACTION = 0.25
+    POLL_BACKOFF = 1.5
+    QUEUE_POLL_MIN_INTERVAL = 1.0
+    QUEUE_POLL_MAX_INTERVAL = 15.0
+
+    CONSOLE_CHUNK_SIZE = 256 * 1024
+    CONSOLE_MAX_FAILURES = 5  # Consecutive connection errors / 5xx before giving up on a log stream
+
+    # Artifact downloads
+    DOWNLOAD_WORKERS = 8
+    DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+    DOWNLOAD_ATTEMPTS = 3
+    DOWNLOAD_MANIFEST = '.jenkins-downloads.json'
+
+    def __init__(self, base_url: str, username: str, api_token: str, verify_ssl: bool = True,
+                 cache_dir: Optional[Path] = None):
+        """Initialize Jenkins client (cache_dir keeps finished builds across runs)."""
         self.base_url = base_url.rstrip('/')
         self.username = username
         self.api_token = api_token
@@ -119,6 +441,17 @@ class JenkinsClient:
             'Accept': 'application/json'
         })
 
+        # One connection per download worker, reused across requests
+        self._mount_pool(self.DOWNLOAD_WORKERS)
+
+        self.download_stats = {'downloaded': 0, 'resumed': 0, 'skipped': 0, 'failed': 0, 'bytes': 0, 'seconds': 0.0}
+        self._stats_lock = threading.Lock()
+
+        # Finished builds, and validators of the last response per URL for conditional requests
+        self.build_cache = BuildCache(cache_dir, self.base_url)
+        self._validated: Dict[str, Tuple[Dict[str, str], Any]] = {}
+        self.api_stats = {'requests': 0, 'not_modified': 0}
+
         # Validate connection
         self._validate_connection()
 
@@ -150,65 +483,106 @@ class JenkinsClient:
         except requests.exceptions.RequestException as e:
             raise JenkinsAPIError(f"Failed to get job info: {str(e)}")
 
+    def _get_json(self, url: str, params: Optional[Dict[str, str]] = None, timeout: int = 30) -> Any:
+        """
+        GET a JSON API URL, conditionally if an earlier response carried validators.
+
+        A 304 returns the earlier body; Jenkins versions or proxies that send
+        no ETag/Last-Modified simply get a full response every time.
+        """
+        key = self._url_key(url, params)
+        validators, cached = self._validated.get(key, ({}, None))
+        response = self.session.get(url, params=params, headers=validators, timeout=timeout)
+        self.api_stats['requests'] += 1
+        if response.status_code == 304 and validators:
+            self.api_stats['not_modified'] += 1
+            return cached
+
+        response.raise_for_status()
+        data = response.json()
+        validators = {}
+        if response.headers.get('ETag'):
+            validators['If-None-Match'] = response.headers['ETag']
+        if response.headers.get('Last-Modified'):
+            validators['If-Modified-Since'] = response.headers['Last-Modified']
+        if validators:
+            self._validated[key] = (validators, data)
+        else:
+            self._validated.pop(key, None)
+        return data
+
+    @staticmethod
+    def _url_key(url: str, params: Optional[Dict[str, str]]) -> str:
+        return f"{url}?{urllib.parse.urlencode(sorted((params or {}).items()))}"
+
+    def _get_build_data(self, job_name: str, build_number: Union[int, str], detailed: bool = False) -> Dict[str, Any]:
+        """Build API data from the cache of finished builds, or one tree query."""
+        data = self.build_cache.get(job_name, build_number, detailed)
+        if data is None:
+            encoded_job = urllib.parse.quote(job_name, safe='')
+            data = self._get_json(f"{self.base_url}/job/{encoded_job}/{build_number}/api/json",
+                                  {'tree': self.REPORT_TREE if detailed else self.BUILD_TREE})
+            if self.build_cache.put(job_name, data, detailed):
+                self.build_cache.save(job_name)
+        return data
+
+    @staticmethod
+    def _parse_build(data: Dict[str, Any]) -> BuildInfo:
+        """BuildInfo from build API data."""
+        # Parse build status and result
+        building = data.get('building', False)
+        result = data.get('result', 'BUILDING' if building else 'UNKNOWN')
+
+        status = result if result else ('BUILDING' if building else 'UNKNOWN')
+
+        # Parse timestamp
+        timestamp = datetime.fromtimestamp(data.get('timestamp', 0) / 1000)
+
+        # Extract cause information
+        causes = data.get('actions', [])
+        cause_info = None
+        commit_hash = None
+        branch = None
+
+        for action in causes:
+            if action and isinstance(action, dict):
+                # Look for cause information
+                if 'causes' in action:
+                    cause_list = action.get('causes', [])
+                    if cause_list and len(cause_list) > 0:
+                        cause_info = cause_list[0].get('shortDescription', 'Unknown')
+
+                # Look for Git information
+                if 'lastBuiltRevision' in action:
+                    revision = action.get('lastBuiltRevision', {})
+                    if 'SHA1' in revision:
+                        commit_hash = revision['SHA1'][:8]  # Short hash
+
+                if 'remoteUrls' in action and 'branch' in action:
+                    branches = action.get('branch', [])
+                    if branches and len(branches) > 0:
+                        branch = branches[0].get('name', '').replace('origin/', '')
+
+        return BuildInfo(
+            number=int(data.get('number', 0)),
+            url=data.get('url', ''),
+            status=status,
+            result=result,
+            timestamp=timestamp,
+            duration_ms=data.get('duration', 0),
+            display_name=data.get('displayName', f"#{data.get('number', 0)}"),
+            description=data.get('description'),
+            node_name=data.get('builtOn'),
+            cause=cause_info,
+            commit_hash=commit_hash,
+            branch=branch,
+            estimated_duration_ms=data['estimatedDuration'] if (data.get('estimatedDuration') or 0) > 0 else None
+        )
+
     def get_build_info(self, job_name: str, build_number: Union[int, str]) -> BuildInfo:
         """Get detailed build information."""
         try:
-            encoded_job = urllib.parse.quote(job_name, safe='')
-            response = self.session.get(
-                f"{self.base_url}/job/{encoded_job}/{build_number}/api/json",
-                timeout=30
-            )
-            response.raise_for_status()
-            data = response.json()
-
-            # Parse build status and result
-            building = data.get('building', False)
-            result = data.get('result', 'BUILDING' if building else 'UNKNOWN')
-
-            status = result if result else ('BUILDING' if building else 'UNKNOWN')
-
-            # Parse timestamp
-            timestamp = datetime.fromtimestamp(data.get('timestamp', 0) / 1000)
-
-            # Extract cause information
-            causes = data.get('actions', [])
-            cause_info = None
-            commit_hash = None
-            branch = None
-
-            for action in causes:
-                if action and isinstance(action, dict):
-                    # Look for cause information
-                    if 'causes' in action:
-                        cause_list = action.get('causes', [])
-                        if cause_list and len(cause_list) > 0:
-                            cause_info = cause_list[0].get('shortDescription', 'Unknown')
-
-                    # Look for Git information
-                    if 'lastBuiltRevision' in action:
-                        revision = action.get('lastBuiltRevision', {})
-                        if 'SHA1' in revision:
-                            commit_hash = revision['SHA1'][:8]  # Short hash
-
-                    if 'remoteUrls' in action and 'branch' in action:
-                        branches = action.get('branch', [])
-                        if branches and len(branches) > 0:
-                            branch = branches[0].get('name', '').replace('origin/', '')
-
-            return BuildInfo(
-                number=int(data.get('number', 0)),
-                url=data.get('url', ''),
-                status=status,
-                result=result,
-                timestamp=timestamp,
-                duration_ms=data.get('duration', 0),
-                display_name=data.get('displayName', f"#{data.get('number', 0)}"),
-                description=data.get('description'),
-                node_name=data.get('builtOn'),
-                cause=cause_info,
-                commit_hash=commit_hash,
-                branch=branch
-            )
+            return self._parse_build(self._get_build_data(job_name, build_number))
 
         except requests.exceptions.RequestException as e:
             raise JenkinsAPIError(f"Failed to get build info: {str(e)}")
@@ -216,77 +590,193 @@ class JenkinsClient:
     def get_build_artifacts(self, job_name: str, build_number: Union[int, str]) -> List[ArtifactInfo]:
         """Get list of build artifacts."""
         try:
-            encoded_job = urllib.parse.quote(job_name, safe='')
-            response = self.session.get(
-                f"{self.base_url}/job/{encoded_job}/{build_number}/api/json",
-                timeout=30
+            return self._parse_artifacts(job_name, self._get_build_data(job_name, build_number, detailed=True))
+
+        except requests.exceptions.RequestException as e:
+            raise JenkinsAPIError(f"Failed to get build artifacts: {str(e)}")
+
+    def _parse_artifacts(self, job_name: str, data: Dict[str, Any]) -> List[ArtifactInfo]:
+        """ArtifactInfo list from build API data (report tree)."""
+        encoded_job = urllib.parse.quote(job_name, safe='')
+        build_number = int(data.get('number', 0))
+
+        # MD5s of fingerprinted artifacts (archiveArtifacts fingerprint: true). A fingerprint record is
+        # shared by hash and keeps the name of its first archiving, so a bare file name is only trusted
+        # when no other artifact of the build has the same one
+        fingerprints = {item.get('fileName'): item.get('hash') for item in data.get('fingerprint') or []}
+        name_counts = Counter(artifact_data.get('fileName') for artifact_data in data.get('artifacts', []))
+
+        artifacts = []
+        for artifact_data in data.get('artifacts', []):
+            relative_path = artifact_data.get('relativePath', '')
+            fingerprint = fingerprints.get(relative_path)
+            if fingerprint is None and name_counts[artifact_data.get('fileName')] == 1:
+                fingerprint = fingerprints.get(artifact_data.get('fileName'))
+            artifact = ArtifactInfo(
+                display_path=artifact_data.get('displayPath', ''),
+                file_name=artifact_data.get('fileName', ''),
+                relative_path=relative_path,
+                size_bytes=artifact_data.get('size', 0),
+                build_number=build_number,
+                download_url=f"{self.base_url}/job/{encoded_job}/{build_number}/artifact/{urllib.parse.quote(relative_path)}",
+                fingerprint=fingerprint
             )
-            response.raise_for_status()
-            data = response.json()
+            artifacts.append(artifact)
 
-            artifacts = []
-            for artifact_data in data.get('artifacts', []):
-                artifact = ArtifactInfo(
-                    display_path=artifact_data.get('displayPath', ''),
-                    file_name=artifact_data.get('fileName', ''),
-                    relative_path=artifact_data.get('relativePath', ''),
-                    size_bytes=artifact_data.get('size', 0),
-                    build_number=int(build_number),
-                    download_url=f"{self.base_url}/job/{encoded_job}/{build_number}/artifact/{artifact_data.get('relativePath', '')}"
-                )
-                artifacts.append(artifact)
+        logger.info(f"Found {len(artifacts)} artifacts for build {build_number}")
+        return artifacts
 
-            logger.info(f"Found {len(artifacts)} artifacts for build {build_number}")
-            return artifacts
+    def _mount_pool(self, size: int) -> None:
+        self.pool_size = size
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=size)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
 
-        except requests.exceptions.RequestException as e:
-            raise JenkinsAPIError(f"Failed to get build artifacts: {str(e)}")
+    @staticmethod
+    def _md5(file_path: Path) -> str:
+        md5 = hashlib.md5()
+        with open(file_path, 'rb') as f:
+            for block in iter(lambda: f.read(1024 * 1024), b''):
+                md5.update(block)
+        return md5.hexdigest()
+
+    def _count(self, outcome: str, size: int = 0) -> None:
+        with self._stats_lock:
+            self.download_stats[outcome] += 1
+            self.download_stats['bytes'] += size
 
     def download_artifact(self, artifact: ArtifactInfo, download_path: Path,
                          create_dirs: bool = True) -> bool:
-        """Download a specific artifact."""
-        try:
-            if create_dirs:
-                download_path.parent.mkdir(parents=True, exist_ok=True)
+        """
+        Download a specific artifact, resuming an interrupted download.
 
-            logger.info(f"Downloading artifact: {artifact.file_name} to {download_path}")
+        Data goes to <name>.part and is renamed into place once its size (and
+        MD5, if Jenkins fingerprinted it) checks out. A .part left by a failed
+        attempt or an earlier run is continued with an HTTP Range request;
+        servers that ignore the range send the whole file, which is then
+        written from the start.
+        """
+        if create_dirs:
+            download_path.parent.mkdir(parents=True, exist_ok=True)
+        part_path = download_path.with_name(download_path.name + '.part')
 
-            with self.session.get(artifact.download_url, stream=True, timeout=300) as response:
-                response.raise_for_status()
+        for attempt in range(1, self.DOWNLOAD_ATTEMPTS + 1):
+            try:
+                offset = part_path.stat().st_size if part_path.exists() else 0
+                if artifact.size_bytes and offset > artifact.size_bytes:
+                    offset = 0
+                headers = {'Range': f'bytes={offset}-'} if offset else {}
+
+                logger.info(f"Downloading artifact: {artifact.file_name} to {download_path}"
+                            + (f" (resuming at {offset} bytes)" if offset else ""))
+
+                with self.session.get(artifact.download_url, headers=headers, stream=True, timeout=300) as response:
+                    if response.status_code == 416:
+                        # Nothing left to send: the partial file is complete, or invalid
+                        received = 0
+                    else:
+                        response.raise_for_status()
+                        if offset and response.status_code != 206:
+                            offset = 0
+                        received = 0
+                        with open(part_path, 'ab' if offset else 'wb') as f:
+                            for chunk in response.iter_content(chunk_size=self.DOWNLOAD_CHUNK_SIZE):
+                                f.write(chunk)
+                                received += len(chunk)
+
+                size = part_path.stat().st_size if part_path.exists() else 0
+                if artifact.size_bytes and size != artifact.size_bytes:
+                    if not received and part_path.exists():
+                        part_path.unlink()  # No progress from this offset: start over next time
+                    raise IOError(f"size {size} bytes, expected {artifact.size_bytes}")
+                if artifact.fingerprint and self._md5(part_path) != artifact.fingerprint:
+                    part_path.unlink()
+                    raise IOError("MD5 does not match the Jenkins fingerprint")
+
+                os.replace(part_path, download_path)
+                self._count('resumed' if offset else 'downloaded', received)
+                logger.info(f"Successfully downloaded: {artifact.file_name} ({size} bytes)")
+                return True
 
-                with open(download_path, 'wb') as f:
-                    for chunk in response.iter_content(chunk_size=8192):
-                        f.write(chunk)
+            except (requests.exceptions.RequestException, IOError) as e:
+                logger.warning(f"Download attempt {attempt}/{self.DOWNLOAD_ATTEMPTS} of {artifact.file_name} failed: {str(e)}")
 
-            # Verify download
-            if download_path.exists() and download_path.stat().st_size > 0:
-                logger.info(f"Successfully downloaded: {artifact.file_name} ({download_path.stat().st_size} bytes)")
-                return True
-            else:
-                logger.error(f"Download verification failed: {artifact.file_name}")
-                return False
+        logger.error(f"Failed to download artifact {artifact.file_name}")
+        self._count('failed')
+        return False
 
-        except requests.exceptions.RequestException as e:
-            logger.error(f"Failed to download artifact {artifact.file_name}: {str(e)}")
-            return False
-        except IOError as e:
-            logger.error(f"File I/O error downloading {artifact.file_name}: {str(e)}")
+    def _is_downloaded(self, artifact: ArtifactInfo, download_path: Path, manifest: Dict[str, Any]) -> bool:
+        """Whether a local file already is this artifact (size, and MD5 from Jenkins or from our manifest)."""
+        try:
+            if download_path.stat().st_size != artifact.size_bytes:
+                return False
+        except OSError:
             return False
 
+        expected = artifact.fingerprint
+        if not expected:
+            entry = manifest.get(artifact.relative_path) or {}
+            if entry.get('download_url') != artifact.download_url or entry.get('size') != artifact.size_bytes:
+                return False
+            expected = entry.get('md5')
+        return bool(expected) and self._md5(download_path) == expected
+
     def download_all_artifacts(self, job_name: str, build_number: Union[int, str],
-                              download_dir: Path) -> List[Path]:
-        """Download all artifacts from a build."""
-        artifacts = self.get_build_artifacts(job_name, build_number)
-        downloaded_files = []
+                              download_dir: Path, max_workers: Optional[int] = None) -> List[Path]:
+        """
+        Download all artifacts from a build, several at a time.
 
+        Artifacts keep their relative paths under download_dir. Files already
+        present with the same size and MD5 (Jenkins fingerprint, or the one
+        recorded in the directory's download manifest) are skipped.
+        Aggregate throughput is logged and kept in download_stats.
+        """
+        artifacts = self.get_build_artifacts(job_name, build_number)
         download_dir.mkdir(parents=True, exist_ok=True)
+        root = download_dir.resolve()
 
-        for artifact in artifacts:
-            download_path = download_dir / artifact.file_name
-            if self.download_artifact(artifact, download_path):
-                downloaded_files.append(download_path)
-
-        logger.info(f"Downloaded {len(downloaded_files)}/{len(artifacts)} artifacts to {download_dir}")
+        manifest_path = download_dir / self.DOWNLOAD_MANIFEST
+        try:
+            manifest = json.loads(manifest_path.read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            manifest = {}
+
+        self.download_stats = {'downloaded': 0, 'resumed': 0, 'skipped': 0, 'failed': 0, 'bytes': 0, 'seconds': 0.0}
+        started = time.perf_counter()
+
+        def fetch(artifact: ArtifactInfo) -> Optional[Path]:
+            download_path = (download_dir / (artifact.relative_path or artifact.file_name)).resolve()
+            if root not in download_path.parents:
+                logger.error(f"Refusing to write artifact outside {download_dir}: {artifact.relative_path}")
+                self._count('failed')
+                return None
+            if self._is_downloaded(artifact, download_path, manifest):
+                self._count('skipped')
+                return download_path
+            if not self.download_artifact(artifact, download_path):
+                return None
+            manifest[artifact.relative_path] = {'download_url': artifact.download_url, 'size': artifact.size_bytes,
+                                                'md5': artifact.fingerprint or self._md5(download_path)}
+            return download_path
+
+        workers = max(1, max_workers or self.DOWNLOAD_WORKERS)
+        if workers > self.pool_size:
+            self._mount_pool(workers)
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            downloaded_files = [path for path in executor.map(fetch, artifacts) if path is not None]
+
+        tmp_path = manifest_path.with_name(manifest_path.name + '.tmp')
+        tmp_path.write_text(json.dumps(manifest, indent=2), encoding='utf-8')
+        os.replace(tmp_path, manifest_path)
+
+        stats = self.download_stats
+        stats['seconds'] = time.perf_counter() - started
+        rate = stats['bytes'] / stats['seconds'] / (1024 * 1024) if stats['seconds'] > 0 else 0.0
+        logger.info(f"Downloaded {len(downloaded_files)}/{len(artifacts)} artifacts to {download_dir} "
+                    f"({stats['downloaded']} new, {stats['resumed']} resumed, {stats['skipped']} up to date, "
+                    f"{stats['failed']} failed; {stats['bytes'] / (1024 * 1024):.1f} MB in {stats['seconds']:.1f}s, "
+                    f"{rate:.1f} MB/s)")
         return downloaded_files
 
     def get_console_log(self, job_name: str, build_number: Union[int, str]) -> str:
@@ -303,130 +793,100 @@ class JenkinsClient:
         except requests.exceptions.RequestException as e:
             raise JenkinsAPIError(f"Failed to get console log: {str(e)}")
 
-    def analyze_console_log(self, console_log: str) -> ConsoleLogAnalysis:
-        """Analyze console log for errors, warnings, and performance metrics."""
-        lines = console_log.split('\n')
-        total_lines = len(lines)
-
-        # Count errors and warnings
-        error_count = 0
-        warning_count = 0
-        key_events = []
-        duration_analysis = {}
-
-        # Patterns for different log types
-        error_patterns = [
-            r'(?i)\berror\b',
-            r'(?i)\bfailed\b',
-            r'(?i)\bexception\b',
-            r'(?i)\bfatal\b',
-            r'\[ERROR\]',
-            r'ERROR:',
-            r'✗',
-            r'FAIL:'
-        ]
-
-        warning_patterns = [
-            r'(?i)\bwarning\b',
-            r'(?i)\bwarn\b',
-            r'\[WARN\]',
-            r'WARNING:',
-            r'⚠',
-            r'UNSTABLE'
-        ]
-
-        # Duration extraction patterns
-        duration_patterns = {
-            'total_build': r'Finished: \w+ in ([0-9.]+) (sec|min|hr)',
-            'test_execution': r'Tests run: \d+.*Time elapsed: ([0-9.]+) sec',
-            'compilation': r'Compilation time: ([0-9.]+) seconds?',
-            'docker_build': r'Successfully built.*in ([0-9.]+)s'
-        }
+    def stream_console_log(self, job_name: str, build_number: Union[int, str],
+                           on_text: Callable[[str], None], start: int = 0, follow: bool = False,
+                           poll_interval: float = 5.0,
+                           on_poll: Optional[Callable[[int, bool], None]] = None) -> int:
+        """
+        Read a console log through logText/progressiveText, chunk by chunk.
+
+        Decoded text goes to on_text as it is received, starting at byte offset
+        start. With follow=True the log of a running build is tailed: Jenkins
+        sets X-More-Data while the build is running, and the next request
+        continues from the X-Text-Size offset. on_poll(offset, more_data) is
+        called after every response. Connection errors and 5xx responses are
+        retried after the bytes already received, up to CONSOLE_MAX_FAILURES
+        times in a row; 4xx responses fail at once. Returns the offset to
+        resume from.
+        """
+        encoded_job = urllib.parse.quote(job_name, safe='')
+        url = f"{self.base_url}/job/{encoded_job}/{build_number}/logText/progressiveText"
+        decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+        offset = start
+        failures = 0
+
+        while True:
+            received = 0
+            try:
+                with self.session.get(url, params={'start': offset}, stream=True, timeout=60) as response:
+                    response.raise_for_status()
+                    for chunk in response.iter_content(chunk_size=self.CONSOLE_CHUNK_SIZE):
+                        received += len(chunk)
+                        text = decoder.decode(chunk)
+                        if text:
+                            on_text(text)
+                    offset = int(response.headers.get('X-Text-Size', offset + received))
+                    more_data = response.headers.get('X-More-Data', '').lower() == 'true'
 
-        # Performance metrics patterns
-        performance_patterns = {
-            'memory_usage': r'Memory usage: ([0-9.]+)MB',
-            'cpu_usage': r'CPU usage: ([0-9.]+)%',
-            'test_count': r'Tests run: (\d+)',
-            'passed_tests': r'Tests run: \d+.*Failures: (\d+).*Errors: (\d+)'
-        }
+            except requests.exceptions.RequestException as e:
+                status_code = getattr(e.response, 'status_code', None)
+                failures += 1
+                if (status_code is not None and status_code < 500) or failures >= self.CONSOLE_MAX_FAILURES:
+                    raise JenkinsAPIError(f"Failed to get console log: {str(e)}")
+                # Text already handed to on_text is not requested again
+                offset += received
+                logger.warning(f"Error reading console log ({failures}/{self.CONSOLE_MAX_FAILURES}), "
+                               f"resuming at offset {offset}: {str(e)}")
+                time.sleep(poll_interval)
+                continue
+
+            failures = 0
+            if on_poll:
+                on_poll(offset, more_data)
+            if not (follow and more_data):
+                break
+            time.sleep(poll_interval)
+
+        tail = decoder.decode(b'', final=True)
+        if tail:
+            on_text(tail)
+        return offset
+
+    def analyze_console_log_stream(self, job_name: str, build_number: Union[int, str], follow: bool = False,
+                                   poll_interval: float = 5.0,
+                                   on_update: Optional[Callable[[ConsoleLogAnalysis], None]] = None) -> ConsoleLogAnalysis:
+        """
+        Analyze a console log while it is streamed, in constant memory.
 
-        for i, line in enumerate(lines):
-            # Count errors
-            for pattern in error_patterns:
-                if re.search(pattern, line):
-                    error_count += 1
-                    key_events.append({
-                        'line_number': i + 1,
-                        'type': 'error',
-                        'message': line.strip()[:200],  # Truncate long messages
-                        'timestamp': self._extract_timestamp(line)
-                    })
-                    break
-
-            # Count warnings
-            for pattern in warning_patterns:
-                if re.search(pattern, line):
-                    warning_count += 1
-                    key_events.append({
-                        'line_number': i + 1,
-                        'type': 'warning',
-                        'message': line.strip()[:200],
-                        'timestamp': self._extract_timestamp(line)
-                    })
-                    break
-
-            # Extract duration information
-            for metric_name, pattern in duration_patterns.items():
-                match = re.search(pattern, line)
-                if match:
-                    duration_analysis[metric_name] = float(match.group(1))
-
-            # Extract performance metrics
-            for metric_name, pattern in performance_patterns.items():
-                match = re.search(pattern, line)
-                if match:
-                    if metric_name not in duration_analysis:
-                        duration_analysis[metric_name] = []
-                    if metric_name == 'passed_tests':
-                        failures = int(match.group(1))
-                        errors = int(match.group(2))
-                        duration_analysis[metric_name] = {'failures': failures, 'errors': errors}
-                    else:
-                        duration_analysis[metric_name] = float(match.group(1))
+        With follow=True a running build is tailed until it finishes and
+        on_update receives the analysis so far after every poll.
+        """
+        scanner = ConsoleLogScanner()
+        on_poll = (lambda offset, more_data: on_update(scanner.analysis())) if on_update else None
 
-        # Calculate performance metrics
-        performance_metrics = {
-            'error_rate': (error_count / total_lines * 100) if total_lines > 0 else 0,
-            'warning_rate': (warning_count / total_lines * 100) if total_lines > 0 else 0,
-            'log_density': total_lines,
-            'has_performance_data': bool(duration_analysis)
-        }
+        started = time.perf_counter()
+        offset = self.stream_console_log(job_name, build_number, scanner.feed, follow=follow,
+                                         poll_interval=poll_interval, on_poll=on_poll)
+        scanner.finish()
+        elapsed = time.perf_counter() - started
 
-        return ConsoleLogAnalysis(
-            total_lines=total_lines,
-            error_count=error_count,
-            warning_count=warning_count,
-            duration_analysis=duration_analysis,
-            key_events=key_events[-50:],  # Keep last 50 events to avoid memory issues
-            performance_metrics=performance_metrics
-        )
+        logger.info(f"Analyzed {scanner.total_lines} console log lines ({offset} bytes) in {elapsed:.2f}s")
+        return scanner.analysis()
+
+    def analyze_console_log(self, console_log: str) -> ConsoleLogAnalysis:
+        """Analyze console log for errors, warnings, and performance metrics."""
+        scanner = ConsoleLogScanner()
+        started = time.perf_counter()
+        scanner.scan(console_log)
+        elapsed = time.perf_counter() - started
+
+        rate = f"{scanner.total_lines / elapsed:,.0f} lines/s" if elapsed > 0 else "instant"
+        logger.info(f"Analyzed {scanner.total_lines} console log lines in {elapsed:.2f}s ({rate})")
+        return scanner.analysis()
 
     def _extract_timestamp(self, line: str) -> Optional[str]:
         """Extract timestamp from log line if present."""
-        # Common timestamp patterns in Jenkins logs
-        timestamp_patterns = [
-            r'(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2})',
-            r'(\d{2}:\d{2}:\d{2})',
-            r'\[(\d{2}:\d{2}:\d{2})\]'
-        ]
-
-        for pattern in timestamp_patterns:
-            match = re.search(pattern, line)
-            if match:
-                return match.group(1)
-
-        return None
+        return ConsoleLogScanner.extract_timestamp(line)
 
     def get_test_results(self, job_name: str, build_number: Union[int, str]) -> Optional[TestResults]:
         """Get test results summary from build."""
@@ -434,6 +894,7 @@ class JenkinsClient:
             encoded_job = urllib.parse.quote(job_name, safe='')
             response = self.session.get(
                 f"{self.base_url}/job/{encoded_job}/{build_number}/testReport/api/json",
+                params={'tree': self.TEST_REPORT_TREE},  # Totals only, not every case of every suite
                 timeout=30
             )
 
@@ -443,6 +904,7 @@ class JenkinsClient:
 
             response.raise_for_status()
             data = response.json()
+            data.setdefault('totalCount', data.get('passCount', 0) + data.get('failCount', 0) + data.get('skipCount', 0))
 
             return TestResults(
                 total_count=data.get('totalCount', 0),
@@ -459,6 +921,14 @@ class JenkinsClient:
 
     def trigger_build(self, job_name: str, parameters: Optional[Dict[str, str]] = None) -> Optional[int]:
         """Trigger a new build and return the build number."""
+        queue_id = self._queue_build(job_name, parameters)
+        if queue_id is None:
+            return None
+        # Wait for build to start and get build number
+        return self._wait_for_build_start(queue_id)
+
+    def _queue_build(self, job_name: str, parameters: Optional[Dict[str, str]] = None) -> Optional[int]:
+        """Trigger a new build and return its queue item ID."""
         try:
             encoded_job = urllib.parse.quote(job_name, safe='')
 
@@ -483,9 +953,7 @@ class JenkinsClient:
                     # Location format: http://jenkins/queue/item/123/
                     match = re.search(r'/item/(\d+)/', location)
                     if match:
-                        queue_id = int(match.group(1))
-                        # Wait for build to start and get build number
-                        return self._wait_for_build_start(queue_id)
+                        return int(match.group(1))
 
             response.raise_for_status()
             logger.warning("Build triggered but no build number received")
@@ -494,95 +962,227 @@ class JenkinsClient:
         except requests.exceptions.RequestException as e:
             raise JenkinsAPIError(f"Failed to trigger build: {str(e)}")
 
-    def _wait_for_build_start(self, queue_id: int, timeout_seconds: int = 300) -> Optional[int]:
-        """Wait for a queued build to start and return build number."""
-        start_time = time.time()
+    def poll_interval(self, elapsed: float, estimated: Optional[float], polls: int = 0) -> float:
+        """
+        Seconds until the next status check of a running build.
 
-        while time.time() - start_time < timeout_seconds:
-            try:
-                response = self.session.get(f"{self.base_url}/queue/item/{queue_id}/api/json", timeout=10)
+        With an estimate, checks are a quarter of the time since the start or
+        until the expected end apart, whichever is nearer: frequent at first
+        (builds that fail fast) and near the end, sparse in the middle. Past
+        the estimate they back off again as the overrun grows. Without one
+        (a job's first build) the interval grows geometrically per poll.
+        """
+        if estimated and estimated > 0:
+            remaining = estimated - elapsed
+            interval = (min(elapsed, remaining) if remaining > 0 else -remaining) * self.POLL_FRACTION
+        else:
+            interval = self.POLL_MIN_INTERVAL * self.POLL_BACKOFF ** polls
+        return min(max(interval, self.POLL_MIN_INTERVAL), self.POLL_MAX_INTERVAL)
+
+    def _poll_build(self, job_name: str, build_number: int, polls: int) -> Tuple[Optional[BuildInfo], float]:
+        """One status check: (final build info, or None while running; seconds until the next check)."""
+        try:
+            build_info = self.get_build_info(job_name, build_number)
+        except JenkinsAPIError as e:
+            logger.warning(f"Error checking build status: {str(e)}")
+            return None, self.poll_interval(0, None, polls)
+
+        if build_info.status != 'BUILDING':
+            logger.info(f"Build {build_number} completed with status: {build_info.status}")
+            return build_info, 0
+
+        elapsed = time.time() - build_info.timestamp.timestamp()
+        estimated = build_info.estimated_duration_ms / 1000 if build_info.estimated_duration_ms else None
+        interval = self.poll_interval(elapsed, estimated, polls)
+        logger.debug(f"Build {build_number} still running ({elapsed:.0f}s of ~{estimated or 0:.0f}s), "
+                     f"next check in {interval:.1f}s")
+        return None, interval
+
+    def _poll_queue(self, queue_id: int, polls: int) -> Tuple[bool, Optional[int], float]:
+        """One queue check: (settled, build number if started, seconds until the next check)."""
+        interval = min(self.QUEUE_POLL_MIN_INTERVAL * self.POLL_BACKOFF ** polls, self.QUEUE_POLL_MAX_INTERVAL)
+        try:
+            response = self.session.get(f"{self.base_url}/queue/item/{queue_id}/api/json", timeout=10)
 
-                if response.status_code == 404:
-                    # Queue item might have been processed
-                    logger.warning(f"Queue item {queue_id} not found")
-                    return None
+            if response.status_code == 404:
+                # Queue item might have been processed
+                logger.warning(f"Queue item {queue_id} not found")
+                return True, None, 0
 
-                response.raise_for_status()
-                data = response.json()
+            response.raise_for_status()
+            data = response.json()
 
-                # Check if build has started
-                if 'executable' in data:
-                    executable = data.get('executable', {})
-                    build_number = executable.get('number')
-                    if build_number:
-                        logger.info(f"Build started: #{build_number}")
-                        return int(build_number)
+            # Check if build has started
+            build_number = (data.get('executable') or {}).get('number')
+            if build_number:
+                logger.info(f"Build started: #{build_number}")
+                return True, int(build_number), 0
 
-                # Check if still in queue
-                if data.get('blocked', False) or data.get('buildable', False):
-                    logger.debug(f"Build still in queue (blocked: {data.get('blocked')}, buildable: {data.get('buildable')})")
-                    time.sleep(5)
-                    continue
+            # Check for cancellation
+            if data.get('cancelled', False):
+                logger.warning("Build was cancelled while in queue")
+                return True, None, 0
 
-                # Check for cancellation
-                if data.get('cancelled', False):
-                    logger.warning("Build was cancelled while in queue")
-                    return None
+            if data.get('blocked', False) or data.get('buildable', False):
+                logger.debug(f"Build still in queue (blocked: {data.get('blocked')}, buildable: {data.get('buildable')})")
+            else:
+                # Still in the quiet period: the item's timestamp is when it ends
+                interval = max(interval, data.get('timestamp', 0) / 1000 - time.time())
 
-                time.sleep(2)
+        except requests.exceptions.RequestException as e:
+            logger.warning(f"Error checking queue status: {str(e)}")
 
-            except requests.exceptions.RequestException as e:
-                logger.warning(f"Error checking queue status: {str(e)}")
-                time.sleep(5)
+        return False, None, interval
 
-        logger.error(f"Timeout waiting for build to start (queue ID: {queue_id})")
-        return None
+    def _wait_for_build_start(self, queue_id: int, timeout_seconds: int = 300) -> Optional[int]:
+        """Wait for a queued build to start and return build number."""
+        deadline = time.time() + timeout_seconds
+        polls = 0
+
+        while True:
+            settled, build_number, interval = self._poll_queue(queue_id, polls)
+            if settled:
+                return build_number
+            polls += 1
+            remaining = deadline - time.time()
+            if remaining <= 0:
+                logger.error(f"Timeout waiting for build to start (queue ID: {queue_id})")
+                return None
+            time.sleep(min(interval, remaining))
 
     def wait_for_build_completion(self, job_name: str, build_number: int,
                                  timeout_seconds: int = 1800,
-                                 check_interval: int = 30) -> BuildInfo:
-        """Wait for build completion and return final build info."""
-        start_time = time.time()
+                                 check_interval: Optional[float] = None) -> BuildInfo:
+        """Wait for build completion and return final build info (polled adaptively unless check_interval is set)."""
+        deadline = time.time() + timeout_seconds
+        polls = 0
+
+        while True:
+            build_info, interval = self._poll_build(job_name, build_number, polls)
+            if build_info:
+                return build_info
+            polls += 1
+            remaining = deadline - time.time()
+            if remaining <= 0:
+                raise JenkinsAPIError(f"Timeout waiting for build {build_number} to complete")
+            time.sleep(min(check_interval or interval, remaining))
+
+    async def wait_for_build_start_async(self, queue_id: int, timeout_seconds: int = 300) -> Optional[int]:
+        """Event-loop version of _wait_for_build_start (HTTP calls run in worker threads)."""
+        deadline = time.time() + timeout_seconds
+        polls = 0
+
+        while True:
+            settled, build_number, interval = await asyncio.to_thread(self._poll_queue, queue_id, polls)
+            if settled:
+                return build_number
+            polls += 1
+            remaining = deadline - time.time()
+            if remaining <= 0:
+                logger.error(f"Timeout waiting for build to start (queue ID: {queue_id})")
+                return None
+            await asyncio.sleep(min(interval, remaining))
+
+    async def wait_for_build_completion_async(self, job_name: str, build_number: int,
+                                              timeout_seconds: int = 1800,
+                                              check_interval: Optional[float] = None) -> BuildInfo:
+        """Event-loop version of wait_for_build_completion, for waiting on many builds at once."""
+        deadline = time.time() + timeout_seconds
+        polls = 0
+
+        while True:
+            build_info, interval = await asyncio.to_thread(self._poll_build, job_name, build_number, polls)
+            if build_info:
+                return build_info
+            polls += 1
+            remaining = deadline - time.time()
+            if remaining <= 0:
+                raise JenkinsAPIError(f"Timeout waiting for build {build_number} to complete")
+            await asyncio.sleep(min(check_interval or interval, remaining))
 
-        while time.time() - start_time < timeout_seconds:
-            try:
-                build_info = self.get_build_info(job_name, build_number)
+    @staticmethod
+    def _settled_results(labels: List[str], results: List[Any]) -> List[Optional[BuildInfo]]:
+        """gather(return_exceptions=True) results with each failure logged and replaced by None."""
+        settled = []
+        for label, result in zip(labels, results):
+            if isinstance(result, BaseException):
+                logger.error(f"Waiting for {label} failed: {str(result)}")
+                result = None
+            settled.append(result)
+        return settled
+
+    def wait_for_builds(self, builds: Sequence[Tuple[str, int]],
+                        timeout_seconds: int = 1800) -> List[Optional[BuildInfo]]:
+        """
+        Wait for several builds ((job, number) pairs) concurrently; results in the same order.
 
-                if build_info.status != 'BUILDING':
-                    logger.info(f"Build {build_number} completed with status: {build_info.status}")
-                    return build_info
+        A build that times out or cannot be read gives None without affecting the others.
+        """
+        async def wait_all() -> List[Any]:
+            return await asyncio.gather(*(
+                self.wait_for_build_completion_async(job_name, build_number, timeout_seconds)
+                for job_name, build_number in builds), return_exceptions=True)
+
+        return self._settled_results([f"{job_name} #{build_number}" for job_name, build_number in builds],
+                                     asyncio.run(wait_all()))
 
-                logger.debug(f"Build {build_number} still running...")
-                time.sleep(check_interval)
+    def run_builds(self, jobs: Dict[str, Optional[Dict[str, str]]],
+                   timeout_seconds: int = 1800) -> Dict[str, Optional[BuildInfo]]:
+        """
+        Trigger several jobs at once (job name -> parameters) and wait for all of them.
 
+        Returns each job's final build info, or None if it could not be triggered,
+        never left the queue or did not finish in time.
+        """
+        queue_ids = {}
+        for job_name, parameters in jobs.items():
+            try:
+                queue_ids[job_name] = self._queue_build(job_name, parameters)
             except JenkinsAPIError as e:
-                logger.warning(f"Error checking build status: {str(e)}")
-                time.sleep(check_interval)
+                logger.error(str(e))
+                queue_ids[job_name] = None
+        deadline = time.time() + timeout_seconds
 
-        raise JenkinsAPIError(f"Timeout waiting for build {build_number} to complete")
+        async def run(job_name: str, queue_id: Optional[int]) -> Optional[BuildInfo]:
+            if queue_id is None:
+                return None
+            build_number = await self.wait_for_build_start_async(queue_id, min(300, timeout_seconds))
+            if build_number is None:
+                return None
+            logger.info(f"{job_name} started: #{build_number}")
+            return await self.wait_for_build_completion_async(job_name, build_number,
+                                                              max(0.0, deadline - time.time()))
+
+        async def run_all() -> List[Any]:
+            return await asyncio.gather(*(run(job_name, queue_id) for job_name, queue_id in queue_ids.items()),
+                                        return_exceptions=True)
+
+        return dict(zip(queue_ids, self._settled_results(list(queue_ids), asyncio.run(run_all()))))
 
     def create_build_report(self, job_name: str, build_number: Union[int, str],
                            include_console_log: bool = True,
                            include_test_results: bool = True) -> Dict[str, Any]:
         """Create comprehensive build report."""
         try:
-            # Get basic build info
-            build_info = self.get_build_info(job_name, build_number)
-
-            # Get artifacts
-            artifacts = self.get_build_artifacts(job_name, build_number)
+            # Build info, artifacts and test counts come from one tree query
+            try:
+                data = self._get_build_data(job_name, build_number, detailed=True)
+            except requests.exceptions.RequestException as e:
+                raise JenkinsAPIError(f"Failed to get build info: {str(e)}")
+            build_info = self._parse_build(data)
+            artifacts = self._parse_artifacts(job_name, data)
 
-            # Get test results if available
+            # Get test results if the build published any
             test_results = None
-            if include_test_results:
-                test_results = self.get_test_results(job_name, build_number)
+            has_tests = any(isinstance(action, dict) and 'totalCount' in action for action in data.get('actions', []))
+            if include_test_results and has_tests:
+                test_results = self.get_test_results(job_name, build_info.number)
 
             # Analyze console log if requested
             console_analysis = None
             if include_console_log:
                 try:
-                    console_log = self.get_console_log(job_name, build_number)
-                    console_analysis = self.analyze_console_log(console_log)
+                    console_analysis = self.analyze_console_log_stream(job_name, build_info.number)
                 except JenkinsAPIError as e:
                     logger.warning(f"Failed to analyze console log: {str(e)}")
 
@@ -605,25 +1205,51 @@ class JenkinsClient:
             raise
 
     def get_recent_builds(self, job_name: str, count: int = 10) -> List[BuildInfo]:
-        """Get information for recent builds."""
+        """
+        Get information for recent builds.
+
+        With nothing cached for the job this is one tree query for all the
+        builds. Otherwise one query lists the build numbers, and a second
+        fetches only the span of builds that are running or not yet cached.
+        """
         try:
-            job_info = self.get_job_info(job_name)
-            builds = job_info.get('builds', [])[:count]
+            encoded_job = urllib.parse.quote(job_name, safe='')
+            url = f"{self.base_url}/job/{encoded_job}/api/json"
+            prop = 'builds' if count <= self.BUILDS_PROPERTY_LIMIT else 'allBuilds'
+
+            def query(fields: str, first: int, last: int) -> List[Dict[str, Any]]:
+                return self._get_json(url, {'tree': f"{prop}[{fields}]{{{first},{last}}}"}).get(prop) or []
+
+            fetched = []
+            if self.build_cache.has_job(job_name):
+                numbers = [build['number'] for build in query('number', 0, count)]
+                builds = {number: self.build_cache.get(job_name, number) for number in numbers}
+                missing = [index for index, number in enumerate(numbers) if builds[number] is None]
+                if missing:
+                    fetched = query(self.BUILD_TREE, missing[0], missing[-1] + 1)
+            else:
+                fetched = query(self.BUILD_TREE, 0, count)
+                numbers = [build['number'] for build in fetched]
+                builds = {}
 
-            build_infos = []
-            for build_data in builds:
-                build_number = build_data.get('number')
-                if build_number:
-                    try:
-                        build_info = self.get_build_info(job_name, build_number)
-                        build_infos.append(build_info)
-                    except JenkinsAPIError as e:
-                        logger.warning(f"Failed to get info for build {build_number}: {str(e)}")
+            builds.update((build['number'], build) for build in fetched)
+            if [build for build in fetched if self.build_cache.put(job_name, build)]:
+                self.build_cache.save(job_name)
 
-            logger.info(f"Retrieved info for {len(build_infos)} recent builds")
+            build_infos = []
+            for number in numbers:
+                try:
+                    # Only missing if a new build shifted the list between the two queries
+                    build_infos.append(self._parse_build(builds.get(number) or self._get_build_data(job_name, number)))
+                except requests.exceptions.RequestException as e:
+                    logger.warning(f"Failed to get info for build {number}: {str(e)}")
+
+            fetched_numbers = {build['number'] for build in fetched}
+            logger.info(f"Retrieved info for {len(build_infos)} recent builds "
+                        f"({len([n for n in numbers if n not in fetched_numbers])} from cache)")
             return build_infos
 
-        except JenkinsAPIError as e:
+        except requests.exceptions.RequestException as e:
             raise JenkinsAPIError(f"Failed to get recent builds: {str(e)}")
 
 
@@ -734,12 +1360,25 @@ Examples:
         help='Download build artifacts to specified directory'
     )
 
+    parser.add_argument(
+        '--download-workers',
+        type=int,
+        default=JenkinsClient.DOWNLOAD_WORKERS,
+        help='Number of artifacts downloaded at a time'
+    )
+
     parser.add_argument(
         '--console-log',
         action='store_true',
         help='Analyze console log'
     )
 
+    parser.add_argument(
+        '--follow',
+        action='store_true',
+        help='Tail the console log of a running build until it finishes (use with --console-log)'
+    )
+
     parser.add_argument(
         '--trigger',
         action='store_true',
@@ -758,6 +1397,13 @@ Examples:
         help='Wait for build completion (use with --trigger)'
     )
 
+    parser.add_argument(
+        '--fan-out',
+        nargs='+',
+        metavar='JOB',
+        help='More jobs to trigger along with --job (same --parameters); with --wait all are awaited concurrently'
+    )
+
     parser.add_argument(
         '--webhook',
         type=str,
@@ -776,6 +1422,13 @@ Examples:
         help='Get info for N recent builds'
     )
 
+    parser.add_argument(
+        '--cache-dir',
+        type=str,
+        default=os.getenv('JENKINS_CACHE_DIR'),
+        help='Directory keeping finished builds between runs (default: $JENKINS_CACHE_DIR, or none)'
+    )
+
     parser.add_argument(
         '--timeout',
         type=int,
@@ -809,7 +1462,8 @@ Examples:
             base_url=args.url,
             username=username,
             api_token=token,
-            verify_ssl=not args.url.startswith('http://localhost')
+            verify_ssl=not args.url.startswith('http://localhost'),
+            cache_dir=Path(args.cache_dir) if args.cache_dir else None
         )
 
         # Handle different operations
@@ -823,32 +1477,64 @@ Examples:
             if args.parameters:
                 parameters = json.loads(args.parameters)
 
-            build_number = client.trigger_build(args.job, parameters)
-            if build_number:
-                logger.info(f"Build triggered successfully: #{build_number}")
-                result_data['triggered_build'] = build_number
-
-                # Wait for completion if requested
-                if args.wait:
-                    logger.info("Waiting for build completion...")
-                    build_info = client.wait_for_build_completion(
-                        args.job,
-                        build_number,
-                        timeout_seconds=args.timeout
-                    )
-                    result_data['build_info'] = asdict(build_info)
-
-                    # Send webhook notification
-                    if args.webhook:
+            if args.fan_out and args.wait:
+                # Trigger every job, then wait for all of them from one event loop
+                jobs = [args.job] + [job for job in args.fan_out if job != args.job]
+                logger.info(f"Triggering {len(jobs)} builds and waiting for completion...")
+                results = client.run_builds({job: parameters for job in jobs}, timeout_seconds=args.timeout)
+                result_data['fan_out'] = {job: asdict(info) if info else None for job, info in results.items()}
+
+                for job, build_info in results.items():
+                    if build_info and args.webhook:
                         WebhookHandler.notify_build_status(
                             args.webhook,
                             build_info,
-                            args.job,
+                            job,
                             {'triggered_by': 'jenkins_helper'}
                         )
+
+                if results[args.job]:
+                    result_data['triggered_build'] = results[args.job].number
+                    result_data['build_info'] = result_data['fan_out'][args.job]
+
+                failed = [job for job, build_info in results.items() if build_info is None]
+                if failed:
+                    logger.error(f"Builds that did not complete: {', '.join(failed)}")
+                    if args.output:
+                        with open(args.output, 'w', encoding='utf-8') as f:
+                            json.dump(result_data, f, indent=2, ensure_ascii=False, default=str)
+                    return 1
+
             else:
-                logger.error("Failed to trigger build")
-                return 1
+                for job in args.fan_out or []:
+                    result_data.setdefault('fan_out', {})[job] = client.trigger_build(job, parameters)
+
+                build_number = client.trigger_build(args.job, parameters)
+                if build_number:
+                    logger.info(f"Build triggered successfully: #{build_number}")
+                    result_data['triggered_build'] = build_number
+
+                    # Wait for completion if requested
+                    if args.wait:
+                        logger.info("Waiting for build completion...")
+                        build_info = client.wait_for_build_completion(
+                            args.job,
+                            build_number,
+                            timeout_seconds=args.timeout
+                        )
+                        result_data['build_info'] = asdict(build_info)
+
+                        # Send webhook notification
+                        if args.webhook:
+                            WebhookHandler.notify_build_status(
+                                args.webhook,
+                                build_info,
+                                args.job,
+                                {'triggered_by': 'jenkins_helper'}
+                            )
+                else:
+                    logger.error("Failed to trigger build")
+                    return 1
 
         # Use provided build number or get from trigger result
         build_number = args.build_number
@@ -872,14 +1558,21 @@ Examples:
         if args.download_artifacts:
             logger.info(f"Downloading artifacts for build #{build_number}")
             download_dir = Path(args.download_artifacts)
-            downloaded_files = client.download_all_artifacts(args.job, build_number, download_dir)
+            downloaded_files = client.download_all_artifacts(args.job, build_number, download_dir,
+                                                             max_workers=args.download_workers)
             result_data['downloaded_artifacts'] = [str(f) for f in downloaded_files]
+            result_data['download_stats'] = dict(client.download_stats)
 
         # Console log analysis
         if args.console_log:
             logger.info(f"Analyzing console log for build #{build_number}")
-            console_log = client.get_console_log(args.job, build_number)
-            analysis = client.analyze_console_log(console_log)
+
+            def show_progress(analysis: ConsoleLogAnalysis) -> None:
+                logger.info(f"Console log: {analysis.total_lines} lines, {analysis.error_count} errors, "
+                            f"{analysis.warning_count} warnings")
+
+            analysis = client.analyze_console_log_stream(args.job, build_number, follow=args.follow,
+                                                         on_update=show_progress if args.follow else None)
             result_data['console_analysis'] = asdict(analysis)
 
         # Recent builds
@@ -891,7 +1584,7 @@ Examples:
         # Save output
         if args.output and result_data:
             with open(args.output, 'w', encoding='utf-8') as f:
-                json.dump(result_data, f, indent=2, ensure_ascii=False)
+                json.dump(result_data, f, indent=2, ensure_ascii=False, default=str)
             logger.info(f"Results saved to {args.output}")
 
         # Print summary
@@ -3,7 +3,7 @@
 Report Aggregator for WeSign CI/CD Pipeline
 ===========================================
 
-Collect and merge TRX, Newman HTML, Playwright HTML reports into unified JSON summary.
+Collect and merge TRX, Newman HTML/JSON, Playwright HTML/JSON reports into unified JSON summary.
 Generate weighted "Run Score" and integrate with QA Intelligence backend.
 
 Author: QA Intelligence System
@@ -12,18 +12,29 @@ Platform: Windows-compatible (py command ready)
 """
 
 import argparse
+import base64
+import gzip
 import hashlib
+import heapq
+import io
 import json
 import logging
+import mmap
 import os
 import re
 import shutil
+import sqlite3
 import sys
+import threading
 import xml.etree.ElementTree as ET
-from dataclasses import dataclass, asdict
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, asdict, field
+from itertools import groupby
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Any, Union
+from typing import Callable, Dict, Iterator, List, Optional, Tuple, Any, Union
+from urllib.parse import urlsplit
 import zipfile
 
 try:
@@ -33,6 +44,12 @@ except ImportError:
     print("ERROR: Required libraries not installed. Run: pip install beautifulsoup4 requests lxml")
     sys.exit(1)
 
+try:
+    import numpy as np
+except ImportError:
+    # Optional "performance" extra - latency statistics fall back to pure Python
+    np = None
+
 # Configure structured logging
 logging.basicConfig(
     level=logging.INFO,
@@ -57,6 +74,38 @@ class TestMetrics:
     average_response_time_ms: float = 0.0
 
 
+@dataclass
+class TestCaseResult:
+    """Outcome and timing of a single test case."""
+    name: str
+    outcome: str  # 'passed', 'failed', 'skipped'
+    duration_seconds: float = 0.0
+    error_message: Optional[str] = None
+    source: str = ''  # metrics key of the report it came from, e.g. 'trx_api.trx'
+    retries: int = 0
+    steps: Optional[List[Dict[str, Any]]] = None  # [{'title', 'duration_seconds', 'steps'?}]
+    attachments: Optional[List[Dict[str, Any]]] = None  # [{'name', 'content_type', 'path', 'retry'}]
+
+
+@dataclass
+class EndpointStats:
+    """Latency and payload statistics of one request (or folder of requests)."""
+    name: str
+    kind: str  # 'request', 'folder', 'har'
+    source: str = ''
+    count: int = 0
+    p50_ms: float = 0.0
+    p90_ms: float = 0.0
+    p99_ms: float = 0.0
+    mean_ms: float = 0.0
+    max_ms: float = 0.0
+    mean_size_bytes: float = 0.0
+    total_size_bytes: int = 0
+    failures: int = 0
+    phases_ms: Optional[Dict[str, float]] = None  # HAR only: mean blocked/dns/connect/ssl/send/wait/receive
+    cache: Optional[Dict[str, int]] = None  # HAR only: {'hit', 'revalidated', 'miss'} counts
+
+
 @dataclass
 class ArtifactInfo:
     """Information about test artifacts."""
@@ -64,7 +113,7 @@ class ArtifactInfo:
     path: Path
     size_bytes: int
     checksum: str
-    type: str  # 'trx', 'newman-html', 'playwright-html', 'screenshot', 'video', 'har'
+    type: str  # 'trx', 'junit', 'newman-html', 'newman-json', 'playwright-html', 'playwright-json', 'screenshot', 'video', 'har'
     created_at: datetime
     metadata: Optional[Dict[str, Any]] = None
 
@@ -90,6 +139,9 @@ class ReportSummary:
     # Detailed metrics
     metrics: Dict[str, TestMetrics]
     artifacts: List[ArtifactInfo]
+    test_results: List[TestCaseResult] = field(default_factory=list)
+    endpoint_stats: List[EndpointStats] = field(default_factory=list)
+    performance_profile: Dict[str, Any] = field(default_factory=dict)
 
     # Integration info
     qa_intelligence_reported: bool = False
@@ -100,23 +152,116 @@ class ReportSummary:
 class TRXParser:
     """Parser for Visual Studio TRX test results."""
 
+    # TRX outcomes folded into passed / failed / skipped
+    OUTCOMES = {
+        'passed': 'passed', 'passedbutrunaborted': 'passed', 'warning': 'passed',
+        'failed': 'failed', 'error': 'failed', 'timeout': 'failed', 'aborted': 'failed',
+        'notexecuted': 'skipped', 'inconclusive': 'skipped', 'pending': 'skipped',
+        'disconnected': 'skipped', 'notrunnable': 'skipped'
+    }
+
+    MAX_ERROR_LENGTH = 4000
+
     @staticmethod
-    def parse_trx_file(file_path: Path) -> TestMetrics:
-        """Parse TRX file and extract test metrics."""
-        logger.info(f"Parsing TRX file: {file_path}")
+    def _local_name(tag: str) -> str:
+        return tag.rsplit('}', 1)[-1]
 
+    @staticmethod
+    def _parse_duration(value: str) -> float:
+        """Convert a TRX duration ("hh:mm:ss.fffffff", optionally "d.hh:mm:ss") to seconds."""
         try:
-            tree = ET.parse(file_path)
-            root = tree.getroot()
+            days = 0
+            if '.' in value.split(':', 1)[0]:
+                day_part, value = value.split('.', 1)
+                days = int(day_part)
+            hours, minutes, seconds = value.split(':')
+            return days * 86400 + int(hours) * 3600 + int(minutes) * 60 + float(seconds)
+        except (ValueError, AttributeError):
+            return 0.0
 
-            # Handle XML namespace
-            namespace = {'mstest': 'http://microsoft.com/schemas/VisualStudio/TeamTest/2010'}
+    @staticmethod
+    def _test_result(elem: ET.Element, source: str) -> TestCaseResult:
+        """Build a per-test record from a UnitTestResult element."""
+        error_message = None
+        for child in elem.iter():
+            if TRXParser._local_name(child.tag) == 'Message' and child.text:
+                error_message = child.text.strip()[:TRXParser.MAX_ERROR_LENGTH]
+                break
+
+        outcome = elem.get('outcome', '')
+        return TestCaseResult(
+            name=elem.get('testName', ''),
+            outcome=TRXParser.OUTCOMES.get(outcome.lower(), 'skipped'),
+            duration_seconds=TRXParser._parse_duration(elem.get('duration', '')),
+            error_message=error_message,
+            source=source
+        )
 
-            # Find test results summary
-            counters = root.find('.//mstest:Counters', namespace)
-            if counters is None:
-                # Try without namespace for older TRX files
-                counters = root.find('.//Counters')
+    @staticmethod
+    def iter_trx(file_path: Path) -> Iterator[Tuple[str, Any]]:
+        """
+        Stream a TRX file in bounded memory.
+
+        Yields ('result', TestCaseResult) for every top-level UnitTestResult and
+        ('counters', attrs) / ('times', attrs) for the run summary. Processed
+        elements are cleared and detached, so memory stays flat regardless of
+        file size.
+        """
+        source = f"trx_{file_path.name}"
+        stack: List[ET.Element] = []
+
+        for event, elem in ET.iterparse(str(file_path), events=('start', 'end')):
+            if event == 'start':
+                stack.append(elem)
+                continue
+
+            stack.pop()
+            name = TRXParser._local_name(elem.tag)
+            parent_name = TRXParser._local_name(stack[-1].tag) if stack else ''
+
+            if name == 'UnitTestResult' and parent_name == 'Results':
+                yield 'result', TRXParser._test_result(elem, source)
+            elif name == 'Counters':
+                yield 'counters', dict(elem.attrib)
+            elif name == 'Times':
+                yield 'times', dict(elem.attrib)
+            elif parent_name not in ('TestDefinitions', 'TestEntries'):
+                continue
+
+            # Drop what has been consumed (results, test definitions and entries)
+            elem.clear()
+            if stack:
+                stack[-1].remove(elem)
+
+    @staticmethod
+    def iter_test_results(file_path: Path) -> Iterator[TestCaseResult]:
+        """Per-test records (name, outcome, duration, error message) of a TRX file."""
+        for kind, value in TRXParser.iter_trx(file_path):
+            if kind == 'result':
+                yield value
+
+    @staticmethod
+    def parse_trx_file(file_path: Path,
+                       on_result: Optional[Callable[[TestCaseResult], None]] = None) -> TestMetrics:
+        """Parse TRX file and extract test metrics (per-test records go to on_result)."""
+        logger.info(f"Parsing TRX file: {file_path}")
+
+        try:
+            counters = None
+            times = None
+            result_counts = {'passed': 0, 'failed': 0, 'skipped': 0}
+            result_duration = 0.0
+
+            for kind, value in TRXParser.iter_trx(file_path):
+                if kind == 'result':
+                    result_counts[value.outcome] += 1
+                    result_duration += value.duration_seconds
+                    if on_result:
+                        on_result(value)
+                elif kind == 'counters':
+                    counters = value
+                elif kind == 'times':
+                    times = value
 
             if counters is not None:
                 total = int(counters.get('total', 0))
@@ -126,44 +271,48 @@ class TRXParser:
                 error = int(counters.get('error', 0))
                 timeout = int(counters.get('timeout', 0))
                 aborted = int(counters.get('aborted', 0))
-                inconclusive = int(counters.get('inconclusive', 0))
 
                 # Calculate skipped and failed totals
                 total_failed = failed + error + timeout + aborted
                 skipped = total - executed
-
-                success_rate = (passed / total * 100) if total > 0 else 0
-
-                # Extract execution times
-                times = root.find('.//mstest:Times', namespace)
-                if times is None:
-                    times = root.find('.//Times')
-
-                duration_seconds = 0.0
-                if times is not None:
-                    start_time = times.get('start', '')
-                    finish_time = times.get('finish', '')
-
-                    if start_time and finish_time:
-                        try:
-                            start = datetime.fromisoformat(start_time.replace('Z', '+00:00'))
-                            finish = datetime.fromisoformat(finish_time.replace('Z', '+00:00'))
-                            duration_seconds = (finish - start).total_seconds()
-                        except ValueError:
-                            logger.warning("Failed to parse TRX execution times")
-
-                return TestMetrics(
-                    total_tests=total,
-                    passed_tests=passed,
-                    failed_tests=total_failed,
-                    skipped_tests=skipped,
-                    duration_seconds=duration_seconds,
-                    success_rate=success_rate
-                )
+            elif sum(result_counts.values()):
+                # No ResultSummary (e.g. a truncated run) - count the results themselves
+                logger.warning("No counters found in TRX file, counting test results")
+                passed = result_counts['passed']
+                total_failed = result_counts['failed']
+                skipped = result_counts['skipped']
+                total = passed + total_failed + skipped
             else:
                 logger.warning("No counters found in TRX file")
                 return TestMetrics()
 
+            success_rate = (passed / total * 100) if total > 0 else 0
+
+            # Extract execution times
+            duration_seconds = 0.0
+            if times is not None:
+                start_time = times.get('start', '')
+                finish_time = times.get('finish', '')
+
+                if start_time and finish_time:
+                    try:
+                        start = datetime.fromisoformat(start_time.replace('Z', '+00:00'))
+                        finish = datetime.fromisoformat(finish_time.replace('Z', '+00:00'))
+                        duration_seconds = (finish - start).total_seconds()
+                    except ValueError:
+                        logger.warning("Failed to parse TRX execution times")
+            else:
+                duration_seconds = result_duration
+
+            return TestMetrics(
+                total_tests=total,
+                passed_tests=passed,
+                failed_tests=total_failed,
+                skipped_tests=skipped,
+                duration_seconds=duration_seconds,
+                success_rate=success_rate
+            )
+
         except ET.ParseError as e:
             logger.error(f"Failed to parse TRX file: {e}")
             return TestMetrics()
@@ -172,6 +321,198 @@ class TRXParser:
             return TestMetrics()
 
 
+class JUnitParser:
+    """Parser for JUnit XML (pytest --junitxml, also per-worker or per-node shards)."""
+
+    # junit-e2e-shard2.xml, results.gw3.xml, junit-node-1.xml -> one shard group
+    SHARD_SUFFIX = re.compile(r'[-_.](?:shard|node|part|worker|split|gw)?[-_]?\d+$', re.IGNORECASE)
+    RETRY_TAGS = ('rerunFailure', 'rerunError', 'flakyFailure', 'flakyError')
+    PHASES = ('setup', 'call', 'teardown')
+
+    @staticmethod
+    def shard_group(file_path: Path) -> str:
+        """File stem without its shard/worker suffix."""
+        return JUnitParser.SHARD_SUFFIX.sub('', file_path.stem) or file_path.stem
+
+    @staticmethod
+    def _seconds(value: Optional[str]) -> float:
+        try:
+            return float((value or '0').replace(',', ''))
+        except ValueError:
+            return 0.0
+
+    @staticmethod
+    def _test_result(elem: ET.Element, source: str) -> TestCaseResult:
+        """Build a per-test record from a testcase element."""
+        outcome = 'passed'
+        error_message = None
+        retries = 0
+        phases: Dict[str, float] = {}
+
+        for child in elem:
+            tag = TRXParser._local_name(child.tag)
+            if tag in ('failure', 'error'):
+                outcome = 'failed'
+                if error_message is None:
+                    message = child.get('message') or (child.text or '').strip()
+                    error_message = message[:TRXParser.MAX_ERROR_LENGTH] or None
+            elif tag == 'skipped' and outcome != 'failed':
+                outcome = 'skipped'
+            elif tag in JUnitParser.RETRY_TAGS:
+                retries += 1
+            elif tag == 'properties':
+                # Phase timings recorded by the suite's conftest as <when>_duration properties
+                for prop in child:
+                    name = prop.get('name', '')
+                    if name.endswith('_duration') and name[:-len('_duration')] in JUnitParser.PHASES:
+                        phases[name[:-len('_duration')]] = JUnitParser._seconds(prop.get('value'))
+
+        classname = elem.get('classname', '')
+        name = elem.get('name', '')
+        steps = [{'title': phase, 'duration_seconds': phases[phase]} for phase in JUnitParser.PHASES if phase in phases]
+        return TestCaseResult(
+            name=f"{classname}::{name}" if classname else name,
+            outcome=outcome,
+            duration_seconds=JUnitParser._seconds(elem.get('time')),
+            error_message=error_message,
+            source=source,
+            retries=retries,
+            steps=steps or None
+        )
+
+    @staticmethod
+    def iter_junit(file_path: Path, source: str) -> Iterator[Tuple[str, Any]]:
+        """
+        Stream a JUnit XML file in bounded memory.
+
+        Yields ('result', TestCaseResult) for every testcase and ('suite', attrs)
+        for every testsuite once it is closed. Consumed elements (including
+        their captured output) are cleared and detached as in TRXParser.iter_trx.
+        """
+        stack: List[ET.Element] = []
+
+        for event, elem in ET.iterparse(str(file_path), events=('start', 'end')):
+            if event == 'start':
+                stack.append(elem)
+                continue
+
+            stack.pop()
+            name = TRXParser._local_name(elem.tag)
+            if name == 'testcase':
+                yield 'result', JUnitParser._test_result(elem, source)
+            elif name == 'testsuite':
+                yield 'suite', dict(elem.attrib)
+            else:
+                continue
+
+            elem.clear()
+            if stack:
+                stack[-1].remove(elem)
+
+
+class JUnitMerger:
+    """
+    Merges JUnit XML shards into one run per shard group.
+
+    Files of the same group (xdist workers or CI nodes writing junit-<n>.xml,
+    re-run jobs) become a single metrics entry 'junit_<group>'. A test found in
+    several shards counts once: a pass beats a failure (the re-run succeeded),
+    which beats a skip, and the extra attempts are added to its retries. The
+    run's duration is the wall-clock span of the shards' suites.
+    """
+
+    OUTCOME_RANK = {'skipped': 0, 'failed': 1, 'passed': 2}
+
+    def __init__(self):
+        self.groups: Dict[str, Dict[str, Any]] = {}
+
+    @staticmethod
+    def _suite_span(attrs: Dict[str, str]) -> Optional[Tuple[datetime, datetime]]:
+        timestamp = attrs.get('timestamp')
+        if not timestamp:
+            return None
+        try:
+            start = datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
+        except ValueError:
+            return None
+        if start.tzinfo is not None:
+            start = start.astimezone().replace(tzinfo=None)
+        return start, start + timedelta(seconds=JUnitParser._seconds(attrs.get('time')))
+
+    def add_file(self, file_path: Path) -> str:
+        """Stream one JUnit XML file into its shard group; returns the group's metrics key."""
+        key = f"junit_{JUnitParser.shard_group(file_path)}"
+        logger.info(f"Parsing JUnit XML: {file_path} (into {key})")
+        group = self.groups.setdefault(key, {'results': {}, 'spans': [], 'suite_times': [], 'files': 0})
+        results: Dict[str, TestCaseResult] = group['results']
+        seen = set()  # Tests already found in this file
+
+        try:
+            for kind, value in JUnitParser.iter_junit(file_path, key):
+                if kind == 'suite':
+                    span = self._suite_span(value)
+                    if span:
+                        group['spans'].append(span)
+                    elif value.get('time'):
+                        group['suite_times'].append(JUnitParser._seconds(value.get('time')))
+                    continue
+
+                previous = results.get(value.name)
+                repeated_in_file = value.name in seen
+                seen.add(value.name)
+                if previous is not None and repeated_in_file:
+                    # pytest writes a second testcase for an error in teardown after a failed call
+                    value.outcome = 'failed'
+                    value.error_message = previous.error_message or value.error_message
+                    value.retries = previous.retries
+                elif previous is not None:
+                    value.retries += previous.retries + 1
+                    if self.OUTCOME_RANK[previous.outcome] > self.OUTCOME_RANK[value.outcome]:
+                        previous.retries = value.retries
+                        continue
+                    del results[value.name]  # Keep the record in order of its latest attempt
+                results[value.name] = value
+            group['files'] += 1
+        except ET.ParseError as e:
+            logger.error(f"Failed to parse JUnit XML {file_path}: {e}")
+
+        return key
+
+    def metrics(self, key: str) -> TestMetrics:
+        """Merged metrics of one shard group."""
+        group = self.groups.get(key)
+        if not group or not group['results']:
+            return TestMetrics()
+
+        counts = {'passed': 0, 'failed': 0, 'skipped': 0}
+        test_seconds = 0.0
+        for result in group['results'].values():
+            counts[result.outcome] += 1
+            test_seconds += result.duration_seconds
+
+        if group['spans']:
+            duration_seconds = (max(end for _, end in group['spans']) -
+                                min(start for start, _ in group['spans'])).total_seconds()
+        elif group['suite_times']:
+            duration_seconds = max(group['suite_times'])  # Shards run side by side
+        else:
+            duration_seconds = test_seconds
+
+        total = sum(counts.values())
+        return TestMetrics(
+            total_tests=total,
+            passed_tests=counts['passed'],
+            failed_tests=counts['failed'],
+            skipped_tests=counts['skipped'],
+            duration_seconds=duration_seconds,
+            success_rate=counts['passed'] / total * 100
+        )
+
+    def results(self) -> List[TestCaseResult]:
+        """Merged per-test records of every group."""
+        return [result for group in self.groups.values() for result in group['results'].values()]
+
+
 class NewmanHTMLParser:
     """Parser for Newman HTML reports."""
 
@@ -258,53 +599,395 @@ class NewmanHTMLParser:
             return TestMetrics()
 
 
+class LatencyAnalyzer:
+    """Grouped latency percentiles over many samples (numpy-vectorised when available)."""
+
+    PERCENTILES = (50, 90, 99)
+
+    @staticmethod
+    def _percentile(sorted_values: List[float], q: float) -> float:
+        """Linear-interpolation percentile of a sorted list (same as numpy's default)."""
+        position = (len(sorted_values) - 1) * q / 100
+        lower = int(position)
+        upper = min(lower + 1, len(sorted_values) - 1)
+        return sorted_values[lower] + (sorted_values[upper] - sorted_values[lower]) * (position - lower)
+
+    @staticmethod
+    def summarize(kind: str, source: str, keys: List[str], times_ms: List[float],
+                  sizes: List[float], failures: List[int]) -> List[EndpointStats]:
+        """One EndpointStats per distinct key, in order of first appearance."""
+        key_index: Dict[str, int] = {}
+        group_ids = [key_index.setdefault(key, len(key_index)) for key in keys]
+        group_count = len(key_index)
+        if not group_count:
+            return []
+
+        if np is not None:
+            ids = np.asarray(group_ids, dtype=np.int64)
+            times = np.asarray(times_ms, dtype=np.float64)
+            counts = np.bincount(ids, minlength=group_count)
+            time_sums = np.bincount(ids, weights=times, minlength=group_count)
+            size_sums = np.bincount(ids, weights=np.asarray(sizes, dtype=np.float64), minlength=group_count)
+            failure_sums = np.bincount(ids, weights=np.asarray(failures, dtype=np.float64), minlength=group_count)
+
+            # Sort by (group, time) once; each group's samples are then a contiguous run
+            sorted_times = times[np.lexsort((times, ids))]
+            starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+            percentiles = {}
+            for q in LatencyAnalyzer.PERCENTILES:
+                position = starts + (counts - 1) * q / 100
+                lower = np.floor(position).astype(np.int64)
+                upper = np.minimum(lower + 1, starts + counts - 1)
+                percentiles[q] = sorted_times[lower] + (sorted_times[upper] - sorted_times[lower]) * (position - lower)
+            maxima = sorted_times[starts + counts - 1]
+
+            columns = zip(counts.tolist(), percentiles[50].tolist(), percentiles[90].tolist(), percentiles[99].tolist(),
+                          (time_sums / counts).tolist(), maxima.tolist(), (size_sums / counts).tolist(),
+                          size_sums.tolist(), failure_sums.tolist())
+        else:
+            grouped_times: List[List[float]] = [[] for _ in range(group_count)]
+            size_sums = [0.0] * group_count
+            failure_sums = [0] * group_count
+            for group_id, time_ms, size, failure in zip(group_ids, times_ms, sizes, failures):
+                grouped_times[group_id].append(time_ms)
+                size_sums[group_id] += size
+                failure_sums[group_id] += failure
+
+            columns = []
+            for group_id, values in enumerate(grouped_times):
+                values.sort()
+                count = len(values)
+                columns.append((count, *(LatencyAnalyzer._percentile(values, q) for q in LatencyAnalyzer.PERCENTILES),
+                                sum(values) / count, values[-1], size_sums[group_id] / count,
+                                size_sums[group_id], failure_sums[group_id]))
+
+        return [
+            EndpointStats(
+                name=key, kind=kind, source=source, count=int(count),
+                p50_ms=round(p50, 3), p90_ms=round(p90, 3), p99_ms=round(p99, 3),
+                mean_ms=round(mean, 3), max_ms=round(maximum, 3),
+                mean_size_bytes=round(mean_size, 1), total_size_bytes=int(total_size), failures=int(failure_count)
+            )
+            for key, (count, p50, p90, p99, mean, maximum, mean_size, total_size, failure_count)
+            in zip(key_index, columns)
+        ]
+
+
+class NewmanJSONParser:
+    """Parser for Newman JSON reporter output (--reporters json)."""
+
+    @staticmethod
+    def _folder_paths(items: List[Dict[str, Any]], parents: Tuple[str, ...] = ()) -> Dict[str, Tuple[str, ...]]:
+        """Map every request id in a collection to its folder path."""
+        paths = {}
+        for item in items or []:
+            if 'item' in item:
+                paths.update(NewmanJSONParser._folder_paths(item['item'], parents + (item.get('name', ''),)))
+            elif item.get('id'):
+                paths[item['id']] = parents
+        return paths
+
+    @staticmethod
+    def parse_newman_json(file_path: Path,
+                          on_result: Optional[Callable[[TestCaseResult], None]] = None,
+                          on_endpoint: Optional[Callable[[EndpointStats], None]] = None) -> TestMetrics:
+        """
+        Parse a Newman JSON report: run stats, per-request records and latency statistics.
+
+        Per-test records (one per request execution) go to on_result; per-request
+        and per-folder EndpointStats (p50/p90/p99, payload sizes, assertion
+        failures) go to on_endpoint.
+        """
+        logger.info(f"Parsing Newman JSON report: {file_path}")
+
+        try:
+            with open(file_path, 'rb') as f:
+                report = json.load(f)
+
+            run = report.get('run')
+            if not isinstance(run, dict):
+                logger.warning(f"No 'run' section in {file_path}, not a Newman JSON report")
+                return TestMetrics()
+
+            source = f"newman_{file_path.name}"
+            folder_paths = NewmanJSONParser._folder_paths(report.get('collection', {}).get('item', []))
+
+            request_keys, folder_keys, times, sizes, failures = [], [], [], [], []
+            for execution in run.get('executions', []):
+                item = execution.get('item', {})
+                folder = ' › '.join(folder_paths.get(item.get('id'), ()))
+                name = f"{folder} › {item.get('name', '')}" if folder else item.get('name', '')
+
+                failed_assertions = [a for a in execution.get('assertions', []) if a.get('error') and not a.get('skipped')]
+                request_error = execution.get('requestError')
+                response = execution.get('response') or {}
+
+                if on_result:
+                    error_message = None
+                    if request_error:
+                        error_message = str(request_error.get('message', request_error))
+                    elif failed_assertions:
+                        first = failed_assertions[0]
+                        error_message = f"{first.get('assertion', '')}: {first['error'].get('message', '')}"
+                    on_result(TestCaseResult(
+                        name=name,
+                        outcome='failed' if failed_assertions or request_error else 'passed',
+                        duration_seconds=(response.get('responseTime') or 0) / 1000,
+                        error_message=error_message,
+                        source=source
+                    ))
+
+                # Executions without a response (connection errors) have no latency to measure
+                if 'responseTime' not in response:
+                    continue
+
+                method = (execution.get('request') or {}).get('method', '')
+                request_keys.append(f"{method} {name}".strip())
+                folder_keys.append(folder or '(root)')
+                times.append(float(response.get('responseTime') or 0))
+                size = response.get('responseSize')
+                if size is None:
+                    size = len((response.get('stream') or {}).get('data', []))
+                sizes.append(float(size))
+                failures.append(len(failed_assertions))
+
+            if on_endpoint:
+                for stats in LatencyAnalyzer.summarize('request', source, request_keys, times, sizes, failures):
+                    on_endpoint(stats)
+                for stats in LatencyAnalyzer.summarize('folder', source, folder_keys, times, sizes, failures):
+                    on_endpoint(stats)
+
+            # Newman counts assertions as its tests
+            assertions = run.get('stats', {}).get('assertions', {})
+            total = assertions.get('total', 0)
+            failed = assertions.get('failed', 0)
+            skipped = assertions.get('pending', 0)
+            passed = max(total - failed - skipped, 0)
+
+            timings = run.get('timings', {})
+            duration_seconds = 0.0
+            if timings.get('started') and timings.get('completed'):
+                duration_seconds = (timings['completed'] - timings['started']) / 1000
+            average_response_time_ms = timings.get('responseAverage') or (sum(times) / len(times) if times else 0.0)
+
+            metrics = TestMetrics(
+                total_tests=total,
+                passed_tests=passed,
+                failed_tests=failed,
+                skipped_tests=skipped,
+                duration_seconds=duration_seconds,
+                success_rate=(passed / total * 100) if total > 0 else 0.0,
+                average_response_time_ms=average_response_time_ms
+            )
+            logger.info(f"Newman metrics: {len(times)} requests, {total} assertions, {failed} failed, "
+                        f"avg {average_response_time_ms:.1f}ms")
+            return metrics
+
+        except Exception as e:
+            logger.error(f"Error parsing Newman JSON report: {e}")
+            return TestMetrics()
+
+
 class PlaywrightHTMLParser:
-    """Parser for Playwright HTML reports."""
+    """Parser for Playwright HTML reports and JSON reporter output."""
+
+    REPORT_MARKER = b'window.playwrightReportBase64'
+    REPORT_ASSIGNMENT = re.compile(rb'\s*=\s*["\']')
+    ANSI_ESCAPE = re.compile(r'\x1b\[[0-9;]*m')
+
+    # Playwright test outcomes; flaky tests passed on a retry
+    OUTCOMES = {'expected': 'passed', 'flaky': 'passed', 'unexpected': 'failed', 'skipped': 'skipped'}
 
     @staticmethod
-    def parse_playwright_html(file_path: Path) -> TestMetrics:
-        """Parse Playwright HTML report and extract metrics."""
+    def extract_report_data(content: bytes) -> Optional[Dict[str, Any]]:
+        """
+        Decode the report data embedded in an HTML report, straight from bytes.
+
+        Current reports embed a base64 zip (report.json plus one <fileId>.json
+        with full results per test file); older ones embed base64 JSON.
+        """
+        marker = content.find(PlaywrightHTMLParser.REPORT_MARKER)
+        if marker < 0:
+            return None
+        assignment = PlaywrightHTMLParser.REPORT_ASSIGNMENT.match(content, marker + len(PlaywrightHTMLParser.REPORT_MARKER))
+        if not assignment:
+            return None
+
+        quote = content[assignment.end() - 1:assignment.end()]
+        payload = content[assignment.end():content.find(quote, assignment.end())]
+        if payload.startswith(b'data:'):
+            payload = payload.split(b',', 1)[1]
+        raw = base64.b64decode(payload)
+
+        if not raw.startswith(b'PK'):
+            return json.loads(raw)
+
+        with zipfile.ZipFile(io.BytesIO(raw)) as archive:
+            report = json.loads(archive.read('report.json'))
+            names = set(archive.namelist())
+            for file_entry in report.get('files', []):
+                detail_name = f"{file_entry.get('fileId')}.json"
+                if detail_name in names:
+                    file_entry['tests'] = json.loads(archive.read(detail_name)).get('tests', file_entry.get('tests', []))
+        return report
+
+    @staticmethod
+    def _metrics_from_stats(stats: Dict[str, Any], duration_ms: float) -> TestMetrics:
+        passed = stats.get('expected', 0) + stats.get('flaky', 0)
+        failed = stats.get('unexpected', 0)
+        skipped = stats.get('skipped', 0)
+        total = stats.get('total') or passed + failed + skipped
+
+        return TestMetrics(
+            total_tests=total,
+            passed_tests=passed,
+            failed_tests=failed,
+            skipped_tests=skipped,
+            duration_seconds=(duration_ms or 0) / 1000,  # Convert ms to seconds
+            success_rate=(passed / total * 100) if total > 0 else 0.0
+        )
+
+    @staticmethod
+    def _steps(steps: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Step titles and durations (nested steps kept under 'steps')."""
+        result = []
+        for step in steps or []:
+            entry = {'title': step.get('title', ''), 'duration_seconds': max(step.get('duration', 0), 0) / 1000}
+            if step.get('steps'):
+                entry['steps'] = PlaywrightHTMLParser._steps(step['steps'])
+            result.append(entry)
+        return result
+
+    @staticmethod
+    def _error_message(result: Dict[str, Any]) -> Optional[str]:
+        errors = result.get('errors') or ([result['error']] if result.get('error') else [])
+        for error in errors:
+            message = error.get('message') if isinstance(error, dict) else error
+            if message:
+                return PlaywrightHTMLParser.ANSI_ESCAPE.sub('', message).strip()[:TRXParser.MAX_ERROR_LENGTH]
+        return None
+
+    @staticmethod
+    def _test_result(title_path: List[str], project: str, outcome: str,
+                     results: List[Dict[str, Any]], source: str) -> TestCaseResult:
+        """Build a per-test record from a test's attempts (one per retry)."""
+        name = ' › '.join(part for part in title_path if part)
+        if project:
+            name = f"[{project}] › {name}"
+
+        final = results[-1] if results else {}
+        error_message = None
+        for result in reversed(results):
+            error_message = PlaywrightHTMLParser._error_message(result)
+            if error_message:
+                break
+
+        attachments = [
+            {
+                'name': attachment.get('name', ''),
+                'content_type': attachment.get('contentType', ''),
+                'path': attachment.get('path'),
+                'retry': result.get('retry', index)
+            }
+            for index, result in enumerate(results)
+            for attachment in result.get('attachments', [])
+        ]
+
+        return TestCaseResult(
+            name=name,
+            outcome=PlaywrightHTMLParser.OUTCOMES.get(outcome, 'failed' if outcome else 'skipped'),
+            duration_seconds=sum(max(result.get('duration', 0), 0) for result in results) / 1000,
+            error_message=error_message,
+            source=source,
+            retries=max(len(results) - 1, 0),
+            steps=PlaywrightHTMLParser._steps(final.get('steps')),
+            attachments=attachments
+        )
+
+    @staticmethod
+    def iter_html_report_results(report: Dict[str, Any], source: str) -> Iterator[TestCaseResult]:
+        """Per-test records of decoded HTML report data."""
+        for file_entry in report.get('files', []):
+            file_name = file_entry.get('fileName', '')
+            for test in file_entry.get('tests', []):
+                yield PlaywrightHTMLParser._test_result(
+                    [file_name, *test.get('path', []), test.get('title', '')],
+                    test.get('projectName', ''),
+                    test.get('outcome', ''),
+                    test.get('results', []),
+                    source
+                )
+
+    @staticmethod
+    def iter_json_report_results(report: Dict[str, Any], source: str) -> Iterator[TestCaseResult]:
+        """Per-test records of JSON reporter output (suites -> specs -> tests)."""
+        stack = [(suite, [suite.get('title', '')]) for suite in reversed(report.get('suites', []))]
+        while stack:
+            suite, titles = stack.pop()
+            for spec in suite.get('specs', []):
+                for test in spec.get('tests', []):
+                    yield PlaywrightHTMLParser._test_result(
+                        titles + [spec.get('title', '')],
+                        test.get('projectName', ''),
+                        test.get('status', ''),
+                        test.get('results', []),
+                        source
+                    )
+            stack.extend((child, titles + [child.get('title', '')]) for child in reversed(suite.get('suites', [])))
+
+    @staticmethod
+    def parse_playwright_json(file_path: Path,
+                              on_result: Optional[Callable[[TestCaseResult], None]] = None) -> TestMetrics:
+        """Parse Playwright JSON reporter output (--reporter=json)."""
+        logger.info(f"Parsing Playwright JSON report: {file_path}")
+
+        try:
+            with open(file_path, 'rb') as f:
+                report = json.load(f)
+
+            if on_result:
+                for result in PlaywrightHTMLParser.iter_json_report_results(report, f"playwright_{file_path.name}"):
+                    on_result(result)
+
+            stats = report.get('stats', {})
+            metrics = PlaywrightHTMLParser._metrics_from_stats(stats, stats.get('duration', 0))
+            logger.info(f"Playwright metrics: {metrics.total_tests} total, {metrics.passed_tests} passed, {metrics.failed_tests} failed")
+            return metrics
+
+        except Exception as e:
+            logger.error(f"Error parsing Playwright JSON report: {e}")
+            return TestMetrics()
+
+    @staticmethod
+    def parse_playwright_html(file_path: Path,
+                              on_result: Optional[Callable[[TestCaseResult], None]] = None) -> TestMetrics:
+        """Parse Playwright HTML report and extract metrics (per-test records go to on_result)."""
         logger.info(f"Parsing Playwright HTML report: {file_path}")
 
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
+            with open(file_path, 'rb') as f:
+                raw_content = f.read()
+
+            # Fast path: decode the embedded report data without building a DOM
+            try:
+                report_data = PlaywrightHTMLParser.extract_report_data(raw_content)
+            except Exception as e:
+                logger.warning(f"Failed to parse embedded Playwright data: {e}")
+                report_data = None
 
+            if report_data is not None:
+                if on_result:
+                    for result in PlaywrightHTMLParser.iter_html_report_results(report_data, f"playwright_{file_path.name}"):
+                        on_result(result)
+
+                metrics = PlaywrightHTMLParser._metrics_from_stats(report_data.get('stats', {}), report_data.get('duration', 0))
+                logger.info(f"Playwright metrics: {metrics.total_tests} total, {metrics.passed_tests} passed, {metrics.failed_tests} failed")
+                return metrics
+
+            content = raw_content.decode('utf-8', errors='replace')
             soup = BeautifulSoup(content, 'html.parser')
             metrics = TestMetrics()
 
-            # Look for Playwright-specific elements
-            # Check for JSON data embedded in script tags
-            script_tags = soup.find_all('script')
-            for script in script_tags:
-                if script.string and 'window.playwrightReportBase64' in script.string:
-                    try:
-                        # Extract base64 data and decode
-                        import base64
-                        match = re.search(r'window\.playwrightReportBase64\s*=\s*["\']([^"\']+)["\']', script.string)
-                        if match:
-                            report_data = json.loads(base64.b64decode(match.group(1)).decode('utf-8'))
-
-                            # Extract stats from report data
-                            if 'stats' in report_data:
-                                stats = report_data['stats']
-                                metrics.total_tests = stats.get('total', 0)
-                                metrics.passed_tests = stats.get('expected', 0)
-                                metrics.failed_tests = stats.get('unexpected', 0)
-                                metrics.skipped_tests = stats.get('skipped', 0)
-
-                                if metrics.total_tests > 0:
-                                    metrics.success_rate = metrics.passed_tests / metrics.total_tests * 100
-
-                            # Extract duration
-                            if 'duration' in report_data:
-                                metrics.duration_seconds = report_data['duration'] / 1000  # Convert ms to seconds
-
-                            return metrics
-                    except Exception as e:
-                        logger.warning(f"Failed to parse embedded Playwright data: {e}")
-                        continue
-
             # Fallback: Parse HTML structure
             # Look for test result summaries in HTML
             summary_elements = [
@@ -363,31 +1046,482 @@ class PlaywrightHTMLParser:
             return TestMetrics()
 
 
+class HARReader:
+    """
+    Incremental HAR reader: yields log.entries one at a time.
+
+    The document is decoded member by member with JSONDecoder.raw_decode over a
+    sliding buffer, so memory is bounded by the read chunk plus the largest
+    single entry instead of the whole recording (HARs with embedded response
+    bodies run to hundreds of MB).
+    """
+
+    CHUNK_SIZE = 1024 * 1024
+    WHITESPACE = re.compile(r'[ \t\n\r]*')
+
+    def __init__(self, stream):
+        self._stream = stream
+        self._decoder = json.JSONDecoder()
+        self._buffer = ''
+        self._pos = 0
+        self._eof = False
+        self.version: Optional[str] = None
+        self.pages: List[Dict[str, Any]] = []
+        self.entry_count = 0
+
+    def _fill(self, size: int) -> bool:
+        """Append the next chunk, dropping the consumed prefix of the buffer."""
+        if self._eof:
+            return False
+        chunk = self._stream.read(size)
+        if not chunk:
+            self._eof = True
+            return False
+        self._buffer = self._buffer[self._pos:] + chunk
+        self._pos = 0
+        return True
+
+    def _peek(self) -> str:
+        """Next non-whitespace character ('' at end of file)."""
+        while True:
+            self._pos = self.WHITESPACE.match(self._buffer, self._pos).end()
+            if self._pos < len(self._buffer):
+                return self._buffer[self._pos]
+            if not self._fill(self.CHUNK_SIZE):
+                return ''
+
+    def _expect(self, char: str) -> None:
+        found = self._peek()
+        if found != char:
+            raise ValueError(f"Malformed HAR: expected {char!r}, found {found or 'end of file'!r}")
+        self._pos += 1
+
+    def _value(self) -> Any:
+        """Decode the JSON value at the cursor, reading more input until it is complete."""
+        self._peek()
+        read_size = self.CHUNK_SIZE
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._pos)
+                # A number ending exactly at the buffer end may continue in the next chunk
+                if end < len(self._buffer) or self._eof:
+                    self._pos = end
+                    return value
+            except json.JSONDecodeError:
+                if self._eof:
+                    raise
+            self._fill(read_size)
+            read_size *= 2  # Large values are re-decoded O(log n) times, not once per chunk
+
+    def _members(self) -> Iterator[str]:
+        """Keys of the object at the cursor; the caller consumes each value before resuming."""
+        self._expect('{')
+        if self._peek() == '}':
+            self._pos += 1
+            return
+        while True:
+            key = self._value()
+            self._expect(':')
+            yield key
+            separator = self._peek()
+            self._pos += 1
+            if separator == '}':
+                return
+            if separator != ',':
+                raise ValueError(f"Malformed HAR: expected ',' or '}}', found {separator or 'end of file'!r}")
+
+    def _items(self) -> Iterator[Any]:
+        """Elements of the array at the cursor."""
+        self._expect('[')
+        if self._peek() == ']':
+            self._pos += 1
+            return
+        while True:
+            yield self._value()
+            separator = self._peek()
+            self._pos += 1
+            if separator == ']':
+                return
+            if separator != ',':
+                raise ValueError(f"Malformed HAR: expected ',' or ']', found {separator or 'end of file'!r}")
+
+    def entries(self) -> Iterator[Dict[str, Any]]:
+        """Stream log.entries; version and pages are recorded as they are passed."""
+        for key in self._members():
+            if key != 'log':
+                self._value()
+                continue
+            for log_key in self._members():
+                if log_key == 'entries':
+                    for entry in self._items():
+                        self.entry_count += 1
+                        yield entry
+                    continue
+                value = self._value()
+                if log_key == 'version':
+                    self.version = value
+                elif log_key == 'pages' and isinstance(value, list):
+                    self.pages = value
+
+
+class HARAnalyzer:
+    """
+    Backend performance profile from HAR recordings.
+
+    Requests are grouped per endpoint (method, host and path with ids folded to
+    {id}; static assets per extension) for latency percentiles, mean timing
+    phases and cache status, and the slowest requests of each recording (one
+    HAR per test or module) are kept for the summary.
+    """
+
+    # HAR timing phases: wait is time to first byte, receive is the download; ssl is included in connect
+    PHASES = ('blocked', 'dns', 'connect', 'ssl', 'send', 'wait', 'receive')
+    SLOWEST_PER_TEST = 5
+    MAX_URL_LENGTH = 500
+
+    STATIC_PATH = re.compile(r'\.(js|mjs|css|map|woff2?|ttf|otf|eot|png|jpe?g|gif|svg|ico|webp)$', re.IGNORECASE)
+    ID_SEGMENT = re.compile(
+        r'^(?:\d+|[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}|[0-9a-f]{16,}|[A-Za-z0-9_-]{32,})$',
+        re.IGNORECASE
+    )
+    CACHE_HEADERS = ('x-cache', 'x-cache-status', 'cf-cache-status')
+
+    def __init__(self):
+        self.keys: List[str] = []
+        self.times: List[float] = []
+        self.sizes: List[float] = []
+        self.failures: List[int] = []
+        self.phase_totals: Dict[str, List[float]] = {}
+        self.cache_counts: Dict[str, Dict[str, int]] = {}
+        self.slowest: Dict[str, List[Tuple[float, int, Dict[str, Any]]]] = {}
+        self.har_files = 0
+        self._sequence = 0
+
+    @staticmethod
+    def endpoint_key(method: str, url: str) -> str:
+        """'GET host/userapi/v3/documents/{id}' (query dropped); static assets as 'GET host/*.js'."""
+        parts = urlsplit(url)
+        path = parts.path or '/'
+        static = HARAnalyzer.STATIC_PATH.search(path)
+        if static:
+            return f"{method} {parts.netloc}/*.{static.group(1).lower()}"
+        segments = ['{id}' if HARAnalyzer.ID_SEGMENT.match(segment) else segment for segment in path.split('/')]
+        return f"{method} {parts.netloc}{'/'.join(segments)}"
+
+    @staticmethod
+    def cache_status(entry: Dict[str, Any]) -> str:
+        """'hit' (browser or CDN cache), 'revalidated' (304) or 'miss'."""
+        response = entry.get('response') or {}
+        if entry.get('_fromCache') or (entry.get('cache') or {}).get('beforeRequest'):
+            return 'hit'
+        if response.get('status') == 304:
+            return 'revalidated'
+        for header in response.get('headers') or []:
+            if str(header.get('name', '')).lower() in HARAnalyzer.CACHE_HEADERS:
+                if 'HIT' in str(header.get('value', '')).upper():
+                    return 'hit'
+        return 'miss'
+
+    def add_entry(self, test: str, entry: Dict[str, Any]) -> None:
+        """Record one HAR entry of a test's recording."""
+        request = entry.get('request') or {}
+        response = entry.get('response') or {}
+        timings = entry.get('timings') or {}
+
+        # -1 marks a phase that does not apply (e.g. dns/connect on a reused connection)
+        phases = [max(float(timings.get(phase) or 0), 0.0) for phase in self.PHASES]
+        total = entry.get('time')
+        if total is None or total < 0:
+            total = sum(value for phase, value in zip(self.PHASES, phases) if phase != 'ssl')
+        total = float(total)
+
+        size = response.get('bodySize')
+        if size is None or size < 0:
+            size = (response.get('content') or {}).get('size') or 0
+        size = max(float(size), 0.0)
+
+        status = int(response.get('status') or 0)
+        method = request.get('method', 'GET')
+        url = request.get('url', '')
+        key = self.endpoint_key(method, url)
+        cache = self.cache_status(entry)
+
+        self.keys.append(key)
+        self.times.append(total)
+        self.sizes.append(size)
+        self.failures.append(1 if status <= 0 or status >= 400 else 0)
+
+        sums = self.phase_totals.setdefault(key, [0.0] * len(self.PHASES))
+        for index, value in enumerate(phases):
+            sums[index] += value
+        counts = self.cache_counts.setdefault(key, {})
+        counts[cache] = counts.get(cache, 0) + 1
+
+        heap = self.slowest.setdefault(test, [])
+        if len(heap) < self.SLOWEST_PER_TEST or total > heap[0][0]:
+            self._sequence += 1
+            record = {
+                'endpoint': key,
+                'method': method,
+                'url': url[:self.MAX_URL_LENGTH],
+                'status': status,
+                'started': entry.get('startedDateTime'),
+                'time_ms': round(total, 3),
+                'phases_ms': {phase: round(value, 3) for phase, value in zip(self.PHASES, phases)},
+                'size_bytes': int(size),
+                'cache': cache
+            }
+            if len(heap) < self.SLOWEST_PER_TEST:
+                heapq.heappush(heap, (total, self._sequence, record))
+            else:
+                heapq.heapreplace(heap, (total, self._sequence, record))
+
+    def analyze_har(self, file_path: Path) -> Dict[str, Any]:
+        """Stream one HAR file into the profile; returns its metadata (entry_count, version, pages)."""
+        logger.info(f"Analyzing HAR recording: {file_path}")
+        test = file_path.stem
+        reader = None
+        try:
+            with open(file_path, 'r', encoding='utf-8', errors='replace') as f:
+                reader = HARReader(f)
+                for entry in reader.entries():
+                    if isinstance(entry, dict):
+                        self.add_entry(test, entry)
+            self.har_files += 1
+        except (OSError, ValueError) as e:
+            logger.error(f"Error analyzing HAR recording {file_path}: {e}")
+
+        if reader is None:
+            return {}
+        logger.info(f"HAR {file_path.name}: {reader.entry_count} requests")
+        return {'entry_count': reader.entry_count, 'version': reader.version or 'unknown', 'pages': len(reader.pages)}
+
+    def endpoint_stats(self) -> List[EndpointStats]:
+        """Per-endpoint latency percentiles with mean phases and cache status counts."""
+        stats = LatencyAnalyzer.summarize('har', 'har', self.keys, self.times, self.sizes, self.failures)
+        for endpoint in stats:
+            endpoint.phases_ms = {phase: round(total / endpoint.count, 3)
+                                  for phase, total in zip(self.PHASES, self.phase_totals[endpoint.name])}
+            endpoint.cache = dict(self.cache_counts[endpoint.name])
+        return stats
+
+    def profile(self) -> Dict[str, Any]:
+        """Run-wide profile: phase means, cache status totals and the slowest requests per test."""
+        requests_seen = len(self.times)
+        phase_sums = [0.0] * len(self.PHASES)
+        for sums in self.phase_totals.values():
+            for index, value in enumerate(sums):
+                phase_sums[index] += value
+        cache_totals: Dict[str, int] = {}
+        for counts in self.cache_counts.values():
+            for status, count in counts.items():
+                cache_totals[status] = cache_totals.get(status, 0) + count
+
+        return {
+            'har_files': self.har_files,
+            'requests': requests_seen,
+            'endpoints': len(self.phase_totals),
+            'phases_ms': {phase: round(total / requests_seen, 3) if requests_seen else 0.0
+                          for phase, total in zip(self.PHASES, phase_sums)},
+            'cache': cache_totals,
+            'slowest_by_test': {
+                test: [record for _, _, record in sorted(heap, key=lambda item: (-item[0], item[1]))]
+                for test, heap in sorted(self.slowest.items())
+            }
+        }
+
+
+class ChecksumCache:
+    """Persistent SHA-256 cache keyed by (path, size, mtime_ns)."""
+
+    DEFAULT_PATH = Path('.report_aggregator_cache') / 'checksums.json'
+
+    def __init__(self, cache_path: Path):
+        """Load cached checksums from disk (an unreadable cache starts empty)."""
+        self.cache_path = Path(cache_path)
+        self._lock = threading.Lock()
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self._dirty = False
+        self.hits = 0
+        self.misses = 0
+
+        try:
+            with open(self.cache_path, 'r', encoding='utf-8') as f:
+                self._entries = json.load(f).get('entries', {})
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable checksum cache {self.cache_path}: {e}")
+
+    @staticmethod
+    def _key(file_path: Path) -> str:
+        return str(Path(file_path).resolve())
+
+    def get(self, file_path: Path, stat: os.stat_result) -> Optional[str]:
+        """Cached checksum if the file's size and mtime are unchanged."""
+        with self._lock:
+            entry = self._entries.get(self._key(file_path))
+            if entry and entry['size'] == stat.st_size and entry['mtime_ns'] == stat.st_mtime_ns:
+                self.hits += 1
+                return entry['sha256']
+            self.misses += 1
+            return None
+
+    def put(self, file_path: Path, stat: os.stat_result, checksum: str) -> None:
+        """Remember a checksum for the file's current size and mtime."""
+        with self._lock:
+            self._entries[self._key(file_path)] = {
+                'size': stat.st_size,
+                'mtime_ns': stat.st_mtime_ns,
+                'sha256': checksum
+            }
+            self._dirty = True
+
+    def save(self) -> None:
+        """Write the cache atomically (no-op if nothing changed)."""
+        with self._lock:
+            if not self._dirty:
+                return
+            try:
+                self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+                tmp_path = self.cache_path.with_suffix(f'.{os.getpid()}.tmp')
+                with open(tmp_path, 'w', encoding='utf-8') as f:
+                    json.dump({'version': 1, 'entries': self._entries}, f)
+                os.replace(tmp_path, self.cache_path)
+                self._dirty = False
+            except Exception as e:
+                logger.warning(f"Failed to save checksum cache {self.cache_path}: {e}")
+
+
 class ArtifactManager:
     """Manages test artifacts and generates checksums."""
 
+    # hashlib releases the GIL for large updates, so threads hash in parallel
+    HASH_BUFFER_SIZE = 1024 * 1024
+    MMAP_THRESHOLD = 16 * 1024 * 1024
+    MAX_HASH_WORKERS = min(8, (os.cpu_count() or 2) * 2)
+
+    # Never descended into while scanning the workspace
+    EXCLUDED_DIRS = frozenset({'node_modules', '.git', '__pycache__', '.report_aggregator_cache'})
+
     @staticmethod
-    def scan_artifacts(directory: Path, patterns: List[str]) -> List[ArtifactInfo]:
-        """Scan directory for artifacts matching patterns."""
-        artifacts = []
+    def compile_patterns(patterns: List[str]) -> "re.Pattern[str]":
+        """
+        Combine glob patterns into one regex over workspace-relative POSIX paths.
 
+        Matches like directory.rglob(pattern): the pattern may start at any
+        depth, '**' spans zero or more directories, '*' and '?' stay within
+        one path segment.
+        """
+        alternatives = []
         for pattern in patterns:
-            for file_path in directory.rglob(pattern):
-                if file_path.is_file():
-                    artifact = ArtifactManager._create_artifact_info(file_path)
+            segments = pattern.strip('/').split('/')
+            regex = ''
+            for index, segment in enumerate(segments):
+                last = index == len(segments) - 1
+                if segment == '**':
+                    regex += '(?:[^/]+/)*[^/]+' if last else '(?:[^/]+/)*'
+                    continue
+                regex += re.escape(segment).replace(r'\*', '[^/]*').replace(r'\?', '[^/]')
+                if not last:
+                    regex += '/'
+            alternatives.append(regex)
+        return re.compile(r'^(?:[^/]+/)*(?:' + '|'.join(alternatives) + r')$')
+
+    @staticmethod
+    def walk_workspace(directory: Path, patterns: List[str],
+                       excluded_dirs: Optional[set] = None) -> Iterator[Tuple[Path, os.stat_result]]:
+        """Yield (path, stat) of files matching any pattern in one os.scandir walk, each file once."""
+        matcher = ArtifactManager.compile_patterns(patterns)
+        excluded = ArtifactManager.EXCLUDED_DIRS if excluded_dirs is None else excluded_dirs
+        seen_files = set()
+        stack = [(str(directory), '')]
+
+        while stack:
+            dir_path, rel_dir = stack.pop()
+            try:
+                with os.scandir(dir_path) as entries:
+                    entries = sorted(entries, key=lambda entry: entry.name)
+            except OSError as e:
+                logger.warning(f"Cannot scan {dir_path}: {e}")
+                continue
+
+            subdirs = []
+            for entry in entries:
+                rel_path = f"{rel_dir}{entry.name}"
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in excluded:
+                            subdirs.append((entry.path, rel_path + '/'))
+                        continue
+                    if not matcher.match(rel_path) or not entry.is_file():
+                        continue
+                    stat = entry.stat()
+                except OSError as e:
+                    logger.warning(f"Cannot stat {entry.path}: {e}")
+                    continue
+
+                # DirEntry.stat() reports st_ino == st_dev == 0 on Windows: fall back to the resolved path
+                if stat.st_ino:
+                    identity = (stat.st_dev, stat.st_ino)
+                else:
+                    identity = os.path.normcase(os.path.realpath(entry.path))
+                if identity in seen_files:
+                    continue
+                seen_files.add(identity)
+                yield Path(entry.path), stat
+
+            # Depth-first, directories in name order
+            stack.extend(reversed(subdirs))
+
+    @staticmethod
+    def iter_artifacts(directory: Path, patterns: List[str],
+                       checksum_cache: Optional[ChecksumCache] = None,
+                       excluded_dirs: Optional[set] = None,
+                       max_workers: Optional[int] = None) -> Iterator[ArtifactInfo]:
+        """Stream ArtifactInfo records in discovery order while checksums run on a thread pool."""
+        workers = max_workers or ArtifactManager.MAX_HASH_WORKERS
+        pending = deque()
+
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            for file_path, stat in ArtifactManager.walk_workspace(directory, patterns, excluded_dirs):
+                pending.append(pool.submit(ArtifactManager._create_artifact_info, file_path, checksum_cache, stat))
+
+                # Hand over finished records early and keep the backlog bounded
+                while pending and (pending[0].done() or len(pending) > workers * 4):
+                    artifact = pending.popleft().result()
                     if artifact:
-                        artifacts.append(artifact)
+                        yield artifact
+
+            while pending:
+                artifact = pending.popleft().result()
+                if artifact:
+                    yield artifact
 
-        return artifacts
+        if checksum_cache:
+            logger.info(f"Checksums: {checksum_cache.misses} hashed, {checksum_cache.hits} reused from cache")
+            checksum_cache.save()
 
     @staticmethod
-    def _create_artifact_info(file_path: Path) -> Optional[ArtifactInfo]:
-        """Create artifact info with checksum and metadata."""
+    def scan_artifacts(directory: Path, patterns: List[str],
+                       checksum_cache: Optional[ChecksumCache] = None) -> List[ArtifactInfo]:
+        """Scan directory for artifacts matching patterns."""
+        return list(ArtifactManager.iter_artifacts(directory, patterns, checksum_cache))
+
+    @staticmethod
+    def _create_artifact_info(file_path: Path, checksum_cache: Optional[ChecksumCache] = None,
+                              stat: Optional[os.stat_result] = None) -> Optional[ArtifactInfo]:
+        """Create artifact info with checksum and metadata (stat as read by the workspace walk, if any)."""
         try:
-            stat = file_path.stat()
+            if stat is None:
+                stat = file_path.stat()
 
-            # Calculate file checksum
-            checksum = ArtifactManager._calculate_checksum(file_path)
+            # Calculate file checksum (unless cached for this size and mtime)
+            checksum = checksum_cache.get(file_path, stat) if checksum_cache else None
+            if checksum is None:
+                checksum = ArtifactManager._calculate_checksum(file_path)
+                if checksum_cache and checksum != "unknown":
+                    checksum_cache.put(file_path, stat, checksum)
 
             # Determine artifact type
             artifact_type = ArtifactManager._determine_artifact_type(file_path)
@@ -411,17 +1545,51 @@ class ArtifactManager:
 
     @staticmethod
     def _calculate_checksum(file_path: Path) -> str:
-        """Calculate SHA-256 checksum of file."""
+        """Calculate SHA-256 checksum of file (mmap for large files, 1 MB reads otherwise)."""
         sha256_hash = hashlib.sha256()
         try:
             with open(file_path, 'rb') as f:
-                for chunk in iter(lambda: f.read(4096), b""):
-                    sha256_hash.update(chunk)
+                size = os.fstat(f.fileno()).st_size
+                if size >= ArtifactManager.MMAP_THRESHOLD:
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                        sha256_hash.update(mapped)
+                else:
+                    buffer = bytearray(ArtifactManager.HASH_BUFFER_SIZE)
+                    view = memoryview(buffer)
+                    while True:
+                        read = f.readinto(buffer)
+                        if not read:
+                            break
+                        sha256_hash.update(view[:read])
             return sha256_hash.hexdigest()
         except Exception as e:
             logger.warning(f"Failed to calculate checksum for {file_path}: {e}")
             return "unknown"
 
+    @staticmethod
+    def _is_playwright_json(file_path: Path) -> bool:
+        """JSON reporter output starts with its "config" block (rootDir, projects, ...)."""
+        if 'playwright' in file_path.name.lower():
+            return True
+        try:
+            with open(file_path, 'rb') as f:
+                head = f.read(512)
+            return head.lstrip().startswith(b'{') and b'"config"' in head and (b'"configFile"' in head or b'"rootDir"' in head)
+        except OSError:
+            return False
+
+    @staticmethod
+    def _is_junit_xml(file_path: Path) -> bool:
+        """JUnit XML is named after JUnit (junit.xml, TEST-*.xml) or has a testsuite(s) root."""
+        if 'junit' in file_path.name.lower() or file_path.name.startswith('TEST-'):
+            return True
+        try:
+            with open(file_path, 'rb') as f:
+                head = f.read(512)
+            return b'<testsuites' in head or b'<testsuite ' in head
+        except OSError:
+            return False
+
     @staticmethod
     def _determine_artifact_type(file_path: Path) -> str:
         """Determine artifact type based on file extension and content."""
@@ -430,10 +1598,16 @@ class ArtifactManager:
 
         if suffix == '.trx':
             return 'trx'
+        elif suffix == '.xml' and ArtifactManager._is_junit_xml(file_path):
+            return 'junit'
         elif suffix == '.html' and 'newman' in name:
             return 'newman-html'
+        elif suffix == '.json' and 'newman' in name:
+            return 'newman-json'
         elif suffix == '.html' and 'playwright' in name:
             return 'playwright-html'
+        elif suffix == '.json' and ArtifactManager._is_playwright_json(file_path):
+            return 'playwright-json'
         elif suffix in ['.png', '.jpg', '.jpeg']:
             return 'screenshot'
         elif suffix in ['.mp4', '.webm', '.avi']:
@@ -465,7 +1639,7 @@ class ArtifactManager:
                 except Exception:
                     pass
 
-            elif artifact_type in ['newman-html', 'playwright-html', 'trx']:
+            elif artifact_type in ['newman-html', 'playwright-html', 'trx', 'junit']:
                 # Add parsing timestamp
                 metadata['parsed_at'] = datetime.now().isoformat()
 
@@ -473,16 +1647,7 @@ class ArtifactManager:
                 # Could add video duration, codec info etc.
                 metadata['type'] = 'test-recording'
 
-            elif artifact_type == 'har':
-                # Try to extract entry count from HAR file
-                try:
-                    with open(file_path, 'r', encoding='utf-8') as f:
-                        har_data = json.load(f)
-                        entries = har_data.get('log', {}).get('entries', [])
-                        metadata['entry_count'] = len(entries)
-                        metadata['version'] = har_data.get('log', {}).get('version', 'unknown')
-                except Exception:
-                    pass
+            # HAR entry_count/version are filled in by HARAnalyzer's single streaming pass
 
         except Exception as e:
             logger.debug(f"Failed to extract metadata for {file_path}: {e}")
@@ -491,12 +1656,32 @@ class ArtifactManager:
 
 
 class QAIntelligenceReporter:
-    """Integration with QA Intelligence backend API."""
-
-    def __init__(self, base_url: str, api_key: Optional[str] = None):
+    """
+    Integration with QA Intelligence backend API.
+
+    Every upload is first written to an on-disk spool as gzip-compressed JSON
+    parts (the run summary, then batches of per-test records), then sent
+    oldest-first within a time budget. Parts that cannot be delivered stay
+    spooled with exponential backoff and go out with the next report or
+    `--flush-spool`; parts the backend rejects (4xx) are moved aside, never
+    deleted.
+    """
+
+    ENDPOINT = '/api/v1/test-results'
+    DEFAULT_SPOOL_DIR = Path.home() / '.qa-intelligence' / 'spool'
+    BATCH_SIZE = 500
+    REQUEST_TIMEOUT = (5, 15)  # connect, read
+    FLUSH_BUDGET_SECONDS = 30.0
+    BACKOFF_BASE_SECONDS = 30
+    BACKOFF_MAX_SECONDS = 3600
+
+    def __init__(self, base_url: str, api_key: Optional[str] = None,
+                 spool_dir: Optional[Path] = None, batch_size: Optional[int] = None):
         """Initialize QA Intelligence reporter."""
         self.base_url = base_url.rstrip('/')
         self.api_key = api_key or os.getenv('QA_INTELLIGENCE_API_KEY')
+        self.spool_dir = Path(spool_dir or os.getenv('QA_INTELLIGENCE_SPOOL_DIR') or self.DEFAULT_SPOOL_DIR)
+        self.batch_size = batch_size or self.BATCH_SIZE
         self.session = requests.Session()
 
         if self.api_key:
@@ -504,45 +1689,592 @@ class QAIntelligenceReporter:
 
         self.session.headers.update({
             'Content-Type': 'application/json',
+            'Content-Encoding': 'gzip',
             'User-Agent': 'WeSign-ReportAggregator/2.0'
         })
 
-    def report_results(self, summary: ReportSummary) -> bool:
-        """Report test results to QA Intelligence backend."""
-        try:
-            endpoint = f"{self.base_url}/api/v1/test-results"
+    def build_payloads(self, summary: ReportSummary) -> List[Dict[str, Any]]:
+        """Split a summary into upload parts: the run summary, then batches of per-test records."""
+        test_results = [asdict(result) for result in summary.test_results]
+        batches = [test_results[i:i + self.batch_size] for i in range(0, len(test_results), self.batch_size)]
+        parts = 1 + len(batches)
+
+        payloads = [{
+            'run_id': summary.run_id,
+            'part': 1,
+            'parts': parts,
+            'environment': summary.environment,
+            'timestamp': summary.end_time.isoformat(),
+            'duration_seconds': summary.total_duration_seconds,
+            'scores': {
+                'build': summary.build_score,
+                'smoke': summary.smoke_score,
+                'api': summary.api_score,
+                'e2e': summary.e2e_score,
+                'overall': summary.overall_score
+            },
+            'metrics': {name: asdict(metrics) for name, metrics in summary.metrics.items()},
+            'endpoint_stats': [asdict(stats) for stats in summary.endpoint_stats],
+            'performance_profile': summary.performance_profile,
+            'test_result_count': len(test_results),
+            'artifact_count': len(summary.artifacts),
+            'jenkins_build_number': summary.jenkins_build_number,
+            'git_commit_hash': summary.git_commit_hash
+        }]
+
+        for index, batch in enumerate(batches, start=2):
+            payloads.append({'run_id': summary.run_id, 'part': index, 'parts': parts, 'test_results': batch})
+
+        return payloads
+
+    def spool(self, payloads: List[Dict[str, Any]]) -> List[Path]:
+        """Write upload parts to the spool (gzip JSON, atomically); returns their paths."""
+        self.spool_dir.mkdir(parents=True, exist_ok=True)
+        stamp = datetime.now().strftime('%Y%m%d%H%M%S%f')
+        paths = []
+        for payload in payloads:
+            run_id = re.sub(r'[^A-Za-z0-9_.-]+', '_', str(payload['run_id']))
+            path = self.spool_dir / f"{stamp}-{run_id}-{payload['part']:04d}.json.gz"
+            tmp_path = path.with_name(path.name + '.tmp')
+            with open(tmp_path, 'wb') as f:
+                f.write(gzip.compress(json.dumps(payload, default=str).encode('utf-8'), compresslevel=6))
+            os.replace(tmp_path, path)
+            paths.append(path)
+        return paths
+
+    def pending(self) -> List[Path]:
+        """Spooled parts waiting for upload, oldest first."""
+        if not self.spool_dir.exists():
+            return []
+        return sorted(self.spool_dir.glob('*.json.gz'))
 
-            payload = {
-                'run_id': summary.run_id,
-                'environment': summary.environment,
-                'timestamp': summary.end_time.isoformat(),
-                'duration_seconds': summary.total_duration_seconds,
-                'scores': {
-                    'build': summary.build_score,
-                    'smoke': summary.smoke_score,
-                    'api': summary.api_score,
-                    'e2e': summary.e2e_score,
-                    'overall': summary.overall_score
-                },
-                'metrics': {name: asdict(metrics) for name, metrics in summary.metrics.items()},
-                'artifact_count': len(summary.artifacts),
-                'jenkins_build_number': summary.jenkins_build_number,
-                'git_commit_hash': summary.git_commit_hash
-            }
+    @staticmethod
+    def _retry_state_path(path: Path) -> Path:
+        return path.with_name(path.name + '.retry')
 
-            response = self.session.post(endpoint, json=payload, timeout=30)
-            response.raise_for_status()
+    def _retry_state(self, path: Path) -> Dict[str, float]:
+        try:
+            with open(self._retry_state_path(path), 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {'attempts': 0, 'next_attempt_at': 0}
+
+    def _schedule_retry(self, path: Path, error: str) -> None:
+        state = self._retry_state(path)
+        state['attempts'] += 1
+        delay = min(self.BACKOFF_BASE_SECONDS * 2 ** (state['attempts'] - 1), self.BACKOFF_MAX_SECONDS)
+        state['next_attempt_at'] = datetime.now().timestamp() + delay
+        state['last_error'] = error
+        with open(self._retry_state_path(path), 'w', encoding='utf-8') as f:
+            json.dump(state, f)
+
+    def _send(self, path: Path) -> str:
+        """Upload one spooled part: 'sent', 'retry' or 'rejected'."""
+        try:
+            response = self.session.post(f"{self.base_url}{self.ENDPOINT}", data=path.read_bytes(),
+                                         timeout=self.REQUEST_TIMEOUT)
+        except requests.exceptions.RequestException as e:
+            self._schedule_retry(path, str(e))
+            return 'retry'
+
+        if response.status_code < 300:
+            return 'sent'
+        if 400 <= response.status_code < 500 and response.status_code not in (408, 429):
+            logger.error(f"QA Intelligence rejected {path.name}: {response.status_code} {response.text[:200]}")
+            return 'rejected'
+        self._schedule_retry(path, f"HTTP {response.status_code}")
+        return 'retry'
+
+    def flush_spool(self, force: bool = False, budget_seconds: Optional[float] = None) -> Dict[str, int]:
+        """
+        Send spooled parts oldest-first until the spool is empty or the time budget runs out.
 
-            logger.info(f"Successfully reported results to QA Intelligence: {response.status_code}")
-            return True
+        Parts still backing off are skipped unless force is set. A connection
+        failure stops the flush, since the backend is unreachable for the rest.
+        """
+        budget = self.FLUSH_BUDGET_SECONDS if budget_seconds is None else budget_seconds
+        deadline = datetime.now().timestamp() + budget
+        result = {'sent': 0, 'rejected': 0, 'pending': 0}
+
+        for path in self.pending():
+            now = datetime.now().timestamp()
+            if now > deadline or (not force and self._retry_state(path)['next_attempt_at'] > now):
+                result['pending'] += 1
+                continue
+
+            outcome = self._send(path)
+            if outcome == 'sent':
+                path.unlink()
+                self._retry_state_path(path).unlink(missing_ok=True)
+                result['sent'] += 1
+            elif outcome == 'rejected':
+                rejected_dir = self.spool_dir / 'rejected'
+                rejected_dir.mkdir(exist_ok=True)
+                os.replace(path, rejected_dir / path.name)
+                self._retry_state_path(path).unlink(missing_ok=True)
+                result['rejected'] += 1
+            else:
+                result['pending'] += 1
+                # Backend unreachable or failing - leave the rest for later
+                deadline = 0
 
-        except requests.exceptions.RequestException as e:
-            logger.error(f"Failed to report to QA Intelligence: {e}")
-            return False
+        logger.info(f"QA Intelligence spool: {result['sent']} sent, {result['pending']} pending, "
+                    f"{result['rejected']} rejected ({self.spool_dir})")
+        return result
+
+    def report_results(self, summary: ReportSummary) -> bool:
+        """Report test results to QA Intelligence backend (True once every part is delivered)."""
+        try:
+            paths = self.spool(self.build_payloads(summary))
         except Exception as e:
-            logger.error(f"Unexpected error reporting to QA Intelligence: {e}")
+            logger.error(f"Failed to spool QA Intelligence report: {e}")
             return False
 
+        self.flush_spool()
+        delivered = not any(path.exists() for path in paths)
+        if delivered:
+            logger.info(f"Successfully reported results to QA Intelligence ({len(paths)} parts)")
+        else:
+            logger.warning(f"QA Intelligence report for {summary.run_id} kept in spool for retry")
+        return delivered
+
+
+class ResultsWarehouse:
+    """
+    Embedded SQLite history of runs for trend queries and CI gates.
+
+    Each aggregated run is ingested once (re-ingesting a run id replaces it):
+    report metrics, per-test results and endpoint timings. Tests are keyed by
+    (kind, name), where kind is the report family ('trx', 'newman',
+    'playwright', 'junit'), so renamed or timestamped report files of later
+    builds still line up.
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS runs (
+            run_seq INTEGER PRIMARY KEY AUTOINCREMENT,
+            run_id TEXT NOT NULL UNIQUE,
+            build_number TEXT,
+            environment TEXT,
+            git_commit TEXT,
+            started_at TEXT,
+            finished_at TEXT,
+            duration_seconds REAL,
+            build_score REAL,
+            smoke_score REAL,
+            api_score REAL,
+            e2e_score REAL,
+            overall_score REAL,
+            ingested_at TEXT
+        );
+        CREATE TABLE IF NOT EXISTS report_metrics (
+            run_seq INTEGER NOT NULL REFERENCES runs(run_seq),
+            report TEXT NOT NULL,
+            total_tests INTEGER,
+            passed_tests INTEGER,
+            failed_tests INTEGER,
+            skipped_tests INTEGER,
+            duration_seconds REAL,
+            success_rate REAL,
+            average_response_time_ms REAL,
+            PRIMARY KEY (run_seq, report)
+        );
+        CREATE TABLE IF NOT EXISTS tests (
+            test_id INTEGER PRIMARY KEY,
+            kind TEXT NOT NULL,
+            name TEXT NOT NULL,
+            UNIQUE (kind, name)
+        );
+        CREATE TABLE IF NOT EXISTS test_results (
+            run_seq INTEGER NOT NULL REFERENCES runs(run_seq),
+            test_id INTEGER NOT NULL REFERENCES tests(test_id),
+            outcome TEXT NOT NULL,
+            duration_seconds REAL,
+            retries INTEGER,
+            error_message TEXT
+        );
+        CREATE INDEX IF NOT EXISTS idx_test_results_test_run ON test_results (test_id, run_seq);
+        CREATE INDEX IF NOT EXISTS idx_test_results_run ON test_results (run_seq);
+        CREATE TABLE IF NOT EXISTS endpoint_timings (
+            run_seq INTEGER NOT NULL REFERENCES runs(run_seq),
+            name TEXT NOT NULL,
+            kind TEXT NOT NULL,
+            source TEXT,
+            count INTEGER,
+            p50_ms REAL,
+            p90_ms REAL,
+            p99_ms REAL,
+            mean_ms REAL,
+            max_ms REAL,
+            mean_size_bytes REAL,
+            total_size_bytes INTEGER,
+            failures INTEGER
+        );
+        CREATE INDEX IF NOT EXISTS idx_endpoint_timings_name_run ON endpoint_timings (name, kind, run_seq);
+        CREATE INDEX IF NOT EXISTS idx_endpoint_timings_run ON endpoint_timings (run_seq);
+    """
+
+    WINDOW = "SELECT run_seq FROM runs ORDER BY run_seq DESC LIMIT ?"
+
+    def __init__(self, db_path: Path):
+        """Open (and create if needed) the warehouse database."""
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(str(self.db_path), timeout=30)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self.conn.execute('PRAGMA synchronous=NORMAL')
+        self.conn.executescript(self.SCHEMA)
+
+    def close(self) -> None:
+        self.conn.close()
+
+    def __enter__(self) -> "ResultsWarehouse":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    @staticmethod
+    def _kind(source: str) -> str:
+        """Report family of a metrics key / result source ('trx_api.trx' -> 'trx')."""
+        return source.split('_', 1)[0] if source else 'unknown'
+
+    def ingest_run(self, summary: ReportSummary) -> int:
+        """Store one run in a single transaction; returns its sequence number."""
+        run_values = (
+            summary.jenkins_build_number, summary.environment, summary.git_commit_hash,
+            summary.start_time.isoformat(), summary.end_time.isoformat(), summary.total_duration_seconds,
+            summary.build_score, summary.smoke_score, summary.api_score, summary.e2e_score,
+            summary.overall_score, datetime.now().isoformat()
+        )
+
+        with self.conn:
+            row = self.conn.execute("SELECT run_seq FROM runs WHERE run_id = ?", (summary.run_id,)).fetchone()
+            if row:
+                run_seq = row['run_seq']
+                for table in ('report_metrics', 'test_results', 'endpoint_timings'):
+                    self.conn.execute(f"DELETE FROM {table} WHERE run_seq = ?", (run_seq,))
+                self.conn.execute(
+                    """UPDATE runs SET build_number = ?, environment = ?, git_commit = ?, started_at = ?,
+                       finished_at = ?, duration_seconds = ?, build_score = ?, smoke_score = ?, api_score = ?,
+                       e2e_score = ?, overall_score = ?, ingested_at = ? WHERE run_seq = ?""",
+                    run_values + (run_seq,)
+                )
+            else:
+                run_seq = self.conn.execute(
+                    """INSERT INTO runs (run_id, build_number, environment, git_commit, started_at, finished_at,
+                       duration_seconds, build_score, smoke_score, api_score, e2e_score, overall_score, ingested_at)
+                       VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+                    (summary.run_id,) + run_values
+                ).lastrowid
+
+            self.conn.executemany(
+                "INSERT INTO report_metrics VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                [(run_seq, report, m.total_tests, m.passed_tests, m.failed_tests, m.skipped_tests,
+                  m.duration_seconds, m.success_rate, m.average_response_time_ms)
+                 for report, m in summary.metrics.items()]
+            )
+
+            test_keys = {(self._kind(result.source), result.name) for result in summary.test_results}
+            self.conn.executemany("INSERT OR IGNORE INTO tests (kind, name) VALUES (?, ?)", test_keys)
+            test_ids = {}
+            for kind in {kind for kind, _ in test_keys}:
+                for test in self.conn.execute("SELECT test_id, name FROM tests WHERE kind = ?", (kind,)):
+                    test_ids[(kind, test['name'])] = test['test_id']
+
+            self.conn.executemany(
+                "INSERT INTO test_results VALUES (?, ?, ?, ?, ?, ?)",
+                [(run_seq, test_ids[(self._kind(r.source), r.name)], r.outcome, r.duration_seconds,
+                  r.retries, r.error_message) for r in summary.test_results]
+            )
+
+            self.conn.executemany(
+                "INSERT INTO endpoint_timings VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                [(run_seq, e.name, e.kind, e.source, e.count, e.p50_ms, e.p90_ms, e.p99_ms, e.mean_ms,
+                  e.max_ms, e.mean_size_bytes, e.total_size_bytes, e.failures) for e in summary.endpoint_stats]
+            )
+
+        logger.info(f"Stored run {summary.run_id} in {self.db_path}: {len(summary.test_results)} test results, "
+                     f"{len(summary.endpoint_stats)} endpoint timings")
+        return run_seq
+
+    def run_count(self) -> int:
+        return self.conn.execute("SELECT COUNT(*) FROM runs").fetchone()[0]
+
+    def baseline_scores(self, last_n: int = 10, exclude_run_id: Optional[str] = None) -> Optional[Dict[str, float]]:
+        """Average component scores of the last N stored runs (None without history)."""
+        row = self.conn.execute(
+            f"""SELECT COUNT(*) AS runs, AVG(build_score) AS build, AVG(smoke_score) AS smoke,
+                AVG(api_score) AS api, AVG(e2e_score) AS e2e, AVG(overall_score) AS overall
+                FROM runs WHERE run_seq IN ({self.WINDOW}) AND run_id != ?""",
+            (last_n, exclude_run_id or '')
+        ).fetchone()
+        if not row['runs']:
+            return None
+        return {key: row[key] for key in ('build', 'smoke', 'api', 'e2e', 'overall')}
+
+    def pass_rate_trend(self, last_n: int = 20, report_kind: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Pass rate per run (oldest first), optionally for one report family."""
+        query = f"""
+            SELECT r.run_id, r.build_number, r.finished_at, SUM(m.total_tests) AS total,
+                   SUM(m.passed_tests) AS passed, SUM(m.failed_tests) AS failed
+            FROM runs r JOIN report_metrics m ON m.run_seq = r.run_seq
+            WHERE r.run_seq IN ({self.WINDOW}) AND (? IS NULL OR substr(m.report, 1, length(?) + 1) = ? || '_')
+            GROUP BY r.run_seq ORDER BY r.run_seq
+        """
+        trend = []
+        # Prefix compare rather than LIKE: '_' in "<kind>_" would be a wildcard
+        for row in self.conn.execute(query, (last_n, report_kind, report_kind, report_kind)):
+            total = row['total'] or 0
+            trend.append({
+                'run_id': row['run_id'],
+                'build_number': row['build_number'],
+                'finished_at': row['finished_at'],
+                'total': total,
+                'passed': row['passed'] or 0,
+                'failed': row['failed'] or 0,
+                'pass_rate': (row['passed'] / total * 100) if total else 0.0
+            })
+        return trend
+
+    def _test_durations(self, last_n: int) -> Iterator[Tuple[Tuple[str, str], List[sqlite3.Row]]]:
+        """(kind, name) with its non-skipped results in the window, ordered by run."""
+        rows = self.conn.execute(
+            f"""SELECT t.kind, t.name, tr.run_seq, tr.duration_seconds
+                FROM test_results tr JOIN tests t ON t.test_id = tr.test_id
+                WHERE tr.run_seq IN ({self.WINDOW}) AND tr.outcome != 'skipped'
+                ORDER BY tr.test_id, tr.run_seq""",
+            (last_n,)
+        )
+        for key, group in groupby(rows, key=lambda row: (row['kind'], row['name'])):
+            yield key, list(group)
+
+    def duration_percentiles(self, last_n: int = 20, percentile: float = 95,
+                             min_runs: int = 1) -> List[Dict[str, Any]]:
+        """Duration percentile (default p95) per test over the last N runs, slowest first."""
+        stats = []
+        for (kind, name), rows in self._test_durations(last_n):
+            runs = len({row['run_seq'] for row in rows})
+            if runs < min_runs:
+                continue
+            durations = sorted(row['duration_seconds'] or 0.0 for row in rows)
+            stats.append({
+                'kind': kind,
+                'name': name,
+                'runs': runs,
+                f'p{percentile:g}_seconds': LatencyAnalyzer._percentile(durations, percentile),
+                'mean_seconds': sum(durations) / len(durations)
+            })
+        stats.sort(key=lambda entry: entry[f'p{percentile:g}_seconds'], reverse=True)
+        return stats
+
+    def slowest_tests(self, last_n: int = 20, limit: int = 10) -> List[Dict[str, Any]]:
+        """Tests with the highest p95 duration over the last N runs."""
+        return self.duration_percentiles(last_n)[:limit]
+
+    def most_regressed_tests(self, last_n: int = 20, limit: int = 10, min_history: int = 2,
+                             min_seconds: float = 0.1, min_ratio: float = 1.0) -> List[Dict[str, Any]]:
+        """
+        Tests of the latest run that got slowest relative to their history.
+
+        The baseline is the median of the test's per-run mean durations in the
+        earlier runs of the window; tests faster than min_seconds are ignored
+        as noise.
+        """
+        latest = self.conn.execute("SELECT MAX(run_seq) FROM runs").fetchone()[0]
+        regressed = []
+        for (kind, name), rows in self._test_durations(last_n):
+            per_run: Dict[int, List[float]] = {}
+            for row in rows:
+                per_run.setdefault(row['run_seq'], []).append(row['duration_seconds'] or 0.0)
+            if latest not in per_run:
+                continue
+            current_runs = per_run.pop(latest)
+            current = sum(current_runs) / len(current_runs)
+            history = sorted(sum(values) / len(values) for values in per_run.values())
+            if len(history) < min_history or current < min_seconds:
+                continue
+            baseline = LatencyAnalyzer._percentile(history, 50)
+            ratio = current / baseline if baseline > 0 else float('inf')
+            if ratio >= min_ratio:
+                regressed.append({
+                    'kind': kind,
+                    'name': name,
+                    'current_seconds': current,
+                    'baseline_seconds': baseline,
+                    'ratio': ratio,
+                    'history_runs': len(history)
+                })
+        regressed.sort(key=lambda entry: entry['ratio'], reverse=True)
+        return regressed[:limit]
+
+    def endpoint_trend(self, name: str, last_n: int = 20, kind: str = 'request') -> List[Dict[str, Any]]:
+        """Latency percentiles of one endpoint per run (oldest first)."""
+        rows = self.conn.execute(
+            f"""SELECT r.run_id, r.build_number, SUM(e.count) AS count, MAX(e.p50_ms) AS p50_ms,
+                       MAX(e.p90_ms) AS p90_ms, MAX(e.p99_ms) AS p99_ms, SUM(e.failures) AS failures
+                FROM endpoint_timings e JOIN runs r ON r.run_seq = e.run_seq
+                WHERE e.name = ? AND e.kind = ? AND e.run_seq IN ({self.WINDOW})
+                GROUP BY r.run_seq ORDER BY r.run_seq""",
+            (name, kind, last_n)
+        )
+        return [dict(row) for row in rows]
+
+
+class ArtifactArchiver:
+    """
+    Media-aware artifact archiver.
+
+    Already-compressed files (images, videos, traces) are stored as-is and
+    text artifacts are deflated, all through the public ZipFile API. Files
+    are read ahead on a thread pool while earlier entries are written, in
+    artifact order. Optionally, artifacts also go to a content-addressed
+    store where identical files from different builds are kept once; its
+    hashing and copies run on the same number of threads.
+    """
+
+    # Compressed formats gain nothing from deflate
+    STORED_EXTENSIONS = frozenset({
+        '.png', '.jpg', '.jpeg', '.gif', '.webp', '.mp4', '.webm', '.avi',
+        '.zip', '.gz', '.tgz', '.7z', '.br', '.woff', '.woff2', '.pdf'
+    })
+
+    # Larger files are streamed by ZipFile.write instead of read ahead into memory
+    MAX_PARALLEL_FILE_SIZE = 64 * 1024 * 1024
+
+    def __init__(self, workspace_dir: Path, max_workers: Optional[int] = None, compresslevel: int = 6):
+        self.workspace_dir = Path(workspace_dir)
+        self.max_workers = max_workers or ArtifactManager.MAX_HASH_WORKERS
+        self.compresslevel = compresslevel
+        self.stats = {
+            'files': 0, 'stored': 0, 'deflated': 0, 'bytes_in': 0, 'bytes_out': 0,
+            'store_new': 0, 'store_reused': 0, 'store_bytes_saved': 0
+        }
+
+    def _arcname(self, artifact: ArtifactInfo) -> str:
+        try:
+            return artifact.path.relative_to(self.workspace_dir).as_posix()
+        except ValueError:
+            return artifact.path.name
+
+    def _is_stored(self, file_path: Path) -> bool:
+        return file_path.suffix.lower() in self.STORED_EXTENSIONS
+
+    @staticmethod
+    def _read(file_path: Path, arcname: str) -> Tuple[zipfile.ZipInfo, bytes]:
+        """Read a file in a worker thread; returns its ZipInfo (name, mtime, mode) and contents."""
+        return zipfile.ZipInfo.from_file(file_path, arcname), file_path.read_bytes()
+
+    def write_zip(self, summary: ReportSummary, archive_path: Path) -> None:
+        """Write summary.json plus all artifacts to a zip archive."""
+        summary_json = json.dumps({
+            'run_id': summary.run_id,
+            'overall_score': summary.overall_score,
+            'generated_at': datetime.now().isoformat()
+        }, indent=2)
+
+        with zipfile.ZipFile(archive_path, 'w', zipfile.ZIP_DEFLATED, compresslevel=self.compresslevel) as archive, \
+                ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            archive.writestr('summary.json', summary_json)
+
+            # Entries are written in artifact order; reads run ahead on the pool
+            pending = deque()
+
+            def write_next() -> None:
+                kind, value, arcname, compress_type, size = pending.popleft()
+                if kind == 'read':
+                    zinfo, data = value.result()
+                    archive.writestr(zinfo, data, compress_type=compress_type, compresslevel=self.compresslevel)
+                else:
+                    archive.write(value, arcname, compress_type=compress_type)
+                self.stats['stored' if compress_type == zipfile.ZIP_STORED else 'deflated'] += 1
+                self.stats['bytes_out'] += archive.getinfo(arcname).compress_size
+                self.stats['files'] += 1
+                self.stats['bytes_in'] += size
+
+            for artifact in summary.artifacts:
+                if not artifact.path.exists():
+                    continue
+                arcname = self._arcname(artifact)
+                size = artifact.path.stat().st_size
+                compress_type = zipfile.ZIP_STORED if self._is_stored(artifact.path) else zipfile.ZIP_DEFLATED
+
+                if size > self.MAX_PARALLEL_FILE_SIZE:
+                    pending.append(('write', artifact.path, arcname, compress_type, size))
+                else:
+                    pending.append(('read', pool.submit(self._read, artifact.path, arcname), arcname, compress_type, size))
+
+                # Bound the file contents held in memory
+                while len(pending) > self.max_workers * 2 or (pending and pending[0][0] == 'write'):
+                    write_next()
+
+            while pending:
+                write_next()
+
+    @staticmethod
+    def _object_checksum(artifact: ArtifactInfo) -> Optional[str]:
+        """SHA-256 of an artifact (hashed now if the scan had none); None if it cannot be read."""
+        if not artifact.path.exists():
+            return None
+        checksum = artifact.checksum
+        if not checksum or checksum == 'unknown':
+            checksum = ArtifactManager._calculate_checksum(artifact.path)
+        return None if checksum == 'unknown' else checksum
+
+    @staticmethod
+    def _copy_object(source: Path, object_path: Path) -> None:
+        object_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = object_path.with_name(f"{object_path.name}.{os.getpid()}.tmp")
+        shutil.copy2(source, tmp_path)
+        os.replace(tmp_path, object_path)
+
+    def write_content_addressed(self, summary: ReportSummary, store_dir: Path) -> Path:
+        """
+        Add artifacts to a content-addressed store; returns the build manifest path.
+
+        Files live once under objects/<sha256[:2]>/<sha256>; builds/<run_id>.json
+        maps each artifact path to its object. Objects are copies, never links:
+        reused workspaces rewrite files like test-results/*.png in place, which
+        would change a linked object's bytes under its old hash.
+        """
+        store_dir = Path(store_dir)
+        objects_dir = store_dir / 'objects'
+        manifest = {'run_id': summary.run_id, 'generated_at': datetime.now().isoformat(), 'artifacts': []}
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            checksums = list(pool.map(self._object_checksum, summary.artifacts))
+
+            # Each new object is copied once, even if several artifacts share it
+            copies = {}
+            for artifact, checksum in zip(summary.artifacts, checksums):
+                if checksum is None:
+                    continue
+
+                object_path = objects_dir / checksum[:2] / checksum
+                if checksum in copies or object_path.exists():
+                    self.stats['store_reused'] += 1
+                    self.stats['store_bytes_saved'] += artifact.size_bytes
+                else:
+                    copies[checksum] = pool.submit(self._copy_object, artifact.path, object_path)
+                    self.stats['store_new'] += 1
+
+                manifest['artifacts'].append({
+                    'path': self._arcname(artifact),
+                    'sha256': checksum,
+                    'size_bytes': artifact.size_bytes,
+                    'type': artifact.type
+                })
+
+            for copy in copies.values():
+                copy.result()
+
+        manifest_path = store_dir / 'builds' / f"{summary.run_id}.json"
+        manifest_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(manifest_path, 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, indent=2)
+        return manifest_path
+
 
 class ReportAggregator:
     """Main report aggregation engine."""
@@ -561,24 +2293,45 @@ class ReportAggregator:
         self.config = config or {}
         self.artifacts: List[ArtifactInfo] = []
         self.metrics: Dict[str, TestMetrics] = {}
+        self.test_results: List[TestCaseResult] = []
+        self.endpoint_stats: List[EndpointStats] = []
+        self.har_analyzer = HARAnalyzer()
+        self.junit_merger = JUnitMerger()
+        self._parsed_paths = set()
+
+        # Checksums of unchanged artifacts are reused across runs
+        cache_path = self.config.get('checksum_cache', self.workspace_dir / ChecksumCache.DEFAULT_PATH)
+        self.checksum_cache = ChecksumCache(Path(cache_path)) if cache_path else None
 
         # QA Intelligence integration
         qa_config = self.config.get('qa_intelligence', {})
         if qa_config.get('enabled', True):
             self.qa_reporter = QAIntelligenceReporter(
                 base_url=qa_config.get('base_url', 'http://localhost:8082'),
-                api_key=qa_config.get('api_key')
+                api_key=qa_config.get('api_key'),
+                spool_dir=qa_config.get('spool_dir'),
+                batch_size=qa_config.get('batch_size')
             )
         else:
             self.qa_reporter = None
 
-    def collect_artifacts(self, patterns: Optional[List[str]] = None) -> List[ArtifactInfo]:
-        """Collect all test artifacts from workspace."""
+        # Run history for trends and CI gates (disabled unless a database is configured)
+        history_db = self.config.get('history_db')
+        self.warehouse = ResultsWarehouse(Path(history_db)) if history_db else None
+        self.history_builds = int(self.config.get('history_builds', 20))
+        self.baseline_scores: Optional[Dict[str, float]] = None
+
+    def collect_artifacts(self, patterns: Optional[List[str]] = None, parse: bool = True) -> List[ArtifactInfo]:
+        """Collect all test artifacts from workspace, parsing reports as they are found."""
         if patterns is None:
             patterns = [
                 '*.trx',
+                '*junit*.xml',
+                'TEST-*.xml',
                 '*newman*.html',
+                '*newman*.json',
                 '*playwright*.html',
+                '*playwright*.json',
                 'playwright-report/**/*.html',
                 '*.har',
                 'screenshots/*.png',
@@ -588,34 +2341,66 @@ class ReportAggregator:
 
         logger.info(f"Collecting artifacts from {self.workspace_dir} with patterns: {patterns}")
 
-        self.artifacts = ArtifactManager.scan_artifacts(self.workspace_dir, patterns)
+        excluded_dirs = self.config.get('exclude_dirs')
+        if excluded_dirs is not None:
+            excluded_dirs = set(excluded_dirs) | set(ArtifactManager.EXCLUDED_DIRS)
 
-        logger.info(f"Found {len(self.artifacts)} artifacts")
-        for artifact in self.artifacts:
+        # Reports are handed to their parser as soon as the scanner finds them
+        self.artifacts = []
+        for artifact in ArtifactManager.iter_artifacts(self.workspace_dir, patterns, self.checksum_cache, excluded_dirs):
+            self.artifacts.append(artifact)
             logger.debug(f"  {artifact.type}: {artifact.name} ({artifact.size_bytes} bytes)")
+            if parse:
+                self._parse_artifact(artifact)
 
+        logger.info(f"Found {len(self.artifacts)} artifacts")
         return self.artifacts
 
-    def parse_reports(self) -> Dict[str, TestMetrics]:
-        """Parse all collected report artifacts."""
-        logger.info("Parsing collected reports...")
+    def _parse_artifact(self, artifact: ArtifactInfo) -> None:
+        """Parse one report artifact into self.metrics (once per path)."""
+        if artifact.path in self._parsed_paths:
+            return
+        self._parsed_paths.add(artifact.path)
 
-        for artifact in self.artifacts:
-            try:
-                if artifact.type == 'trx':
-                    metrics = TRXParser.parse_trx_file(artifact.path)
-                    self.metrics[f"trx_{artifact.name}"] = metrics
+        try:
+            if artifact.type == 'trx':
+                metrics = TRXParser.parse_trx_file(artifact.path, self.test_results.append)
+                self.metrics[f"trx_{artifact.name}"] = metrics
 
-                elif artifact.type == 'newman-html':
-                    metrics = NewmanHTMLParser.parse_newman_html(artifact.path)
-                    self.metrics[f"newman_{artifact.name}"] = metrics
+            elif artifact.type == 'junit':
+                # Shards of one run share a metrics entry, re-computed as each shard arrives
+                key = self.junit_merger.add_file(artifact.path)
+                self.metrics[key] = self.junit_merger.metrics(key)
 
-                elif artifact.type == 'playwright-html':
-                    metrics = PlaywrightHTMLParser.parse_playwright_html(artifact.path)
-                    self.metrics[f"playwright_{artifact.name}"] = metrics
+            elif artifact.type == 'newman-html':
+                metrics = NewmanHTMLParser.parse_newman_html(artifact.path)
+                self.metrics[f"newman_{artifact.name}"] = metrics
 
-            except Exception as e:
-                logger.error(f"Failed to parse {artifact.path}: {e}")
+            elif artifact.type == 'newman-json':
+                metrics = NewmanJSONParser.parse_newman_json(artifact.path, self.test_results.append,
+                                                             self.endpoint_stats.append)
+                self.metrics[f"newman_{artifact.name}"] = metrics
+
+            elif artifact.type == 'playwright-html':
+                metrics = PlaywrightHTMLParser.parse_playwright_html(artifact.path, self.test_results.append)
+                self.metrics[f"playwright_{artifact.name}"] = metrics
+
+            elif artifact.type == 'playwright-json':
+                metrics = PlaywrightHTMLParser.parse_playwright_json(artifact.path, self.test_results.append)
+                self.metrics[f"playwright_{artifact.name}"] = metrics
+
+            elif artifact.type == 'har':
+                artifact.metadata = {**(artifact.metadata or {}), **self.har_analyzer.analyze_har(artifact.path)}
+
+        except Exception as e:
+            logger.error(f"Failed to parse {artifact.path}: {e}")
+
+    def parse_reports(self) -> Dict[str, TestMetrics]:
+        """Parse all collected report artifacts (those not already parsed during collection)."""
+        logger.info("Parsing collected reports...")
+
+        for artifact in self.artifacts:
+            self._parse_artifact(artifact)
 
         logger.info(f"Parsed {len(self.metrics)} reports")
         return self.metrics
@@ -671,9 +2456,76 @@ class ReportAggregator:
             penalty = missing_components * 10  # 10-point penalty per missing component
             scores['overall'] = max(0, scores['overall'] - penalty)
 
+        # Compare against the recent history, if any
+        if self.warehouse:
+            self.baseline_scores = self.warehouse.baseline_scores(self.history_builds)
+            if self.baseline_scores:
+                delta = scores['overall'] - self.baseline_scores['overall']
+                logger.info(f"Overall score {scores['overall']:.1f} vs {self.baseline_scores['overall']:.1f} "
+                            f"average of the last {self.history_builds} runs ({delta:+.1f})")
+
         logger.info(f"Calculated scores: {scores}")
         return scores
 
+    def record_history(self, summary: ReportSummary) -> bool:
+        """Ingest the run into the results warehouse."""
+        if not self.warehouse:
+            return True
+        try:
+            self.warehouse.ingest_run(summary)
+            return True
+        except sqlite3.Error as e:
+            logger.error(f"Failed to store run history: {e}")
+            return False
+
+    def history_report(self) -> Dict[str, Any]:
+        """Trend data from the warehouse for the exported summary."""
+        if not self.warehouse:
+            return {}
+        return {
+            'database': str(self.warehouse.db_path),
+            'builds': self.history_builds,
+            'baseline_scores': self.baseline_scores,
+            'pass_rate_trend': self.warehouse.pass_rate_trend(self.history_builds),
+            'slowest_tests': self.warehouse.slowest_tests(self.history_builds),
+            'most_regressed_tests': self.warehouse.most_regressed_tests(self.history_builds, min_ratio=1.2)
+        }
+
+    def evaluate_gates(self) -> List[str]:
+        """
+        Check the latest stored run against its history.
+
+        Gates come from config['gates']: 'max_pass_rate_drop' (percentage
+        points below the average of earlier runs) and 'max_regression_ratio'
+        (a test's duration relative to its median in earlier runs).
+        """
+        gates = self.config.get('gates', {})
+        if not self.warehouse or not gates:
+            return []
+
+        violations = []
+        max_drop = gates.get('max_pass_rate_drop')
+        if max_drop is not None:
+            trend = self.warehouse.pass_rate_trend(self.history_builds)
+            if len(trend) >= 2:
+                baseline = sum(entry['pass_rate'] for entry in trend[:-1]) / (len(trend) - 1)
+                drop = baseline - trend[-1]['pass_rate']
+                if drop > max_drop:
+                    violations.append(f"Pass rate {trend[-1]['pass_rate']:.1f}% is {drop:.1f} points below "
+                                      f"the {baseline:.1f}% average of the previous {len(trend) - 1} runs "
+                                      f"(limit {max_drop})")
+
+        max_ratio = gates.get('max_regression_ratio')
+        if max_ratio is not None:
+            for test in self.warehouse.most_regressed_tests(self.history_builds, limit=50, min_ratio=max_ratio):
+                if test['ratio'] > max_ratio:
+                    violations.append(f"{test['kind']} test '{test['name']}' took {test['current_seconds']:.2f}s, "
+                                      f"{test['ratio']:.1f}x its {test['baseline_seconds']:.2f}s median (limit {max_ratio}x)")
+
+        for violation in violations:
+            logger.error(f"Gate failed: {violation}")
+        return violations
+
     def generate_summary(self, run_id: Optional[str] = None) -> ReportSummary:
         """Generate comprehensive report summary."""
         if run_id is None:
@@ -691,6 +2543,9 @@ class ReportAggregator:
 
         total_duration = (end_time - start_time).total_seconds()
 
+        # HAR requests are summarised over all recordings of the run
+        har_stats = self.har_analyzer.endpoint_stats()
+
         # Create summary
         summary = ReportSummary(
             run_id=run_id,
@@ -705,6 +2560,9 @@ class ReportAggregator:
             overall_score=scores['overall'],
             metrics=self.metrics,
             artifacts=self.artifacts,
+            test_results=self.test_results + self.junit_merger.results(),
+            endpoint_stats=self.endpoint_stats + har_stats,
+            performance_profile=self.har_analyzer.profile() if har_stats else {},
             jenkins_build_number=os.getenv('BUILD_NUMBER'),
             git_commit_hash=os.getenv('GIT_COMMIT')
         )
@@ -712,6 +2570,11 @@ class ReportAggregator:
         logger.info(f"Generated summary for run {run_id} with overall score: {summary.overall_score:.1f}")
         return summary
 
+    @staticmethod
+    def slowest_tests(test_results: List[TestCaseResult], limit: int = 20) -> List[TestCaseResult]:
+        """The slowest test cases across all parsed reports."""
+        return heapq.nlargest(limit, test_results, key=lambda result: result.duration_seconds)
+
     def export_summary(self, summary: ReportSummary, output_path: Path) -> bool:
         """Export summary to JSON file."""
         try:
@@ -731,6 +2594,13 @@ class ReportAggregator:
                     'weights': self.SCORE_WEIGHTS
                 },
                 'metrics': {name: asdict(metrics) for name, metrics in summary.metrics.items()},
+                'tests': {
+                    'total': len(summary.test_results),
+                    'slowest': [asdict(result) for result in self.slowest_tests(summary.test_results)],
+                    'failed': [asdict(result) for result in summary.test_results if result.outcome == 'failed']
+                },
+                'endpoints': [asdict(stats) for stats in summary.endpoint_stats],
+                'performance_profile': summary.performance_profile,
                 'artifacts': [
                     {
                         **asdict(artifact),
@@ -739,6 +2609,7 @@ class ReportAggregator:
                     }
                     for artifact in summary.artifacts
                 ],
+                'history': self.history_report(),
                 'integration': {
                     'qa_intelligence_reported': summary.qa_intelligence_reported,
                     'jenkins_build_number': summary.jenkins_build_number,
@@ -768,26 +2639,29 @@ class ReportAggregator:
         summary.qa_intelligence_reported = success
         return success
 
-    def archive_artifacts(self, summary: ReportSummary, archive_path: Path) -> bool:
-        """Archive all artifacts into a ZIP file."""
+    def archive_artifacts(self, summary: ReportSummary, archive_path: Optional[Path] = None,
+                          store_dir: Optional[Path] = None) -> bool:
+        """Archive all artifacts into a ZIP file and/or a content-addressed store."""
         try:
-            with zipfile.ZipFile(archive_path, 'w', zipfile.ZIP_DEFLATED) as archive:
-                # Add summary JSON
-                summary_json = json.dumps({
-                    'run_id': summary.run_id,
-                    'overall_score': summary.overall_score,
-                    'generated_at': datetime.now().isoformat()
-                }, indent=2)
-                archive.writestr('summary.json', summary_json)
-
-                # Add artifacts
-                for artifact in summary.artifacts:
-                    if artifact.path.exists():
-                        # Use relative path in archive
-                        relative_path = artifact.path.relative_to(self.workspace_dir)
-                        archive.write(artifact.path, relative_path)
-
-            logger.info(f"Archived {len(summary.artifacts)} artifacts to {archive_path}")
+            archiver = ArtifactArchiver(self.workspace_dir)
+            start = datetime.now()
+
+            if archive_path:
+                archiver.write_zip(summary, Path(archive_path))
+                stats = archiver.stats
+                ratio = stats['bytes_out'] / stats['bytes_in'] * 100 if stats['bytes_in'] else 0
+                logger.info(f"Archived {stats['files']} artifacts to {archive_path} "
+                            f"({stats['deflated']} deflated, {stats['stored']} stored; "
+                            f"{stats['bytes_in']} -> {stats['bytes_out']} bytes, {ratio:.0f}%)")
+
+            if store_dir:
+                manifest_path = archiver.write_content_addressed(summary, Path(store_dir))
+                stats = archiver.stats
+                logger.info(f"Stored artifacts in {store_dir}: {stats['store_new']} new, "
+                            f"{stats['store_reused']} already present ({stats['store_bytes_saved']} bytes deduplicated); "
+                            f"manifest {manifest_path}")
+
+            logger.info(f"Archiving took {(datetime.now() - start).total_seconds():.2f}s")
             return True
 
         except Exception as e:
@@ -845,12 +2719,54 @@ Examples:
         help='Create ZIP archive of all artifacts'
     )
 
+    parser.add_argument(
+        '--archive-store',
+        type=str,
+        help='Content-addressed artifact store; identical files across builds are stored once'
+    )
+
+    parser.add_argument(
+        '--checksum-cache',
+        type=str,
+        help='Checksum cache file (default: <workspace>/.report_aggregator_cache/checksums.json, "none" to disable)'
+    )
+
+    parser.add_argument(
+        '--history',
+        type=str,
+        help='SQLite results warehouse to record this run in and compare it against'
+    )
+
+    parser.add_argument(
+        '--history-builds',
+        type=int,
+        help='Number of recent runs used for trends and gates (default: 20)'
+    )
+
+    parser.add_argument(
+        '--gate-pass-rate-drop',
+        type=float,
+        help='Fail if the pass rate drops more than this many points below the recent average'
+    )
+
+    parser.add_argument(
+        '--gate-regression-ratio',
+        type=float,
+        help='Fail if a test gets slower than this multiple of its recent median duration'
+    )
+
     parser.add_argument(
         '--qa-intelligence',
         action='store_true',
         help='Report results to QA Intelligence backend'
     )
 
+    parser.add_argument(
+        '--flush-spool',
+        action='store_true',
+        help='Only retry QA Intelligence uploads left in the spool, then exit'
+    )
+
     parser.add_argument(
         '--environment',
         type=str,
@@ -880,6 +2796,29 @@ Examples:
             with open(args.config, 'r', encoding='utf-8') as f:
                 config = json.load(f)
 
+        if args.checksum_cache:
+            config['checksum_cache'] = None if args.checksum_cache.lower() == 'none' else args.checksum_cache
+
+        if args.history:
+            config['history_db'] = args.history
+        if args.history_builds:
+            config['history_builds'] = args.history_builds
+        if args.gate_pass_rate_drop is not None:
+            config.setdefault('gates', {})['max_pass_rate_drop'] = args.gate_pass_rate_drop
+        if args.gate_regression_ratio is not None:
+            config.setdefault('gates', {})['max_regression_ratio'] = args.gate_regression_ratio
+
+        if args.flush_spool:
+            qa_config = config.get('qa_intelligence', {})
+            reporter = QAIntelligenceReporter(
+                base_url=qa_config.get('base_url', 'http://localhost:8082'),
+                api_key=qa_config.get('api_key'),
+                spool_dir=qa_config.get('spool_dir')
+            )
+            result = reporter.flush_spool(force=True, budget_seconds=float('inf'))
+            print(f"Spool flushed: {result['sent']} sent, {result['pending']} pending, {result['rejected']} rejected")
+            return 0 if result['pending'] == 0 else 1
+
         # Initialize aggregator
         aggregator = ReportAggregator(
             workspace_dir=Path(args.workspace),
@@ -900,6 +2839,10 @@ Examples:
         # Generate summary
         summary = aggregator.generate_summary(args.run_id)
 
+        # Record run history
+        if not aggregator.record_history(summary):
+            logger.warning("Failed to record run history (continuing)")
+
         # Export summary
         if args.output:
             success = aggregator.export_summary(summary, Path(args.output))
@@ -908,8 +2851,12 @@ Examples:
                 return 1
 
         # Create archive
-        if args.archive:
-            success = aggregator.archive_artifacts(summary, Path(args.archive))
+        if args.archive or args.archive_store:
+            success = aggregator.archive_artifacts(
+                summary,
+                Path(args.archive) if args.archive else None,
+                Path(args.archive_store) if args.archive_store else None
+            )
             if not success:
                 logger.error("Failed to create artifact archive")
                 return 1
@@ -934,6 +2881,14 @@ Examples:
         print(f"  E2E:     {summary.e2e_score:.1f}/100")
         print(f"  Overall: {summary.overall_score:.1f}/100")
 
+        # Trend gates
+        gate_violations = aggregator.evaluate_gates()
+        if gate_violations:
+            print("\nGates failed:")
+            for violation in gate_violations:
+                print(f"  - {violation}")
+            return 1
+
         # Return appropriate exit code based on overall score
         if summary.overall_score >= 80:
             logger.info("Report aggregation completed successfully with good scores")
@@ -0,0 +1,829 @@
+#!/usr/bin/env python3
+"""
+Unit Tests for Jenkins Helper (jenkins_helper.py)
+=================================================
+
+Unit tests for console log analysis and the Jenkins API client.
+
+Author: QA Intelligence System
+Version: 2.0
+"""
+
+import asyncio
+import hashlib
+import json
+import random
+import re
+import sys
+import threading
+import time
+import tracemalloc
+import urllib.parse
+from dataclasses import asdict
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from jenkins_helper import (
+    BuildInfo,
+    ConsoleLogScanner,
+    JenkinsAPIError,
+    JenkinsClient,
+    main
+)
+
+
+class FakeJenkinsHandler(BaseHTTPRequestHandler):
+    """Dispatches requests to the server's routes: path -> handler(request) -> (status, headers, body)."""
+
+    protocol_version = 'HTTP/1.1'
+
+    def _dispatch(self):
+        parsed = urllib.parse.urlsplit(self.path)
+        self.query = dict(urllib.parse.parse_qsl(parsed.query))
+        self.server.requests.append((self.command, parsed.path, self.query, dict(self.headers)))
+        route = self.server.routes.get(parsed.path)
+        status, headers, body = route(self) if route else (404, {}, b'Not found')
+        if isinstance(body, (dict, list)):
+            body = json.dumps(body).encode()
+            headers = {'Content-Type': 'application/json', **headers}
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, str(value))
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    do_GET = do_POST = do_HEAD = _dispatch
+
+    def log_message(self, format, *args):
+        pass
+
+
+class FakeJenkins(ThreadingHTTPServer):
+    """Minimal Jenkins stand-in on a local port."""
+
+    daemon_threads = True
+
+    def __init__(self):
+        super().__init__(('127.0.0.1', 0), FakeJenkinsHandler)
+        self.url = f"http://127.0.0.1:{self.server_address[1]}"
+        self.requests = []
+        self.routes = {'/api/json': lambda request: (200, {}, {'version': '2.440'})}
+
+    def requested(self, path):
+        """Requests made to a path."""
+        return [request for request in self.requests if request[1] == path]
+
+
+@pytest.fixture
+def jenkins():
+    """Fake Jenkins server."""
+    server = FakeJenkins()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def jenkins_client(jenkins):
+    """JenkinsClient connected to the fake server."""
+    return JenkinsClient(jenkins.url, 'user', 'token')
+
+
+@pytest.fixture
+def client():
+    """JenkinsClient that skips the connection check."""
+    with patch.object(JenkinsClient, '_validate_connection'):
+        yield JenkinsClient('http://jenkins.test', 'user', 'token')
+
+
+def reference_analysis(console_log):
+    """Line-by-line analysis: every pattern searched on every line (the scanner's specification)."""
+    lines = console_log.split('\n')
+    error_count = warning_count = 0
+    key_events = []
+    duration_analysis = {}
+
+    def event(event_type, index, line):
+        key_events.append({'line_number': index + 1, 'type': event_type, 'message': line.strip()[:200],
+                           'timestamp': ConsoleLogScanner.extract_timestamp(line)})
+
+    for index, line in enumerate(lines):
+        if any(re.search(pattern, line) for pattern in ConsoleLogScanner.ERROR_PATTERNS):
+            error_count += 1
+            event('error', index, line)
+        if any(re.search(pattern, line) for pattern in ConsoleLogScanner.WARNING_PATTERNS):
+            warning_count += 1
+            event('warning', index, line)
+        for name, pattern in {**ConsoleLogScanner.DURATION_PATTERNS, **ConsoleLogScanner.PERFORMANCE_PATTERNS}.items():
+            match = re.search(pattern, line)
+            if match:
+                if name == 'passed_tests':
+                    duration_analysis[name] = {'failures': int(match.group(1)), 'errors': int(match.group(2))}
+                else:
+                    duration_analysis[name] = float(match.group(1))
+
+    return {
+        'total_lines': len(lines),
+        'error_count': error_count,
+        'warning_count': warning_count,
+        'duration_analysis': duration_analysis,
+        'key_events': key_events[-50:],
+        'performance_metrics': {
+            'error_rate': error_count / len(lines) * 100,
+            'warning_rate': warning_count / len(lines) * 100,
+            'log_density': len(lines),
+            'has_performance_data': bool(duration_analysis)
+        }
+    }
+
+
+def build_log(line_count, seed=7):
+    """Synthetic console log: mostly noise, ~3% lines with errors, warnings or metrics."""
+    rng = random.Random(seed)
+    noise = [
+        "[{t}] Running step: npm ci --prefer-offline",
+        "2026-01-02 {t} INFO  Downloading https://registry.npmjs.org/pkg-{i}.tgz",
+        "[Pipeline] sh",
+        "+ dotnet build WeSign.sln -c Release",
+        "tests/test_x.py::test_{i} PASSED"
+    ]
+    interesting = [
+        "2026-01-02 {t} ERROR: connection refused to db-{i}",
+        "[WARN] deprecated API used in module {i}",
+        "Tests run: {i}, Failures: 1, Errors: 0, Skipped: 0, Time elapsed: 12.5 sec",
+        "Finished: SUCCESS in 42.5 min",
+        "Memory usage: 512.5MB",
+        "CPU usage: 73.2%",
+        "Successfully built abc123 in 12.3s",
+        "Compilation time: 8.25 seconds",
+        "⚠ build UNSTABLE", "✗ step failed", "FAIL: test_z", "Exception in thread main", "errorless line"
+    ]
+    lines = []
+    for i in range(line_count):
+        pool = interesting if rng.random() < 0.03 else noise
+        lines.append(rng.choice(pool).format(i=i, t=f"10:{i // 60 % 60:02d}:{i % 60:02d}"))
+    return '\n'.join(lines) + '\n'
+
+
+class TestConsoleLogScanner:
+    """Test the single-pass console log scanner."""
+
+    def test_matches_line_by_line_analysis(self, client):
+        """Test that the scanner's analysis is identical to matching every pattern per line."""
+        console_log = build_log(20000)
+
+        analysis = asdict(client.analyze_console_log(console_log))
+        expected = reference_analysis(console_log)
+
+        assert analysis == expected
+        assert list(analysis['duration_analysis']) == list(expected['duration_analysis'])
+
+    @pytest.mark.parametrize('console_log', [
+        '',
+        '\n',
+        'ok\r\nERROR: x\r\n',
+        'Errors everywhere but errorless\nerror_code=1',
+        '⚠✗\n\n\n[12:00:01] FAIL: y',
+        'Tests run: 5, Failures: 1, Errors: 2, Time elapsed: 3.5 sec',
+        'Finished: SUCCESS in 1.5 min\nUNSTABLE warn error',
+        'faıled (dotless i)\nİstanbul error\nſevere warning'
+    ])
+    def test_edge_cases(self, console_log):
+        """Test empty logs, CRLF, word boundaries and Unicode case folding."""
+        scanner = ConsoleLogScanner()
+        scanner.scan(console_log)
+
+        assert asdict(scanner.analysis()) == reference_analysis(console_log)
+
+    def test_key_events(self, client):
+        """Test event line numbers, truncation and timestamps."""
+        console_log = "start\n2026-01-02 10:00:01 ERROR: " + "x" * 300 + "\n[10:00:02] [WARN] slow disk\nend"
+
+        analysis = client.analyze_console_log(console_log)
+
+        assert [(e['line_number'], e['type']) for e in analysis.key_events] == [(2, 'error'), (3, 'warning')]
+        assert len(analysis.key_events[0]['message']) == 200
+        assert analysis.key_events[0]['timestamp'] == '2026-01-02 10:00:01'
+        assert analysis.key_events[1]['timestamp'] == '10:00:02'
+
+    @staticmethod
+    def best_scan_seconds(console_log, repeat=3):
+        """Best-of-n time to scan a log, and its line count."""
+        best, lines = float('inf'), 0
+        for _ in range(repeat):
+            scanner = ConsoleLogScanner()
+            started = time.perf_counter()
+            scanner.scan(console_log)
+            best = min(best, time.perf_counter() - started)
+            lines = scanner.total_lines
+        return best, lines
+
+    def test_benchmark(self):
+        """Test that the scanner matches the line-by-line analysis on the benchmark log."""
+        console_log = build_log(50000)
+        scanner = ConsoleLogScanner()
+        scanner.scan(console_log)
+
+        seconds, lines = self.best_scan_seconds(console_log)
+        expected = reference_analysis(console_log)
+
+        assert asdict(scanner.analysis()) == expected
+        assert lines == expected['total_lines'] == 50001
+        assert seconds > 0
+
+
+class TestConsoleLogStreaming:
+    """Test progressiveText streaming and incremental analysis."""
+
+    LOG_PATH = '/job/WeSign-Main/42/logText/progressiveText'
+
+    def serve_running_build(self, jenkins, log, step):
+        """Serve the log as a running build that writes `step` more bytes before each poll."""
+        state = {'available': step}
+
+        def progressive_text(request):
+            start = int(request.query.get('start', 0))
+            available = min(state['available'], len(log))
+            headers = {'X-Text-Size': available}
+            if available < len(log):
+                headers['X-More-Data'] = 'true'
+            state['available'] += step
+            return 200, headers, log[start:available]
+
+        jenkins.routes[self.LOG_PATH] = progressive_text
+
+    def test_feed_matches_whole_log(self):
+        """Test that feeding arbitrary chunks gives the same analysis as scanning the whole log."""
+        console_log = build_log(5000)
+        whole = ConsoleLogScanner()
+        whole.scan(console_log)
+
+        rng = random.Random(1)
+        scanner = ConsoleLogScanner()
+        position = 0
+        while position < len(console_log):
+            size = rng.randint(1, 500)
+            scanner.feed(console_log[position:position + size])
+            position += size
+        scanner.finish()
+
+        assert asdict(scanner.analysis()) == asdict(whole.analysis())
+        assert scanner.total_lines == 5001
+
+    def test_stream_complete_log(self, jenkins, jenkins_client):
+        """Test that a finished build's log is analyzed from one progressiveText request."""
+        console_log = build_log(3000)
+        jenkins.routes[self.LOG_PATH] = lambda request: (200, {'X-Text-Size': len(console_log.encode())},
+                                                         console_log.encode())
+
+        analysis = jenkins_client.analyze_console_log_stream('WeSign-Main', 42)
+
+        assert asdict(analysis) == reference_analysis(console_log)
+        assert len(jenkins.requested(self.LOG_PATH)) == 1
+
+    def test_follow_running_build(self, jenkins, jenkins_client):
+        """Test live tailing: offsets advance, split lines and characters are reassembled."""
+        console_log = "line one\n⚠ disk almost full\nERROR: step failed\n" * 20 + "Finished: FAILURE in 1.5 min"
+        encoded = console_log.encode()
+        self.serve_running_build(jenkins, encoded, step=37)  # Splits lines and the 3-byte ⚠
+        updates = []
+
+        analysis = jenkins_client.analyze_console_log_stream('WeSign-Main', 42, follow=True, poll_interval=0,
+                                                             on_update=updates.append)
+
+        polls = jenkins.requested(self.LOG_PATH)
+        assert [int(query['start']) for _, _, query, _ in polls] == list(range(0, len(encoded), 37))
+        assert asdict(analysis) == reference_analysis(console_log)
+        assert len(updates) == len(polls)
+        assert updates[0].error_count == 0 and updates[-1].error_count == 20
+        assert [u.warning_count for u in updates] == sorted(u.warning_count for u in updates)
+
+    def test_stream_resumes_from_offset(self, jenkins, jenkins_client):
+        """Test that a stream can resume from a previously returned offset."""
+        encoded = b"first\nsecond\nthird\n"
+        jenkins.routes[self.LOG_PATH] = lambda request: (
+            200, {'X-Text-Size': len(encoded)}, encoded[int(request.query.get('start', 0)):])
+        received = []
+
+        offset = jenkins_client.stream_console_log('WeSign-Main', 42, received.append, start=6)
+
+        assert ''.join(received) == "second\nthird\n"
+        assert offset == len(encoded)
+
+    def test_missing_build(self, jenkins, jenkins_client):
+        """Test that a missing build raises instead of being polled forever."""
+        with pytest.raises(JenkinsAPIError):
+            jenkins_client.analyze_console_log_stream('WeSign-Main', 404, follow=True, poll_interval=0)
+
+    def test_transient_errors_retried(self, jenkins, jenkins_client):
+        """Test that a 5xx is retried from the same offset without follow mode."""
+        encoded = b"first\nsecond\n"
+        responses = [(503, {}, b'Unavailable'), (200, {'X-Text-Size': len(encoded)}, encoded)]
+        jenkins.routes[self.LOG_PATH] = lambda request: responses.pop(0)
+        received = []
+
+        with patch('jenkins_helper.time.sleep'):
+            offset = jenkins_client.stream_console_log('WeSign-Main', 42, received.append)
+
+        assert ''.join(received) == "first\nsecond\n" and offset == len(encoded)
+        assert len(jenkins.requested(self.LOG_PATH)) == 2
+
+    def test_outage_gives_up(self, jenkins, jenkins_client):
+        """Test that a following stream raises after CONSOLE_MAX_FAILURES consecutive errors."""
+        jenkins.routes[self.LOG_PATH] = lambda request: (502, {}, b'Bad gateway')
+
+        with pytest.raises(JenkinsAPIError):
+            jenkins_client.analyze_console_log_stream('WeSign-Main', 42, follow=True, poll_interval=0)
+
+        assert len(jenkins.requested(self.LOG_PATH)) == JenkinsClient.CONSOLE_MAX_FAILURES
+
+    def test_constant_memory(self):
+        """Test that memory does not grow with the length of a fed log."""
+        chunk = build_log(2000)
+
+        def peak_for(chunks):
+            scanner = ConsoleLogScanner()
+            tracemalloc.start()
+            for _ in range(chunks):
+                scanner.feed(chunk)
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            assert scanner.total_lines == chunks * 2000 + 1
+            return peak
+
+        assert peak_for(100) < peak_for(10) * 1.5
+
+
+class TestArtifactDownloads:
+    """Test concurrent, resumable artifact downloads."""
+
+    BUILD_PATH = '/job/WeSign-Main/42/api/json'
+    ARTIFACT_PATH = '/job/WeSign-Main/42/artifact/'
+
+    def serve_artifacts(self, jenkins, files, fingerprinted=True, honor_range=True):
+        """Serve files ({relative path: bytes}) as the build's artifacts, with Range support."""
+        jenkins.routes[self.BUILD_PATH] = lambda request: (200, {}, {
+            'number': 42,
+            'artifacts': [{'displayPath': path.rsplit('/', 1)[-1], 'fileName': path.rsplit('/', 1)[-1],
+                           'relativePath': path, 'size': len(content)} for path, content in files.items()],
+            'fingerprint': [{'fileName': path, 'hash': hashlib.md5(content).hexdigest()}
+                            for path, content in files.items()] if fingerprinted else []
+        })
+
+        def artifact(content):
+            def handler(request):
+                match = re.match(r'bytes=(\d+)-$', request.headers.get('Range', ''))
+                if match and honor_range:
+                    start = int(match.group(1))
+                    if start >= len(content):
+                        return 416, {}, b''
+                    return 206, {'Content-Range': f'bytes {start}-{len(content) - 1}/{len(content)}'}, content[start:]
+                return 200, {}, content
+            return handler
+
+        for path, content in files.items():
+            jenkins.routes[self.ARTIFACT_PATH + urllib.parse.quote(path)] = artifact(content)
+
+    @staticmethod
+    def artifact_files(count=20, size=50000):
+        rng = random.Random(3)
+        return {f"{'screenshots' if i % 2 else 'traces'}/test {i}.bin": rng.randbytes(size + i) for i in range(count)}
+
+    def artifact_requests(self, jenkins):
+        return [request for request in jenkins.requests if request[1].startswith(self.ARTIFACT_PATH)]
+
+    def test_downloads_all_artifacts(self, jenkins, jenkins_client, tmp_path):
+        """Test that every artifact lands at its relative path with the right content."""
+        files = self.artifact_files()
+        self.serve_artifacts(jenkins, files)
+
+        downloaded = jenkins_client.download_all_artifacts('WeSign-Main', 42, tmp_path, max_workers=4)
+
+        assert len(downloaded) == len(files)
+        for path, content in files.items():
+            assert (tmp_path / path).read_bytes() == content
+        assert not list(tmp_path.rglob('*.part'))
+        stats = jenkins_client.download_stats
+        assert stats['downloaded'] == len(files) and stats['failed'] == 0
+        assert stats['bytes'] == sum(len(content) for content in files.values())
+
+    def test_skips_up_to_date_files(self, jenkins, jenkins_client, tmp_path):
+        """Test that files already present with the same size and MD5 are not downloaded again."""
+        files = self.artifact_files(count=4)
+        self.serve_artifacts(jenkins, files)
+        jenkins_client.download_all_artifacts('WeSign-Main', 42, tmp_path)
+        stale = next(iter(files))
+        (tmp_path / stale).write_bytes(bytes(len(files[stale])))  # Same size, different content
+        jenkins.requests.clear()
+
+        downloaded = jenkins_client.download_all_artifacts('WeSign-Main', 42, tmp_path)
+
+        assert len(downloaded) == 4
+        assert [request[1] for request in self.artifact_requests(jenkins)] == [
+            self.ARTIFACT_PATH + urllib.parse.quote(stale)]
+        assert (tmp_path / stale).read_bytes() == files[stale]
+        assert jenkins_client.download_stats['skipped'] == 3
+
+    def test_skips_unfingerprinted_files_from_manifest(self, jenkins, jenkins_client, tmp_path):
+        """Test that without Jenkins fingerprints the download manifest identifies finished files."""
+        files = self.artifact_files(count=3)
+        self.serve_artifacts(jenkins, files, fingerprinted=False)
+        jenkins_client.download_all_artifacts('WeSign-Main', 42, tmp_path)
+        jenkins.requests.clear()
+
+        jenkins_client.download_all_artifacts('WeSign-Main', 42, tmp_path)
+
+        assert self.artifact_requests(jenkins) == []
+        assert jenkins_client.download_stats['skipped'] == 3
+
+    @pytest.mark.parametrize('honor_range', [True, False])
+    def test_resumes_partial_download(self, jenkins, jenkins_client, tmp_path, honor_range):
+        """Test that a .part file is continued with a Range request (or replaced if the range is ignored)."""
+        files = self.artifact_files(count=1)
+        path, content = next(iter(files.items()))
+        self.serve_artifacts(jenkins, files, honor_range=honor_range)
+        part = tmp_path / (path + '.part')
+        part.parent.mkdir(parents=True)
+        part.write_bytes(content[:12345])
+
+        downloaded = jenkins_client.download_all_artifacts('WeSign-Main', 42, tmp_path)
+
+        assert downloaded == [(tmp_path / path).resolve()]
+        assert (tmp_path / path).read_bytes() == content and not part.exists()
+        assert self.artifact_requests(jenkins)[0][3].get('Range') == 'bytes=12345-'
+        stats = jenkins_client.download_stats
+        assert stats['bytes'] == (len(content) - 12345 if honor_range else len(content))
+        assert stats['resumed' if honor_range else 'downloaded'] == 1
+
+    def test_corrupt_partial_is_downloaded_again(self, jenkins, jenkins_client, tmp_path):
+        """Test that a partial file failing the fingerprint check is discarded and fetched whole."""
+        files = self.artifact_files(count=1)
+        path, content = next(iter(files.items()))
+        self.serve_artifacts(jenkins, files)
+        part = tmp_path / (path + '.part')
+        part.parent.mkdir(parents=True)
+        part.write_bytes(b'x' * 100)
+
+        jenkins_client.download_all_artifacts('WeSign-Main', 42, tmp_path)
+
+        assert (tmp_path / path).read_bytes() == content
+        assert [request[3].get('Range') for request in self.artifact_requests(jenkins)] == ['bytes=100-', None]
+
+    def test_ambiguous_fingerprint_names_ignored(self, jenkins, jenkins_client, tmp_path):
+        """Test that a fingerprint recorded under a bare name shared by two artifacts is not applied to either."""
+        files = {'login/failure.png': b'first screenshot', 'upload/failure.png': b'second screenshot!',
+                 'traces/run.zip': b'trace'}
+        self.serve_artifacts(jenkins, files)
+        build = jenkins.routes[self.BUILD_PATH](None)[2]
+        build['fingerprint'] = [{'fileName': 'failure.png', 'hash': hashlib.md5(files['login/failure.png']).hexdigest()},
+                                {'fileName': 'run.zip', 'hash': hashlib.md5(files['traces/run.zip']).hexdigest()}]
+        jenkins.routes[self.BUILD_PATH] = lambda request: (200, {}, build)
+
+        artifacts = {artifact.relative_path: artifact for artifact in jenkins_client.get_build_artifacts('WeSign-Main', 42)}
+        downloaded = jenkins_client.download_all_artifacts('WeSign-Main', 42, tmp_path)
+
+        assert artifacts['login/failure.png'].fingerprint is None
+        assert artifacts['upload/failure.png'].fingerprint is None
+        assert artifacts['traces/run.zip'].fingerprint == hashlib.md5(b'trace').hexdigest()
+        assert len(downloaded) == 3 and jenkins_client.download_stats['failed'] == 0
+        assert len(self.artifact_requests(jenkins)) == 3
+        assert (tmp_path / 'upload/failure.png').read_bytes() == files['upload/failure.png']
+
+    def test_refuses_paths_outside_download_dir(self, jenkins, jenkins_client, tmp_path):
+        """Test that an artifact path escaping the download directory is not written."""
+        self.serve_artifacts(jenkins, {'../escape.txt': b'data', 'ok.txt': b'data'})
+
+        downloaded = jenkins_client.download_all_artifacts('WeSign-Main', 42, tmp_path / 'out')
+
+        assert downloaded == [(tmp_path / 'out' / 'ok.txt').resolve()]
+        assert not (tmp_path / 'escape.txt').exists()
+        assert jenkins_client.download_stats['failed'] == 1
+
+
+class TestBuildMetadata:
+    """Test tree queries, the finished-build cache and conditional requests."""
+
+    JOB_PATH = '/job/WeSign-Main/api/json'
+
+    @staticmethod
+    def build_data(number, building=False):
+        return {
+            'number': number, 'url': f"http://jenkins/job/WeSign-Main/{number}/",
+            'building': building, 'result': None if building else ('SUCCESS' if number % 3 else 'FAILURE'),
+            'timestamp': 1767225600000 + number * 60000, 'duration': 0 if building else 120000,
+            'displayName': f"#{number}", 'builtOn': 'agent-1',
+            'actions': [{'causes': [{'shortDescription': 'Started by timer'}]},
+                        {'lastBuiltRevision': {'SHA1': f"{number:040x}"}, 'remoteUrls': ['git@x'],
+                         'branch': [{'name': 'origin/main'}]},
+                        {'urlName': 'testReport', 'failCount': 1, 'skipCount': 0, 'totalCount': 10}],
+            'artifacts': [{'displayPath': 'report.json', 'fileName': 'report.json',
+                           'relativePath': 'reports/report.json', 'size': 10}],
+            'fingerprint': []
+        }
+
+    def serve_job(self, jenkins, builds):
+        """Serve a job whose builds (newest first) honour tree ranges like builds[...]{0,100}."""
+        def job(request):
+            match = re.fullmatch(r'(builds|allBuilds)\[(.*)\]\{(\d+),(\d+)\}', request.query.get('tree', ''))
+            prop, fields, first, last = match.groups()
+            if prop == 'builds':
+                last = min(int(last), 100)
+            selected = builds[int(first):int(last)]
+            if fields == 'number':
+                selected = [{'number': build['number']} for build in selected]
+            return 200, {}, {prop: selected}
+
+        jenkins.routes[self.JOB_PATH] = job
+        for build in builds:
+            jenkins.routes[f"/job/WeSign-Main/{build['number']}/api/json"] = lambda request, build=build: (200, {}, build)
+
+    def api_requests(self, jenkins):
+        return [request for request in jenkins.requests if request[1] != '/api/json']
+
+    def test_recent_builds_in_one_request(self, jenkins, jenkins_client):
+        """Test that the last 100 builds come from a single tree query."""
+        builds = [self.build_data(number) for number in range(300, 150, -1)]
+        self.serve_job(jenkins, builds)
+
+        recent = jenkins_client.get_recent_builds('WeSign-Main', 100)
+
+        assert [build.number for build in recent] == list(range(300, 200, -1))
+        assert recent[0].status == 'FAILURE' and recent[0].commit_hash == f"{300:040x}"[:8]
+        assert recent[0].branch == 'main' and recent[0].cause == 'Started by timer'
+        requests_made = self.api_requests(jenkins)
+        assert len(requests_made) == 1
+        assert requests_made[0][2]['tree'] == f"builds[{JenkinsClient.BUILD_TREE}]{{0,100}}"
+
+    def test_recent_builds_from_cache(self, jenkins, tmp_path):
+        """Test that cached finished builds are not fetched again, across client instances."""
+        builds = [self.build_data(number, building=number == 200) for number in range(200, 50, -1)]
+        self.serve_job(jenkins, builds)
+        first_run = JenkinsClient(jenkins.url, 'user', 'token', cache_dir=tmp_path)
+        first_run.get_recent_builds('WeSign-Main', 100)
+
+        # Two new builds; #200 has finished since
+        builds[:1] = [self.build_data(202, building=True), self.build_data(201), self.build_data(200)]
+        self.serve_job(jenkins, builds)
+        jenkins.requests.clear()
+        second_run = JenkinsClient(jenkins.url, 'user', 'token', cache_dir=tmp_path)
+
+        recent = second_run.get_recent_builds('WeSign-Main', 100)
+
+        assert [build.number for build in recent] == list(range(202, 102, -1))
+        assert [build.status for build in recent[:3]] == ['BUILDING', 'FAILURE', 'SUCCESS']
+        assert [request[2]['tree'] for request in self.api_requests(jenkins)] == [
+            'builds[number]{0,100}', f"builds[{JenkinsClient.BUILD_TREE}]{{0,3}}"]
+
+        jenkins.requests.clear()
+        second_run.get_recent_builds('WeSign-Main', 100)
+        assert len(self.api_requests(jenkins)) == 2  # #202 is still running
+
+    def test_more_than_100_builds(self, jenkins, jenkins_client):
+        """Test that counts above the builds property limit query allBuilds."""
+        self.serve_job(jenkins, [self.build_data(number) for number in range(300, 0, -1)])
+
+        recent = jenkins_client.get_recent_builds('WeSign-Main', 250)
+
+        assert len(recent) == 250
+        assert self.api_requests(jenkins)[0][2]['tree'].startswith('allBuilds[')
+
+    def test_running_build_is_revalidated(self, jenkins, jenkins_client):
+        """Test that a running build is re-requested with If-None-Match and a 304 reuses the last body."""
+        build = self.build_data(42, building=True)
+
+        def build_route(request):
+            if request.headers.get('If-None-Match') == '"v1"':
+                return 304, {'ETag': '"v1"'}, b''
+            return 200, {'ETag': '"v1"'}, build
+
+        jenkins.routes['/job/WeSign-Main/42/api/json'] = build_route
+
+        first = jenkins_client.get_build_info('WeSign-Main', 42)
+        second = jenkins_client.get_build_info('WeSign-Main', 42)
+
+        assert first == second and second.status == 'BUILDING'
+        assert [request[3].get('If-None-Match') for request in self.api_requests(jenkins)] == [None, '"v1"']
+        assert jenkins_client.api_stats['not_modified'] == 1
+
+    def test_build_report_requests(self, jenkins, jenkins_client):
+        """Test that a report reads build info, artifacts and test counts from one query, cached once finished."""
+        self.serve_job(jenkins, [self.build_data(42)])
+        jenkins.routes['/job/WeSign-Main/42/testReport/api/json'] = lambda request: (
+            200, {}, {'failCount': 1, 'passCount': 9, 'skipCount': 0, 'duration': 12.5})
+
+        report = jenkins_client.create_build_report('WeSign-Main', 42, include_console_log=False)
+        jenkins_client.create_build_report('WeSign-Main', 42, include_console_log=False)
+
+        assert report['build_info']['number'] == 42
+        assert report['artifacts'][0]['relative_path'] == 'reports/report.json'
+        assert report['test_results']['total_count'] == 10 and report['test_results']['duration_seconds'] == 12.5
+        assert [(request[1], request[2].get('tree')) for request in self.api_requests(jenkins)] == [
+            ('/job/WeSign-Main/42/api/json', JenkinsClient.REPORT_TREE),
+            ('/job/WeSign-Main/42/testReport/api/json', JenkinsClient.TEST_REPORT_TREE),
+            ('/job/WeSign-Main/42/testReport/api/json', JenkinsClient.TEST_REPORT_TREE)
+        ]
+        assert jenkins_client.get_build_info('WeSign-Main', 42).number == 42
+        assert len(self.api_requests(jenkins)) == 3
+
+
+class TestBuildPolling:
+    """Test estimatedDuration-driven polling and concurrent waits."""
+
+    @pytest.fixture
+    def fast_client(self, jenkins_client):
+        """Client whose poll intervals are scaled down from seconds to tens of milliseconds."""
+        jenkins_client.POLL_MIN_INTERVAL = 0.02
+        jenkins_client.POLL_MAX_INTERVAL = 0.5
+        jenkins_client.QUEUE_POLL_MIN_INTERVAL = 0.02
+        jenkins_client.QUEUE_POLL_MAX_INTERVAL = 0.1
+        return jenkins_client
+
+    @pytest.fixture
+    def clock(self):
+        """Virtual clock: time.sleep advances time.time instead of blocking. Yields the requested sleeps."""
+        now, sleeps = [time.time()], []
+
+        def sleep(seconds):
+            sleeps.append(seconds)
+            now[0] += seconds
+
+        with patch('time.time', lambda: now[0]), patch('time.sleep', sleep):
+            yield sleeps
+
+    @staticmethod
+    def serve_build_polls(jenkins, job, number, polls, barrier):
+        """Serve a build that reports finished on its `polls`-th status request, with no estimate.
+
+        The first request waits at `barrier`, which only opens once every build has a request in flight.
+        """
+        requests_seen = []
+
+        def build(request):
+            requests_seen.append(request)
+            if len(requests_seen) == 1:
+                try:
+                    barrier.wait(timeout=5)
+                except threading.BrokenBarrierError:
+                    pass
+            building = len(requests_seen) < polls
+            return 200, {}, {'number': number, 'building': building, 'result': None if building else 'SUCCESS',
+                             'timestamp': 0, 'duration': 0, 'estimatedDuration': -1}
+
+        jenkins.routes[f"/job/{job}/{number}/api/json"] = build
+
+    @staticmethod
+    def serve_build(jenkins, job, number, seconds, estimated=None, result='SUCCESS'):
+        """Serve a build that started now and finishes after `seconds`; returns its end time."""
+        started = time.time()
+
+        def build(request):
+            building = time.time() < started + seconds
+            return 200, {}, {'number': number, 'building': building, 'result': None if building else result,
+                             'timestamp': int(started * 1000), 'duration': 0 if building else int(seconds * 1000),
+                             'estimatedDuration': int((estimated or seconds) * 1000) if estimated != -1 else -1}
+
+        jenkins.routes[f"/job/{job}/{number}/api/json"] = build
+        return started + seconds
+
+    def simulate(self, client, estimated, actual):
+        """Poll count and detection delay of a build lasting `actual` seconds, without sleeping."""
+        elapsed, polls = 0.0, 0
+        while elapsed < actual:
+            elapsed += client.poll_interval(elapsed, estimated, polls)
+            polls += 1
+        return polls, elapsed - actual
+
+    def test_poll_interval_schedule(self, client):
+        """Test tight checks at the start and near the end, back-off in the middle and after an overrun."""
+        assert client.poll_interval(4, 600) == 2.0
+        assert client.poll_interval(300, 600) == 60.0
+        assert client.poll_interval(590, 600) == 2.5
+        assert client.poll_interval(700, 600) == 25.0
+        assert [client.poll_interval(100, None, polls) for polls in (0, 3, 20)] == [2.0, 6.75, 60.0]
+
+    @pytest.mark.parametrize('estimated', [60, 600, 7200])
+    def test_schedule_beats_fixed_interval(self, client, estimated):
+        """Test that the end of a build is seen within the minimum interval, with fewer polls on long builds."""
+        polls, delay = self.simulate(client, estimated, estimated)
+
+        assert delay <= client.POLL_MIN_INTERVAL
+        if estimated >= 7200:
+            assert polls < estimated / 30 * 0.7  # Fixed 30 s polling: 240 polls, up to 30 s late
+
+    def test_overrun_and_unknown_estimate(self, client):
+        """Test that builds running past or without an estimate are still polled with bounded delay."""
+        polls, delay = self.simulate(client, 600, 900)
+        assert delay <= 0.25 * 300 and polls < 60
+
+        polls, delay = self.simulate(client, None, 900)
+        assert delay <= client.POLL_MAX_INTERVAL and polls < 30
+
+    def test_wait_for_build_completion(self, jenkins, jenkins_client, clock):
+        """Test that a build is reported within the minimum interval of finishing, on the adaptive schedule."""
+        finished = self.serve_build(jenkins, 'WeSign-Main', 42, 600, result='UNSTABLE')
+
+        build_info = jenkins_client.wait_for_build_completion('WeSign-Main', 42, timeout_seconds=3600)
+
+        polls = len(jenkins.requested('/job/WeSign-Main/42/api/json'))
+        assert build_info.status == 'UNSTABLE' and build_info.estimated_duration_ms == 600000
+        assert 0 <= time.time() - finished <= jenkins_client.POLL_MIN_INTERVAL
+        assert len(clock) == polls - 1 == self.simulate(jenkins_client, 600, 600)[0]
+
+    def test_wait_for_builds_concurrently(self, jenkins, jenkins_client):
+        """Test that several builds are awaited at once: their first status requests are all in flight together."""
+        barrier = threading.Barrier(3)
+        for index, polls in enumerate([2, 3, 4]):
+            self.serve_build_polls(jenkins, f"job-{index}", 7, polls, barrier)
+        sleeps = []
+        real_sleep = asyncio.sleep
+
+        async def sleep(seconds):
+            sleeps.append(seconds)
+            await real_sleep(0)
+
+        with patch('asyncio.sleep', sleep):
+            results = jenkins_client.wait_for_builds([(f"job-{index}", 7) for index in range(3)], timeout_seconds=5)
+
+        assert [build_info.status for build_info in results] == ['SUCCESS'] * 3
+        assert not barrier.broken
+        assert [len(jenkins.requested(f"/job/job-{index}/7/api/json")) for index in range(3)] == [2, 3, 4]
+        assert len(sleeps) == 1 + 2 + 3
+
+    def test_timeout(self, jenkins, fast_client):
+        """Test that a build still running at the deadline raises."""
+        self.serve_build(jenkins, 'WeSign-Main', 42, 60)
+
+        with pytest.raises(JenkinsAPIError, match='Timeout'):
+            fast_client.wait_for_build_completion('WeSign-Main', 42, timeout_seconds=0.2)
+
+    def test_run_builds(self, jenkins, fast_client):
+        """Test fan-out: trigger several jobs, follow their queue items and wait for all builds."""
+        queue = {}
+
+        def trigger(job, queue_id, seconds):
+            def handler(request):
+                queue[queue_id] = {'polls': 0, 'job': job, 'seconds': seconds}
+                return 201, {'Location': f"{jenkins.url}/queue/item/{queue_id}/"}, b''
+            return handler
+
+        def queue_item(queue_id):
+            def handler(request):
+                item = queue[queue_id]
+                item['polls'] += 1
+                if item['polls'] < 3:
+                    return 200, {}, {'id': queue_id, 'buildable': True, 'blocked': False}
+                if 'number' not in item:
+                    item['number'] = 100 + queue_id
+                    self.serve_build(jenkins, item['job'], item['number'], item['seconds'])
+                return 200, {}, {'id': queue_id, 'executable': {'number': item['number']}}
+            return handler
+
+        for queue_id, (job, seconds) in enumerate([('api-tests', 0.4), ('e2e-tests', 0.2)], start=1):
+            jenkins.routes[f"/job/{job}/build"] = trigger(job, queue_id, seconds)
+            jenkins.routes[f"/queue/item/{queue_id}/api/json"] = queue_item(queue_id)
+        jenkins.routes['/job/missing/build'] = lambda request: (404, {}, b'')
+
+        results = fast_client.run_builds({'api-tests': None, 'e2e-tests': None}, timeout_seconds=5)
+
+        assert {job: build_info.number for job, build_info in results.items()} == {'api-tests': 101, 'e2e-tests': 102}
+        assert all(build_info.status == 'SUCCESS' for build_info in results.values())
+        assert fast_client.run_builds({'missing': None}, timeout_seconds=1) == {'missing': None}
+
+    def test_one_timeout_keeps_other_results(self, jenkins, fast_client):
+        """Test that a build still running at the deadline gives None without discarding the others."""
+        self.serve_build(jenkins, 'quick', 1, 0.1)
+        self.serve_build(jenkins, 'slow', 2, 60)
+
+        results = fast_client.wait_for_builds([('quick', 1), ('slow', 2)], timeout_seconds=0.5)
+
+        assert results[0].status == 'SUCCESS'
+        assert results[1] is None
+
+    def test_fan_out_wait_writes_output(self, jenkins, tmp_path):
+        """Test that a successful --fan-out --wait run saves its builds, timestamps included, and exits 0."""
+        output = tmp_path / "out.json"
+        results = {
+            job: BuildInfo(number=number, url=f"{jenkins.url}/job/{job}/{number}/", status='SUCCESS', result='SUCCESS',
+                           timestamp=datetime(2026, 1, 2, 10, 0), duration_ms=1500, display_name=f"#{number}")
+            for job, number in [('WeSign-Main', 7), ('J2', 3)]
+        }
+        argv = ['jenkins_helper.py', '--url', jenkins.url, '--username', 'user', '--token', 'token',
+                '--job', 'WeSign-Main', '--trigger', '--wait', '--fan-out', 'J2', '--output', str(output)]
+
+        with patch.object(sys, 'argv', argv), patch.object(JenkinsClient, 'run_builds', return_value=results):
+            assert main() == 0
+
+        saved = json.loads(output.read_text(encoding='utf-8'))
+        assert saved['triggered_build'] == 7
+        assert saved['fan_out']['J2']['number'] == 3
+        assert saved['build_info']['timestamp'] == str(datetime(2026, 1, 2, 10, 0))
@@ -0,0 +1,1183 @@
+#!/usr/bin/env python3
+"""
+Unit Tests for Report Aggregator (report_aggregator.py)
+=======================================================
+
+Unit tests for artifact scanning, checksumming and report parsing.
+
+Author: QA Intelligence System
+Version: 2.0
+"""
+
+import base64
+import gzip
+import hashlib
+import io
+import json
+import os
+import pytest
+from pathlib import Path
+from unittest.mock import patch, MagicMock
+import requests
+import sys
+import time
+import tracemalloc
+import zipfile
+from datetime import datetime
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from report_aggregator import (
+    ArtifactArchiver,
+    ArtifactManager,
+    ChecksumCache,
+    EndpointStats,
+    HARAnalyzer,
+    HARReader,
+    JUnitMerger,
+    JUnitParser,
+    LatencyAnalyzer,
+    NewmanJSONParser,
+    PlaywrightHTMLParser,
+    QAIntelligenceReporter,
+    ReportAggregator,
+    ReportSummary,
+    ResultsWarehouse,
+    TRXParser,
+    main
+)
+# Aliased so pytest does not try to collect the dataclasses as test classes
+from report_aggregator import TestCaseResult as CaseResult, TestMetrics as Metrics
+
+
+@pytest.fixture
+def artifact_dir(tmp_path):
+    """Workspace with a few artifacts of different sizes."""
+    results = tmp_path / "test-results"
+    results.mkdir()
+    (results / "run.trx").write_text("<TestRun />")
+    (results / "screenshot.png").write_bytes(os.urandom(300 * 1024))
+    (results / "console.log").write_text("line\n" * 1000)
+    return tmp_path
+
+
+class TestChecksums:
+    """Test parallel, cached checksum calculation."""
+
+    def test_checksum_matches_hashlib(self, artifact_dir):
+        """Test buffered and mmap checksums against a one-shot SHA-256."""
+        file_path = artifact_dir / "test-results" / "screenshot.png"
+        expected = hashlib.sha256(file_path.read_bytes()).hexdigest()
+
+        assert ArtifactManager._calculate_checksum(file_path) == expected
+
+        with patch.object(ArtifactManager, 'MMAP_THRESHOLD', 1):
+            assert ArtifactManager._calculate_checksum(file_path) == expected
+
+    def test_empty_and_missing_files(self, tmp_path):
+        """Test checksums of an empty file and a missing file."""
+        empty = tmp_path / "empty.log"
+        empty.write_bytes(b"")
+
+        assert ArtifactManager._calculate_checksum(empty) == hashlib.sha256(b"").hexdigest()
+        assert ArtifactManager._calculate_checksum(tmp_path / "missing.log") == "unknown"
+
+    @staticmethod
+    def checksums(directory, checksum_cache=None, max_workers=None):
+        """Checksums of every file under test-results/, by path."""
+        return {artifact.path: artifact.checksum
+                for artifact in ArtifactManager.iter_artifacts(directory, ["test-results/**/*"], checksum_cache,
+                                                               max_workers=max_workers)}
+
+    def test_iter_artifacts_hashes_in_parallel(self, artifact_dir):
+        """Test that the thread pool hashes every file exactly once, statting each file once."""
+        paths = sorted((artifact_dir / "test-results").iterdir())
+
+        with patch.object(Path, 'stat', side_effect=AssertionError("stat() repeated")):
+            checksums = self.checksums(artifact_dir, max_workers=4)
+
+        assert set(checksums) == set(paths)
+        for path in paths:
+            assert checksums[path] == hashlib.sha256(path.read_bytes()).hexdigest()
+
+    def test_cache_skips_unchanged_files(self, artifact_dir):
+        """Test that unchanged files are served from the persistent cache."""
+        cache_path = artifact_dir / "cache" / "checksums.json"
+        paths = sorted((artifact_dir / "test-results").iterdir())
+
+        first = self.checksums(artifact_dir, ChecksumCache(cache_path))
+        assert cache_path.exists()
+
+        cache = ChecksumCache(cache_path)
+        with patch.object(ArtifactManager, '_calculate_checksum') as mock_hash:
+            second = self.checksums(artifact_dir, cache)
+
+        mock_hash.assert_not_called()
+        assert second == first
+        assert cache.hits == len(paths)
+
+    def test_cache_rehashes_modified_files(self, artifact_dir):
+        """Test that a changed size or mtime invalidates the cache entry."""
+        cache_path = artifact_dir / "checksums.json"
+        log_file = artifact_dir / "test-results" / "console.log"
+
+        self.checksums(artifact_dir, ChecksumCache(cache_path))
+        log_file.write_text("changed\n")
+
+        checksums = self.checksums(artifact_dir, ChecksumCache(cache_path))
+
+        assert checksums[log_file] == hashlib.sha256(b"changed\n").hexdigest()
+
+    def test_corrupt_cache_is_ignored(self, tmp_path):
+        """Test that an unreadable cache file starts an empty cache."""
+        cache_path = tmp_path / "checksums.json"
+        cache_path.write_text("{not json")
+
+        cache = ChecksumCache(cache_path)
+
+        assert cache.get(cache_path, cache_path.stat()) is None
+
+    def test_scan_artifacts_uses_cache(self, artifact_dir):
+        """Test that scanned artifacts carry cached checksums."""
+        cache = ChecksumCache(artifact_dir / "checksums.json")
+
+        artifacts = ArtifactManager.scan_artifacts(artifact_dir, ["test-results/**/*"], cache)
+
+        assert len(artifacts) == 3
+        saved = json.loads((artifact_dir / "checksums.json").read_text())["entries"]
+        for artifact in artifacts:
+            assert saved[str(artifact.path.resolve())]["sha256"] == artifact.checksum
+
+
+class TestWorkspaceScanner:
+    """Test the single-pass multi-pattern workspace walk."""
+
+    DEFAULT_PATTERNS = [
+        '*.trx',
+        '*newman*.html',
+        '*playwright*.html',
+        'playwright-report/**/*.html',
+        '*.har',
+        'screenshots/*.png',
+        'videos/*.mp4',
+        'test-results/**/*'
+    ]
+
+    @pytest.fixture
+    def workspace(self, tmp_path):
+        """Workspace with nested reports, excluded directories and overlapping matches."""
+        files = [
+            'api.trx',
+            'newman-report.html',
+            'test-results/playwright-report.html',
+            'test-results/nested/trace.zip',
+            'playwright-report/index.html',
+            'playwright-report/data/step.html',
+            'screenshots/login.png',
+            'e2e/screenshots/home.png',
+            'screenshots/ignored.jpg',
+            'videos/run.webm',
+            'network.har',
+            'node_modules/pkg/vendor.trx',
+            '.git/objects/pack.trx',
+            'src/app.py'
+        ]
+        for name in files:
+            file_path = tmp_path / name
+            file_path.parent.mkdir(parents=True, exist_ok=True)
+            file_path.write_text(name)
+        return tmp_path
+
+    def _relative(self, workspace, paths):
+        return sorted(path.relative_to(workspace).as_posix() for path in paths)
+
+    def test_matches_rglob_semantics(self, workspace):
+        """Test that one walk finds what per-pattern rglob found, minus excluded directories."""
+        expected = set()
+        for pattern in self.DEFAULT_PATTERNS:
+            expected.update(p for p in workspace.rglob(pattern) if p.is_file())
+        expected = {p for p in expected if 'node_modules' not in p.parts and '.git' not in p.parts}
+
+        found = [path for path, _ in ArtifactManager.walk_workspace(workspace, self.DEFAULT_PATTERNS)]
+
+        assert len(found) == len(set(found))
+        assert self._relative(workspace, found) == self._relative(workspace, expected)
+
+    def test_excluded_directories_are_pruned(self, workspace):
+        """Test that node_modules and .git are never entered."""
+        found = self._relative(workspace, (p for p, _ in ArtifactManager.walk_workspace(workspace, ['*.trx'])))
+
+        assert found == ['api.trx']
+
+    def test_hard_links_deduplicated_by_inode(self, workspace):
+        """Test that the same file reached by two names is reported once."""
+        os.link(workspace / 'api.trx', workspace / 'test-results' / 'copy.trx')
+
+        found = [p for p, _ in ArtifactManager.walk_workspace(workspace, self.DEFAULT_PATTERNS)]
+
+        assert len([p for p in found if p.suffix == '.trx']) == 1
+
+    def test_files_kept_without_inode_numbers(self, workspace):
+        """Test that no file is dropped when stat() has no inode numbers (os.scandir on Windows)."""
+        real_scandir = os.scandir
+
+        class WindowsEntry:
+            def __init__(self, entry):
+                self._entry = entry
+                self.name, self.path = entry.name, entry.path
+
+            def is_dir(self, follow_symlinks=True):
+                return self._entry.is_dir(follow_symlinks=follow_symlinks)
+
+            def is_file(self, follow_symlinks=True):
+                return self._entry.is_file(follow_symlinks=follow_symlinks)
+
+            def stat(self, follow_symlinks=True):
+                fields = list(self._entry.stat(follow_symlinks=follow_symlinks))
+                fields[1] = fields[2] = 0  # st_ino, st_dev
+                return os.stat_result(fields)
+
+        class WindowsScandir:
+            def __init__(self, path):
+                self._iterator = real_scandir(path)
+
+            def __enter__(self):
+                return (WindowsEntry(entry) for entry in self._iterator)
+
+            def __exit__(self, *exc_info):
+                self._iterator.close()
+
+        expected = sorted(p for p, _ in ArtifactManager.walk_workspace(workspace, self.DEFAULT_PATTERNS))
+        with patch('report_aggregator.os.scandir', WindowsScandir):
+            found = sorted(p for p, _ in ArtifactManager.walk_workspace(workspace, self.DEFAULT_PATTERNS))
+
+        assert len(expected) > 1
+        assert found == expected
+
+    def test_compile_patterns(self):
+        """Test glob-to-regex translation of segment wildcards and '**'."""
+        matcher = ArtifactManager.compile_patterns(['screenshots/*.png', 'test-results/**/*', 'report?.xml'])
+
+        assert matcher.match('screenshots/a.png')
+        assert matcher.match('deep/screenshots/a.png')
+        assert not matcher.match('screenshots/sub/a.png')
+        assert matcher.match('test-results/a.txt')
+        assert matcher.match('test-results/x/y/a.txt')
+        assert not matcher.match('test-results')
+        assert matcher.match('report1.xml')
+        assert not matcher.match('report12.xml')
+
+    def test_collect_artifacts_parses_while_scanning(self, workspace, sample_trx_data):
+        """Test that reports found by the scanner are parsed once, during collection."""
+        (workspace / 'api.trx').write_text(sample_trx_data)
+        aggregator = ReportAggregator(workspace, {'checksum_cache': None})
+
+        with patch.object(TRXParser, 'parse_trx_file', wraps=TRXParser.parse_trx_file) as mock_parse:
+            artifacts = aggregator.collect_artifacts(self.DEFAULT_PATTERNS)
+            metrics = aggregator.parse_reports()
+
+        assert mock_parse.call_count == 1
+        assert metrics['trx_api.trx'].total_tests == 10
+        assert len(artifacts) == 9
+
+
+
+TRX_NS = "http://microsoft.com/schemas/VisualStudio/TeamTest/2010"
+
+
+def write_trx(path, results, counters=True):
+    """Write a TRX file with the given (name, outcome, duration, message) results."""
+    lines = [f'<?xml version="1.0" encoding="utf-8"?>\n<TestRun id="run" xmlns="{TRX_NS}">',
+             '  <Times start="2024-01-01T10:00:00.000Z" finish="2024-01-01T10:01:30.000Z" />',
+             '  <Results>']
+    for name, outcome, duration, message in results:
+        lines.append(f'    <UnitTestResult testName="{name}" outcome="{outcome}" duration="{duration}">')
+        lines.append('      <Output><StdOut>' + 'x' * 200 + '</StdOut>')
+        if message:
+            lines.append(f'        <ErrorInfo><Message>{message}</Message><StackTrace>at Test()</StackTrace></ErrorInfo>')
+        lines.append('      </Output>\n    </UnitTestResult>')
+    lines.append('  </Results>')
+    if counters:
+        passed = sum(1 for r in results if r[1] == 'Passed')
+        failed = sum(1 for r in results if r[1] == 'Failed')
+        lines.append(f'  <ResultSummary outcome="Completed"><Counters total="{len(results)}" '
+                     f'executed="{passed + failed}" passed="{passed}" failed="{failed}" /></ResultSummary>')
+    lines.append('</TestRun>')
+    path.write_text('\n'.join(lines), encoding='utf-8')
+    return path
+
+
+class TestTRXParser:
+    """Test the streaming TRX parser."""
+
+    RESULTS = [
+        ('Login_ValidUser', 'Passed', '00:00:01.5000000', None),
+        ('Upload_LargeDocument', 'Failed', '00:01:02.2500000', 'Expected 200 but was 500'),
+        ('Sign_Template', 'NotExecuted', '00:00:00', None)
+    ]
+
+    def test_summary_counters(self, tmp_path, sample_trx_data):
+        """Test metrics from Counters and Times are unchanged."""
+        trx_file = tmp_path / "results.trx"
+        trx_file.write_text(sample_trx_data)
+
+        metrics = TRXParser.parse_trx_file(trx_file)
+
+        assert metrics.total_tests == 10
+        assert metrics.passed_tests == 8
+        assert metrics.failed_tests == 2
+        assert metrics.duration_seconds == 4.0
+        assert metrics.success_rate == 80.0
+
+    def test_per_test_records(self, tmp_path):
+        """Test name, outcome, duration and error message of each test."""
+        trx_file = write_trx(tmp_path / "api.trx", self.RESULTS)
+
+        results = list(TRXParser.iter_test_results(trx_file))
+
+        assert [r.name for r in results] == ['Login_ValidUser', 'Upload_LargeDocument', 'Sign_Template']
+        assert [r.outcome for r in results] == ['passed', 'failed', 'skipped']
+        assert results[1].duration_seconds == pytest.approx(62.25)
+        assert results[1].error_message == 'Expected 200 but was 500'
+        assert results[0].error_message is None
+        assert results[0].source == 'trx_api.trx'
+
+    def test_on_result_callback(self, tmp_path):
+        """Test that parse_trx_file hands every record to the callback in one pass."""
+        trx_file = write_trx(tmp_path / "api.trx", self.RESULTS)
+        collected = []
+
+        metrics = TRXParser.parse_trx_file(trx_file, collected.append)
+
+        assert len(collected) == 3
+        assert metrics.total_tests == 3
+        assert metrics.duration_seconds == 90.0
+
+    def test_counts_results_without_counters(self, tmp_path):
+        """Test a TRX without ResultSummary falls back to counting results."""
+        trx_file = write_trx(tmp_path / "partial.trx", self.RESULTS, counters=False)
+
+        metrics = TRXParser.parse_trx_file(trx_file)
+
+        assert (metrics.total_tests, metrics.passed_tests, metrics.failed_tests, metrics.skipped_tests) == (3, 1, 1, 1)
+
+    def test_parse_duration(self):
+        """Test TRX duration formats."""
+        assert TRXParser._parse_duration('00:00:01.5000000') == 1.5
+        assert TRXParser._parse_duration('1.02:00:00') == 93600.0
+        assert TRXParser._parse_duration('') == 0.0
+
+    def test_large_file_bounded_memory(self, tmp_path):
+        """Test that memory does not grow with the number of results."""
+        results = [(f'Test_{i}', 'Passed', '00:00:00.0100000', None) for i in range(20000)]
+        trx_file = write_trx(tmp_path / "large.trx", results)
+
+        tracemalloc.start()
+        count = sum(1 for _ in TRXParser.iter_test_results(trx_file))
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        assert count == 20000
+        assert peak < trx_file.stat().st_size / 2
+
+    def test_invalid_xml(self, tmp_path):
+        """Test that malformed XML yields empty metrics."""
+        trx_file = tmp_path / "broken.trx"
+        trx_file.write_text("<TestRun><Results>")
+
+        assert TRXParser.parse_trx_file(trx_file).total_tests == 0
+
+
+def write_junit(path, cases, timestamp='2026-01-01T10:00:00.000000', suite_time=60.0):
+    """pytest-style JUnit XML for (classname, name, time, outcome, phases) cases."""
+    lines = ['<?xml version="1.0" encoding="utf-8"?><testsuites name="pytest tests">',
+             f'<testsuite name="pytest" tests="{len(cases)}" time="{suite_time}" timestamp="{timestamp}">']
+    for classname, name, time_s, outcome, phases in cases:
+        lines.append(f'<testcase classname="{classname}" name="{name}" time="{time_s}">')
+        if phases:
+            lines.append('<properties>' + ''.join(f'<property name="{when}_duration" value="{value}" />'
+                                                  for when, value in phases.items()) + '</properties>')
+        if outcome == 'failed':
+            lines.append('<failure message="assert 1 == 2">def test(): assert 1 == 2</failure>')
+        elif outcome == 'skipped':
+            lines.append('<skipped type="pytest.skip" message="not on CI" />')
+        elif outcome == 'flaky':
+            lines.append('<rerunFailure message="timeout">Timeout 5000ms</rerunFailure>')
+        lines.append('<system-out>' + 'x' * 200 + '</system-out></testcase>')
+    lines.append('</testsuite></testsuites>')
+    path.write_text('\n'.join(lines), encoding='utf-8')
+    return path
+
+
+class TestJUnitParser:
+    """Test JUnit XML parsing and shard merging."""
+
+    PHASES = {'setup': 0.5, 'call': 1.25, 'teardown': 0.25}
+
+    def test_per_test_records(self, tmp_path):
+        """Test names, outcomes, errors, reruns and setup/call/teardown timings."""
+        junit_file = write_junit(tmp_path / "junit-e2e.xml", [
+            ('tests.test_login.TestLogin', 'test_valid', 2.0, 'passed', self.PHASES),
+            ('tests.test_login.TestLogin', 'test_invalid', 0.1, 'failed', None),
+            ('tests.test_upload', 'test_pdf', 0.0, 'skipped', None),
+            ('tests.test_upload', 'test_docx', 3.5, 'flaky', None)
+        ])
+
+        results = [value for kind, value in JUnitParser.iter_junit(junit_file, 'junit_junit-e2e') if kind == 'result']
+
+        assert [r.name for r in results] == ['tests.test_login.TestLogin::test_valid', 'tests.test_login.TestLogin::test_invalid',
+                                             'tests.test_upload::test_pdf', 'tests.test_upload::test_docx']
+        assert [r.outcome for r in results] == ['passed', 'failed', 'skipped', 'passed']
+        assert results[0].steps == [{'title': 'setup', 'duration_seconds': 0.5}, {'title': 'call', 'duration_seconds': 1.25},
+                                    {'title': 'teardown', 'duration_seconds': 0.25}]
+        assert results[1].error_message == 'assert 1 == 2'
+        assert results[1].steps is None
+        assert results[3].retries == 1
+
+    def test_shard_group(self):
+        """Test that worker and node suffixes map shards to one group."""
+        for name in ('junit-e2e.xml', 'junit-e2e-shard2.xml', 'junit-e2e.gw3.xml', 'junit-e2e_node_1.xml', 'junit-e2e-4.xml'):
+            assert JUnitParser.shard_group(Path(name)) == 'junit-e2e'
+
+    def test_merges_shards(self, tmp_path):
+        """Test that shards merge into one metrics entry spanning their wall-clock time."""
+        write_junit(tmp_path / "junit-e2e-1.xml", [('tests.a', f'test_{i}', 1.0, 'passed', None) for i in range(3)],
+                    timestamp='2026-01-01T10:00:00', suite_time=60.0)
+        write_junit(tmp_path / "junit-e2e-2.xml", [('tests.b', 'test_0', 1.0, 'failed', None)],
+                    timestamp='2026-01-01T10:00:30', suite_time=45.0)
+        merger = JUnitMerger()
+
+        keys = {merger.add_file(path) for path in sorted(tmp_path.glob('*.xml'))}
+        metrics = merger.metrics('junit_junit-e2e')
+
+        assert keys == {'junit_junit-e2e'}
+        assert (metrics.total_tests, metrics.passed_tests, metrics.failed_tests) == (4, 3, 1)
+        assert metrics.duration_seconds == 75.0
+        assert metrics.success_rate == 75.0
+        assert {r.source for r in merger.results()} == {'junit_junit-e2e'}
+
+    def test_rerun_shard_counts_once(self, tmp_path):
+        """Test that a test repeated in a re-run shard counts once, passing if any attempt passed."""
+        write_junit(tmp_path / "junit-1.xml", [('tests.a', 'test_flaky', 1.0, 'failed', None),
+                                               ('tests.a', 'test_broken', 1.0, 'failed', None)])
+        write_junit(tmp_path / "junit-2.xml", [('tests.a', 'test_flaky', 2.0, 'passed', None)])
+        write_junit(tmp_path / "junit-3.xml", [('tests.a', 'test_flaky', 3.0, 'failed', None)])
+        merger = JUnitMerger()
+        for path in sorted(tmp_path.glob('*.xml')):
+            merger.add_file(path)
+
+        results = {r.name: r for r in merger.results()}
+        metrics = merger.metrics('junit_junit')
+
+        assert (metrics.total_tests, metrics.passed_tests, metrics.failed_tests) == (2, 1, 1)
+        assert results['tests.a::test_flaky'].outcome == 'passed'
+        assert results['tests.a::test_flaky'].duration_seconds == 2.0
+        assert results['tests.a::test_flaky'].retries == 2
+
+    def test_teardown_error_is_not_a_retry(self, tmp_path):
+        """Test pytest's second testcase for a teardown error after a failed call."""
+        junit_file = write_junit(tmp_path / "junit.xml", [('tests.a', 'test_x', 0.1, 'failed', None),
+                                                          ('tests.a', 'test_x', 0.1, 'passed', self.PHASES)])
+        merger = JUnitMerger()
+        merger.add_file(junit_file)
+
+        [result] = merger.results()
+
+        assert result.outcome == 'failed'
+        assert result.retries == 0
+        assert result.error_message == 'assert 1 == 2'
+        assert len(result.steps) == 3
+
+    def test_large_file_bounded_memory(self, tmp_path):
+        """Test that captured output is not retained while streaming."""
+        junit_file = write_junit(tmp_path / "junit.xml", [('tests.a', f'test_{i}', 0.01, 'passed', None)
+                                                          for i in range(20000)])
+
+        tracemalloc.start()
+        count = sum(1 for kind, _ in JUnitParser.iter_junit(junit_file, 'junit_junit') if kind == 'result')
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        assert count == 20000
+        assert peak < junit_file.stat().st_size / 2
+
+    def test_aggregator_collects_junit(self, tmp_path):
+        """Test that JUnit shards feed the metrics, the E2E score and the summary's test records."""
+        write_junit(tmp_path / "junit-e2e-1.xml", [('tests.a', 'test_0', 1.0, 'passed', None)])
+        write_junit(tmp_path / "junit-e2e-2.xml", [('tests.b', 'test_0', 1.0, 'passed', None)])
+        aggregator = ReportAggregator(tmp_path, {'qa_intelligence': {'enabled': False}, 'checksum_cache': None})
+
+        artifacts = aggregator.collect_artifacts()
+        summary = aggregator.generate_summary('run-junit')
+
+        assert {a.type for a in artifacts} == {'junit'}
+        assert list(aggregator.metrics) == ['junit_junit-e2e']
+        assert aggregator.metrics['junit_junit-e2e'].total_tests == 2
+        assert summary.e2e_score == 100.0
+        assert len(summary.test_results) == 2
+
+
+
+def playwright_test(title, outcome, durations, steps=None, error=None, attachments=None):
+    """One test of Playwright report data, with one result per attempt."""
+    results = []
+    for retry, duration in enumerate(durations):
+        last = retry == len(durations) - 1
+        results.append({
+            'retry': retry,
+            'duration': duration,
+            'status': 'passed' if last and outcome != 'unexpected' else 'failed',
+            'steps': steps or [],
+            'errors': [] if last and outcome != 'unexpected' else [{'message': error or 'failed'}],
+            'attachments': attachments or []
+        })
+    return {'title': title, 'projectName': 'chromium', 'outcome': outcome, 'path': ['Documents'], 'results': results}
+
+
+def write_playwright_html(path, tests, as_zip=True):
+    """Write an HTML report embedding its data like Playwright's HTML reporter."""
+    stats = {'total': len(tests), 'expected': 0, 'unexpected': 0, 'flaky': 0, 'skipped': 0}
+    for test in tests:
+        stats[test['outcome']] += 1
+    files = [{'fileId': 'abc123', 'fileName': 'documents.spec.ts', 'tests': tests}]
+    report = {'stats': stats, 'duration': 12500, 'files': files}
+
+    if as_zip:
+        buffer = io.BytesIO()
+        with zipfile.ZipFile(buffer, 'w') as archive:
+            summaries = [{**test, 'results': []} for test in tests]
+            archive.writestr('report.json', json.dumps({**report, 'files': [{**files[0], 'tests': summaries}]}))
+            archive.writestr('abc123.json', json.dumps({'fileId': 'abc123', 'tests': tests}))
+        payload = 'data:application/zip;base64,' + base64.b64encode(buffer.getvalue()).decode()
+    else:
+        payload = base64.b64encode(json.dumps(report).encode()).decode()
+
+    path.write_text(f'<!DOCTYPE html><html><head><script>var x = 1;</script></head><body><div id="root"></div>'
+                    f'<script>\nwindow.playwrightReportBase64 = "{payload}";</script></body></html>')
+    return path
+
+
+class TestPlaywrightParser:
+    """Test the Playwright HTML report and JSON reporter fast paths."""
+
+    TESTS = [
+        playwright_test('uploads a PDF', 'expected', [1200],
+                        steps=[{'title': 'page.goto', 'duration': 300, 'steps': [{'title': 'wait', 'duration': 100}]}]),
+        playwright_test('signs a document', 'flaky', [5000, 2000],
+                        attachments=[{'name': 'trace', 'contentType': 'application/zip', 'path': 'data/trace.zip'}]),
+        playwright_test('deletes a document', 'unexpected', [800], error='\x1b[31mTimeout 30000ms exceeded\x1b[39m')
+    ]
+
+    def test_html_report_zip(self, tmp_path):
+        """Test metrics and per-test records from the embedded report zip."""
+        report_file = write_playwright_html(tmp_path / "playwright-report.html", self.TESTS)
+        collected = []
+
+        with patch('report_aggregator.BeautifulSoup') as mock_soup:
+            metrics = PlaywrightHTMLParser.parse_playwright_html(report_file, collected.append)
+
+        mock_soup.assert_not_called()
+        assert (metrics.total_tests, metrics.passed_tests, metrics.failed_tests) == (3, 2, 1)
+        assert metrics.duration_seconds == 12.5
+
+        uploads, signs, deletes = collected
+        assert uploads.name == '[chromium] › documents.spec.ts › Documents › uploads a PDF'
+        assert uploads.steps == [{'title': 'page.goto', 'duration_seconds': 0.3,
+                                  'steps': [{'title': 'wait', 'duration_seconds': 0.1}]}]
+        assert signs.retries == 1
+        assert signs.duration_seconds == 7.0
+        assert signs.attachments[1] == {'name': 'trace', 'content_type': 'application/zip',
+                                        'path': 'data/trace.zip', 'retry': 1}
+        assert deletes.outcome == 'failed'
+        assert deletes.error_message == 'Timeout 30000ms exceeded'
+        assert uploads.source == 'playwright_playwright-report.html'
+
+    def test_html_report_legacy_json(self, tmp_path):
+        """Test older reports embedding base64 JSON instead of a zip."""
+        report_file = write_playwright_html(tmp_path / "playwright-report.html", self.TESTS, as_zip=False)
+
+        metrics = PlaywrightHTMLParser.parse_playwright_html(report_file)
+
+        assert metrics.total_tests == 3
+        assert metrics.success_rate == pytest.approx(200 / 3)
+
+    def test_html_without_embedded_data_falls_back(self, tmp_path, sample_playwright_html):
+        """Test that HTML without embedded data still uses the DOM fallback."""
+        report_file = tmp_path / "playwright-report.html"
+        report_file.write_text(sample_playwright_html)
+
+        assert PlaywrightHTMLParser.extract_report_data(report_file.read_bytes()) is None
+        PlaywrightHTMLParser.parse_playwright_html(report_file)
+
+    def test_json_reporter(self, tmp_path):
+        """Test JSON reporter output with nested suites."""
+        report = {
+            'config': {'rootDir': '/tests'},
+            'suites': [{
+                'title': 'documents.spec.ts',
+                'specs': [{'title': 'lists documents', 'tests': [
+                    {'projectName': 'chromium', 'status': 'expected',
+                     'results': [{'duration': 900, 'retry': 0, 'steps': [{'title': 'click', 'duration': 40}]}]}
+                ]}],
+                'suites': [{'title': 'Upload', 'specs': [{'title': 'rejects exe', 'tests': [
+                    {'projectName': 'chromium', 'status': 'unexpected',
+                     'results': [{'duration': 300, 'retry': 0, 'error': {'message': 'expected 400'}}]}
+                ]}]}]
+            }],
+            'stats': {'expected': 1, 'unexpected': 1, 'flaky': 0, 'skipped': 0, 'duration': 4200.5}
+        }
+        report_file = tmp_path / "results.json"
+        report_file.write_text(json.dumps(report))
+        collected = []
+
+        assert ArtifactManager._determine_artifact_type(report_file) == 'playwright-json'
+        metrics = PlaywrightHTMLParser.parse_playwright_json(report_file, collected.append)
+
+        assert (metrics.total_tests, metrics.passed_tests, metrics.failed_tests) == (2, 1, 1)
+        assert metrics.duration_seconds == pytest.approx(4.2005)
+        assert [r.name for r in collected] == ['[chromium] › documents.spec.ts › lists documents',
+                                               '[chromium] › documents.spec.ts › Upload › rejects exe']
+        assert collected[1].error_message == 'expected 400'
+
+    def test_large_report_is_fast(self, tmp_path):
+        """Test that a report with thousands of tests parses quickly."""
+        tests = [playwright_test(f'test {i}', 'expected', [100], steps=[{'title': 'step', 'duration': 10}] * 5)
+                 for i in range(5000)]
+        report_file = write_playwright_html(tmp_path / "playwright-report.html", tests)
+        collected = []
+
+        start = time.perf_counter()
+        metrics = PlaywrightHTMLParser.parse_playwright_html(report_file, collected.append)
+
+        assert time.perf_counter() - start < 2.0
+        assert metrics.total_tests == 5000
+        assert len(collected) == 5000
+
+
+
+def newman_report(executions):
+    """Newman JSON reporter output for (folder, name, method, time_ms, size, failed_assertions) tuples."""
+    folders = {}
+    run_executions = []
+    for index, (folder, name, method, time_ms, size, failed) in enumerate(executions):
+        item = {'id': f'{folder}-{name}', 'name': name, 'request': {'method': method}}
+        folders.setdefault(folder, {})[item['id']] = item
+        assertions = [{'assertion': 'Status code is 200', 'skipped': False}]
+        if failed:
+            assertions[0]['error'] = {'name': 'AssertionError', 'message': 'expected 500 to equal 200'}
+        run_executions.append({
+            'item': {'id': item['id'], 'name': name},
+            'request': {'method': method},
+            'response': {'code': 500 if failed else 200, 'responseTime': time_ms, 'responseSize': size},
+            'assertions': assertions
+        })
+
+    failed_count = sum(1 for execution in executions if execution[5])
+    return {
+        'collection': {'item': [{'name': folder, 'item': list(items.values())} for folder, items in folders.items()]},
+        'run': {
+            'stats': {'assertions': {'total': len(executions), 'pending': 0, 'failed': failed_count}},
+            'timings': {'started': 1700000000000, 'completed': 1700000030000, 'responseAverage': 123.4},
+            'executions': run_executions
+        }
+    }
+
+
+class TestNewmanJSONParser:
+    """Test Newman JSON reporter ingestion and latency percentiles."""
+
+    EXECUTIONS = (
+        [('Auth', 'Login', 'POST', t, 512, False) for t in range(10, 110, 10)] +
+        [('Documents', 'Upload', 'POST', 1000, 2048, True), ('Documents', 'List', 'GET', 50, 4096, False)]
+    )
+
+    @pytest.fixture(params=['numpy', 'pure-python'])
+    def latency_backend(self, request):
+        """Run each test with and without the optional numpy extra."""
+        if request.param == 'numpy':
+            pytest.importorskip('numpy')
+            yield
+        else:
+            with patch('report_aggregator.np', None):
+                yield
+
+    def _parse(self, tmp_path, report):
+        report_file = tmp_path / "newman-report.json"
+        report_file.write_text(json.dumps(report))
+        results, endpoints = [], []
+        metrics = NewmanJSONParser.parse_newman_json(report_file, results.append, endpoints.append)
+        return metrics, results, endpoints
+
+    def test_run_metrics(self, tmp_path, latency_backend):
+        """Test assertion counts, duration and the reporter's response average."""
+        metrics, _, _ = self._parse(tmp_path, newman_report(self.EXECUTIONS))
+
+        assert (metrics.total_tests, metrics.passed_tests, metrics.failed_tests) == (12, 11, 1)
+        assert metrics.duration_seconds == 30.0
+        assert metrics.average_response_time_ms == 123.4
+
+    def test_request_and_folder_percentiles(self, tmp_path, latency_backend):
+        """Test per-request and per-folder p50/p90/p99, sizes and failures."""
+        _, _, endpoints = self._parse(tmp_path, newman_report(self.EXECUTIONS))
+        by_name = {(e.kind, e.name): e for e in endpoints}
+
+        login = by_name[('request', 'POST Auth › Login')]
+        assert login.count == 10
+        assert (login.p50_ms, login.p90_ms, login.p99_ms) == (55.0, 91.0, 99.1)
+        assert login.mean_ms == 55.0
+        assert login.max_ms == 100.0
+        assert login.total_size_bytes == 5120
+
+        documents = by_name[('folder', 'Documents')]
+        assert documents.count == 2
+        assert documents.failures == 1
+        assert documents.mean_size_bytes == 3072.0
+        assert by_name[('request', 'POST Documents › Upload')].failures == 1
+
+    def test_per_execution_records(self, tmp_path, latency_backend):
+        """Test that each execution becomes a test record with its assertion error."""
+        _, results, _ = self._parse(tmp_path, newman_report(self.EXECUTIONS))
+
+        upload = [r for r in results if r.name == 'Documents › Upload'][0]
+        assert upload.outcome == 'failed'
+        assert upload.duration_seconds == 1.0
+        assert upload.error_message == 'Status code is 200: expected 500 to equal 200'
+        assert upload.source == 'newman_newman-report.json'
+
+    def test_backends_agree(self):
+        """Test that numpy and pure-Python percentiles are identical."""
+        pytest.importorskip('numpy')
+        keys = [f'request-{i % 7}' for i in range(3000)]
+        times = [float((i * 37) % 1013) for i in range(3000)]
+        sizes = [float(i % 50) for i in range(3000)]
+        failures = [i % 2 for i in range(3000)]
+
+        vectorised = LatencyAnalyzer.summarize('request', 'src', keys, times, sizes, failures)
+        with patch('report_aggregator.np', None):
+            pure = LatencyAnalyzer.summarize('request', 'src', keys, times, sizes, failures)
+
+        assert vectorised == pure
+
+    def test_request_errors_have_no_latency(self, tmp_path):
+        """Test that executions without a response are failed records but not latency samples."""
+        report = newman_report(self.EXECUTIONS[:1])
+        report['run']['executions'].append({'item': {'id': 'Auth-Login', 'name': 'Login'},
+                                            'requestError': {'message': 'ECONNREFUSED'}})
+
+        _, results, endpoints = self._parse(tmp_path, report)
+
+        assert results[-1].outcome == 'failed'
+        assert results[-1].error_message == 'ECONNREFUSED'
+        assert endpoints[0].count == 1
+
+    def test_not_a_newman_report(self, tmp_path):
+        """Test that a JSON file without a run section yields empty metrics."""
+        metrics, results, endpoints = self._parse(tmp_path, {'info': {'name': 'collection'}})
+
+        assert metrics.total_tests == 0
+        assert results == endpoints == []
+
+
+def har_entry(url, time_ms, method='GET', status=200, size=100, wait=None, headers=(), from_cache=False):
+    """A HAR 1.2 entry with timing phases summing to time_ms (dns 2, connect 3, wait, receive 1)."""
+    wait = time_ms - 6 if wait is None else wait
+    entry = {
+        'startedDateTime': '2026-01-01T10:00:00.000Z',
+        'time': time_ms,
+        'request': {'method': method, 'url': url, 'headers': []},
+        'response': {'status': status, 'bodySize': size, 'content': {'size': size},
+                     'headers': [{'name': name, 'value': value} for name, value in headers]},
+        'cache': {},
+        'timings': {'blocked': -1, 'dns': 2, 'connect': 3, 'ssl': -1, 'send': 0, 'wait': wait, 'receive': 1}
+    }
+    if from_cache:
+        entry['_fromCache'] = 'memory'
+    return entry
+
+
+def write_har(path, entries):
+    """HAR file with pages listed before entries, as Playwright writes them."""
+    path.write_text(json.dumps({'log': {
+        'version': '1.2',
+        'creator': {'name': 'Playwright', 'version': '1.40.0'},
+        'pages': [{'id': 'page@1', 'title': 'WeSign "entries": [ decoy'}],
+        'entries': entries
+    }}, indent=2))
+    return path
+
+
+class TestHARAnalyzer:
+    """Test streaming HAR analysis and the backend performance profile."""
+
+    API = 'https://wesign.example/userapi/v3'
+
+    def test_reader_streams_entries_across_chunk_boundaries(self, tmp_path):
+        """Test that entries decode identically whatever the read chunk size."""
+        entries = [har_entry(f'{self.API}/documents/{i}?page={i}', 10.5 + i) for i in range(50)]
+        har_file = write_har(tmp_path / 'login.har', entries)
+
+        for chunk_size in (1, 13, 4096):
+            with patch.object(HARReader, 'CHUNK_SIZE', chunk_size), open(har_file, encoding='utf-8') as f:
+                reader = HARReader(f)
+                assert list(reader.entries()) == entries
+                assert reader.version == '1.2'
+                assert reader.entry_count == 50
+                assert len(reader.pages) == 1
+
+    def test_endpoint_keys(self):
+        """Test that ids and query strings are folded and static assets grouped by extension."""
+        assert HARAnalyzer.endpoint_key('GET', f'{self.API}/documents/12345/pages/2?x=1') == \
+            'GET wesign.example/userapi/v3/documents/{id}/pages/{id}'
+        assert HARAnalyzer.endpoint_key('DELETE', f'{self.API}/contacts/3f2a1c9e-1b2d-4f5a-9c8b-7a6d5e4f3a2b') == \
+            'DELETE wesign.example/userapi/v3/contacts/{id}'
+        assert HARAnalyzer.endpoint_key('GET', 'https://wesign.example/main.3f2a1c9e1b2d4f5a.js') == \
+            'GET wesign.example/*.js'
+
+    def test_percentiles_phases_and_cache(self, tmp_path):
+        """Test per-endpoint latency, mean phases, failures and cache status counts."""
+        entries = [har_entry(f'{self.API}/documents/{i}', 10.0 * i, headers=[('X-Cache', 'HIT')] if i <= 2 else ())
+                   for i in range(1, 11)]
+        entries.append(har_entry(f'{self.API}/documents/99', 500.0, status=500))
+        entries.append(har_entry(f'{self.API}/documents/7', 20.0, status=304))
+        entries.append(har_entry('https://wesign.example/styles.css', 8.0, from_cache=True))
+
+        analyzer = HARAnalyzer()
+        metadata = analyzer.analyze_har(write_har(tmp_path / 'documents.har', entries))
+        stats = {e.name: e for e in analyzer.endpoint_stats()}
+
+        assert metadata == {'entry_count': 13, 'version': '1.2', 'pages': 1}
+        documents = stats['GET wesign.example/userapi/v3/documents/{id}']
+        assert documents.kind == 'har'
+        assert documents.count == 12
+        assert documents.failures == 1
+        assert documents.max_ms == 500.0
+        assert documents.phases_ms['dns'] == 2.0
+        assert documents.phases_ms['blocked'] == 0.0
+        assert documents.cache == {'hit': 2, 'miss': 9, 'revalidated': 1}
+        assert stats['GET wesign.example/*.css'].cache == {'hit': 1}
+
+    def test_slowest_requests_per_test(self, tmp_path):
+        """Test that each recording keeps its slowest requests, slowest first."""
+        analyzer = HARAnalyzer()
+        analyzer.analyze_har(write_har(tmp_path / 'test_login.har',
+                                       [har_entry(f'{self.API}/login', float(t)) for t in range(10, 200, 10)]))
+        analyzer.analyze_har(write_har(tmp_path / 'test_upload.har', [har_entry(f'{self.API}/upload', 900.0)]))
+
+        profile = analyzer.profile()
+
+        assert profile['har_files'] == 2
+        assert profile['requests'] == 20
+        assert [r['time_ms'] for r in profile['slowest_by_test']['test_login']] == [190.0, 180.0, 170.0, 160.0, 150.0]
+        assert profile['slowest_by_test']['test_upload'][0]['phases_ms']['wait'] == 894.0
+
+    def test_truncated_har_keeps_entries_read(self, tmp_path):
+        """Test that a truncated recording is reported but its complete entries still count."""
+        har_file = write_har(tmp_path / 'partial.har', [har_entry(f'{self.API}/a', 10.0), har_entry(f'{self.API}/b', 20.0)])
+        content = har_file.read_text()
+        har_file.write_text(content[:content.rindex('"startedDateTime"')])
+
+        analyzer = HARAnalyzer()
+        metadata = analyzer.analyze_har(har_file)
+
+        assert metadata['entry_count'] == 1
+        assert analyzer.profile()['requests'] == 1
+
+    def test_summary_performance_profile(self, tmp_path):
+        """Test that HAR recordings feed the summary's endpoints and performance profile."""
+        write_har(tmp_path / 'documents.har', [har_entry(f'{self.API}/documents/{i}', 50.0) for i in range(3)])
+        aggregator = ReportAggregator(tmp_path, {'qa_intelligence': {'enabled': False}, 'checksum_cache': None})
+
+        artifacts = aggregator.collect_artifacts(['*.har'])
+        summary = aggregator.generate_summary('run-har')
+
+        assert artifacts[0].metadata['entry_count'] == 3
+        assert [e.name for e in summary.endpoint_stats] == ['GET wesign.example/userapi/v3/documents/{id}']
+        assert summary.performance_profile['requests'] == 3
+
+        output = tmp_path / 'summary.json'
+        assert aggregator.export_summary(summary, output)
+        exported = json.loads(output.read_text())
+        assert exported['performance_profile']['phases_ms']['wait'] == 44.0
+        assert exported['endpoints'][0]['cache'] == {'miss': 3}
+
+
+
+def make_summary(run_id, test_durations, failed=(), overall=90.0, endpoint_p90=None):
+    """ReportSummary of a run with TRX test durations and an optional endpoint timing."""
+    results = [CaseResult(name=name, outcome='failed' if name in failed else 'passed',
+                              duration_seconds=duration, source='trx_api.trx')
+               for name, duration in test_durations.items()]
+    passed = sum(1 for r in results if r.outcome == 'passed')
+    metrics = {'trx_api.trx': Metrics(total_tests=len(results), passed_tests=passed,
+                                          failed_tests=len(results) - passed,
+                                          success_rate=passed / len(results) * 100)}
+    endpoints = []
+    if endpoint_p90 is not None:
+        endpoints.append(EndpointStats(name='POST Auth › Login', kind='request', count=10, p90_ms=endpoint_p90))
+    now = datetime(2024, 1, 1, 10, 0, 0)
+    return ReportSummary(
+        run_id=run_id, environment='dev', start_time=now, end_time=now, total_duration_seconds=0.0,
+        build_score=100.0, smoke_score=0.0, api_score=0.0, e2e_score=overall, overall_score=overall,
+        metrics=metrics, artifacts=[], test_results=results, endpoint_stats=endpoints
+    )
+
+
+class TestResultsWarehouse:
+    """Test the SQLite run history and its trend queries."""
+
+    @pytest.fixture
+    def warehouse(self, tmp_path):
+        """Warehouse with five runs; 'Upload' regresses in the last one."""
+        with ResultsWarehouse(tmp_path / "history.db") as warehouse:
+            for build in range(1, 5):
+                warehouse.ingest_run(make_summary(f'run-{build}', {'Login': 1.0 + build / 100, 'Upload': 2.0},
+                                                  endpoint_p90=100.0 + build))
+            warehouse.ingest_run(make_summary('run-5', {'Login': 1.0, 'Upload': 6.0}, failed={'Login'},
+                                              overall=60.0, endpoint_p90=180.0))
+            yield warehouse
+
+    def test_pass_rate_trend(self, warehouse):
+        """Test pass rate per run, oldest first, limited to the last N runs."""
+        trend = warehouse.pass_rate_trend(last_n=3)
+
+        assert [entry['run_id'] for entry in trend] == ['run-3', 'run-4', 'run-5']
+        assert [entry['pass_rate'] for entry in trend] == [100.0, 100.0, 50.0]
+        assert warehouse.pass_rate_trend(report_kind='newman') == []
+        assert len(warehouse.pass_rate_trend(report_kind='trx')) == 5
+        assert warehouse.pass_rate_trend(report_kind='tr') == []  # '_' is not a wildcard here
+
+    def test_duration_p95_and_slowest(self, warehouse):
+        """Test per-test p95 durations, slowest first."""
+        slowest = warehouse.slowest_tests(last_n=5, limit=1)
+
+        assert slowest[0]['name'] == 'Upload'
+        assert slowest[0]['runs'] == 5
+        assert slowest[0]['p95_seconds'] == pytest.approx(5.2)
+
+    def test_most_regressed(self, warehouse):
+        """Test that the latest run is compared with the median of earlier runs."""
+        regressed = warehouse.most_regressed_tests(last_n=5, min_ratio=1.5)
+
+        assert len(regressed) == 1
+        assert regressed[0]['name'] == 'Upload'
+        assert regressed[0]['ratio'] == pytest.approx(3.0)
+        assert regressed[0]['history_runs'] == 4
+
+    def test_reingest_replaces_run(self, warehouse):
+        """Test that ingesting the same run id again replaces its rows."""
+        warehouse.ingest_run(make_summary('run-5', {'Login': 1.0, 'Upload': 2.0}))
+
+        assert warehouse.run_count() == 5
+        assert warehouse.most_regressed_tests(last_n=5, min_ratio=1.5) == []
+        assert warehouse.pass_rate_trend(last_n=1)[0]['pass_rate'] == 100.0
+
+    def test_endpoint_trend_and_baseline(self, warehouse):
+        """Test endpoint percentiles per run and baseline scores."""
+        trend = warehouse.endpoint_trend('POST Auth › Login', last_n=2)
+
+        assert [entry['p90_ms'] for entry in trend] == [104.0, 180.0]
+        assert warehouse.baseline_scores(last_n=5)['overall'] == pytest.approx(84.0)
+
+    def test_aggregator_gates(self, tmp_path):
+        """Test that CI gates read the warehouse after the run is recorded."""
+        config = {'checksum_cache': None, 'history_db': str(tmp_path / "history.db"),
+                  'gates': {'max_pass_rate_drop': 10, 'max_regression_ratio': 2.0},
+                  'qa_intelligence': {'enabled': False}}
+        aggregator = ReportAggregator(tmp_path, config)
+        for build in range(1, 4):
+            aggregator.record_history(make_summary(f'run-{build}', {'Login': 1.0, 'Upload': 2.0}))
+        assert aggregator.evaluate_gates() == []
+
+        aggregator.record_history(make_summary('run-4', {'Login': 1.0, 'Upload': 5.0}, failed={'Login'}))
+        violations = aggregator.evaluate_gates()
+
+        assert len(violations) == 2
+        assert 'Pass rate 50.0%' in violations[0]
+        assert "'Upload'" in violations[1]
+        aggregator.warehouse.close()
+
+
+
+class TestArtifactArchiver:
+    """Test media-aware zip archiving and the content-addressed store."""
+
+    @pytest.fixture
+    def summary(self, tmp_path):
+        """Summary of a workspace with screenshots, a video and text logs."""
+        workspace = tmp_path / "ws"
+        (workspace / "screenshots").mkdir(parents=True)
+        (workspace / "test-results").mkdir()
+        (workspace / "screenshots" / "login.png").write_bytes(os.urandom(50000))
+        (workspace / "screenshots" / "login-copy.png").write_bytes((workspace / "screenshots" / "login.png").read_bytes())
+        (workspace / "test-results" / "run.webm").write_bytes(os.urandom(20000))
+        for i in range(6):
+            (workspace / "test-results" / f"console-{i}.log").write_text(f"step {i} ok\n" * 5000)
+
+        aggregator = ReportAggregator(workspace, {'checksum_cache': None, 'qa_intelligence': {'enabled': False}})
+        aggregator.collect_artifacts(['screenshots/*.png', 'test-results/**/*'])
+        return aggregator, aggregator.generate_summary('build-1')
+
+    def test_zip_stores_media_and_deflates_text(self, tmp_path, summary):
+        """Test compression method per entry and round-trip contents."""
+        aggregator, run_summary = summary
+        archive_path = tmp_path / "artifacts.zip"
+
+        assert aggregator.archive_artifacts(run_summary, archive_path)
+
+        with zipfile.ZipFile(archive_path) as archive:
+            assert archive.testzip() is None
+            infos = {info.filename: info for info in archive.infolist()}
+            assert infos['screenshots/login.png'].compress_type == zipfile.ZIP_STORED
+            assert infos['test-results/run.webm'].compress_type == zipfile.ZIP_STORED
+            assert infos['test-results/console-3.log'].compress_type == zipfile.ZIP_DEFLATED
+            assert infos['test-results/console-3.log'].compress_size < infos['test-results/console-3.log'].file_size
+            assert archive.read('test-results/console-3.log') == b"step 3 ok\n" * 5000
+            assert json.loads(archive.read('summary.json'))['run_id'] == 'build-1'
+            assert len(infos) == 1 + len(run_summary.artifacts)
+
+    def test_large_text_files_use_streaming_deflate(self, tmp_path, summary):
+        """Test that files above the in-memory limit are still deflated correctly."""
+        aggregator, run_summary = summary
+        archive_path = tmp_path / "artifacts.zip"
+
+        with patch.object(ArtifactArchiver, 'MAX_PARALLEL_FILE_SIZE', 1000):
+            assert aggregator.archive_artifacts(run_summary, archive_path)
+
+        with zipfile.ZipFile(archive_path) as archive:
+            assert archive.testzip() is None
+            assert archive.getinfo('test-results/console-0.log').compress_type == zipfile.ZIP_DEFLATED
+
+    def test_content_addressed_store_dedupes_across_builds(self, tmp_path, summary):
+        """Test that identical files are stored once across files and builds."""
+        aggregator, run_summary = summary
+        store_dir = tmp_path / "store"
+
+        archiver = ArtifactArchiver(aggregator.workspace_dir)
+        manifest_path = archiver.write_content_addressed(run_summary, store_dir)
+        assert archiver.stats['store_reused'] == 1  # login-copy.png
+
+        second = ArtifactArchiver(aggregator.workspace_dir)
+        run_summary.run_id = 'build-2'
+        second.write_content_addressed(run_summary, store_dir)
+
+        objects = [path for path in (store_dir / "objects").rglob("*") if path.is_file()]
+        manifest = json.loads(manifest_path.read_text())
+        assert len(objects) == len(run_summary.artifacts) - 1
+        assert second.stats['store_new'] == 0
+        assert second.stats['store_reused'] == len(run_summary.artifacts)
+        assert (store_dir / "builds" / "build-2.json").exists()
+
+        entry = next(item for item in manifest['artifacts'] if item['path'] == 'test-results/console-0.log')
+        stored = store_dir / "objects" / entry['sha256'][:2] / entry['sha256']
+        assert stored.read_bytes() == (aggregator.workspace_dir / entry['path']).read_bytes()
+
+    def test_store_unaffected_by_workspace_rewrites(self, tmp_path, summary):
+        """Test that rewriting a workspace file in place (same inode) leaves its stored object intact."""
+        aggregator, run_summary = summary
+        store_dir = tmp_path / "store"
+        screenshot = aggregator.workspace_dir / "screenshots" / "login.png"
+        original = screenshot.read_bytes()
+
+        manifest_path = ArtifactArchiver(aggregator.workspace_dir).write_content_addressed(run_summary, store_dir)
+        with open(screenshot, 'r+b') as f:  # Next build's screenshot, written through the same inode
+            f.truncate(0)
+            f.write(os.urandom(len(original)))
+
+        entry = next(item for item in json.loads(manifest_path.read_text())['artifacts']
+                     if item['path'] == 'screenshots/login.png')
+        stored = store_dir / "objects" / entry['sha256'][:2] / entry['sha256']
+        assert stored.read_bytes() == original
+
+
+
+class TestQAIntelligenceReporter:
+    """Test spooled, batched, gzip-compressed uploads."""
+
+    @pytest.fixture
+    def reporter(self, tmp_path):
+        """Reporter with a temporary spool and small batches."""
+        return QAIntelligenceReporter('http://qa.local', api_key='key', spool_dir=tmp_path / "spool", batch_size=2)
+
+    @pytest.fixture
+    def summary(self):
+        """Summary with five per-test records."""
+        return make_summary('build-7', {f'Test{i}': 1.0 for i in range(5)}, endpoint_p90=120.0)
+
+    def _response(self, status_code):
+        response = MagicMock()
+        response.status_code = status_code
+        response.text = ''
+        return response
+
+    def test_parts_are_batched_and_gzipped(self, reporter, summary):
+        """Test that the summary and test batches go out as gzip JSON parts."""
+        with patch.object(reporter.session, 'post', return_value=self._response(201)) as mock_post:
+            assert reporter.report_results(summary)
+
+        bodies = [json.loads(gzip.decompress(call.kwargs['data'])) for call in mock_post.call_args_list]
+        assert [body['part'] for body in bodies] == [1, 2, 3, 4]
+        assert all(body['parts'] == 4 for body in bodies)
+        assert bodies[0]['scores']['overall'] == 90.0
+        assert bodies[0]['endpoint_stats'][0]['p90_ms'] == 120.0
+        assert [len(body['test_results']) for body in bodies[1:]] == [2, 2, 1]
+        assert reporter.session.headers['Content-Encoding'] == 'gzip'
+        assert reporter.pending() == []
+
+    def test_backend_down_keeps_parts_spooled(self, reporter, summary):
+        """Test that nothing is lost when the backend is unreachable."""
+        with patch.object(reporter.session, 'post', side_effect=requests.exceptions.ConnectionError('down')) as mock_post:
+            assert not reporter.report_results(summary)
+
+        assert mock_post.call_count == 1  # stops at the first connection failure
+        assert len(reporter.pending()) == 4
+
+        # Backing off: a regular flush skips the part that just failed
+        with patch.object(reporter.session, 'post', return_value=self._response(200)) as mock_post:
+            result = reporter.flush_spool()
+        assert result['sent'] == 3 and result['pending'] == 1
+
+        with patch.object(reporter.session, 'post', return_value=self._response(200)):
+            assert reporter.flush_spool(force=True)['sent'] == 1
+        assert reporter.pending() == []
+        assert list(reporter.spool_dir.glob('*.retry')) == []
+
+    def test_server_errors_back_off_exponentially(self, reporter, summary):
+        """Test retry bookkeeping on 5xx responses."""
+        reporter.spool(reporter.build_payloads(summary)[:1])
+
+        with patch.object(reporter.session, 'post', return_value=self._response(503)):
+            reporter.flush_spool(force=True)
+            reporter.flush_spool(force=True)
+
+        state = reporter._retry_state(reporter.pending()[0])
+        assert state['attempts'] == 2
+        assert state['last_error'] == 'HTTP 503'
+        assert state['next_attempt_at'] - datetime.now().timestamp() > QAIntelligenceReporter.BACKOFF_BASE_SECONDS
+
+    def test_rejected_parts_are_kept_aside(self, reporter, summary):
+        """Test that a 4xx rejection moves the part out of the queue without deleting it."""
+        reporter.spool(reporter.build_payloads(summary)[:1])
+
+        with patch.object(reporter.session, 'post', return_value=self._response(400)):
+            result = reporter.flush_spool()
+
+        assert result['rejected'] == 1
+        assert reporter.pending() == []
+        assert len(list((reporter.spool_dir / "rejected").glob('*.json.gz'))) == 1
+
+    def test_flush_spool_cli(self, tmp_path, reporter, summary):
+        """Test the --flush-spool mode exit code."""
+        reporter.spool(reporter.build_payloads(summary))
+        config_file = tmp_path / "aggregator.json"
+        config_file.write_text(json.dumps({'qa_intelligence': {'spool_dir': str(reporter.spool_dir)}}))
+
+        with patch('sys.argv', ['report_aggregator.py', '--flush-spool', '--config', str(config_file)]), \
+                patch('requests.Session.post', return_value=self._response(200)):
+            assert main() == 0
+
+        assert reporter.pending() == []
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,30 @@
+"""
+Session hooks for the root (sync Playwright) test suite
+"""
+
+import pytest
+
+from config.utils.locators import LocatorHelper, get_selector_cache, get_selector_stats, record_selector_stats
+
+
+def pytest_sessionfinish(session):
+    """Add this process's selector cache lookups to the run totals; xdist workers hand them to the controller."""
+    cache = get_selector_cache(create=False)
+    if cache is not None:
+        record_selector_stats(cache.stats)
+    if hasattr(session.config, "workeroutput"):
+        session.config.workeroutput["selector_cache"] = get_selector_stats()
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error):
+    """Controller side of pytest_sessionfinish (only called with pytest-xdist)."""
+    record_selector_stats(getattr(node, "workeroutput", {}).get("selector_cache", {}))
+
+
+def pytest_terminal_summary(terminalreporter):
+    """Report the selector cache hit rate; a falling hit rate means the UI is drifting from the primary selectors."""
+    stats = get_selector_stats()
+    if any(stats.values()):
+        terminalreporter.section("selector cache")
+        LocatorHelper(page=None).report_cache_stats(terminalreporter.write_line, stats)
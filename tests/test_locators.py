@@ -0,0 +1,129 @@
+"""
+Unit tests for config/utils/locators.py
+Selector cache hit/drift counting, persistence and the merge on save
+"""
+
+import json
+
+import pytest
+
+from config.utils.locators import LocatorHelper, SelectorCache
+
+
+class FakeLocator:
+    """Sync Playwright locator stand-in; `present` is the set of selectors on the page"""
+
+    def __init__(self, selector, present):
+        self.selector = selector
+        self.present = present
+        self.first = self
+
+    def or_(self, other):
+        return FakeLocator(f"{self.selector} >> or >> {other.selector}", self.present)
+
+    def wait_for(self, timeout=None):
+        if not any(part in self.present for part in self.selector.split(" >> or >> ")):
+            raise Exception("Timeout")
+
+    def is_visible(self):
+        return self.selector in self.present
+
+    def count(self):
+        return int(self.selector in self.present)
+
+
+class FakePage:
+    def __init__(self, present):
+        self.present = set(present)
+
+    def locator(self, selector):
+        return FakeLocator(selector, self.present)
+
+
+@pytest.fixture
+def cache_path(tmp_path):
+    return tmp_path / "locator_cache.json"
+
+
+class TestSelectorCache:
+    """Cold, hit and drift lookups and the on-disk format"""
+
+    def test_counts(self, cache_path):
+        cache = SelectorCache(cache_path)
+
+        cache.record("login", "password_input", 'input[name="password"]')
+        cache.record("login", "password_input", 'input[name="password"]')
+        cache.record("login", "password_input", 'input[type="password"]')
+
+        assert cache.stats == {"hits": 1, "drifts": 1, "cold": 1}
+        assert cache.report()["hit_rate"] == pytest.approx(0.333)
+        assert cache.report()["primary_stale"] == {"LOGIN.password_input": 'input[type="password"]'}
+
+    def test_cached_winner_tried_first(self, cache_path):
+        cache = SelectorCache(cache_path)
+        cache.record("login", "password_input", "b")
+
+        assert cache.order("login", "password_input", ["a", "b", "c"]) == ["b", "a", "c"]
+        assert cache.order("login", "username_input", ["a", "b"]) == ["a", "b"]
+
+    def test_record_stays_in_memory_until_save(self, cache_path):
+        cache = SelectorCache(cache_path)
+        cache.record("login", "password_input", 'input[type="password"]')
+        assert not cache_path.exists()
+
+        cache.save()
+
+        reloaded = SelectorCache(cache_path)
+        assert reloaded.cached_selector("login", "password_input") == 'input[type="password"]'
+        assert [path.name for path in cache_path.parent.iterdir()] == [cache_path.name]
+
+    def test_save_without_lookups_writes_nothing(self, cache_path):
+        SelectorCache(cache_path).save()
+        assert not cache_path.exists()
+
+    def test_save_merges_with_other_processes(self, cache_path):
+        worker_a, worker_b = SelectorCache(cache_path), SelectorCache(cache_path)
+        worker_a.entries, worker_b.entries  # Both loaded the (empty) file before either saved
+
+        worker_a.record("login", "username_input", 'input[type="email"]')
+        worker_a.record("login", "password_input", "stale")
+        worker_b.record("login", "password_input", 'input[type="password"]')
+        worker_b.save()
+        worker_a.save()
+
+        saved = json.loads(cache_path.read_text(encoding="utf-8"))
+        assert saved["LOGIN.username_input"]["selector"] == 'input[type="email"]'
+        # worker_b's entry is newer, so worker_a's later save does not overwrite it
+        assert saved["LOGIN.password_input"]["selector"] == 'input[type="password"]'
+
+
+class TestLocatorHelper:
+    """Racing fallbacks records the winner; the report goes to any writer"""
+
+    def test_winner_recorded_and_reported(self, cache_path):
+        cache = SelectorCache(cache_path)
+        helper = LocatorHelper(FakePage({'input[type="password"]'}), cache)
+
+        first = helper.wait_for_element_with_fallbacks("login", "password_input", timeout=100)
+        second = helper.wait_for_element_with_fallbacks("login", "password_input", timeout=100)
+        lines = []
+        report = helper.report_cache_stats(lines.append)
+
+        assert first.selector == second.selector == 'input[type="password"]'
+        assert (report["cold"], report["hits"]) == (1, 1)
+        assert lines == ["Selector cache: 1 hits, 0 drifts, 1 cold, hit rate 50.0%",
+                         '   LOGIN.password_input: primary stale, using input[type="password"]']
+
+    def test_not_found(self, cache_path):
+        helper = LocatorHelper(FakePage(set()), SelectorCache(cache_path))
+
+        with pytest.raises(TimeoutError, match="Password input field"):
+            helper.wait_for_element_with_fallbacks("login", "password_input", timeout=100)
+        assert helper.find_element_with_fallbacks("login", "password_input") is None
+
+    def test_report_run_totals(self, cache_path):
+        helper = LocatorHelper(FakePage(set()), SelectorCache(cache_path))
+
+        report = helper.report_cache_stats(lambda line: None, {"hits": 3, "drifts": 1})
+
+        assert report["hit_rate"] == 0.75 and report["cold"] == 0